@@ -1,6 +1,7 @@
 # handler.py  (backend)  ─────────────────────────────────────
 import os, json, logging, subprocess
 import sys
+import tempfile
 from typing import Optional
 import uuid
 import threading
@@ -168,10 +169,15 @@ def _init_runs_store(sqlite_path: str):
                 finished_at TEXT NOT NULL,
                 exit_code INTEGER,
                 output TEXT,
-                error TEXT
+                error TEXT,
+                profile TEXT
             )
             """
         )
+        # Stores created before node profiling lack the profile column
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(scheduler_runs)")}
+        if "profile" not in columns:
+            conn.execute("ALTER TABLE scheduler_runs ADD COLUMN profile TEXT")
         conn.commit()
 
 def _save_run(run: dict):
@@ -181,8 +187,8 @@ def _save_run(run: dict):
         conn.execute(
             """
             INSERT INTO scheduler_runs
-            (job_id, job_name, status, triggered_by, started_at, finished_at, exit_code, output, error)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (job_id, job_name, status, triggered_by, started_at, finished_at, exit_code, output, error, profile)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 run.get("job_id"),
@@ -194,6 +200,7 @@ def _save_run(run: dict):
                 run.get("exit_code"),
                 run.get("output"),
                 run.get("error"),
+                run.get("profile"),
             ),
         )
         conn.commit()
@@ -206,7 +213,7 @@ def _list_runs(limit: int = 200):
         conn.row_factory = sqlite3.Row
         rows = conn.execute(
             """
-            SELECT id, job_id, job_name, status, triggered_by, started_at, finished_at, exit_code, output, error
+            SELECT id, job_id, job_name, status, triggered_by, started_at, finished_at, exit_code, output, error, profile
             FROM scheduler_runs
             ORDER BY id DESC
             LIMIT ?
@@ -222,7 +229,7 @@ def _get_run(run_id: int):
         conn.row_factory = sqlite3.Row
         row = conn.execute(
             """
-            SELECT id, job_id, job_name, status, triggered_by, started_at, finished_at, exit_code, output, error
+            SELECT id, job_id, job_name, status, triggered_by, started_at, finished_at, exit_code, output, error, profile
             FROM scheduler_runs
             WHERE id = ?
             """,
@@ -313,6 +320,7 @@ def _serialise(job):
         "next_run_time": next_time.isoformat() if next_time else None,
         "pipeline_path": pipeline_path,
         "trigger": str(job.trigger),
+        "profile": bool(job.kwargs.get("profile", False)),
     }
 
     if job.kwargs.get("schedule_type") == "trigger":
@@ -423,13 +431,23 @@ def run_pipeline(pipeline_or_code, **meta):
         else:
             cmd = [sys.executable, "-c", pipeline_or_code]
 
+        # Profiled pipelines write their JSON profile to AMPHI_PROFILE_PATH
+        fd, profile_path = tempfile.mkstemp(prefix="amphi_profile_", suffix=".json")
+        os.close(fd)
+
         # Run from pipeline directory so relative IO resolves from pipeline location
-        res = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=run_cwd,
-        )
+        try:
+            res = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=run_cwd,
+                env={**os.environ, "AMPHI_PROFILE_PATH": profile_path},
+            )
+            with open(profile_path, encoding="utf-8") as f:
+                profile = f.read() or None
+        finally:
+            os.remove(profile_path)
 
         success = (res.returncode == 0)
         finished_at = dt.datetime.utcnow().isoformat() + "Z"
@@ -448,6 +466,7 @@ def run_pipeline(pipeline_or_code, **meta):
             "error": res.stderr if res.stderr else None,
             "exit_code": res.returncode,
             "cwd": run_cwd,
+            "profile": profile,
         }
         _save_run(
             {
@@ -460,6 +479,7 @@ def run_pipeline(pipeline_or_code, **meta):
                 "exit_code": res.returncode,
                 "output": res.stdout,
                 "error": res.stderr if res.stderr else None,
+                "profile": profile,
             }
         )
         return result
@@ -596,6 +616,7 @@ class SchedulerListHandler(APIHandler):
                 "schedule_type": body.get("schedule_type", kind),
                 "job_id": job_id,
                 "job_name": job_name,
+                "profile": bool(body.get("profile", False)),
             }
             if kind == "cron":
                 kwargs["cron_expression"] = body.get("cron_expression")
@@ -28,6 +28,7 @@ import { pipelineBrandIcon, schedulerIcon } from './icons';
 import {
   Button,
   Card,
+  Checkbox,
   DatePicker,
   Divider,
   Empty,
@@ -69,6 +70,7 @@ interface Job {
   cron_expression?: string;       // only for `cron`
   logical_operator?: 'AND' | 'OR';
   trigger_conditions?: TriggerCondition[];
+  profile?: boolean;
 }
 
 interface TriggerCondition {
@@ -87,6 +89,7 @@ interface RunEntry {
   exit_code?: number | null;
   output?: string | null;
   error?: string | null;
+  profile?: string | null;        // JSON profile of a profiled run
 }
 
 interface JobFormValues {
@@ -101,6 +104,7 @@ interface JobFormValues {
   cron_expression?: string;
   logical_operator?: 'AND' | 'OR';
   trigger_conditions?: TriggerCondition[];
+  profile?: boolean;
 }
 
 /* Replace the previous definition completely */
@@ -117,6 +121,7 @@ interface JobFormSubmitValues {
   trigger_conditions?: TriggerCondition[];
   pipeline_path: string;      // ALWAYS present - the original file path
   python_code?: string;       // present when user picked a .ampln
+  profile?: boolean;          // instrument the generated code per node
 }
 
 interface SchedulerPanelProps {
@@ -372,6 +377,15 @@ const JobForm: React.FC<{
           </Space.Compact>
         </Form.Item>
 
+        <Form.Item
+          style={{ marginBottom: 16 }}
+          name="profile"
+          valuePropName="checked"
+          tooltip="Record wall time, rows and memory of each component (.ampln pipelines only). The profile is attached to each run."
+        >
+          <Checkbox>Profile components</Checkbox>
+        </Form.Item>
+
         <Form.Item style={{ marginBottom: 16 }} name="schedule_type" label="Schedule Type">
           <Radio.Group onChange={(e) => setScheduleType(e.target.value)}>
             <Radio value="date">Date</Radio>
@@ -531,11 +545,31 @@ const JobForm: React.FC<{
   );
 };
 
+/** formatProfile – per-component table of a run's JSON profile, slowest first */
+const formatProfile = (profile: string): string => {
+  try {
+    const parsed = JSON.parse(profile);
+    const rows = [...(parsed.nodes || [])]
+      .sort((a, b) => b.wallTime - a.wallTime)
+      .map(node => {
+        const rowsOut = node.rowsOut === null || node.rowsOut === undefined ? '' : `  ${node.rowsOut} rows`;
+        const memory = node.memoryDelta === null || node.memoryDelta === undefined
+          ? ''
+          : `  ${(node.memoryDelta / (1024 * 1024)).toFixed(1)} MB`;
+        return `${node.wallTime.toFixed(3).padStart(10)}s  ${node.title} (${node.nodeId})${rowsOut}${memory}`;
+      });
+    return [`Total: ${Number(parsed.totalWallTime || 0).toFixed(3)}s`, ...rows].join('\n');
+  } catch {
+    return profile;
+  }
+};
+
 /** getPythonCode – convert .ampln to Python */
 const getPythonCode = async (
   path: string,
   commands: JupyterFrontEnd['commands'],
-  docManager: IDocumentManager
+  docManager: IDocumentManager,
+  profiling = false
 ): Promise<string> => {
 
   console.log('Loaded path:', path);
@@ -562,7 +596,8 @@ const getPythonCode = async (
 
       // Many generators expect a string and will JSON.parse internally.
       const code = (await commands.execute('pipeline-editor:generate-code', {
-        json: jsonString
+        json: jsonString,
+        profiling
       })) as string;
 
       console.log('Generated Python code:', code);
@@ -648,7 +683,8 @@ const SchedulerPanel: React.FC<SchedulerPanelProps> = ({ commands, docManager })
       id: job.id,
       name: job.name,
       pipeline_path: job.pipeline_path,
-      schedule_type: job.schedule_type as any
+      schedule_type: job.schedule_type as any,
+      profile: !!job.profile
     };
 
     if (job.schedule_type === 'date') {
@@ -724,7 +760,8 @@ const SchedulerPanel: React.FC<SchedulerPanelProps> = ({ commands, docManager })
         run_date: values.run_date ? values.run_date.toDate().toISOString() : undefined,
         interval_seconds: values.interval_seconds,
         cron_expression: values.cron_expression,
-        pipeline_path: values.pipeline_path  // ALWAYS send the original path
+        pipeline_path: values.pipeline_path,  // ALWAYS send the original path
+        profile: !!values.profile
       };
 
       // Add date_type if schedule_type is 'date'
@@ -746,7 +783,8 @@ const SchedulerPanel: React.FC<SchedulerPanelProps> = ({ commands, docManager })
         formData.python_code = await getPythonCode(
           values.pipeline_path,
           commands,
-          docManager
+          docManager,
+          !!values.profile
         );
       }
 
@@ -1081,6 +1119,14 @@ const SchedulerPanel: React.FC<SchedulerPanelProps> = ({ commands, docManager })
                   {selectedRun?.error || '(no error)'}
                 </pre>
               </div>
+              {selectedRun?.profile && (
+                <div>
+                  <strong>Profile</strong>
+                  <pre style={{ maxHeight: 220, overflow: 'auto', background: '#f6f8fa', padding: 10 }}>
+                    {formatProfile(selectedRun.profile)}
+                  </pre>
+                </div>
+              )}
             </div>
           )}
         </Modal>
@@ -0,0 +1,200 @@
+export class DatabaseBulkLoadHandler {
+    // Write modes offered by the database outputs
+    public static getModeOptions(): object[] {
+        return [
+            { value: "insert", label: "INSERT", tooltip: "Row-wise INSERT statements through DataFrame.to_sql." },
+            { value: "bulk", label: "BULK", tooltip: "Use the native bulk path of the database, in batches with periodic commits." },
+            { value: "merge", label: "MERGE (upsert)", tooltip: "Bulk load into a staging table, then merge it into the target table on the key columns. The target table must exist." }
+        ];
+    }
+
+    public static getBulkLoadFields(): object[] {
+        return [
+            {
+                type: "inputNumber",
+                label: "Batch size (rows)",
+                id: "tsCFinputNumberBatchSize",
+                tooltip: "Number of rows sent to the database per batch.",
+                placeholder: "Default: 10000",
+                min: 1,
+                condition: { tsCFradioMode: ["bulk", "merge"] },
+                advanced: true
+            },
+            {
+                type: "inputNumber",
+                label: "Commit interval (batches)",
+                id: "tsCFinputNumberCommitInterval",
+                tooltip: "Number of batches written between two commits.",
+                placeholder: "Default: 10",
+                min: 1,
+                condition: { tsCFradioMode: ["bulk", "merge"] },
+                advanced: true
+            },
+            {
+                type: "columns",
+                label: "Merge keys",
+                id: "tsCFcolumnsMergeKeys",
+                tooltip: "Columns identifying a row in the target table. Matching rows are updated, the others are inserted. For Postgres and MySQL a unique constraint on these columns is required.",
+                placeholder: "Select key columns",
+                condition: { tsCFradioMode: "merge" },
+                advanced: true
+            }
+        ];
+    }
+
+    public static isBulkMode(config): boolean {
+        return config.tsCFradioMode === "bulk" || config.tsCFradioMode === "merge";
+    }
+
+    // Python helpers, shared by every database output
+    public static provideFunctions(): string[] {
+        const tsBulkToSqlFunction = `
+def py_fn_bulk_to_sql(py_arg_df, py_arg_table, py_arg_engine, py_arg_schema=None, py_arg_if_exists="fail", py_arg_method=None, py_arg_batch_size=10000, py_arg_commit_interval=10):
+    """
+    Write a DataFrame with DataFrame.to_sql in batches of py_arg_batch_size rows,
+    committing every py_arg_commit_interval batches.
+    """
+    py_var_batch_size = max(1, int(py_arg_batch_size))
+    py_var_rows_per_commit = py_var_batch_size * max(1, int(py_arg_commit_interval))
+    py_var_if_exists = py_arg_if_exists
+    for py_var_start in range(0, max(len(py_arg_df), 1), py_var_rows_per_commit):
+        py_arg_df.iloc[py_var_start:py_var_start + py_var_rows_per_commit].to_sql(
+            name=py_arg_table,
+            con=py_arg_engine,
+            schema=py_arg_schema,
+            if_exists=py_var_if_exists,
+            index=False,
+            chunksize=py_var_batch_size,
+            method=py_arg_method
+        )
+        py_var_if_exists = "append"
+`;
+        const tsMergeToSqlFunction = `
+def py_fn_merge_to_sql(py_arg_df, py_arg_table, py_arg_engine, py_arg_keys, py_arg_dialect, py_arg_schema=None, py_arg_method=None, py_arg_batch_size=10000, py_arg_commit_interval=10):
+    """
+    Upsert a DataFrame: bulk load it into a staging table, then merge the staging table
+    into the target table on py_arg_keys. The staging table has a name of its own for every
+    run, so concurrent upserts into the same table do not share it, and is dropped even when the merge fails.
+    """
+    import uuid
+    if not py_arg_keys:
+        raise ValueError("Merge mode requires at least one key column.")
+    py_var_staging = f"amphi_staging_{uuid.uuid4().hex}"
+    try:
+        py_fn_bulk_to_sql(py_arg_df, py_var_staging, py_arg_engine, py_arg_schema, "replace", py_arg_method, py_arg_batch_size, py_arg_commit_interval)
+        py_fn_merge_staging(py_arg_df, py_arg_table, py_var_staging, py_arg_engine, py_arg_keys, py_arg_dialect, py_arg_schema)
+    finally:
+        sqlalchemy.Table(py_var_staging, sqlalchemy.MetaData(), schema=py_arg_schema).drop(py_arg_engine, checkfirst=True)
+
+
+def py_fn_merge_staging(py_arg_df, py_arg_table, py_arg_staging, py_arg_engine, py_arg_keys, py_arg_dialect, py_arg_schema=None):
+    # Merge the staging table into the target table on py_arg_keys, in the SQL of the dialect
+    py_var_preparer = py_arg_engine.dialect.identifier_preparer
+
+    def py_fn_qualify(py_arg_name):
+        if py_arg_schema:
+            return f"{py_var_preparer.quote_schema(py_arg_schema)}.{py_var_preparer.quote(py_arg_name)}"
+        return py_var_preparer.quote(py_arg_name)
+
+    py_var_target = py_fn_qualify(py_arg_table)
+    py_var_staging_name = py_fn_qualify(py_arg_staging)
+    py_var_columns = [py_var_preparer.quote(str(py_var_col)) for py_var_col in py_arg_df.columns]
+    py_var_keys = [py_var_preparer.quote(str(py_var_key)) for py_var_key in py_arg_keys]
+    py_var_updates = [py_var_col for py_var_col in py_var_columns if py_var_col not in py_var_keys]
+    py_var_column_list = ", ".join(py_var_columns)
+
+    if py_arg_dialect in ("postgres", "sqlite"):
+        py_var_action = ("UPDATE SET " + ", ".join(f"{py_var_col} = EXCLUDED.{py_var_col}" for py_var_col in py_var_updates)) if py_var_updates else "NOTHING"
+        py_var_sql = (
+            f"INSERT INTO {py_var_target} ({py_var_column_list}) SELECT {py_var_column_list} FROM {py_var_staging_name} WHERE TRUE "
+            f"ON CONFLICT ({', '.join(py_var_keys)}) DO {py_var_action}"
+        )
+    elif py_arg_dialect == "mysql":
+        py_var_action = ", ".join(f"{py_var_col} = VALUES({py_var_col})" for py_var_col in (py_var_updates or py_var_keys))
+        py_var_sql = (
+            f"INSERT INTO {py_var_target} ({py_var_column_list}) SELECT {py_var_column_list} FROM {py_var_staging_name} "
+            f"ON DUPLICATE KEY UPDATE {py_var_action}"
+        )
+    else:
+        # ANSI MERGE (SQL Server, Oracle, Snowflake)
+        py_var_on = " AND ".join(f"t.{py_var_key} = s.{py_var_key}" for py_var_key in py_var_keys)
+        py_var_sql = f"MERGE INTO {py_var_target} t USING {py_var_staging_name} s ON ({py_var_on})"
+        if py_var_updates:
+            py_var_sql += " WHEN MATCHED THEN UPDATE SET " + ", ".join(f"t.{py_var_col} = s.{py_var_col}" for py_var_col in py_var_updates)
+        py_var_sql += f" WHEN NOT MATCHED THEN INSERT ({py_var_column_list}) VALUES ({', '.join('s.' + py_var_col for py_var_col in py_var_columns)})"
+        if py_arg_dialect == "sqlserver":
+            py_var_sql += ";"
+
+    with py_arg_engine.begin() as py_var_connection:
+        py_var_connection.execute(sqlalchemy.text(py_var_sql))
+`;
+        return [tsBulkToSqlFunction, tsMergeToSqlFunction];
+    }
+
+    // COPY FROM STDIN through psycopg2, used as a to_sql insertion method
+    public static providePostgresCopyFunction(): string {
+        return `
+def py_fn_postgres_copy_method(py_arg_table, py_arg_conn, py_arg_keys, py_arg_data_iter):
+    # Stream the batch as CSV into COPY ... FROM STDIN
+    import csv
+    import io
+    import uuid
+    # Unquoted empty fields are NULL in COPY CSV, so nulls get a marker of their own and empty strings stay empty strings
+    py_var_null = f"amphi_null_{uuid.uuid4().hex}"
+    py_var_buffer = io.StringIO()
+    csv.writer(py_var_buffer).writerows(
+        [py_var_null if py_var_value is None else py_var_value for py_var_value in py_var_row] for py_var_row in py_arg_data_iter
+    )
+    py_var_buffer.seek(0)
+    py_var_preparer = py_arg_conn.dialect.identifier_preparer
+    py_var_columns = ", ".join(py_var_preparer.quote(py_var_key) for py_var_key in py_arg_keys)
+    py_var_table_name = py_var_preparer.format_table(py_arg_table.table)
+    with py_arg_conn.connection.cursor() as py_var_cursor:
+        py_var_cursor.copy_expert(f"COPY {py_var_table_name} ({py_var_columns}) FROM STDIN WITH (FORMAT csv, NULL '{py_var_null}')", py_var_buffer)
+`;
+    }
+
+    // Array binding: the whole batch in a single executemany round-trip
+    public static provideArrayInsertFunction(): string {
+        return `
+def py_fn_array_insert_method(py_arg_table, py_arg_conn, py_arg_keys, py_arg_data_iter):
+    # Positional binds so the driver sends the batch as arrays
+    py_var_preparer = py_arg_conn.dialect.identifier_preparer
+    py_var_table_name = py_var_preparer.format_table(py_arg_table.table)
+    py_var_columns = ", ".join(py_var_preparer.quote(py_var_key) for py_var_key in py_arg_keys)
+    py_var_binds = ", ".join(f":{py_var_index + 1}" for py_var_index in range(len(py_arg_keys)))
+    py_var_sql = f"INSERT INTO {py_var_table_name} ({py_var_columns}) VALUES ({py_var_binds})"
+    py_var_cursor = py_arg_conn.connection.cursor()
+    try:
+        py_var_cursor.executemany(py_var_sql, list(py_arg_data_iter))
+    finally:
+        py_var_cursor.close()
+`;
+    }
+
+    // Write block for bulk and merge modes
+    public static generateWriteCode({ config, inputName, engineName, tableName, schema, dialect, method, label }): string {
+        const batchSize = config.tsCFinputNumberBatchSize || 10000;
+        const commitInterval = config.tsCFinputNumberCommitInterval || 10;
+        const schemaArg = schema ? `"${schema}"` : "None";
+
+        if (config.tsCFradioMode === "merge") {
+            const keys = (config.tsCFcolumnsMergeKeys || []).map(column => `"${column.value}"`).join(", ");
+            return `
+# Upsert DataFrame into ${label} through a staging table
+try:
+    py_fn_merge_to_sql(${inputName}, "${tableName}", ${engineName}, [${keys}], "${dialect}", py_arg_schema=${schemaArg}, py_arg_method=${method}, py_arg_batch_size=${batchSize}, py_arg_commit_interval=${commitInterval})
+finally:
+    ${engineName}.dispose()
+`;
+        }
+
+        return `
+# Bulk load DataFrame into ${label}
+try:
+    py_fn_bulk_to_sql(${inputName}, "${tableName}", ${engineName}, py_arg_schema=${schemaArg}, py_arg_if_exists="${config.tsCFradioIfTableExists}", py_arg_method=${method}, py_arg_batch_size=${batchSize}, py_arg_commit_interval=${commitInterval})
+finally:
+    ${engineName}.dispose()
+`;
+    }
+}
@@ -0,0 +1,195 @@
+export class DatabaseReadHandler {
+    // Read mode fields shared by the database inputs
+    public static getReadModeFields(): object[] {
+        return [
+            {
+                type: "radio",
+                label: "Read Mode",
+                id: "tsCFradioReadMode",
+                tooltip: "Standard buffers the whole result set before building the DataFrame. Chunked streams the result set through a server-side cursor, chunk by chunk, to chunk-compatible components. Partitioned splits the query on the value range of a numeric or date column and reads the partitions concurrently over separate connections.",
+                options: [
+                    { value: "standard", label: "Standard" },
+                    { value: "chunked", label: "Chunked" },
+                    { value: "partitioned", label: "Partitioned" }
+                ],
+                advanced: true
+            },
+            {
+                type: "inputNumber",
+                label: "Chunk size (rows)",
+                id: "tsCFinputNumberChunkSize",
+                tooltip: "Number of rows fetched per chunk in chunked mode.",
+                placeholder: "Default: 100000",
+                min: 1,
+                condition: { tsCFradioReadMode: "chunked" },
+                advanced: true
+            },
+            {
+                type: "input",
+                label: "Partition column",
+                id: "tsCFinputPartitionColumn",
+                tooltip: "Numeric or date column used to split the query. An indexed column keeps each partition query cheap.",
+                placeholder: "Column name",
+                condition: { tsCFradioReadMode: "partitioned" },
+                advanced: true
+            },
+            {
+                type: "inputNumber",
+                label: "Partitions",
+                id: "tsCFinputNumberPartitions",
+                tooltip: "Number of key ranges read concurrently, each over its own connection.",
+                placeholder: "Default: 4",
+                min: 1,
+                max: 64,
+                condition: { tsCFradioReadMode: "partitioned" },
+                advanced: true
+            }
+        ];
+    }
+
+    public static isChunked(config): boolean {
+        return config.tsCFradioReadMode === "chunked";
+    }
+
+    public static isPartitioned(config): boolean {
+        return config.tsCFradioReadMode === "partitioned" && !!(config.tsCFinputPartitionColumn && config.tsCFinputPartitionColumn.trim());
+    }
+
+    // Python helpers, only needed outside the standard read mode
+    public static provideFunctions(config): string[] {
+        if (DatabaseReadHandler.isChunked(config)) {
+            return [DatabaseReadHandler.provideChunkedReadFunction()];
+        }
+        if (DatabaseReadHandler.isPartitioned(config)) {
+            return [DatabaseReadHandler.providePartitionedReadFunction()];
+        }
+        return [];
+    }
+
+    public static provideChunkedReadFunction(): string {
+        return `
+def py_fn_read_sql_chunks(py_arg_connect, py_arg_query, py_arg_chunk_size=100000):
+    """
+    Stream a query result chunk by chunk. py_arg_connect opens a connection using
+    a server-side cursor, so only one chunk is held client-side at a time.
+    Every chunk is converted to the dtypes of the first one, the query is not run twice to scan them.
+    """
+    py_var_dtypes = None
+    with py_arg_connect() as py_var_conn:
+        for py_var_chunk in pd.read_sql(py_arg_query, con=py_var_conn, chunksize=int(py_arg_chunk_size)):
+            if py_var_dtypes is None:
+                py_var_dtypes = py_fn_chunk_dtypes(py_var_chunk)
+            yield py_fn_cast_chunk(py_var_chunk, py_var_dtypes)
+`;
+    }
+
+    public static providePartitionedReadFunction(): string {
+        return `
+def py_fn_read_sql_partitioned(py_arg_connect, py_arg_query, py_arg_column, py_arg_partitions=4, py_arg_paramstyle="named"):
+    """
+    Split a query on the value range of a numeric or date column and read the
+    partitions concurrently, each one over its own connection.
+    py_arg_paramstyle is "named" for SQLAlchemy connections and "qmark" for DBAPI ones.
+    """
+    import concurrent.futures
+    import datetime
+    import decimal
+
+    py_var_query = py_arg_query.strip().rstrip(";")
+    py_var_source = f"SELECT * FROM ({py_var_query}) amphi_src"
+
+    def py_fn_statement(py_arg_sql):
+        if py_arg_paramstyle == "named":
+            return sqlalchemy.text(py_arg_sql)
+        return py_arg_sql
+
+    def py_fn_read(py_arg_sql, py_arg_params=None):
+        with py_arg_connect() as py_var_conn:
+            return pd.read_sql(py_fn_statement(py_arg_sql), con=py_var_conn, params=py_arg_params)
+
+    def py_fn_scalar(py_arg_value):
+        # Drivers bind plain Python values, not numpy or pandas scalars
+        if isinstance(py_arg_value, pd.Timestamp):
+            return py_arg_value.to_pydatetime()
+        return py_arg_value.item() if hasattr(py_arg_value, "item") else py_arg_value
+
+    py_var_bounds = py_fn_read(f"SELECT MIN({py_arg_column}) AS amphi_low, MAX({py_arg_column}) AS amphi_high FROM ({py_var_query}) amphi_src")
+    py_var_low, py_var_high = py_var_bounds.iloc[0, 0], py_var_bounds.iloc[0, 1]
+    if pd.isna(py_var_low) or pd.isna(py_var_high):
+        return py_fn_read(py_var_source).convert_dtypes()
+
+    py_var_count = max(1, int(py_arg_partitions))
+    if isinstance(py_var_low, (pd.Timestamp, datetime.date)):
+        py_var_edges = list(pd.date_range(pd.Timestamp(py_var_low), pd.Timestamp(py_var_high), periods=py_var_count + 1))
+    else:
+        py_var_low, py_var_high = py_fn_scalar(py_var_low), py_fn_scalar(py_var_high)
+        # NUMERIC and DECIMAL columns are split in Decimal arithmetic, so the bounds are not rounded
+        if not isinstance(py_var_low, (int, float, decimal.Decimal)):
+            raise ValueError(f"Partition column {py_arg_column} must be numeric or date.")
+        py_var_step = (py_var_high - py_var_low) / py_var_count
+        py_var_edges = [py_var_low + py_var_step * py_var_index for py_var_index in range(py_var_count)] + [py_var_high]
+        if isinstance(py_var_low, int):
+            py_var_edges = [int(py_var_edge) for py_var_edge in py_var_edges]
+    py_var_edges = sorted(set(py_fn_scalar(py_var_edge) for py_var_edge in py_var_edges))
+    if len(py_var_edges) == 1:
+        py_var_edges = py_var_edges * 2
+
+    if py_arg_paramstyle == "named":
+        py_var_lower, py_var_upper = ":amphi_low", ":amphi_high"
+    else:
+        py_var_lower, py_var_upper = "?", "?"
+
+    py_var_tasks = []
+    for py_var_index in range(len(py_var_edges) - 1):
+        # The last range is closed so the maximum value is not lost
+        py_var_operator = "<=" if py_var_index == len(py_var_edges) - 2 else "<"
+        py_var_sql = f"{py_var_source} WHERE {py_arg_column} >= {py_var_lower} AND {py_arg_column} {py_var_operator} {py_var_upper}"
+        py_var_low_edge, py_var_high_edge = py_var_edges[py_var_index], py_var_edges[py_var_index + 1]
+        if py_arg_paramstyle == "named":
+            py_var_params = {"amphi_low": py_var_low_edge, "amphi_high": py_var_high_edge}
+        else:
+            py_var_params = [py_var_low_edge, py_var_high_edge]
+        py_var_tasks.append((py_var_sql, py_var_params))
+    py_var_tasks.append((f"{py_var_source} WHERE {py_arg_column} IS NULL", None))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(py_var_tasks)) as py_var_executor:
+        py_var_frames = list(py_var_executor.map(lambda py_var_task: py_fn_read(*py_var_task), py_var_tasks))
+    return pd.concat(py_var_frames, ignore_index=True).convert_dtypes()
+`;
+    }
+
+    // Read block for the chunked and partitioned modes of SQLAlchemy based inputs
+    public static generateReadCode({ config, outputName, engineName, connectionCode, sqlQuery }): string {
+        const sqlLiteral = `"""
+${sqlQuery}
+"""`;
+
+        if (DatabaseReadHandler.isChunked(config)) {
+            const chunkSize = config.tsCFinputNumberChunkSize || 100000;
+            return `
+${connectionCode}
+# Stream the result set through a server-side cursor
+${outputName} = py_cls_chunked_frame(lambda: py_fn_read_sql_chunks(
+    lambda: ${engineName}.connect().execution_options(stream_results=True),
+    ${sqlLiteral},
+    ${chunkSize}
+))
+`;
+        }
+
+        const partitions = config.tsCFinputNumberPartitions || 4;
+        return `
+${connectionCode}
+# Read the query in key range partitions, concurrently
+try:
+    ${outputName} = py_fn_read_sql_partitioned(
+        ${engineName}.connect,
+        ${sqlLiteral},
+        ${JSON.stringify(config.tsCFinputPartitionColumn.trim())},
+        ${partitions}
+    )
+finally:
+    ${engineName}.dispose()
+`;
+    }
+}
@@ -29,19 +29,37 @@ if not ${outputName}_file_paths:
   }
 
   // Static method to generate the concatenation code
-  static generateConcatCode(outputName: string, readMethod: string, optionsString: string, isS3: boolean): string {
+  static generateConcatCode(outputName: string, readMethod: string, optionsString: string, isS3: boolean, convertDtypes: boolean = true): string {
     const readFunction = isS3
       ? `pd.${readMethod}(${outputName}_fs.open(file, 'rb')${optionsString})`
       : `pd.${readMethod}(file${optionsString})`;
 
     return `
-${outputName} = pd.concat([${readFunction} for file in ${outputName}_file_paths], ignore_index=True).convert_dtypes()
+${outputName} = pd.concat([${readFunction} for file in ${outputName}_file_paths], ignore_index=True)${convertDtypes ? '.convert_dtypes()' : ''}
+`;
+  }
+
+  // Static method to generate a chunked stream over every matched file (readMethod must accept chunksize), with the same dtypes in every chunk
+  static generateChunkedCode(outputName: string, readMethod: string, optionsString: string, isS3: boolean): string {
+    const readFunction = isS3
+      ? `pd.${readMethod}(${outputName}_fs.open(file, 'rb')${optionsString})`
+      : `pd.${readMethod}(file${optionsString})`;
+
+    return `
+${outputName} = py_fn_stable_chunks(lambda: (chunk for file in ${outputName}_file_paths for chunk in ${readFunction}))
+`;
+  }
+
+  // Static method to generate a concurrent read of the S3 objects matched by a pattern or stored under a prefix
+  static generateS3ConcurrentCode(filePath: string, storageOptionsString: string, outputName: string, readMethod: string, optionsString: string, maxWorkers: number, convertDtypes: boolean = true): string {
+    return `
+${outputName}_fs = s3fs.S3FileSystem(**${storageOptionsString})
+${outputName}_objects = py_fn_s3_list_objects(${outputName}_fs, "${filePath}")
+${outputName} = py_fn_s3_read_objects(${outputName}_fs, ${outputName}_objects, lambda file: pd.${readMethod}(file${optionsString}), ${maxWorkers})${convertDtypes ? '.convert_dtypes()' : ''}
 `;
   }
 
   static isWildcardInput(filePath: string): boolean {
     return filePath.includes('*');
   }
-
-  
 }
@@ -0,0 +1,166 @@
+export class JSONColumnHandler {
+    // Imports needed by the JSON column helpers
+    public static provideImports(): string[] {
+        return [
+            "import json",
+            "import numpy as np",
+            "import pandas as pd",
+            "import pyarrow as pa",
+            "import pyarrow.compute as pc"
+        ];
+    }
+
+    // Python helpers shared by the JSON components
+    public static provideFunctions(): string[] {
+        const tsJSONColumnFunctions = `
+def py_fn_json_loads():
+    # orjson parses several times faster than json when it is installed
+    try:
+        import orjson
+    except ImportError:
+        return json.loads, (json.JSONDecodeError, TypeError, ValueError)
+
+    def py_fn_loads(py_arg_text):
+        try:
+            return orjson.loads(py_arg_text)
+        except orjson.JSONDecodeError:
+            # orjson rejects valid JSON that json accepts, such as integers wider than 64 bits
+            return json.loads(py_arg_text)
+
+    return py_fn_loads, (json.JSONDecodeError, TypeError, ValueError)
+
+
+def py_fn_json_parse_column(py_arg_series, py_arg_keep_values=True, py_arg_containers_only=False):
+    """
+    Parse a column of JSON text in bulk. Each distinct string is parsed once with the fastest
+    available parser, values that are not strings (already parsed objects, nulls) are passed through.
+    With py_arg_containers_only, only the strings holding a JSON array or object are parsed,
+    other text is passed through as it is.
+    Returns the parsed values as an object array (None when py_arg_keep_values is False),
+    a mask of the parsed string values and a mask of the strings that are not valid JSON.
+    """
+    py_var_loads, py_var_errors = py_fn_json_loads()
+    py_var_values = py_arg_series.to_numpy(dtype=object, na_value=None)
+    if pd.api.types.is_string_dtype(py_arg_series.dtype) and not pd.api.types.is_object_dtype(py_arg_series.dtype):
+        py_var_is_str = py_arg_series.notna().to_numpy()
+    else:
+        py_var_is_str = np.fromiter((isinstance(py_var_value, str) for py_var_value in py_var_values), dtype=bool, count=len(py_var_values))
+    if py_arg_containers_only:
+        py_var_is_str = py_var_is_str.copy()
+        py_var_is_str[py_var_is_str] = np.fromiter(
+            (py_var_value.lstrip()[:1] in ("[", "{") for py_var_value in py_var_values[py_var_is_str]),
+            dtype=bool, count=int(py_var_is_str.sum())
+        )
+
+    py_var_codes, py_var_uniques = pd.factorize(py_var_values[py_var_is_str])
+    py_var_invalid_uniques = np.zeros(len(py_var_uniques), dtype=bool)
+    py_var_parsed_uniques = np.empty(len(py_var_uniques), dtype=object)
+    for py_var_index, py_var_text in enumerate(py_var_uniques):
+        try:
+            py_var_parsed = py_var_loads(py_var_text)
+        except py_var_errors:
+            py_var_invalid_uniques[py_var_index] = True
+            continue
+        if py_arg_keep_values:
+            py_var_parsed_uniques[py_var_index] = py_var_parsed
+
+    py_var_invalid = np.zeros(len(py_var_values), dtype=bool)
+    py_var_invalid[py_var_is_str] = py_var_invalid_uniques[py_var_codes]
+    if not py_arg_keep_values:
+        return None, py_var_is_str, py_var_invalid
+
+    py_var_result = py_var_values.copy()
+    py_var_result[py_var_is_str] = py_var_parsed_uniques[py_var_codes]
+    return py_var_result, py_var_is_str, py_var_invalid
+
+
+def py_fn_json_validate_column(py_arg_series):
+    # True for the string values that parse as JSON
+    _, py_var_is_str, py_var_invalid = py_fn_json_parse_column(py_arg_series, py_arg_keep_values=False)
+    return py_var_is_str & ~py_var_invalid
+
+
+def py_fn_json_uniform_objects(py_arg_values):
+    """
+    True when no object is nested in a list and the objects found at the same place all have the same keys.
+    Arrow merges the keys of the objects it puts in one struct type, which would add keys missing from the input.
+    """
+    py_var_keys = {}
+    py_var_stack = [(py_var_value, (), False) for py_var_value in py_arg_values]
+    while py_var_stack:
+        py_var_value, py_var_path, py_var_in_list = py_var_stack.pop()
+        if isinstance(py_var_value, dict):
+            if py_var_in_list or py_var_keys.setdefault(py_var_path, frozenset(py_var_value)) != frozenset(py_var_value):
+                return False
+            py_var_stack.extend((py_var_child, py_var_path + (py_var_key,), False) for py_var_key, py_var_child in py_var_value.items())
+        elif isinstance(py_var_value, list):
+            py_var_stack.extend((py_var_item, py_var_path, True) for py_var_item in py_var_value)
+    return True
+
+
+def py_fn_json_to_arrow(py_arg_values):
+    # Arrow struct/list array of parsed JSON values, or None when the values do not share one type
+    if not py_fn_json_uniform_objects(py_arg_values):
+        return None
+    try:
+        return pa.array(py_arg_values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, OverflowError):
+        return None
+
+
+def py_fn_json_flatten_arrow(py_arg_array, py_arg_sep=".", py_arg_max_level=None):
+    """
+    Flatten an Arrow struct array into (name, array) columns, nested objects being joined with py_arg_sep.
+    Objects deeper than py_arg_max_level are kept as values, like pandas.json_normalize.
+    """
+    py_var_columns = []
+
+    def py_fn_walk(py_arg_child, py_arg_name, py_arg_level):
+        if (
+            pa.types.is_struct(py_arg_child.type)
+            and py_arg_child.type.num_fields > 0
+            and (py_arg_level == 0 or py_arg_max_level is None or py_arg_level <= py_arg_max_level)
+        ):
+            for py_var_field, py_var_values in zip(py_arg_child.type, py_arg_child.flatten()):
+                py_var_name = f"{py_arg_name}{py_arg_sep}{py_var_field.name}" if py_arg_name else py_var_field.name
+                py_fn_walk(py_var_values, py_var_name, py_arg_level + 1)
+        elif py_arg_name:
+            # Objects without any key (every value is {}) add no column
+            py_var_columns.append((py_arg_name, py_arg_child))
+
+    py_fn_walk(py_arg_array, "", 0)
+    return py_var_columns
+
+
+def py_fn_json_list_columns(py_arg_array):
+    # Split an Arrow list array into one array per list position, using the list offsets
+    py_var_offsets = py_arg_array.offsets.to_numpy()[:-1]
+    py_var_lengths = pc.fill_null(pc.list_value_length(py_arg_array), 0).to_numpy()
+    py_var_columns = []
+    for py_var_position in range(int(py_var_lengths.max()) if len(py_var_lengths) else 0):
+        py_var_indices = pa.array(py_var_offsets + py_var_position, mask=py_var_lengths <= py_var_position)
+        py_var_columns.append((py_var_position, py_arg_array.values.take(py_var_indices)))
+    return py_var_columns
+
+
+def py_fn_json_columns_to_frame(py_arg_columns, py_arg_index):
+    # Assemble (name, Arrow array) columns into a pandas DataFrame on the given index
+    def py_fn_to_pandas(py_arg_array):
+        # Nested values stay Python lists and dicts, as json.loads returns them
+        # Keys null in every row (Arrow null type) keep their column of nulls
+        if pa.types.is_nested(py_arg_array.type) or pa.types.is_null(py_arg_array.type):
+            return pd.Series(py_arg_array.to_pylist(), dtype=object)
+        return py_arg_array.to_pandas()
+
+    if not py_arg_columns:
+        return pd.DataFrame(index=py_arg_index)
+    py_var_frame = pd.DataFrame(
+        {py_var_position: py_fn_to_pandas(py_var_array) for py_var_position, (_, py_var_array) in enumerate(py_arg_columns)}
+    )
+    py_var_frame.columns = [py_var_name for py_var_name, _ in py_arg_columns]
+    py_var_frame.index = py_arg_index
+    return py_var_frame
+`;
+        return [tsJSONColumnFunctions];
+    }
+}
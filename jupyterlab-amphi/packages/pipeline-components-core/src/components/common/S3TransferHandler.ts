@@ -0,0 +1,227 @@
+import { S3OptionsHandler } from './S3OptionsHandler';
+
+export class S3TransferHandler {
+    // Transfer fields of the components reading several S3 objects at once
+    public static getReadFields(): object[] {
+        return [
+            {
+                type: "inputNumber",
+                label: "Concurrent downloads",
+                id: "tsCFinputNumberS3MaxWorkers",
+                tooltip: "Number of objects fetched at the same time when the path is a glob pattern (e.g. s3://bucket/data/*.csv) or a prefix ending with /. The objects are listed once and concatenated in listing order.",
+                placeholder: "Default: 16",
+                min: 1,
+                max: 128,
+                advanced: true
+            }
+        ];
+    }
+
+    // Transfer fields of the components uploading to S3, partitioning is only offered to the given file types
+    public static getWriteFields(partitionFileTypes: string[]): object[] {
+        return [
+            {
+                type: "columns",
+                label: "Partition columns",
+                id: "tsCFcolumnsS3PartitionCols",
+                tooltip: "Write one object per group under hive-style prefixes (e.g. year=2023/output.csv) instead of a single object. Partition columns are dropped from the objects.",
+                placeholder: "Select columns",
+                condition: { tsCFradioFileType: partitionFileTypes },
+                advanced: true
+            },
+            {
+                type: "inputNumber",
+                label: "Part size (MB)",
+                id: "tsCFinputNumberS3PartSize",
+                tooltip: "Objects larger than one part are sent as a multipart upload. S3 requires parts of at least 5 MB and accepts up to 10,000 parts per object.",
+                placeholder: "Default: 50",
+                min: 5,
+                advanced: true
+            },
+            {
+                type: "inputNumber",
+                label: "Concurrent uploads",
+                id: "tsCFinputNumberS3MaxWorkers",
+                tooltip: "Number of parts, or of partition objects, uploaded at the same time.",
+                placeholder: "Default: 8",
+                min: 1,
+                max: 64,
+                advanced: true
+            }
+        ];
+    }
+
+    // A glob pattern, or a prefix ending with / when prefixes are accepted, names several objects
+    public static isMultiObjectInput(config, acceptPrefix: boolean = true): boolean {
+        if (config.tsCFradioFileLocation !== "s3" || typeof config.filePath !== "string") {
+            return false;
+        }
+        return config.filePath.includes('*') || (acceptPrefix && config.filePath.endsWith('/'));
+    }
+
+    // File system options: manual key-value entries, then the credentials of the connection
+    public static getStorageOptions(config, storageOptions): object {
+        let finalStorageOptions = {};
+        if (Array.isArray(storageOptions)) {
+            finalStorageOptions = storageOptions.reduce((acc, item: { key: string; value: any }) => {
+                if (item.key) {
+                    acc[item.key] = item.value;
+                }
+                return acc;
+            }, {});
+        } else if (storageOptions && typeof storageOptions === 'object') {
+            finalStorageOptions = { ...storageOptions };
+        }
+        return S3OptionsHandler.handleS3SpecificOptions({ ...config, tsCFradioFileLocation: "s3" }, finalStorageOptions);
+    }
+
+    // Reader and writer options without the storage options, the file system is opened by the helpers
+    public static withoutStorageOptions(config, optionsKey: string): object {
+        const options = { ...(config[optionsKey] || {}) };
+        delete options.storage_options;
+        return { ...config, tsCFradioFileLocation: "local", connectionMethod: "env", [optionsKey]: options };
+    }
+
+    public static provideImports(): string[] {
+        return [
+            "import io",
+            "import posixpath",
+            "import concurrent.futures",
+            "import pandas as pd",
+            "import s3fs"
+        ];
+    }
+
+    // Python helpers listing and fetching S3 objects concurrently, and uploading objects in concurrent parts
+    public static provideFunctions(): string[] {
+        const tsS3TransferFunctions = `
+def py_fn_s3_list_objects(py_arg_fs, py_arg_pattern):
+    # Objects matched by a glob pattern, or stored under a prefix ending with "/", with their size, in one listing
+    if py_arg_pattern.endswith("/"):
+        py_var_found = py_arg_fs.find(py_arg_pattern, detail=True)
+    else:
+        py_var_found = py_arg_fs.glob(py_arg_pattern, detail=True)
+    py_var_objects = {
+        py_var_path: py_var_info.get("size") or 0 for py_var_path, py_var_info in sorted(py_var_found.items())
+        if py_var_info.get("type") != "directory" and not py_var_path.endswith("/")
+    }
+    if not py_var_objects:
+        raise FileNotFoundError("No files found matching the pattern.")
+    return py_var_objects
+
+
+def py_fn_s3_read_objects(py_arg_fs, py_arg_objects, py_arg_reader, py_arg_max_workers=16, py_arg_buffer_mb=64):
+    """
+    Read S3 objects on a bounded thread pool with py_arg_reader(file) and concatenate the frames in listing order.
+    Objects up to py_arg_buffer_mb are fetched with a single request, larger ones are streamed by block.
+    """
+    def py_fn_read(py_arg_path):
+        if py_arg_objects[py_arg_path] <= py_arg_buffer_mb * 2 ** 20:
+            return py_arg_reader(io.BytesIO(py_arg_fs.cat_file(py_arg_path)))
+        with py_arg_fs.open(py_arg_path, "rb") as py_var_file:
+            return py_arg_reader(py_var_file)
+
+    py_var_paths = list(py_arg_objects)
+    py_var_workers = max(1, min(int(py_arg_max_workers or 16), len(py_var_paths)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=py_var_workers) as py_var_pool:
+        py_var_futures = [py_var_pool.submit(py_fn_read, py_var_path) for py_var_path in py_var_paths]
+        try:
+            py_var_frames = [py_var_future.result() for py_var_future in py_var_futures]
+        except BaseException:
+            for py_var_future in py_var_futures:
+                py_var_future.cancel()
+            raise
+    return pd.concat(py_var_frames, ignore_index=True)
+
+
+def py_fn_s3_upload(py_arg_fs, py_arg_path, py_arg_data, py_arg_part_size_mb=50, py_arg_max_workers=8):
+    """
+    Upload bytes to an S3 object. Payloads larger than one part are sent as a multipart upload whose parts
+    are uploaded by py_arg_max_workers threads. A failed upload is aborted so that no orphan parts are billed.
+    """
+    py_var_part_size = max(int(py_arg_part_size_mb or 50), 5) * 2 ** 20
+    py_var_bucket, py_var_key, _ = py_arg_fs.split_path(py_arg_path)
+    if len(py_arg_data) <= py_var_part_size:
+        py_arg_fs.call_s3("put_object", Bucket=py_var_bucket, Key=py_var_key, Body=bytes(py_arg_data))
+        py_arg_fs.invalidate_cache(py_arg_path)
+        return
+    # S3 accepts up to 10,000 parts per object
+    py_var_part_size = max(py_var_part_size, -(-len(py_arg_data) // 10_000))
+    py_var_view = memoryview(py_arg_data)
+    py_var_upload_id = py_arg_fs.call_s3("create_multipart_upload", Bucket=py_var_bucket, Key=py_var_key)["UploadId"]
+
+    def py_fn_upload_part(py_arg_number):
+        py_var_start = (py_arg_number - 1) * py_var_part_size
+        py_var_part = py_arg_fs.call_s3(
+            "upload_part", Bucket=py_var_bucket, Key=py_var_key, UploadId=py_var_upload_id,
+            PartNumber=py_arg_number, Body=bytes(py_var_view[py_var_start:py_var_start + py_var_part_size])
+        )
+        return {"PartNumber": py_arg_number, "ETag": py_var_part["ETag"]}
+
+    py_var_numbers = range(1, -(-len(py_arg_data) // py_var_part_size) + 1)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(int(py_arg_max_workers or 8), len(py_var_numbers)))) as py_var_pool:
+            py_var_futures = [py_var_pool.submit(py_fn_upload_part, py_var_number) for py_var_number in py_var_numbers]
+            try:
+                py_var_parts = [py_var_future.result() for py_var_future in py_var_futures]
+            except BaseException:
+                for py_var_future in py_var_futures:
+                    py_var_future.cancel()
+                raise
+        py_arg_fs.call_s3(
+            "complete_multipart_upload", Bucket=py_var_bucket, Key=py_var_key, UploadId=py_var_upload_id,
+            MultipartUpload={"Parts": py_var_parts}
+        )
+    except BaseException:
+        py_arg_fs.call_s3("abort_multipart_upload", Bucket=py_var_bucket, Key=py_var_key, UploadId=py_var_upload_id)
+        raise
+    finally:
+        py_arg_fs.invalidate_cache(py_arg_path)
+
+
+def py_fn_s3_write_frame(py_arg_frame, py_arg_path, py_arg_writer, py_arg_storage_options=None, py_arg_part_size_mb=50, py_arg_max_workers=8, py_arg_partition_cols=None):
+    """
+    Serialize a DataFrame in memory with py_arg_writer(frame, buffer) and upload it to py_arg_path in concurrent parts.
+    With py_arg_partition_cols, each group is written to <folder>/<column>=<value>/.../<file name> without the
+    partition columns, and the groups are uploaded concurrently.
+    """
+    py_var_fs = s3fs.S3FileSystem(**(py_arg_storage_options or {}))
+    py_var_max_workers = max(1, int(py_arg_max_workers or 8))
+
+    def py_fn_serialize(py_arg_data):
+        py_var_buffer = io.BytesIO()
+        py_arg_writer(py_arg_data, py_var_buffer)
+        return py_var_buffer.getbuffer()
+
+    if not py_arg_partition_cols:
+        py_fn_s3_upload(py_var_fs, py_arg_path, py_fn_serialize(py_arg_frame), py_arg_part_size_mb, py_var_max_workers)
+        return
+
+    py_var_folder, py_var_name = posixpath.split(py_arg_path)
+    py_var_groups = py_arg_frame.groupby(list(py_arg_partition_cols), dropna=False, sort=False, observed=True)
+    # Groups and parts share the thread budget
+    py_var_group_workers = max(1, min(py_var_max_workers, py_var_groups.ngroups))
+    py_var_part_workers = max(1, py_var_max_workers // py_var_group_workers)
+
+    def py_fn_write_group(py_arg_values, py_arg_group):
+        py_var_values = py_arg_values if isinstance(py_arg_values, tuple) else (py_arg_values,)
+        py_var_prefix = "/".join(
+            f"{py_var_column}={'__HIVE_DEFAULT_PARTITION__' if pd.isna(py_var_value) else py_var_value}"
+            for py_var_column, py_var_value in zip(py_arg_partition_cols, py_var_values)
+        )
+        py_var_data = py_arg_group.drop(columns=list(py_arg_partition_cols))
+        py_fn_s3_upload(py_var_fs, f"{py_var_folder}/{py_var_prefix}/{py_var_name}", py_fn_serialize(py_var_data), py_arg_part_size_mb, py_var_part_workers)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=py_var_group_workers) as py_var_pool:
+        py_var_futures = [py_var_pool.submit(py_fn_write_group, py_var_values, py_var_group) for py_var_values, py_var_group in py_var_groups]
+        try:
+            for py_var_future in concurrent.futures.as_completed(py_var_futures):
+                py_var_future.result()
+        except BaseException:
+            for py_var_future in py_var_futures:
+                py_var_future.cancel()
+            raise
+`;
+        return [tsS3TransferFunctions];
+    }
+}
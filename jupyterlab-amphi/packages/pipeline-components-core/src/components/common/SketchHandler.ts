@@ -0,0 +1,136 @@
+export class SketchHandler {
+    // Imports needed by the sketch helpers
+    public static provideImports(): string[] {
+        return [
+            "import numpy as np",
+            "import pandas as pd"
+        ];
+    }
+
+    // Python helpers computing approximate statistics in one chunked pass, with error bounds
+    public static provideFunctions(): string[] {
+        const tsSketchFunctions = `
+def py_fn_sketch_chunks(py_arg_data, py_arg_chunk_rows=1_000_000):
+    # Row chunks of a DataFrame, or the chunks of a chunked stream as they come
+    if not isinstance(py_arg_data, pd.DataFrame):
+        yield from py_arg_data
+        return
+    for py_var_start in range(0, len(py_arg_data), py_arg_chunk_rows):
+        yield py_arg_data.iloc[py_var_start:py_var_start + py_arg_chunk_rows]
+
+
+def py_fn_sketch_hash(py_arg_values):
+    # 64-bit hashes of a Series or DataFrame rows, equal values hash equally whatever the chunk
+    return pd.util.hash_pandas_object(py_arg_values, index=False).to_numpy()
+
+
+def py_fn_hll_new(py_arg_precision=14):
+    # HyperLogLog registers, the relative standard error of the distinct count is 1.04 / sqrt(2 ** precision)
+    return np.zeros(1 << py_arg_precision, dtype=np.uint8)
+
+
+def py_fn_hll_update(py_arg_registers, py_arg_hashes):
+    py_var_precision = int(len(py_arg_registers)).bit_length() - 1
+    py_var_index = (py_arg_hashes >> np.uint64(64 - py_var_precision)).astype(np.intp)
+    # Leading zeros of the remaining bits, a sentinel bit bounds the rank
+    py_var_rest = (py_arg_hashes << np.uint64(py_var_precision)) | np.uint64(1 << (py_var_precision - 1))
+    _, py_var_exponent = np.frexp((py_var_rest >> np.uint64(11)).astype(np.float64))
+    py_var_rank = (64 - 11 - py_var_exponent + 1).astype(np.uint8)
+    np.maximum.at(py_arg_registers, py_var_index, py_var_rank)
+
+
+def py_fn_hll_count(py_arg_registers):
+    # Distinct count estimate and its relative standard error
+    py_var_m = len(py_arg_registers)
+    py_var_alpha = 0.7213 / (1 + 1.079 / py_var_m)
+    py_var_estimate = py_var_alpha * py_var_m * py_var_m / np.sum(np.ldexp(1.0, -py_arg_registers.astype(np.int64)))
+    py_var_zeros = int(np.count_nonzero(py_arg_registers == 0))
+    if py_var_estimate <= 2.5 * py_var_m and py_var_zeros:
+        # Linear counting is more accurate for small cardinalities
+        py_var_estimate = py_var_m * np.log(py_var_m / py_var_zeros)
+    return py_var_estimate, 1.04 / np.sqrt(py_var_m)
+
+
+def py_fn_kll_new(py_arg_capacity=2048, py_arg_seed=0):
+    # Quantile sketch made of sorted compactors, items of level h weigh 2 ** h
+    return {"capacity": py_arg_capacity, "levels": [], "error": 0, "n": 0, "rng": np.random.default_rng(py_arg_seed)}
+
+
+def py_fn_kll_update(py_arg_sketch, py_arg_values):
+    py_arg_sketch["n"] += len(py_arg_values)
+    py_var_levels = py_arg_sketch["levels"]
+    py_var_values = np.sort(py_arg_values)
+    py_var_level = 0
+    while len(py_var_values):
+        if py_var_level == len(py_var_levels):
+            py_var_levels.append(py_var_values[:0])
+        py_var_merged = np.sort(np.concatenate([py_var_levels[py_var_level], py_var_values]), kind="mergesort")
+        if len(py_var_merged) <= py_arg_sketch["capacity"]:
+            py_var_levels[py_var_level] = py_var_merged
+            return
+        # Keep one item of each pair, from a random offset, at twice the weight. Any rank moves by at most the item weight.
+        py_var_even = len(py_var_merged) - len(py_var_merged) % 2
+        py_var_values = py_var_merged[int(py_arg_sketch["rng"].integers(2)):py_var_even:2]
+        py_var_levels[py_var_level] = py_var_merged[py_var_even:]
+        py_arg_sketch["error"] += 1 << py_var_level
+        py_var_level += 1
+
+
+def py_fn_kll_quantiles(py_arg_sketch, py_arg_quantiles):
+    # Approximate quantiles and the bound of their rank error, as a fraction of the count
+    py_var_items = [py_var_items for py_var_items in py_arg_sketch["levels"] if len(py_var_items)]
+    if not py_var_items:
+        return [None] * len(py_arg_quantiles), 0.0
+    py_var_weights = np.concatenate([np.full(len(py_var_level_items), 1 << py_var_level, dtype=np.int64) for py_var_level, py_var_level_items in enumerate(py_arg_sketch["levels"]) if len(py_var_level_items)])
+    py_var_items = np.concatenate(py_var_items)
+    py_var_order = np.argsort(py_var_items, kind="mergesort")
+    py_var_cumulative = np.cumsum(py_var_weights[py_var_order])
+    py_var_positions = np.searchsorted(py_var_cumulative, np.asarray(py_arg_quantiles) * (py_var_cumulative[-1] - 1), side="right")
+    py_var_values = py_var_items[py_var_order][np.minimum(py_var_positions, len(py_var_items) - 1)]
+    return list(py_var_values), py_arg_sketch["error"] / max(py_arg_sketch["n"], 1)
+
+
+def py_fn_mg_new(py_arg_capacity=1000):
+    # Misra-Gries frequent items summary: estimates are at most "error" below the true frequencies
+    return {"capacity": py_arg_capacity, "counts": pd.Series(dtype="int64"), "error": 0, "n": 0}
+
+
+def py_fn_mg_update(py_arg_sketch, py_arg_values):
+    py_arg_sketch["n"] += len(py_arg_values)
+    py_var_counts = py_arg_sketch["counts"].add(py_arg_values.value_counts(sort=False, dropna=True), fill_value=0).astype("int64")
+    if len(py_var_counts) > py_arg_sketch["capacity"]:
+        # Merge rule of mergeable summaries: subtract the (capacity + 1)-th largest count from the capacity largest ones.
+        # Counters left at 0 are kept, so a column of distinct values still has candidates for its most frequent value
+        py_var_counts = py_var_counts.nlargest(py_arg_sketch["capacity"] + 1)
+        py_var_threshold = int(py_var_counts.iloc[-1])
+        py_var_counts = py_var_counts.iloc[:-1] - py_var_threshold
+        py_arg_sketch["error"] += py_var_threshold
+    py_arg_sketch["counts"] = py_var_counts
+
+
+def py_fn_mg_exact(py_arg_sketch):
+    # True while nothing was ever dropped: the counts are then the exact frequencies of every value
+    return py_arg_sketch["error"] == 0
+
+
+def py_fn_sketch_numbers(py_arg_series):
+    """
+    Float view of a numeric, boolean or datetime Series without its nulls, for moments and quantiles,
+    and the function converting a result back to the type of the Series.
+    """
+    if pd.api.types.is_datetime64_any_dtype(py_arg_series.dtype):
+        py_var_tz = getattr(py_arg_series.dtype, "tz", None)
+        py_var_values = py_arg_series.dropna().to_numpy(dtype="datetime64[ns]").view("int64").astype(np.float64)
+
+        def py_fn_back(py_arg_value, py_arg_delta=False):
+            if py_arg_delta:
+                return pd.Timedelta(int(round(py_arg_value)))
+            py_var_timestamp = pd.Timestamp(int(round(py_arg_value)))
+            return py_var_timestamp.tz_localize("UTC").tz_convert(py_var_tz) if py_var_tz else py_var_timestamp
+
+        return py_var_values, py_fn_back
+    return py_arg_series.dropna().to_numpy(dtype=np.float64), lambda py_arg_value, py_arg_delta=False: py_arg_value
+`;
+        return [tsSketchFunctions];
+    }
+}
@@ -0,0 +1,283 @@
+import { ChunkUtils } from '@amphi/pipeline-components-manager';
+
+export class SpillHandler {
+    // Spill fields shared by the components that can run out of core
+    public static getSpillFields(tooltip: string): object[] {
+        return [
+            {
+                type: "boolean",
+                label: "Spill to disk",
+                id: "tsCFbooleanSpillToDisk",
+                tooltip: tooltip,
+                advanced: true
+            },
+            {
+                type: "inputNumber",
+                label: "Memory budget (MB)",
+                id: "tsCFinputNumberSpillMemory",
+                tooltip: "Memory the component may use for the rows it holds at once, the rest stays on disk.",
+                placeholder: "Default: 512",
+                min: 16,
+                condition: { tsCFbooleanSpillToDisk: true },
+                advanced: true
+            },
+            {
+                type: "input",
+                label: "Temporary directory",
+                id: "tsCFinputSpillDirectory",
+                tooltip: "Directory of the spilled files, removed once the result is no longer used. Pick a disk with enough free space for the data.",
+                placeholder: "Default: system temporary directory",
+                condition: { tsCFbooleanSpillToDisk: true },
+                advanced: true
+            }
+        ];
+    }
+
+    public static isSpilled(config): boolean {
+        return !!config.tsCFbooleanSpillToDisk;
+    }
+
+    public static provideImports(): string[] {
+        return [
+            "import os",
+            "import shutil",
+            "import tempfile",
+            "import weakref",
+            "import numpy as np",
+            "import pandas as pd",
+            "import pyarrow as pa",
+            "import pyarrow.parquet as pq"
+        ];
+    }
+
+    // Python helpers partitioning or sorting the rows in Parquet runs on disk, results are chunked streams
+    public static provideFunctions(): string[] {
+        const tsSpillFunctions = `
+def py_fn_spill_chunks(py_arg_data, py_arg_memory_mb):
+    # Chunks of a stream, DataFrames cut in slices of about a quarter of the memory budget
+    for py_var_frame in ([py_arg_data] if isinstance(py_arg_data, pd.DataFrame) else py_arg_data):
+        if py_var_frame.empty:
+            yield py_var_frame
+            continue
+        py_var_row_bytes = py_fn_spill_row_bytes(py_var_frame)
+        py_var_rows = max(int(py_arg_memory_mb * 2 ** 20 / 4 / py_var_row_bytes), 1)
+        for py_var_start in range(0, len(py_var_frame), py_var_rows):
+            yield py_var_frame.iloc[py_var_start:py_var_start + py_var_rows]
+
+
+def py_fn_spill_row_bytes(py_arg_frame):
+    # Memory of one row, measured on the leading rows
+    py_var_sample = py_arg_frame.head(10_000)
+    return max(py_var_sample.memory_usage(deep=True, index=False).sum() / max(len(py_var_sample), 1), 1.0)
+
+
+def py_fn_spill_read(py_arg_path):
+    # Read back a spilled run and delete it
+    py_var_frame = pd.read_parquet(py_arg_path)
+    os.remove(py_arg_path)
+    return py_var_frame
+
+
+def py_fn_spill_stream(py_arg_paths, py_arg_directory, py_arg_empty):
+    # Chunked stream over the result runs, the spill directory is removed with the stream
+    py_var_stream = py_cls_chunked_frame(lambda: (pd.read_parquet(py_var_path) for py_var_path in py_arg_paths) if py_arg_paths else iter([py_arg_empty]))
+    weakref.finalize(py_var_stream, shutil.rmtree, py_arg_directory, True)
+    return py_var_stream
+
+
+def py_fn_spill_hash_frame(py_arg_frame):
+    """
+    Key columns in types shared by every chunk, for hashing. Chunks converted one by one may hold a key as Int64
+    in one chunk and Float64 in another: numbers are hashed as float64 and other values as Python objects,
+    with None for every kind of null, so that equal values land in the same partition.
+    """
+    py_var_columns = {}
+    for py_var_position in range(py_arg_frame.shape[1]):
+        py_var_series = py_arg_frame.iloc[:, py_var_position]
+        if pd.api.types.is_numeric_dtype(py_var_series.dtype):
+            py_var_columns[py_var_position] = py_var_series.to_numpy(dtype="float64", na_value=np.nan)
+        elif pd.api.types.is_datetime64_any_dtype(py_var_series.dtype):
+            py_var_columns[py_var_position] = py_var_series
+        else:
+            py_var_columns[py_var_position] = py_var_series.astype(object).where(py_var_series.notna(), None)
+    return pd.DataFrame(py_var_columns, index=py_arg_frame.index)
+
+
+def py_fn_spill_partition(py_arg_chunks, py_arg_keys, py_arg_directory, py_arg_prefix, py_arg_fanout):
+    """
+    Write the rows in py_arg_fanout partitions by hash of the key columns (all columns when None), one Parquet run
+    per chunk and partition. Returns the run paths of each partition, the memory of a row and an empty frame.
+    """
+    # The hash key changes with the prefix so that a partition split again spreads over new partitions
+    py_var_hash_key = (py_arg_prefix + "amphi_spill_key_")[:16]
+    py_var_paths = [[] for _ in range(py_arg_fanout)]
+    py_var_row_bytes = 1.0
+    py_var_empty = None
+    for py_var_number, py_var_chunk in enumerate(py_arg_chunks):
+        if py_var_empty is None:
+            py_var_empty = py_var_chunk.head(0)
+        if py_var_chunk.empty:
+            continue
+        py_var_row_bytes = max(py_var_row_bytes, py_fn_spill_row_bytes(py_var_chunk))
+        py_var_hashes = pd.util.hash_pandas_object(py_fn_spill_hash_frame(py_var_chunk if py_arg_keys is None else py_var_chunk[py_arg_keys]), index=False, hash_key=py_var_hash_key).to_numpy()
+        py_var_partitions = (py_var_hashes % np.uint64(py_arg_fanout)).astype(np.intp)
+        for py_var_partition in np.unique(py_var_partitions):
+            py_var_path = os.path.join(py_arg_directory, f"{py_arg_prefix}p{py_var_partition:03d}-r{py_var_number:06d}.parquet")
+            py_var_chunk[py_var_partitions == py_var_partition].to_parquet(py_var_path, index=False)
+            py_var_paths[py_var_partition].append(py_var_path)
+    return py_var_paths, py_var_row_bytes, py_var_empty
+
+
+def py_fn_spill_reduce(py_arg_paths, py_arg_keys, py_arg_reduce, py_arg_directory, py_arg_prefix, py_arg_memory_mb, py_arg_row_bytes, py_arg_fanout):
+    # Reduce every partition that fits the memory budget, split the others again with another hash
+    for py_var_partition, py_var_runs in enumerate(py_arg_paths):
+        if not py_var_runs:
+            continue
+        py_var_rows = sum(pq.ParquetFile(py_var_run).metadata.num_rows for py_var_run in py_var_runs)
+        py_var_prefix = f"{py_arg_prefix}p{py_var_partition:03d}_"
+        # A partition still too large after a few splits holds a few very frequent keys, it is reduced as it is
+        if py_var_rows * py_arg_row_bytes > py_arg_memory_mb * 2 ** 20 / 2 and len(py_var_prefix) < 24:
+            py_var_sub_paths, _, _ = py_fn_spill_partition((py_fn_spill_read(py_var_run) for py_var_run in py_var_runs), py_arg_keys, py_arg_directory, py_var_prefix, py_arg_fanout)
+            yield from py_fn_spill_reduce(py_var_sub_paths, py_arg_keys, py_arg_reduce, py_arg_directory, py_var_prefix, py_arg_memory_mb, py_arg_row_bytes, py_arg_fanout)
+        else:
+            yield py_arg_reduce(pd.concat([py_fn_spill_read(py_var_run) for py_var_run in py_var_runs], ignore_index=True))
+
+
+def py_fn_spill_apply(py_arg_data, py_arg_keys, py_arg_reduce, py_arg_memory_mb=512, py_arg_temp_dir=None, py_arg_fanout=16):
+    """
+    Out-of-core group operation: the rows are partitioned on disk by hash of the key columns, so that all the rows
+    of a key land in the same partition, then py_arg_reduce (DataFrame -> DataFrame) runs on one partition at a time.
+    Returns a chunked stream of the results, in partition order.
+    """
+    py_var_directory = tempfile.mkdtemp(prefix="amphi_spill_", dir=py_arg_temp_dir or None)
+    try:
+        py_var_paths, py_var_row_bytes, py_var_empty = py_fn_spill_partition(py_fn_spill_chunks(py_arg_data, py_arg_memory_mb), py_arg_keys, py_var_directory, "", py_arg_fanout)
+        py_var_results = []
+        for py_var_result in py_fn_spill_reduce(py_var_paths, py_arg_keys, py_arg_reduce, py_var_directory, "", py_arg_memory_mb, py_var_row_bytes, py_arg_fanout):
+            py_var_path = os.path.join(py_var_directory, f"out-{len(py_var_results):06d}.parquet")
+            py_var_result.to_parquet(py_var_path, index=False)
+            py_var_results.append(py_var_path)
+        py_var_empty = py_arg_reduce(py_var_empty if py_var_empty is not None else pd.DataFrame())
+    except BaseException:
+        shutil.rmtree(py_var_directory, ignore_errors=True)
+        raise
+    return py_fn_spill_stream(py_var_results, py_var_directory, py_var_empty)
+
+
+def py_fn_spill_write_run(py_arg_frames, py_arg_path):
+    # Write frames one after the other as the row groups of a single Parquet run
+    py_var_writer = None
+    try:
+        for py_var_frame in py_arg_frames:
+            py_var_table = pa.Table.from_pandas(py_var_frame, preserve_index=False)
+            if py_var_writer is None:
+                py_var_writer = pq.ParquetWriter(py_arg_path, py_var_table.schema)
+            py_var_writer.write_table(py_var_table.cast(py_var_writer.schema))
+    finally:
+        if py_var_writer is not None:
+            py_var_writer.close()
+
+
+def py_fn_spill_merge(py_arg_runs, py_arg_by, py_arg_ascending, py_arg_batch_rows):
+    """
+    Merge sorted Parquet runs into sorted frames, reading each run by batches. Each step sorts the buffered rows and
+    emits them up to the last buffered row of the run that is behind the others: no unread row can sort before it.
+    """
+    py_var_readers = {py_var_index: pq.ParquetFile(py_var_run).iter_batches(batch_size=py_arg_batch_rows) for py_var_index, py_var_run in enumerate(py_arg_runs)}
+    py_var_buffers = {}
+
+    def py_fn_refill(py_arg_index):
+        py_var_batch = next(py_var_readers[py_arg_index], None)
+        if py_var_batch is None:
+            del py_var_readers[py_arg_index]
+            return
+        py_var_frame = pa.Table.from_batches([py_var_batch]).to_pandas()
+        py_var_frame["__amphi_run"] = py_arg_index
+        py_var_buffers[py_arg_index] = pd.concat([py_var_buffers[py_arg_index], py_var_frame], ignore_index=True) if py_arg_index in py_var_buffers else py_var_frame
+
+    for py_var_index in list(py_var_readers):
+        py_fn_refill(py_var_index)
+    while py_var_buffers:
+        py_var_merged = pd.concat(list(py_var_buffers.values()), ignore_index=True).sort_values(py_arg_by, ascending=py_arg_ascending, kind="mergesort", ignore_index=True)
+        py_var_run_of_row = py_var_merged["__amphi_run"].to_numpy()
+        py_var_cut = len(py_var_merged)
+        for py_var_index in py_var_readers:
+            py_var_cut = min(py_var_cut, int(np.flatnonzero(py_var_run_of_row == py_var_index)[-1]) + 1)
+        yield py_var_merged.iloc[:py_var_cut].drop(columns="__amphi_run")
+        py_var_rest = py_var_merged.iloc[py_var_cut:]
+        py_var_buffers = {py_var_index: py_var_frame for py_var_index, py_var_frame in py_var_rest.groupby("__amphi_run", sort=False)}
+        for py_var_index in list(py_var_readers):
+            if py_var_index not in py_var_buffers:
+                py_fn_refill(py_var_index)
+
+
+def py_fn_spill_sort(py_arg_data, py_arg_by, py_arg_ascending, py_arg_memory_mb=512, py_arg_temp_dir=None, py_arg_fan_in=32):
+    """
+    External merge sort: chunks of a quarter of the memory budget are sorted and spilled as Parquet runs, runs are
+    merged py_arg_fan_in at a time until one merge is left, which streams the sorted rows.
+    Returns a chunked stream of the sorted rows.
+    """
+    py_var_directory = tempfile.mkdtemp(prefix="amphi_spill_", dir=py_arg_temp_dir or None)
+    try:
+        py_var_runs = []
+        py_var_row_bytes = 1.0
+        py_var_empty = None
+        for py_var_chunk in py_fn_spill_chunks(py_arg_data, py_arg_memory_mb):
+            if py_var_empty is None:
+                py_var_empty = py_var_chunk.head(0).reset_index(drop=True)
+            if py_var_chunk.empty:
+                continue
+            py_var_row_bytes = max(py_var_row_bytes, py_fn_spill_row_bytes(py_var_chunk))
+            py_var_path = os.path.join(py_var_directory, f"run-0-{len(py_var_runs):06d}.parquet")
+            py_var_chunk.sort_values(py_arg_by, ascending=py_arg_ascending, kind="mergesort").to_parquet(py_var_path, index=False)
+            py_var_runs.append(py_var_path)
+
+        # Merge buffers share half of the budget, with batches of at least 1,000 rows
+        py_var_batch_rows = max(int(py_arg_memory_mb * 2 ** 20 / 2 / py_arg_fan_in / py_var_row_bytes), 1_000)
+        py_var_pass = 0
+        while len(py_var_runs) > py_arg_fan_in:
+            py_var_pass += 1
+            py_var_merged_runs = []
+            for py_var_start in range(0, len(py_var_runs), py_arg_fan_in):
+                py_var_group = py_var_runs[py_var_start:py_var_start + py_arg_fan_in]
+                py_var_path = os.path.join(py_var_directory, f"run-{py_var_pass}-{len(py_var_merged_runs):06d}.parquet")
+                py_fn_spill_write_run(py_fn_spill_merge(py_var_group, py_arg_by, py_arg_ascending, py_var_batch_rows), py_var_path)
+                for py_var_run in py_var_group:
+                    os.remove(py_var_run)
+                py_var_merged_runs.append(py_var_path)
+            py_var_runs = py_var_merged_runs
+
+        # Merge steps may emit few rows, they are gathered in result runs of about a quarter of the budget
+        py_var_chunk_rows = max(int(py_arg_memory_mb * 2 ** 20 / 4 / py_var_row_bytes), 1)
+        py_var_results = []
+        py_var_pending = []
+
+        def py_fn_flush():
+            py_var_path = os.path.join(py_var_directory, f"out-{len(py_var_results):06d}.parquet")
+            pd.concat(py_var_pending, ignore_index=True).to_parquet(py_var_path, index=False)
+            py_var_results.append(py_var_path)
+            py_var_pending.clear()
+
+        for py_var_frame in py_fn_spill_merge(py_var_runs, py_arg_by, py_arg_ascending, py_var_batch_rows):
+            py_var_pending.append(py_var_frame)
+            if sum(len(py_var_item) for py_var_item in py_var_pending) >= py_var_chunk_rows:
+                py_fn_flush()
+        if py_var_pending:
+            py_fn_flush()
+        for py_var_run in py_var_runs:
+            os.remove(py_var_run)
+    except BaseException:
+        shutil.rmtree(py_var_directory, ignore_errors=True)
+        raise
+    return py_fn_spill_stream(py_var_results, py_var_directory, py_var_empty if py_var_empty is not None else pd.DataFrame())
+`;
+        return [...ChunkUtils.provideFunctions(), tsSpillFunctions];
+    }
+
+    // Memory budget and temporary directory arguments of py_fn_spill_apply and py_fn_spill_sort
+    public static generateOptionsCode(config): string {
+        const memory = config.tsCFinputNumberSpillMemory || 512;
+        const directory = (config.tsCFinputSpillDirectory || "").trim();
+        return `, py_arg_memory_mb=${memory}, py_arg_temp_dir=${directory ? `r"${directory}"` : "None"}`;
+    }
+}
@@ -54,6 +54,7 @@ export { Sample } from './transforms/Sample';
 export { Sort } from './transforms/Sort';
 export { RenameColumns } from './transforms/RenameColumns/RenameColumns';
 export { TypeConverter } from './transforms/TypeConverter';
+export { OptimizeMemory } from './transforms/OptimizeMemory';
 export { Extract } from './transforms/Extract';
 export { FilterColumns } from './transforms/FilterColumns';
 export { Join } from './transforms/join/BasicJoin';
@@ -70,6 +71,7 @@ export { Summary } from './transforms/Summary';
 export { FrequencyAnalysis } from './transforms/FrequencyAnalysis';
 export { UniqueKeyDetector } from './transforms/UniqueKeyDetector';
 export { FileAction } from './transforms/files/FileAction';
+export { ForLoop } from './orchestration/ForLoop';
 export { HierarchyPath } from './transforms/HierarchyPath';
 export { CompareDataframes } from './transforms/CompareDataframes';
 export { CorrelationMatrix } from './transforms/CorrelationMatrix';
@@ -14,7 +14,12 @@ export class RestInput extends BaseCoreComponent {
 		tsCFtextareaRestApiBodyJSON : "",
 		tsCFbooleanRestApiResponseAsString : false,
         tsCFfileRestApiDownloadFilePath : "",
-        tsCFkeyvalueRestApiUploadFilePaths : []
+        tsCFkeyvalueRestApiUploadFilePaths : [],
+        tsCFselectRestApiPagination : "none",
+        tsCFinputRestApiPageParam : "",
+        tsCFinputRestApiLimitParam : "",
+        tsCFinputRestApiCursorPath : "",
+        tsCFinputRestApiRecordsPath : ""
 	};
     const form = {
       idPrefix: 'component__form_name_input_hello_df',
@@ -112,6 +117,101 @@ export class RestInput extends BaseCoreComponent {
           placeholder: "Type file name",
           condition: { tsCFSelectRestApiMethod: ["GET"]},
           advanced: true
+        },
+        {
+          type: "select",
+          label: "Pagination",
+          id: "tsCFselectRestApiPagination",
+          options: [
+            { value: "none", label: "None", tooltip: "Send a single request." },
+            { value: "offset", label: "Offset", tooltip: "Pages are requested with an offset parameter (0, page size, 2 x page size...). Pages can be fetched concurrently." },
+            { value: "page", label: "Page number", tooltip: "Pages are requested with a page number parameter (1, 2, 3...). Pages can be fetched concurrently." },
+            { value: "cursor", label: "Cursor", tooltip: "Each response gives the cursor of the next page." },
+            { value: "link", label: "Link header", tooltip: "Each response gives the URL of the next page in its Link header." }
+          ],
+          advanced: true
+        },
+        {
+          type: "input",
+          label: "Page parameter",
+          id: "tsCFinputRestApiPageParam",
+          tooltip: "Query parameter carrying the offset, page number or cursor.",
+          placeholder: "Default: offset, page or cursor",
+          condition: { tsCFselectRestApiPagination: ["offset", "page", "cursor"]},
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Page size",
+          id: "tsCFinputNumberRestApiPageSize",
+          tooltip: "Number of records per page. A page with fewer records is the last one.",
+          min: 1,
+          condition: { tsCFselectRestApiPagination: ["offset", "page", "cursor", "link"]},
+          advanced: true
+        },
+        {
+          type: "input",
+          label: "Page size parameter",
+          id: "tsCFinputRestApiLimitParam",
+          tooltip: "Query parameter carrying the page size, leave empty if the API does not take one.",
+          placeholder: "limit",
+          condition: { tsCFselectRestApiPagination: ["offset", "page", "cursor", "link"]},
+          advanced: true
+        },
+        {
+          type: "input",
+          label: "Next cursor path",
+          id: "tsCFinputRestApiCursorPath",
+          tooltip: "Dotted path of the next cursor in the JSON response.",
+          placeholder: "meta.next_cursor",
+          condition: { tsCFselectRestApiPagination: ["cursor"]},
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Max pages",
+          id: "tsCFinputNumberRestApiMaxPages",
+          placeholder: "No limit",
+          min: 1,
+          condition: { tsCFselectRestApiPagination: ["offset", "page", "cursor", "link"]},
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Concurrent requests",
+          id: "tsCFinputNumberRestApiConcurrency",
+          tooltip: "Number of pages fetched at the same time on a shared connection pool.",
+          placeholder: "Default: 1",
+          min: 1,
+          max: 64,
+          condition: { tsCFselectRestApiPagination: ["offset", "page"]},
+          advanced: true
+        },
+        {
+          type: "input",
+          label: "Records path",
+          id: "tsCFinputRestApiRecordsPath",
+          tooltip: "Dotted path of the records in the JSON response ($ for the whole body). When set, the output has one row per record of all the pages instead of one row per response.",
+          placeholder: "data.items",
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Requests per second",
+          id: "tsCFinputNumberRestApiRateLimit",
+          placeholder: "No limit",
+          min: 0,
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Retries",
+          id: "tsCFinputNumberRestApiMaxRetries",
+          tooltip: "Retries on connection errors, timeouts and 429/5xx responses, waiting for the Retry-After header when the server sends one.",
+          placeholder: "Default: 0",
+          min: 0,
+          max: 10,
+          advanced: true
         }
       ]
     };
@@ -123,6 +223,11 @@ export class RestInput extends BaseCoreComponent {
   provideImports() {
     return ["import requests",
 "import pandas as pd",
+"import time",
+"import threading",
+"import email.utils",
+"from requests.adapters import HTTPAdapter",
+"from concurrent.futures import ThreadPoolExecutor",
 "from typing import Optional, Union, Dict, Tuple, List"
 ];
   }
@@ -130,6 +235,177 @@ export class RestInput extends BaseCoreComponent {
 provideFunctions({ config }): string[] {
     const prefix = config?.backend?.prefix ?? "pd";
     const tsRestAPIInputFunction = `
+def py_fn_rest_api_throttle(py_arg_rate_limit: Optional[float] = None):
+    # Returns a function that waits for the next request slot, at most py_arg_rate_limit requests per second
+    if not py_arg_rate_limit:
+        return lambda: None
+    py_var_interval = 1.0 / float(py_arg_rate_limit)
+    py_var_lock = threading.Lock()
+    py_var_state = {"next": time.monotonic()}
+
+    def py_fn_wait():
+        with py_var_lock:
+            py_var_now = time.monotonic()
+            py_var_slot = max(py_var_state["next"], py_var_now)
+            py_var_state["next"] = py_var_slot + py_var_interval
+        if py_var_slot > py_var_now:
+            time.sleep(py_var_slot - py_var_now)
+
+    return py_fn_wait
+
+
+def py_fn_rest_api_retry_after(py_arg_value: Optional[str]) -> Optional[float]:
+    # Seconds to wait from a Retry-After header, given either in seconds or as an HTTP date
+    if not py_arg_value:
+        return None
+    try:
+        return max(float(py_arg_value), 0.0)
+    except ValueError:
+        pass
+    py_var_date = email.utils.parsedate_tz(py_arg_value)
+    if py_var_date is None:
+        return None
+    return max(email.utils.mktime_tz(py_var_date) - time.time(), 0.0)
+
+
+def py_fn_rest_api_send(py_arg_session, py_arg_throttle, py_arg_max_retries: Optional[int] = None, **py_arg_request):
+    """
+    Send one request on a pooled session. Connection errors, timeouts and 429/5xx responses are retried
+    up to py_arg_max_retries times, waiting for the Retry-After delay when the server sends one and
+    with an exponential backoff otherwise.
+    """
+    py_var_attempt = 0
+    while True:
+        py_arg_throttle()
+        for _, py_var_file in py_arg_request.get("files") or []:
+            py_var_file.seek(0)
+        py_var_wait = None
+        try:
+            response = py_arg_session.request(**py_arg_request)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if py_var_attempt >= (py_arg_max_retries or 0):
+                print("A request error occurred:", e)
+                raise
+        except requests.exceptions.RequestException as e:
+            print("A request error occurred:", e)
+            raise
+        else:
+            if response.status_code not in (429, 500, 502, 503, 504) or py_var_attempt >= (py_arg_max_retries or 0):
+                try:
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError as e:
+                    print("HTTP error occurred:", e)
+                    raise
+                return response
+            py_var_wait = py_fn_rest_api_retry_after(response.headers.get("Retry-After"))
+        py_var_attempt += 1
+        time.sleep(py_var_wait if py_var_wait is not None else min(2 ** (py_var_attempt - 1), 60))
+
+
+def py_fn_rest_api_json(py_arg_response):
+    # Parsed body of a JSON response (sometimes there may be a charset), None for other content types
+    if (py_arg_response.headers.get("Content-Type") or "")[:16] != "application/json":
+        return None
+    return py_arg_response.json()
+
+
+def py_fn_rest_api_value(py_arg_body, py_arg_path: Optional[str]):
+    # Value at a dotted path of a JSON body ("$" or no path is the body itself), None when it is missing
+    if py_arg_path in (None, "", "$"):
+        return py_arg_body
+    py_var_value = py_arg_body
+    for py_var_key in py_arg_path.split("."):
+        if isinstance(py_var_value, dict):
+            py_var_value = py_var_value.get(py_var_key)
+        elif isinstance(py_var_value, list) and py_var_key.lstrip("-").isdigit() and -len(py_var_value) <= int(py_var_key) < len(py_var_value):
+            py_var_value = py_var_value[int(py_var_key)]
+        else:
+            return None
+    return py_var_value
+
+
+def py_fn_rest_api_pages(
+    py_arg_send,
+    py_arg_pagination: Optional[str] = None,
+    py_arg_page_param: Optional[str] = None,
+    py_arg_page_size: Optional[int] = None,
+    py_arg_limit_param: Optional[str] = None,
+    py_arg_cursor_path: Optional[str] = None,
+    py_arg_records_path: Optional[str] = None,
+    py_arg_max_pages: Optional[int] = None,
+    py_arg_concurrency: int = 1
+) -> List[Tuple[requests.Response, object]]:
+    """
+    Fetch the pages of an endpoint and return (response, parsed JSON body) pairs in page order.
+    Offset and page number pagination fetch py_arg_concurrency pages at a time and stop at the first
+    short or empty page, they need the records of each page as a list: the body itself or the value at
+    py_arg_records_path. Cursor and link header pagination follow the pages one after the other.
+    """
+    py_var_max_pages = py_arg_max_pages or float("inf")
+    py_var_size_params = {py_arg_limit_param: py_arg_page_size} if py_arg_limit_param and py_arg_page_size else {}
+
+    def py_fn_fetch(py_arg_page_params=None, py_arg_page_url=None):
+        py_var_response = py_arg_send(py_arg_page_params, py_arg_page_url)
+        return py_var_response, py_fn_rest_api_json(py_var_response)
+
+    def py_fn_records_count(py_arg_body):
+        py_var_records = py_fn_rest_api_value(py_arg_body, py_arg_records_path)
+        return len(py_var_records) if isinstance(py_var_records, list) else None
+
+    if py_arg_pagination in (None, "none"):
+        return [py_fn_fetch()]
+
+    py_var_pages = []
+    if py_arg_pagination in ("offset", "page"):
+        if py_arg_pagination == "offset" and not py_arg_page_size:
+            raise ValueError("Offset pagination requires a page size")
+        py_var_param = py_arg_page_param or py_arg_pagination
+        py_var_first, py_var_step = (0, py_arg_page_size) if py_arg_pagination == "offset" else (1, 1)
+        with ThreadPoolExecutor(max_workers=py_arg_concurrency) as py_var_executor:
+            py_var_index = 0
+            while py_var_index < py_var_max_pages:
+                py_var_batch = range(py_var_index, int(min(py_var_index + py_arg_concurrency, py_var_max_pages)))
+                py_var_results = py_var_executor.map(
+                    lambda py_var_page: py_fn_fetch({py_var_param: py_var_first + py_var_page * py_var_step, **py_var_size_params}),
+                    py_var_batch
+                )
+                for py_var_result in py_var_results:
+                    py_var_count = py_fn_records_count(py_var_result[1])
+                    # Without a list of records, the end of the pages cannot be told apart from a page
+                    if py_var_count is None and py_arg_records_path in (None, "", "$"):
+                        raise ValueError(f"{py_arg_pagination.capitalize()} pagination requires a Records path when the response is not a list")
+                    if py_var_count != 0 or not py_var_pages:
+                        py_var_pages.append(py_var_result)
+                    if not py_var_count or (py_arg_page_size and py_var_count < py_arg_page_size):
+                        return py_var_pages
+                py_var_index += len(py_var_batch)
+    elif py_arg_pagination == "cursor":
+        if not py_arg_cursor_path:
+            raise ValueError("Cursor pagination requires the path of the next cursor in the response")
+        py_var_param = py_arg_page_param or "cursor"
+        py_var_cursor = None
+        while len(py_var_pages) < py_var_max_pages:
+            py_var_page_params = dict(py_var_size_params)
+            if py_var_cursor is not None:
+                py_var_page_params[py_var_param] = py_var_cursor
+            py_var_response, py_var_body = py_fn_fetch(py_var_page_params)
+            py_var_pages.append((py_var_response, py_var_body))
+            py_var_cursor = py_fn_rest_api_value(py_var_body, py_arg_cursor_path)
+            if py_var_cursor in (None, "") or py_fn_records_count(py_var_body) == 0:
+                break
+    elif py_arg_pagination == "link":
+        py_var_next_url = None
+        while len(py_var_pages) < py_var_max_pages:
+            py_var_response, py_var_body = py_fn_fetch(py_var_size_params, py_var_next_url)
+            py_var_pages.append((py_var_response, py_var_body))
+            py_var_next_url = py_var_response.links.get("next", {}).get("url")
+            if not py_var_next_url:
+                break
+    else:
+        raise ValueError(f"Invalid pagination: {py_arg_pagination}")
+    return py_var_pages
+
+
 def py_fn_rest_api_call(
     py_arg_url: str,
     py_arg_method: str = "GET",
@@ -144,7 +420,17 @@ def py_fn_rest_api_call(
     py_arg_timeout: Optional[Tuple[int, int]] = None,
     py_arg_response_as_string: bool = False,
     py_arg_upload_file_paths: Optional[Dict[str, str]] = None,
-    py_arg_save_path: Optional[str] = None
+    py_arg_save_path: Optional[str] = None,
+    py_arg_pagination: Optional[str] = None,
+    py_arg_page_param: Optional[str] = None,
+    py_arg_page_size: Optional[int] = None,
+    py_arg_limit_param: Optional[str] = None,
+    py_arg_cursor_path: Optional[str] = None,
+    py_arg_records_path: Optional[str] = None,
+    py_arg_max_pages: Optional[int] = None,
+    py_arg_concurrency: int = 1,
+    py_arg_rate_limit: Optional[float] = None,
+    py_arg_max_retries: Optional[int] = None
 ) -> pd.DataFrame:
 
     """
@@ -167,9 +453,20 @@ def py_fn_rest_api_call(
         py_arg_response_as_string (bool, optional): Whether to cast the response body and headers as strings. Defaults to False.
         py_arg_upload_file_paths (Optional[Dict[str, str]], optional): The list of file paths to upload. Defaults to None.
         py_arg_save_path (Optional[str], optional): The path to save the downloaded file. Defaults to None.
+        py_arg_pagination (Optional[str], optional): "offset", "page", "cursor" or "link" (Link header) to fetch every page. Defaults to None.
+        py_arg_page_param (Optional[str], optional): The query parameter carrying the offset, page number or cursor. Defaults to the pagination name.
+        py_arg_page_size (Optional[int], optional): The number of records per page, a shorter page is the last one. Defaults to None.
+        py_arg_limit_param (Optional[str], optional): The query parameter carrying the page size. Defaults to None.
+        py_arg_cursor_path (Optional[str], optional): The dotted path of the next cursor in the JSON response. Defaults to None.
+        py_arg_records_path (Optional[str], optional): The dotted path of the records in the JSON response ("$" for the whole body). Defaults to None.
+        py_arg_max_pages (Optional[int], optional): The maximum number of pages to fetch. Defaults to None.
+        py_arg_concurrency (int, optional): The number of pages fetched at the same time (offset and page pagination). Defaults to 1.
+        py_arg_rate_limit (Optional[float], optional): The maximum number of requests per second. Defaults to None.
+        py_arg_max_retries (Optional[int], optional): The number of retries on connection errors, 429 and 5xx responses. Defaults to None.
     Returns:
 
-        pd.DataFrame: A DataFrame containing the request parameters, response body, and response headers.
+        pd.DataFrame: A DataFrame containing the request parameters, response body, and response headers, one row per page.
+        With py_arg_records_path, a DataFrame of the records of all the pages.
 
     """
  
@@ -241,67 +538,101 @@ def py_fn_rest_api_call(
         files = []
         for field_name, file_path in py_arg_upload_file_paths.items():
             files.append((field_name, (open(file_path, "rb")))) 
-    # Send the request
-    try:
-        response = requests.request(
-            url=py_arg_url,
-            method=py_arg_method,
-            params=py_arg_params,
-            headers=py_arg_headers,
-            data=data,
-            json=json,
-            files=files,
-            proxies=py_arg_proxies,
-            cert=py_arg_cert,
-            timeout=py_arg_timeout
-        )		
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as e:
-        print("HTTP error occurred:", e)
-        raise
-    except requests.exceptions.RequestException as e:
-        print("A request error occurred:", e)
-        raise
+    # Send the requests on a pooled session, connections are reused across pages and retries
+    py_var_concurrency = max(int(py_arg_concurrency or 1), 1) if not files else 1
+    py_var_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=py_var_concurrency)
+    py_var_throttle = py_fn_rest_api_throttle(py_arg_rate_limit)
+    with requests.Session() as py_var_session:
+        py_var_session.mount("http://", py_var_adapter)
+        py_var_session.mount("https://", py_var_adapter)
+
+        def py_fn_send(py_arg_page_params=None, py_arg_page_url=None):
+            return py_fn_rest_api_send(
+                py_var_session,
+                py_var_throttle,
+                py_arg_max_retries,
+                url=py_arg_page_url or py_arg_url,
+                method=py_arg_method,
+                params=None if py_arg_page_url else ({**(py_arg_params or {}), **(py_arg_page_params or {})} or None),
+                headers=py_arg_headers,
+                data=data,
+                json=json,
+                files=files,
+                proxies=py_arg_proxies,
+                cert=py_arg_cert,
+                timeout=py_arg_timeout
+            )
+
+        py_var_pages = py_fn_rest_api_pages(
+            py_fn_send,
+            py_arg_pagination,
+            py_arg_page_param,
+            py_arg_page_size,
+            py_arg_limit_param,
+            py_arg_cursor_path,
+            py_arg_records_path,
+            py_arg_max_pages,
+            py_var_concurrency
+        )
+
     # Handle file download
-    if py_arg_save_path and response.status_code == 200:
+    if py_arg_save_path and len(py_var_pages) == 1 and py_var_pages[0][0].status_code == 200:
         with open(py_arg_save_path, "wb") as f:
-            f.write(response.content) 
-			
-    # Prepare the response data
-    if py_arg_response_as_string:
-        response_body = response.text
-        response_headers = str(response.headers)
-    else:
-        response_headers = dict(response.headers)
-        #sometimes there may be a charset
-        response_body = response.json() if response.headers.get("Content-Type")[:16] == "application/json" else response.text
+            f.write(py_var_pages[0][0].content)
+
+    # Records of all the pages, assembled into one DataFrame
+    if py_arg_records_path:
+        py_var_records = []
+        for _, py_var_body in py_var_pages:
+            py_var_page_records = py_fn_rest_api_value(py_var_body, py_arg_records_path)
+            if isinstance(py_var_page_records, list):
+                py_var_records.extend(py_var_page_records)
+            elif py_var_page_records is not None:
+                py_var_records.append(py_var_page_records)
+        if all(isinstance(py_var_record, dict) for py_var_record in py_var_records):
+            return pd.json_normalize(py_var_records)
+        return pd.DataFrame({"value": py_var_records})
+
+    # Prepare the response data, one row per page
+    py_var_rows = []
+    for py_var_page, (response, py_var_body) in enumerate(py_var_pages):
+        if py_arg_response_as_string:
+            response_body = response.text
+            response_headers = str(response.headers)
+        else:
+            response_headers = dict(response.headers)
+            response_body = py_var_body if py_var_body is not None else response.text
+        py_var_row = {
+            "url": py_arg_url,
+            "method": py_arg_method,
+            "headers": py_arg_headers,
+            "body_mime_type": py_arg_body_mime_type,
+            "body_form": py_arg_body_form,
+            "body_raw": py_arg_body_raw,
+            "proxies": py_arg_proxies,
+            "cert": py_arg_cert,
+            "timeout": py_arg_timeout,
+            "file_paths": py_arg_upload_file_paths,
+            "save_path": py_arg_save_path,
+            "response_as_string": py_arg_response_as_string,
+            "response_body": response_body,
+            "response_headers": response_headers,
+            "response_status_code": response.status_code
+        }
+        if py_arg_pagination not in (None, "none"):
+            py_var_row["page"] = py_var_page
+        py_var_rows.append(py_var_row)
 
     # Create the DataFrame
-    py_df_rest_api = pd.DataFrame({
-        "url": [py_arg_url],
-        "method": [py_arg_method],
-        "headers": [py_arg_headers],
-        "body_mime_type": [py_arg_body_mime_type],
-        "body_form": [py_arg_body_form],
-        "body_raw": [py_arg_body_raw],
-        "proxies": [py_arg_proxies],
-        "cert": [py_arg_cert],
-        "timeout": [py_arg_timeout],
-        "file_paths": [py_arg_upload_file_paths],
-        "save_path": [py_arg_save_path],
-        "response_as_string": [py_arg_response_as_string],
-        "response_body": [response_body],
-        "response_headers": [response_headers],
-		"response_status_code":[response.status_code]
-    })
+    py_df_rest_api = pd.DataFrame(py_var_rows)
 
     # Convert specific columns to string dtype
     py_df_rest_api["url"] = py_df_rest_api["url"].astype("string")
     py_df_rest_api["method"] = py_df_rest_api["method"].astype("string")
     py_df_rest_api["body_mime_type"] = py_df_rest_api["body_mime_type"].astype("string")
-    py_df_rest_api["response_status_code"] = py_df_rest_api["response_status_code"].astype("string") 
-    py_df_rest_api["save_path"] = py_df_rest_api["save_path"].astype("string")     
-    return py_df_rest_api	
+    py_df_rest_api["response_status_code"] = py_df_rest_api["response_status_code"].astype("string")
+    py_df_rest_api["save_path"] = py_df_rest_api["save_path"].astype("string")
+    return py_df_rest_api
 	    `;
     return [tsRestAPIInputFunction];
   }
@@ -351,6 +682,10 @@ def py_fn_rest_api_call(
     }
 //others
    let tsConstRestApiResponseAsString = config.tsCFbooleanRestApiResponseAsString ? 'True' : 'False';
+//Pagination and throughput
+   const tsConstPyString = (value) => value && value.trim() !== '' ? `'${value.trim()}'` : 'None';
+   const tsConstPyNumber = (value) => value !== undefined && value !== null && value !== '' ? String(value) : 'None';
+   const tsConstPagination = config.tsCFselectRestApiPagination && config.tsCFselectRestApiPagination !== 'none' ? `'${config.tsCFselectRestApiPagination}'` : 'None';
     return `
 ${outputName} =py_fn_rest_api_call(
     py_arg_url='${config.tsCFSelectRestApiUrl}',
@@ -366,7 +701,17 @@ ${outputName} =py_fn_rest_api_call(
     py_arg_timeout = None,#as of today, not handled
     py_arg_response_as_string = ${tsConstRestApiResponseAsString},
     py_arg_upload_file_paths = ${tsConstUploadFilePaths},
-    py_arg_save_path = ${tsConstDownloadFilePath}
+    py_arg_save_path = ${tsConstDownloadFilePath},
+    py_arg_pagination = ${tsConstPagination},
+    py_arg_page_param = ${tsConstPyString(config.tsCFinputRestApiPageParam)},
+    py_arg_page_size = ${tsConstPyNumber(config.tsCFinputNumberRestApiPageSize)},
+    py_arg_limit_param = ${tsConstPyString(config.tsCFinputRestApiLimitParam)},
+    py_arg_cursor_path = ${tsConstPyString(config.tsCFinputRestApiCursorPath)},
+    py_arg_records_path = ${tsConstPyString(config.tsCFinputRestApiRecordsPath)},
+    py_arg_max_pages = ${tsConstPyNumber(config.tsCFinputNumberRestApiMaxPages)},
+    py_arg_concurrency = ${config.tsCFinputNumberRestApiConcurrency || 1},
+    py_arg_rate_limit = ${config.tsCFinputNumberRestApiRateLimit ? String(config.tsCFinputNumberRestApiRateLimit) : 'None'},
+    py_arg_max_retries = ${tsConstPyNumber(config.tsCFinputNumberRestApiMaxRetries)}
     )
 `.trim();
   }
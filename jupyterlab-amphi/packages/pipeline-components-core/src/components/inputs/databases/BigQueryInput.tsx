@@ -1,9 +1,11 @@
 import { bigQueryIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent'; // Adjust the import path
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class BigQueryInput extends BaseCoreComponent {
     constructor() {
         const defaultConfig = {
+			tsCFradioReadMode: "standard",
 			tsCFinputDataset: "",
 			tsCFtableTableName: "",
 			tsCFradioQueryMethod: "table"
@@ -78,8 +80,9 @@ export class BigQueryInput extends BaseCoreComponent {
                     tooltip: 'Optional. By default, the SQL query is: SELECT * FROM dataset.table_name_provided. If specified, the SQL Query is used.',
                     condition: { tsCFradioQueryMethod: "query" },
                     advanced: true
-                }
-            ]
+                },
+                ...DatabaseReadHandler.getReadModeFields()
+            ],
         };
         const description = "Use BigQuery Input to retrieve data from Google BigQuery by specifying either a table name or a custom SQL query.";
 
@@ -93,10 +96,19 @@ export class BigQueryInput extends BaseCoreComponent {
     }
 
     public provideImports({ config }): string[] {
-        return ["import pandas as pd", 
+        return ["import pandas as pd",
+		"import sqlalchemy",
 		"from sqlalchemy.engine import create_engine"];
     }
 
+    public provideFunctions({ config }): string[] {
+        return DatabaseReadHandler.provideFunctions(config);
+    }
+
+    public producesChunks({ config }): boolean {
+        return DatabaseReadHandler.isChunked(config);
+    }
+
     public generateDatabaseConnectionCode({ config, connectionName }): string {
         const connectionString = `bigquery://${config.tsCFinputProjectId}`;
         let connectionCode = `
@@ -128,6 +140,10 @@ ${connectionName} = sqlalchemy.create_engine("${connectionString}", credentials_
 
         const connectionCode = this.generateDatabaseConnectionCode({ config, connectionName: uniqueEngineName });
 
+        if (DatabaseReadHandler.isChunked(config) || DatabaseReadHandler.isPartitioned(config)) {
+            return DatabaseReadHandler.generateReadCode({ config, outputName, engineName: uniqueEngineName, connectionCode, sqlQuery });
+        }
+
         const code = `
 ${connectionCode}
 
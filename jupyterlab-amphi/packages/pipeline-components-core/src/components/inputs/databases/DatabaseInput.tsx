@@ -5,12 +5,14 @@ import { PostgresInput } from './PostgresInput';
 import { ODBCInput } from './ODBCInput';
 import { SqlServerInput } from './SqlServerInput';
 import { SnowflakeInput } from './SnowflakeInput';
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class DatabaseInput extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
 		tsCFselectProvider: "postgres",
 		tsCFradioQueryMethod: "table",
+		tsCFradioReadMode: "standard",
 		tsCFinputHost: "localhost",
         tsCFselectODBCConnectionMethod : "dsn",			
         tsCFinputODBCConnectionString: "",
@@ -96,10 +98,18 @@ export class DatabaseInput extends BaseCoreComponent {
   }
 
   public provideFunctions({ config }): string[] {
-    if (config.tsCFselectProvider === "odbc" && typeof (ODBCInput as any).prototype.provideFunctions === 'function') {
-      return new ODBCInput().provideFunctions({ config });
+    switch (config.tsCFselectProvider) {
+      case "mysql": return new MySQLInput().provideFunctions({ config });
+      case "postgres": return new PostgresInput().provideFunctions({ config });
+      case "sqlserver": return new SqlServerInput().provideFunctions({ config });
+      case "odbc": return new ODBCInput().provideFunctions({ config });
+      case "snowflake": return new SnowflakeInput().provideFunctions({ config });
+      default: return [];
     }
-    return [];
+  }
+
+  public producesChunks({ config }): boolean {
+    return DatabaseReadHandler.isChunked(config);
   }
   
   public generateComponentCode({ config, outputName }): string {
@@ -1,9 +1,11 @@
 import { mySQLIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';// Adjust the import path
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class MySQLInput extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
+		tsCFradioReadMode: "standard",
 		tsCFinputHost: "localhost",
 		tsCFinputPort: "3306",
 		tsCFinputDatabaseName: "",
@@ -84,7 +86,8 @@ export class MySQLInput extends BaseCoreComponent {
           tooltip: 'Optional. By default the SQL query is: SELECT * FROM table_name_provided. If specified, the SQL Query is used.',
           advanced: true,
           condition: { tsCFradioQueryMethod: "query" }
-        }
+        },
+        ...DatabaseReadHandler.getReadModeFields()
       ],
     };
     const description = "Use MySQL Input to retrieve data from MySQL by specifying either a table name or a custom SQL query.";
@@ -104,6 +107,14 @@ export class MySQLInput extends BaseCoreComponent {
 	"import pymysql"];
   }
 
+  public provideFunctions({ config }): string[] {
+    return DatabaseReadHandler.provideFunctions(config);
+  }
+
+  public producesChunks({ config }): boolean {
+    return DatabaseReadHandler.isChunked(config);
+  }
+
   public generateDatabaseConnectionCode({ config, connectionName }): string {
     let connectionString = `mysql+pymysql://${config.tsCFinputUserName}:${config.tsCFinputPassword}@${config.tsCFinputHost}:${config.tsCFinputPort}/${config.tsCFinputDatabaseName}`;
     const connectionCode = `
@@ -156,6 +167,10 @@ ${connectionName} = sqlalchemy.create_engine("${connectionString}")
       connectionName: uniqueEngineName
     });
 
+    if (DatabaseReadHandler.isChunked(config) || DatabaseReadHandler.isPartitioned(config)) {
+      return DatabaseReadHandler.generateReadCode({ config, outputName, engineName: uniqueEngineName, connectionCode, sqlQuery });
+    }
+
     const code = `
 ${connectionCode}
 
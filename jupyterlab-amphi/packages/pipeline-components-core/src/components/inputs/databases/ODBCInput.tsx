@@ -1,9 +1,11 @@
 import { databaseIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';// Adjust the import path
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class ODBCInput extends BaseCoreComponent {
     constructor() {
         const defaultConfig = {
+            tsCFradioReadMode: "standard",
             tsCFselectODBCConnectionMethod : "dsn",			
             tsCFinputODBCConnectionString: "",
             tsCFinputDSN: "",
@@ -103,6 +105,7 @@ export class ODBCInput extends BaseCoreComponent {
           text: "⚠️Take into consideration types can be badly retrieved.",
           advanced: true
         },
+        ...DatabaseReadHandler.getReadModeFields()
             ],
         };
         const description = "Use ODBC Input to retrieve data from various databases using an ODBC connection string, along with either a table name or a custom SQL query.";
@@ -117,6 +120,7 @@ export class ODBCInput extends BaseCoreComponent {
     public provideImports({ config }): string[] {
         return ["import pandas as pd",
 		"import pyodbc",
+		"import contextlib",
 		"from typing import Optional"];
     }
 	
@@ -132,7 +136,11 @@ def py_fn_odbc_input_query(
     py_arg_autocommit: bool = True,
     py_arg_query_method: str = "query",
     py_arg_sql_query: Optional[str] = None,
-    py_arg_table_name: Optional[str] = None
+    py_arg_table_name: Optional[str] = None,
+    py_arg_read_mode: str = "standard",
+    py_arg_chunk_size: int = 100000,
+    py_arg_partition_column: Optional[str] = None,
+    py_arg_partitions: int = 4
 ) -> pd.DataFrame:
     """
     Execute a SQL query or read a full table via ODBC and return a pandas DataFrame.
@@ -142,6 +150,7 @@ def py_fn_odbc_input_query(
       conn_str = f"Driver={{PostgreSQL ODBC Driver(UNICODE)}};Server=localhost;Port=5432;Database=test_dataviz;Uid=postgres;Pwd=MyAmazingPW123!;"
     - py_arg_connection_mode: "conn_str" or "dsn"
     - py_arg_query_method: "query" or "table"
+    - py_arg_read_mode: "standard", "chunked" (stream of DataFrames) or "partitioned"
     """
  
     # Build connection string
@@ -177,6 +186,14 @@ def py_fn_odbc_input_query(
     else:
         raise ValueError("py_arg_query_method must be 'query' or 'table'")
  
+    def py_fn_connect():
+        return contextlib.closing(pyodbc.connect(py_var_conn_str, autocommit=py_arg_autocommit))
+
+    if py_arg_read_mode == "chunked":
+        return py_cls_chunked_frame(lambda: py_fn_read_sql_chunks(py_fn_connect, py_var_query, py_arg_chunk_size))
+    if py_arg_read_mode == "partitioned" and py_arg_partition_column:
+        return py_fn_read_sql_partitioned(py_fn_connect, py_var_query, py_arg_partition_column, py_arg_partitions, "qmark")
+
     py_var_conn = None
     try:
         py_var_conn = pyodbc.connect(py_var_conn_str, autocommit=py_arg_autocommit)
@@ -186,7 +203,11 @@ def py_fn_odbc_input_query(
         if py_var_conn is not None:
             py_var_conn.close()
 	    `;
-    return [tsODBCInputQueryFunction];
+    return [...DatabaseReadHandler.provideFunctions(config), tsODBCInputQueryFunction];
+  }
+
+  public producesChunks({ config }): boolean {
+    return DatabaseReadHandler.isChunked(config);
   }
   
   
@@ -249,6 +270,15 @@ def py_fn_odbc_input_query(
       tsConstSqlQuery = '"' + tsConstParsedQuery+ '"';
     }
 	
+	let tsConstReadMode = 'standard';
+	let tsConstPartitionColumn = 'None';
+    if (DatabaseReadHandler.isChunked(config)) {
+      tsConstReadMode = 'chunked';
+    } else if (DatabaseReadHandler.isPartitioned(config)) {
+      tsConstReadMode = 'partitioned';
+      tsConstPartitionColumn = JSON.stringify(config.tsCFinputPartitionColumn.trim());
+    }
+
     const code = `
 ${outputName} = py_fn_odbc_input_query(
     py_arg_connection_mode=${tsConstConnectionMethod},
@@ -259,7 +289,11 @@ ${outputName} = py_fn_odbc_input_query(
     py_arg_autocommit = ${tsConstAutoCommit},
     py_arg_query_method = ${tsConstQueryMethod},
     py_arg_sql_query = ${tsConstSqlQuery},
-    py_arg_table_name = ${tsConstTableName}
+    py_arg_table_name = ${tsConstTableName},
+    py_arg_read_mode = "${tsConstReadMode}",
+    py_arg_chunk_size = ${config.tsCFinputNumberChunkSize || 100000},
+    py_arg_partition_column = ${tsConstPartitionColumn},
+    py_arg_partitions = ${config.tsCFinputNumberPartitions || 4}
     )
 `;
 
@@ -1,9 +1,11 @@
 import { oracleIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';// Adjust the import path
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class OracleInput extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
+	tsCFradioReadMode: "standard",
 	tsCFinputHost: "localhost",
 	tsCFinputPort: "1521",
 	tsCFinputDatabaseName: "",
@@ -104,7 +106,8 @@ export class OracleInput extends BaseCoreComponent {
             { value: "oracledb", label: "python-oracledb" }
           ],
           advanced: true
-        }
+        },
+        ...DatabaseReadHandler.getReadModeFields()
       ],
     };
     const description = "Use Oracle Input to retrieve data from an Oracle database by specifying either a table name or a custom SQL query.";
@@ -134,6 +137,14 @@ export class OracleInput extends BaseCoreComponent {
     return imports;
   }
 
+  public provideFunctions({ config }): string[] {
+    return DatabaseReadHandler.provideFunctions(config);
+  }
+
+  public producesChunks({ config }): boolean {
+    return DatabaseReadHandler.isChunked(config);
+  }
+
   public generateDatabaseConnectionCode({ config, connectionName }): string {
     const dbapi = config.tsCFselectDbApi;
 
@@ -159,6 +170,10 @@ ${oracleClientInitialization}${connectionName} = sqlalchemy.create_engine("${con
 
     const connectionCode = this.generateDatabaseConnectionCode({ config, connectionName: uniqueEngineName });
 
+    if (DatabaseReadHandler.isChunked(config) || DatabaseReadHandler.isPartitioned(config)) {
+      return DatabaseReadHandler.generateReadCode({ config, outputName, engineName: uniqueEngineName, connectionCode, sqlQuery });
+    }
+
     const code = `
 ${connectionCode}
 
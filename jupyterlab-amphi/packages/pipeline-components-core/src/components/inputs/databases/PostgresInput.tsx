@@ -1,9 +1,11 @@
 import { postgresIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';// Adjust the import path
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class PostgresInput extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
+		tsCFradioReadMode: "standard",
 		tsCFinputHost: "localhost",
 		tsCFinputPort: "5432",
 		tsCFinputDatabaseName: "",
@@ -91,7 +93,8 @@ export class PostgresInput extends BaseCoreComponent {
           tooltip: 'Optional. By default the SQL query is: SELECT * FROM table_name_provided. If specified, the SQL Query is used.',
           condition: { tsCFradioQueryMethod: "query" },
           advanced: true
-        }
+        },
+        ...DatabaseReadHandler.getReadModeFields()
       ],
     };
     const description = "Use Postgres Input to retrieve data from Postgres by specifying either a table name or a custom SQL query.";
@@ -111,6 +114,14 @@ export class PostgresInput extends BaseCoreComponent {
 	"import psycopg2"];
   }
 
+  public provideFunctions({ config }): string[] {
+    return DatabaseReadHandler.provideFunctions(config);
+  }
+
+  public producesChunks({ config }): boolean {
+    return DatabaseReadHandler.isChunked(config);
+  }
+
   public generateDatabaseConnectionCode({ config, connectionName }): string {
     let connectionString = `postgresql://${config.tsCFinputUserName}:${config.tsCFinputPassword}@${config.tsCFinputHost}:${config.tsCFinputPort}/${config.tsCFinputDatabaseName}`;
     const connectionCode = `
@@ -165,6 +176,10 @@ ${connectionName} = sqlalchemy.create_engine("${connectionString}")
       connectionName: uniqueEngineName
     });
 
+    if (DatabaseReadHandler.isChunked(config) || DatabaseReadHandler.isPartitioned(config)) {
+      return DatabaseReadHandler.generateReadCode({ config, outputName, engineName: uniqueEngineName, connectionCode, sqlQuery });
+    }
+
     const code = `
 ${connectionCode}
 
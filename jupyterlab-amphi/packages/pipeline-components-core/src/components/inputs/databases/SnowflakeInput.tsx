@@ -1,9 +1,11 @@
 import { snowflakeIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';// Adjust the import path
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class SnowflakeInput extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
+		tsCFradioReadMode: "standard",
 		tsCFinputSchema: "PUBLIC",
 		tsCFtableTableName: "",
 		tsCFradioQueryMethod: "table" };
@@ -95,7 +97,8 @@ export class SnowflakeInput extends BaseCoreComponent {
           id: "tsCFinputRole",
           placeholder: "Role name",
           advanced: true
-        }
+        },
+        ...DatabaseReadHandler.getReadModeFields()
       ],
     };
     const description = "Use Snowflake Input to retrieve data from Snowflake by specifying either a table name or a custom SQL query.";
@@ -117,6 +120,14 @@ export class SnowflakeInput extends BaseCoreComponent {
 	"from snowflake.sqlalchemy import URL"];
   }
 
+  public provideFunctions({ config }): string[] {
+    return DatabaseReadHandler.provideFunctions(config);
+  }
+
+  public producesChunks({ config }): boolean {
+    return DatabaseReadHandler.isChunked(config);
+  }
+
   public generateDatabaseConnectionCode({ config, connectionName }): string {
     const connectionCode = `
 # Connect to the Snowflake database
@@ -179,6 +190,10 @@ ${connectionName} = sqlalchemy.create_engine(URL(
       connectionName: uniqueEngineName
     });
 
+    if (DatabaseReadHandler.isChunked(config) || DatabaseReadHandler.isPartitioned(config)) {
+      return DatabaseReadHandler.generateReadCode({ config, outputName, engineName: uniqueEngineName, connectionCode, sqlQuery });
+    }
+
     const code = `
 ${connectionCode}
 
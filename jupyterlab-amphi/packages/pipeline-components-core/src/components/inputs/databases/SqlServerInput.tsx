@@ -1,9 +1,11 @@
 import { sqlServerIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';// Adjust the import path
+import { DatabaseReadHandler } from '../../common/DatabaseReadHandler';
 
 export class SqlServerInput extends BaseCoreComponent {
     constructor() {
         const defaultConfig = {
+			tsCFradioReadMode: "standard",
 			tsCFinputHost: "localhost",
 			tsCFinputPort: "1433",
 			tsCFinputDatabaseName: "",
@@ -91,6 +93,7 @@ export class SqlServerInput extends BaseCoreComponent {
                     text: "You may need to install additional drivers on your machine for this component to function. /n For Mac you need to install 'brew install unixodbc'",
                     advanced: true
                 },
+                ...DatabaseReadHandler.getReadModeFields()
             ],
         };
         const description = "Use SQL Server Input to retrieve data from SQL Server by specifying either a table name or a custom SQL query.";
@@ -112,6 +115,14 @@ export class SqlServerInput extends BaseCoreComponent {
 		];
     }
 
+    public provideFunctions({ config }): string[] {
+        return DatabaseReadHandler.provideFunctions(config);
+    }
+
+    public producesChunks({ config }): boolean {
+        return DatabaseReadHandler.isChunked(config);
+    }
+
     public generateDatabaseConnectionCode({ config, connectionName }): string {
         let connectionString = `mssql+pyodbc://${config.tsCFinputUserName}:${config.tsCFinputPassword}@${config.tsCFinputHost}:${config.tsCFinputPort}/${config.tsCFinputDatabaseName}?driver=ODBC+Driver+17+for+SQL+Server`;
         const connectionCode = `
@@ -164,6 +175,10 @@ ${connectionName} = sqlalchemy.create_engine("${connectionString}")
             connectionName: uniqueEngineName
         });
 
+        if (DatabaseReadHandler.isChunked(config) || DatabaseReadHandler.isPartitioned(config)) {
+            return DatabaseReadHandler.generateReadCode({ config, outputName, engineName: uniqueEngineName, connectionCode, sqlQuery });
+        }
+
         const code = `
 ${connectionCode}
 
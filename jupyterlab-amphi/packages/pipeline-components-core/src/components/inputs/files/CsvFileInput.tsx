@@ -3,12 +3,16 @@ import { BaseCoreComponent } from '../../BaseCoreComponent';
 import { S3OptionsHandler } from '../../common/S3OptionsHandler';
 import { FTPOptionsHandler } from '../../common/FTPOptionsHandler';
 import { FileUtils } from '../../common/FileUtils'; // Import the FileUtils class
+import { S3TransferHandler } from '../../common/S3TransferHandler';
+import { ChunkUtils } from '@amphi/pipeline-components-manager';
 
 export class CsvFileInput extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
       tsCFradioFileLocation: "local",
       connectionMethod: "env",
+      tsCFradioReadMode: "standard",
+      tsCFinputNumberChunkSize: 100000,
       csvOptions: {
         sep: ","
       }
@@ -153,6 +157,28 @@ export class CsvFileInput extends BaseCoreComponent {
           ],
           advanced: true
         },
+        {
+          type: "radio",
+          label: "Read mode",
+          id: "tsCFradioReadMode",
+          tooltip: "Standard loads the whole file then converts dtypes (two copies in memory). Arrow-backed reads straight into pyarrow dtypes without the second copy. Chunked streams the file in chunks through chunk-compatible components (Filter Rows, Filter Columns, Type Converter, CSV and Parquet outputs) so files larger than memory can be processed in one pass.",
+          options: [
+            { value: "standard", label: "Standard" },
+            { value: "arrow", label: "Arrow-backed" },
+            { value: "chunked", label: "Chunked" }
+          ],
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Chunk size (rows)",
+          id: "tsCFinputNumberChunkSize",
+          tooltip: "Number of rows read per chunk in chunked mode.",
+          placeholder: "Default: 100000",
+          min: 1,
+          condition: { tsCFradioReadMode: "chunked" },
+          advanced: true
+        },
         {
           type: "keyvalue",
           label: "Storage Options",
@@ -169,7 +195,7 @@ export class CsvFileInput extends BaseCoreComponent {
 
   public provideDependencies({ config }): string[] {
     let deps: string[] = [];
-    if (config.csvOptions.engine === "pyarrow") {
+    if (config.csvOptions.engine === "pyarrow" || config.tsCFradioReadMode === "arrow") {
       deps.push('pyarrow');
     }
     if (config.tsCFradioFileLocation === "s3") {
@@ -183,7 +209,9 @@ export class CsvFileInput extends BaseCoreComponent {
 
   public provideImports({ config }): string[] {
     let imports = ["import pandas as pd"];
-    if (FileUtils.isWildcardInput(config.filePath)) {
+    if (this.readsS3ObjectsConcurrently(config)) {
+      imports.push(...S3TransferHandler.provideImports());
+    } else if (FileUtils.isWildcardInput(config.filePath)) {
       if (config.tsCFradioFileLocation === "s3") {
         imports.push("import s3fs");
       } else {
@@ -193,30 +221,61 @@ export class CsvFileInput extends BaseCoreComponent {
     return imports;
   }
 
-  // Utility method to determine if input uses a wildcard
+  public provideFunctions({ config }): string[] {
+    if (this.readsS3ObjectsConcurrently(config)) {
+      return S3TransferHandler.provideFunctions();
+    }
+    return this.producesChunks({ config }) ? ChunkUtils.provideFunctions() : [];
+  }
+
+  // Several S3 objects are fetched concurrently, chunked reads stream the objects of a pattern one after the other
+  public readsS3ObjectsConcurrently(config): boolean {
+    return config.tsCFradioReadMode !== "chunked" && S3TransferHandler.isMultiObjectInput(config);
+  }
 
+  public producesChunks({ config }): boolean {
+    return config.tsCFradioReadMode === "chunked";
+  }
 
   // Main generation method
   public generateComponentCode({ config, outputName }): string {
+    const readMode = config.tsCFradioReadMode || "standard";
     const optionsString = this.generateOptionsCode({ config });
-    const storageOptionsString = config.csvOptions.storage_options ? JSON.stringify(config.csvOptions.storage_options) : '{}';
+    const storageOptionsString = config.tsCFradioFileLocation === "s3"
+      ? JSON.stringify(S3TransferHandler.getStorageOptions(config, config.csvOptions.storage_options))
+      : (config.csvOptions.storage_options ? JSON.stringify(config.csvOptions.storage_options) : '{}');
+    // Arrow-backed dtypes are produced by the reader itself, no second copy through convert_dtypes()
+    const convertDtypes = readMode === "standard" ? ".convert_dtypes()" : "";
+
+    // S3 objects are opened by the file system, their reader gets no storage options
+    const s3ReadOptionsString = config.tsCFradioFileLocation === "s3"
+      ? this.generateOptionsCode({ config: S3TransferHandler.withoutStorageOptions(config, 'csvOptions') })
+      : optionsString;
 
     let code = '';
-    if (FileUtils.isWildcardInput(config.filePath)) {
+    if (this.readsS3ObjectsConcurrently(config)) {
+      code += FileUtils.generateS3ConcurrentCode(config.filePath, storageOptionsString, outputName, "read_csv", s3ReadOptionsString, config.tsCFinputNumberS3MaxWorkers || 16, readMode === "standard");
+    } else if (FileUtils.isWildcardInput(config.filePath)) {
+      const isRemote = config.tsCFradioFileLocation === "s3" || config.tsCFradioFileLocation === "ftp";
       if (config.tsCFradioFileLocation === "s3") {
         code += FileUtils.getS3FilePaths(config.filePath, storageOptionsString, outputName);
-        code += FileUtils.generateConcatCode(outputName, "read_csv", optionsString, true);
       } else if (config.tsCFradioFileLocation === "ftp") {
         code += FileUtils.getFTPFilePaths(config.filePath, storageOptionsString, outputName);
-        code += FileUtils.generateConcatCode(outputName, "read_csv", optionsString, true);
       } else {
         code += FileUtils.getLocalFilePaths(config.filePath, outputName);
-        code += FileUtils.generateConcatCode(outputName, "read_csv", optionsString, false);
       }
+      code += readMode === "chunked"
+        ? FileUtils.generateChunkedCode(outputName, "read_csv", s3ReadOptionsString, isRemote)
+        : FileUtils.generateConcatCode(outputName, "read_csv", optionsString, isRemote, readMode === "standard");
+    } else if (readMode === "chunked") {
+      code = `
+# Streaming data from ${config.filePath} in chunks
+${outputName} = py_fn_stable_chunks(lambda: pd.read_csv("${config.filePath}"${optionsString}))
+      `;
     } else {
       code = `
 # Reading data from ${config.filePath}
-${outputName} = pd.read_csv("${config.filePath}"${optionsString}).convert_dtypes()
+${outputName} = pd.read_csv("${config.filePath}"${optionsString})${convertDtypes}
       `;
     }
 
@@ -226,6 +285,16 @@ ${outputName} = pd.read_csv("${config.filePath}"${optionsString}).convert_dtypes
   public generateOptionsCode({ config }): string {
     let csvOptions = { ...config.csvOptions };
 
+    if (config.tsCFradioReadMode === 'arrow') {
+      csvOptions.dtype_backend = 'pyarrow';
+    } else if (config.tsCFradioReadMode === 'chunked') {
+      // The pyarrow engine cannot read in chunks, fall back to the default C engine
+      if (csvOptions.engine === 'pyarrow') {
+        delete csvOptions.engine;
+      }
+      csvOptions.chunksize = config.tsCFinputNumberChunkSize || 100000;
+    }
+
     if (csvOptions.sep === 'infer') {
       csvOptions.sep = 'None';
       csvOptions.engine = 'python';
@@ -307,6 +376,7 @@ ${outputName} = pd.read_csv("${config.filePath}"${optionsString}).convert_dtypes
   public generateSampledComponentCode({ config, outputName, nrows }): string {
     config = {
       ...config,
+      tsCFradioReadMode: config.tsCFradioReadMode === "chunked" ? "standard" : config.tsCFradioReadMode,
       csvOptions: {
         ...config.csvOptions,
         nrows: nrows
@@ -3,13 +3,14 @@ import { fileExcelIcon } from '../../../icons';
 import { S3OptionsHandler } from '../../common/S3OptionsHandler';
 import { FTPOptionsHandler } from '../../common/FTPOptionsHandler';
 import { FileUtils } from '../../common/FileUtils'; // Import the FileUtils class
+import { S3TransferHandler } from '../../common/S3TransferHandler';
 
 export class ExcelFileInput extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
       tsCFradioFileLocation: "local",
       connectionMethod: "env",
-      excelOptions: { engine: "None", dtype_backend: "numpy_nullable" }
+      excelOptions: { engine: "auto", dtype_backend: "numpy_nullable" }
     };
     const form = {
       idPrefix: "component__form",
@@ -54,6 +55,14 @@ export class ExcelFileInput extends BaseCoreComponent {
           options: [],
           condition: { tsCFradioFileLocation: ["http", "s3"] }
         },
+        {
+          type: "input",
+          label: "Sheet name column",
+          id: "tsCFinputExcelSheetColumn",
+          placeholder: "Default: none",
+          tooltip: "When multiple sheets are read, name of a column added to the output with the sheet each row comes from.",
+          advanced: true
+        },
         {
           type: "selectCustomizable",
           label: "Header",
@@ -99,8 +108,9 @@ export class ExcelFileInput extends BaseCoreComponent {
           type: "select",
           label: "Engine",
           id: "excelOptions.engine",
-          tooltip: "Depending on the file format, different engines might be used.\nopenpyxl supports newer Excel file formats.\n calamine supports Excel (.xls, .xlsx, .xlsm, .xlsb) and OpenDocument (.ods) file formats.\n odf supports OpenDocument file formats (.odf, .ods, .odt).\n pyxlsb supports Binary Excel files.\n xlrd supports old-style Excel files (.xls).",
+          tooltip: "Depending on the file format, different engines might be used.\nAuto uses calamine when python-calamine is installed, the pandas default otherwise.\nopenpyxl supports newer Excel file formats.\n calamine supports Excel (.xls, .xlsx, .xlsm, .xlsb) and OpenDocument (.ods) file formats.\n odf supports OpenDocument file formats (.odf, .ods, .odt).\n pyxlsb supports Binary Excel files.\n xlrd supports old-style Excel files (.xls).",
           options: [
+            { value: "auto", label: "Auto (calamine when installed)" },
             { value: "openpyxl", label: "openpyxl" },
             { value: "calamine", label: "calamine" },
             { value: "odf", label: "odf (for .ods files)" },
@@ -143,7 +153,7 @@ export class ExcelFileInput extends BaseCoreComponent {
 
     if (engine === 'None' || engine === 'openpyxl') {
       deps.push('openpyxl');
-    } else if (engine === 'calamine') {
+    } else if (engine === 'auto' || engine === 'calamine') {
       deps.push('python-calamine');
     } else if (engine === 'odf') {
       deps.push('odfpy');
@@ -155,7 +165,9 @@ export class ExcelFileInput extends BaseCoreComponent {
     else {
       deps.push(config.engine);
     }
-    if (FileUtils.isWildcardInput(config.filePath)) {
+    if (S3TransferHandler.isMultiObjectInput(config)) {
+      deps.push('s3fs');
+    } else if (FileUtils.isWildcardInput(config.filePath)) {
       deps.push(config.tsCFradioFileLocation === "s3" ? 's3fs' : '');
     }
 
@@ -163,8 +175,10 @@ export class ExcelFileInput extends BaseCoreComponent {
   }
 
   public provideImports({ config }): string[] {
-    let imports = ["import pandas as pd"];
-    if (FileUtils.isWildcardInput(config.filePath)) {
+    let imports = ["import os", "import importlib.util", "import concurrent.futures", "import numpy as np", "import pandas as pd"];
+    if (S3TransferHandler.isMultiObjectInput(config)) {
+      imports.push(...S3TransferHandler.provideImports());
+    } else if (FileUtils.isWildcardInput(config.filePath)) {
       if (config.tsCFradioFileLocation === "s3") {
         imports.push("import s3fs");
       } else {
@@ -174,10 +188,59 @@ export class ExcelFileInput extends BaseCoreComponent {
     return imports;
   }
 
+  public provideFunctions({ config }): string[] {
+    const tsExcelFunctions = `
+def py_fn_excel_engine(py_arg_engine="auto"):
+    # "auto" prefers the Rust-based calamine reader when python-calamine is installed, then the pandas default
+    if py_arg_engine != "auto":
+        return py_arg_engine
+    return "calamine" if importlib.util.find_spec("python_calamine") else None
+
+
+def py_fn_read_excel_sheets(py_arg_path, py_arg_sheet_names, py_arg_sheet_column=None, py_arg_max_workers=None, **py_arg_options):
+    """
+    Read several sheets of a workbook and concatenate them in the given order. With calamine the workbook is
+    opened once and each sheet is parsed in turn. Pure Python engines parse the sheets of a large local workbook
+    in parallel processes. py_arg_sheet_column names a categorical column holding the sheet of each row.
+    """
+    py_var_sheet_names = list(dict.fromkeys(py_arg_sheet_names))
+    py_var_engine = py_arg_options.get("engine")
+    py_var_parallel = (
+        py_var_engine != "calamine"
+        and py_arg_max_workers != 1
+        and len(py_var_sheet_names) > 1
+        and isinstance(py_arg_path, str)
+        and os.path.isfile(py_arg_path)
+        and os.path.getsize(py_arg_path) >= 1 << 20
+    )
+    if py_var_parallel:
+        py_var_max_workers = min(len(py_var_sheet_names), py_arg_max_workers or os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=py_var_max_workers) as py_var_executor:
+            py_var_futures = [py_var_executor.submit(pd.read_excel, py_arg_path, sheet_name=py_var_sheet, **py_arg_options) for py_var_sheet in py_var_sheet_names]
+            py_var_frames = [py_var_future.result() for py_var_future in py_var_futures]
+    else:
+        py_var_read_options = {py_var_key: py_var_value for py_var_key, py_var_value in py_arg_options.items() if py_var_key not in ("engine", "storage_options")}
+        with pd.ExcelFile(py_arg_path, engine=py_var_engine, storage_options=py_arg_options.get("storage_options")) as py_var_workbook:
+            py_var_frames = [pd.read_excel(py_var_workbook, sheet_name=py_var_sheet, **py_var_read_options) for py_var_sheet in py_var_sheet_names]
+
+    py_var_result = pd.concat(py_var_frames, ignore_index=True)
+    if py_arg_sheet_column:
+        py_var_result[py_arg_sheet_column] = pd.Categorical.from_codes(
+            np.repeat(np.arange(len(py_var_frames)), [len(py_var_frame) for py_var_frame in py_var_frames]),
+            categories=[str(py_var_sheet) for py_var_sheet in py_var_sheet_names]
+        )
+    return py_var_result
+`;
+    return S3TransferHandler.isMultiObjectInput(config)
+      ? [tsExcelFunctions, ...S3TransferHandler.provideFunctions()]
+      : [tsExcelFunctions];
+  }
+
   public generateComponentCode({ config, outputName }): string {
     const excelOptions = { ...config.excelOptions };
-    const storageOptionsString = excelOptions.storage_options ? JSON.stringify(excelOptions.storage_options) : '{}';
-    let optionsString = this.generateOptionsCode(config);
+    const isS3MultiObject = S3TransferHandler.isMultiObjectInput(config);
+    // S3 objects are opened by the file system, their reader gets no storage options
+    let optionsString = this.generateOptionsCode(isS3MultiObject ? S3TransferHandler.withoutStorageOptions(config, 'excelOptions') : config);
 
     let code = '';
 
@@ -191,20 +254,19 @@ export class ExcelFileInput extends BaseCoreComponent {
     }
 
     // Check for wildcard input and generate appropriate code
-    if (FileUtils.isWildcardInput(config.filePath)) {
-      if (config.tsCFradioFileLocation === "s3") {
-        code += FileUtils.getS3FilePaths(config.filePath, storageOptionsString, outputName);
-        code += FileUtils.generateConcatCode(outputName, "read_excel", optionsString, true);
-      } else {
-        code += FileUtils.getLocalFilePaths(config.filePath, outputName);
-        code += FileUtils.generateConcatCode(outputName, "read_excel", optionsString, false);
-      }
+    if (isS3MultiObject) {
+      const storageOptionsString = JSON.stringify(S3TransferHandler.getStorageOptions(config, excelOptions.storage_options));
+      code += FileUtils.generateS3ConcurrentCode(config.filePath, storageOptionsString, outputName, "read_excel", optionsString, config.tsCFinputNumberS3MaxWorkers || 16);
+    } else if (FileUtils.isWildcardInput(config.filePath)) {
+      code += FileUtils.getLocalFilePaths(config.filePath, outputName);
+      code += FileUtils.generateConcatCode(outputName, "read_excel", optionsString, false);
     } else {
       // Simple file reading without wildcard
       if (excelOptions.sheet_name && excelOptions.sheet_name.length > 1) {
-        // Multiple sheets: Concatenate DataFrames into a single output
-        code += `${outputName}_dict = pd.read_excel("${config.filePath}"${optionsString})\n`;
-        code += `${outputName} = pd.concat(${outputName}_dict.values(), ignore_index=True).convert_dtypes()\n`;
+        // Multiple sheets: read them from one workbook and concatenate them into a single output
+        const sheetColumn = (config.tsCFinputExcelSheetColumn || '').trim();
+        const sheetColumnString = sheetColumn ? `'${sheetColumn}'` : 'None';
+        code += `${outputName} = py_fn_read_excel_sheets("${config.filePath}", ${JSON.stringify(excelOptions.sheet_name)}, py_arg_sheet_column=${sheetColumnString}${this.generateOptionsCode(config)}).convert_dtypes()\n`;
       } else {
         // Single sheet or no sheet_name specified
         code += `${outputName} = pd.read_excel("${config.filePath}"${optionsString}).convert_dtypes()\n`;
@@ -254,6 +316,8 @@ export class ExcelFileInput extends BaseCoreComponent {
       .map(([key, value]) => {
         if (typeof value === 'boolean') {
           return `${key}=${value ? 'True' : 'False'}`;
+        } else if (key === 'engine' && value === 'auto') {
+          return `${key}=py_fn_excel_engine()`;
         } else if (value === "None") {
           return `${key}=None`;
         } else if (key === 'storage_options') {
@@ -3,6 +3,7 @@ import { BaseCoreComponent } from '../../BaseCoreComponent';
 import { S3OptionsHandler } from '../../common/S3OptionsHandler';
 import { FTPOptionsHandler } from '../../common/FTPOptionsHandler';
 import { FileUtils } from '../../common/FileUtils'; // Import the FileUtils class
+import { S3TransferHandler } from '../../common/S3TransferHandler';
 
 export class ParquetFileInput extends BaseCoreComponent {
   constructor() {
@@ -32,11 +33,28 @@ export class ParquetFileInput extends BaseCoreComponent {
           type: "file",
           label: "File path",
           id: "filePath",
-          placeholder: "Type file name or use '*' for patterns",
-          validation: "\\.(parquet)$|^(.*\\*)$",
-          tooltip: "This field expects a file with a .parquet extension or a wildcard pattern such as input*.parquet.",
+          placeholder: "Type file name, folder or use '*' for patterns",
+          validation: "\\.(parquet)$|^(.*\\*)$|^[^.]*$",
+          tooltip: "This field expects a file with a .parquet extension, a wildcard pattern such as input*.parquet, or a folder of Parquet files. Hive-partitioned folders (e.g. year=2023/) are read in parallel and the partition keys are added as columns.",
           allowedExtensions: ["parquet"]	
         },
+        {
+          type: "selectTokenization",
+          label: "Columns",
+          id: "parquetOptions.columns",
+          tooltip: "Only read these columns. The other column chunks are not read from disk. Leave empty to read all columns.",
+          placeholder: "Type column names (comma-separated)",
+          options: [],
+          advanced: true
+        },
+        {
+          type: "input",
+          label: "Row filters",
+          id: "parquetOptions.filters",
+          tooltip: "Filters pushed down to the reader, as a list of (column, operator, value) tuples combined with AND. Row groups and partitions whose statistics cannot match are skipped.",
+          placeholder: '[("Region", "==", "Europe"), ("Quantity", ">", 10)]',
+          advanced: true
+        },
         {
           type: "select",
           label: "Engine",
@@ -79,7 +97,9 @@ export class ParquetFileInput extends BaseCoreComponent {
     if (config.parquetOptions?.engine === "fastparquet") {
       imports.push("import fastparquet");
     }
-    if (FileUtils.isWildcardInput(config.filePath)) {
+    if (this.readsS3ObjectsConcurrently(config)) {
+      imports.push(...S3TransferHandler.provideImports());
+    } else if (FileUtils.isWildcardInput(config.filePath)) {
       if (config.tsCFradioFileLocation === "s3") {
         imports.push("import s3fs");
       } else {
@@ -89,22 +109,29 @@ export class ParquetFileInput extends BaseCoreComponent {
     return imports;
   }
 
+  public provideFunctions({ config }): string[] {
+    return this.readsS3ObjectsConcurrently(config) ? S3TransferHandler.provideFunctions() : [];
+  }
+
+  // S3 objects of a pattern are fetched concurrently, folders and prefixes are read as a dataset by pyarrow
+  public readsS3ObjectsConcurrently(config): boolean {
+    return S3TransferHandler.isMultiObjectInput(config, false);
+  }
+
   public generateComponentCode({ config, outputName }): string {
-    const parquetOptions = { ...config.parquetOptions };
-    const storageOptionsString = parquetOptions.storage_options ? JSON.stringify(parquetOptions.storage_options) : '{}';
     const optionsString = this.generateParquetOptionsCode({ config });
 
     let code = '';
 
     // Check for wildcard input and generate appropriate code
-    if (FileUtils.isWildcardInput(config.filePath)) {
-      if (config.tsCFradioFileLocation === "s3") {
-        code += FileUtils.getS3FilePaths(config.filePath, storageOptionsString, outputName);
-        code += FileUtils.generateConcatCode(outputName, "read_parquet", optionsString, true);
-      } else {
-        code += FileUtils.getLocalFilePaths(config.filePath, outputName);
-        code += FileUtils.generateConcatCode(outputName, "read_parquet", optionsString, false);
-      }
+    if (this.readsS3ObjectsConcurrently(config)) {
+      // Objects are opened by the file system, the reader gets no storage options
+      const storageOptionsString = JSON.stringify(S3TransferHandler.getStorageOptions(config, config.parquetOptions?.storage_options));
+      const readOptionsString = this.generateParquetOptionsCode({ config: S3TransferHandler.withoutStorageOptions(config, 'parquetOptions') });
+      code += FileUtils.generateS3ConcurrentCode(config.filePath, storageOptionsString, outputName, "read_parquet", readOptionsString, config.tsCFinputNumberS3MaxWorkers || 16);
+    } else if (FileUtils.isWildcardInput(config.filePath)) {
+      code += FileUtils.getLocalFilePaths(config.filePath, outputName);
+      code += FileUtils.generateConcatCode(outputName, "read_parquet", optionsString, false);
     } else {
       // Simple file reading without wildcard
       code += `${outputName} = pd.read_parquet("${config.filePath}"${optionsString}).convert_dtypes()\n`;
@@ -148,10 +175,24 @@ export class ParquetFileInput extends BaseCoreComponent {
       delete parquetOptions.storage_options;
     }
 
+    // Column projection and predicates are handed to the reader as Python literals
+    if (Array.isArray(parquetOptions.columns) && parquetOptions.columns.length > 0) {
+      parquetOptions.columns = `[${parquetOptions.columns.map(column => JSON.stringify(column)).join(', ')}]`;
+    } else {
+      delete parquetOptions.columns;
+    }
+    if (typeof parquetOptions.filters === 'string' && parquetOptions.filters.trim()) {
+      parquetOptions.filters = parquetOptions.filters.trim();
+    } else {
+      delete parquetOptions.filters;
+    }
+
     const options = Object.entries(parquetOptions)
       .filter(([key, value]) => value !== null && value !== '')
       .map(([key, value]) => {
-        if (key === 'storage_options' && typeof value === 'object') {
+        if (key === 'columns' || key === 'filters') {
+          return `${key}=${value}`;
+        } else if (key === 'storage_options' && typeof value === 'object') {
           return `${key}=${JSON.stringify(value)}`;
         } else if (typeof value === 'string') {
           return `${key}="${value}"`;
@@ -1,6 +1,7 @@
 import { bucketIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
 import { S3OptionsHandler } from '../../common/S3OptionsHandler';
+import { S3TransferHandler } from '../../common/S3TransferHandler';
 import { CsvFileInput } from './CsvFileInput';
 import { JsonFileInput } from './JsonFileInput';
 import { ExcelFileInput } from './ExcelFileInput';
@@ -62,6 +63,10 @@ export class S3FileInput extends BaseCoreComponent {
         ...filteredXmlFields.map(field => ({
           ...field,
           condition: { tsCFradioFileType: ["xml"], ...(field.condition || {}) }
+        })),
+        ...S3TransferHandler.getReadFields().map(field => ({
+          ...field,
+          condition: { tsCFradioFileType: ["csv", "excel", "parquet"] }
         }))
       ]
     };
@@ -71,9 +76,29 @@ export class S3FileInput extends BaseCoreComponent {
     super("S3 File Input", "s3FileInput", description, "pandas_df_input", [], "inputs", bucketIcon, defaultConfig, form);
   }
 
+  // Component reading the selected file type
+  public getFileComponent(config): any {
+    if (config.tsCFradioFileType === "csv") {
+      return new CsvFileInput();
+    } else if (config.tsCFradioFileType === "json") {
+      return new JsonFileInput();
+    } else if (config.tsCFradioFileType === "excel") {
+      return new ExcelFileInput();
+    } else if (config.tsCFradioFileType === "parquet") {
+      return new ParquetFileInput();
+    } else if (config.tsCFradioFileType === "xml") {
+      return new XmlFileInput();
+    }
+    return null;
+  }
+
   public provideDependencies({ config }): string[] {
     let deps: string[] = [];
     deps.push('s3fs');
+    const component = this.getFileComponent(config);
+    if (component && typeof component.provideDependencies === 'function') {
+      component.provideDependencies({ config }).forEach(dep => dep && !deps.includes(dep) && deps.push(dep));
+    }
     return deps;
   }
 
@@ -82,26 +107,26 @@ export class S3FileInput extends BaseCoreComponent {
     if (config.createFoldersIfNotExist) {
       imports.push("import os");
     }
+    const component = this.getFileComponent(config);
+    if (component) {
+      component.provideImports({ config }).forEach(imp => !imports.includes(imp) && imports.push(imp));
+    }
     return imports;
   }
 
+  // Helpers of the file type reader, including the concurrent S3 reads of patterns and prefixes
+  public provideFunctions({ config }): string[] {
+    const component = this.getFileComponent(config);
+    return component && typeof component.provideFunctions === 'function' ? component.provideFunctions({ config }) : [];
+  }
+
+  public producesChunks({ config }): boolean {
+    const component = this.getFileComponent(config);
+    return !!component && typeof component.producesChunks === 'function' && component.producesChunks({ config });
+  }
+
   public generateComponentCode({ config, outputName }): string {
-    if (config.tsCFradioFileType === "csv") {
-      const csvComponent = new CsvFileInput();
-      return csvComponent.generateComponentCode({ config, outputName });
-    } else if (config.tsCFradioFileType === "json") {
-      const jsonComponent = new JsonFileInput();
-      return jsonComponent.generateComponentCode({ config, outputName });
-    } else if (config.tsCFradioFileType === "excel") {
-      const excelComponent = new ExcelFileInput();
-      return excelComponent.generateComponentCode({ config, outputName });
-    } else if (config.tsCFradioFileType === "parquet") {
-      const parquetComponent = new ParquetFileInput();
-      return parquetComponent.generateComponentCode({ config, outputName });
-    } else if (config.tsCFradioFileType === "xml") {
-      const xmlComponent = new XmlFileInput();
-      return xmlComponent.generateComponentCode({ config, outputName });
-    }
-    return '';
+    const component = this.getFileComponent(config);
+    return component ? component.generateComponentCode({ config, outputName }) : '';
   }
 }
@@ -3,7 +3,14 @@ import { BaseCoreComponent } from '../BaseCoreComponent';
 
 export class ForLoop extends BaseCoreComponent {
   constructor() {
-    const defaultConfig = { code: "output = input" };
+    const defaultConfig = {
+      tsCFselectForLoopBody: "code",
+      code: "output = pd.DataFrame([row])",
+      tsCFinputForLoopResultName: "output",
+      tsCFselectForLoopExecutor: "thread",
+      tsCFselectForLoopOnError: "fail",
+      tsCFbooleanForLoopAddParameters: false
+    };
     const form = {
       idPrefix: "component__form",
       fields: [
@@ -11,29 +18,235 @@ export class ForLoop extends BaseCoreComponent {
           type: "info",
           label: "Instructions",
           id: "instructions",
-          text: "For Loop / Todo.",
+          text: "Each input row is one iteration (a file, a tenant, a date...). The iteration gets the row as the dict 'row' and returns the DataFrame 'output'. The outputs of all the iterations are concatenated in the input row order.",
+        },
+        {
+          type: "select",
+          label: "Iteration",
+          id: "tsCFselectForLoopBody",
+          options: [
+            { value: "code", label: "Python code", tooltip: "Run Python code with 'row' as input and 'output' as output." },
+            { value: "script", label: "Python script", tooltip: "Run a Python file, for example a pipeline exported to Python code. 'row' and each of its columns are defined as variables before the script runs." }
+          ],
+          advanced: true
+        },
+        {
+          type: "codeTextarea",
+          label: "Code",
+          tooltip: "Use the dict 'row' as input and the DataFrame 'output' as output. For example, output = pd.read_csv(row['path']).",
+          id: "code",
+          mode: "python",
+          height: '200px',
+          placeholder: "output = pd.read_csv(row['path'])",
+          condition: { tsCFselectForLoopBody: ["code"] },
+          advanced: true
+        },
+        {
+          type: "file",
+          label: "Script",
+          id: "tsCFfileForLoopScript",
+          placeholder: "Type file name",
+          tooltip: "Python file run once per row, for example a pipeline exported to Python code.",
+          allowedExtensions: ["py"],
+          condition: { tsCFselectForLoopBody: ["script"] },
+          advanced: true
         },
         {
           type: "input",
-          label: "Host",
-          id: "host",
-          placeholder: "Enter Trino host",
-          connection: 'Trino',
+          label: "Result variable",
+          id: "tsCFinputForLoopResultName",
+          tooltip: "Variable holding the DataFrame produced by the script.",
+          placeholder: "output",
+          condition: { tsCFselectForLoopBody: ["script"] },
           advanced: true
         },
+        {
+          type: "select",
+          label: "Execution",
+          id: "tsCFselectForLoopExecutor",
+          options: [
+            { value: "thread", label: "Threads", tooltip: "Run iterations concurrently in threads, best for I/O (files, databases, APIs)." },
+            { value: "process", label: "Processes", tooltip: "Run iterations in separate processes, best for CPU-bound work. Where processes are spawned (Windows, macOS), run the pipeline as a script." },
+            { value: "sequential", label: "Sequential", tooltip: "Run iterations one after the other." }
+          ],
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Max workers",
+          id: "tsCFinputNumberForLoopMaxWorkers",
+          tooltip: "Maximum number of iterations running at the same time.",
+          placeholder: "Default: number of CPUs",
+          min: 1,
+          max: 256,
+          condition: { tsCFselectForLoopExecutor: ["thread", "process"] },
+          advanced: true
+        },
+        {
+          type: "select",
+          label: "On iteration failure",
+          id: "tsCFselectForLoopOnError",
+          options: [
+            { value: "fail", label: "Fail", tooltip: "Stop the loop and raise the error of the first failed iteration." },
+            { value: "skip", label: "Skip", tooltip: "Report the failed iterations and concatenate the outputs of the others." }
+          ],
+          advanced: true
+        },
+        {
+          type: "boolean",
+          label: "Add parameter columns",
+          id: "tsCFbooleanForLoopAddParameters",
+          tooltip: "Add the columns of the input row to the output of each iteration.",
+          advanced: true
+        }
       ],
     };
+    const description = "Use For Loop to run Python code or a Python script once per input row, concurrently, and concatenate the results.";
+
+    super("For Loop", "forLoop", description, "pandas_df_processor", [], "Orchestration", codeIcon, defaultConfig, form);
+  }
 
-    super("For Loop", "forLoop", "no desc", "orchestrator_to_data", [], "Orchestration", codeIcon, defaultConfig, form);
+  // Python code of the iteration, the code field may hold a JSON object with the code
+  private getEffectiveCode(config: any): string {
+    const rawValue = config.code;
+    if (!rawValue) return "";
+    if (typeof rawValue === 'object') return rawValue.code || "";
+    try {
+      const parsed = JSON.parse(rawValue);
+      if (parsed && typeof parsed === 'object' && 'code' in parsed) {
+        return parsed.code;
+      }
+    } catch (e) {
+      // Plain Python code
+    }
+    return rawValue;
   }
 
-  public provideImports(config): string[] {
-    let imports: string[] = [];
+  // User code lines, without the imports hoisted to the top of the file
+  private getCodeLines(config: any): { imports: string[], body: string[] } {
+    const lines = this.getEffectiveCode(config).split('\n');
+    const isImport = (line: string) => line.trim().startsWith('import ') || line.trim().startsWith('from ');
+    return {
+      imports: lines.filter(isImport).map(line => line.trim()),
+      body: lines.filter(line => !isImport(line))
+    };
+  }
+
+  public provideImports({ config }): string[] {
+    const imports: string[] = [
+      "import os",
+      "import runpy",
+      "import functools",
+      "import concurrent.futures",
+      "import pandas as pd"
+    ];
+    if ((config.tsCFselectForLoopBody || "code") === "code") {
+      imports.push(...this.getCodeLines(config).imports);
+    }
     return imports;
   }
 
-  public generateComponentCode({ config, dependency }): string {
-    let code = ''
+  public provideFunctions({ config }): string[] {
+    const tsForLoopFunctions = `
+def py_fn_for_loop_script(py_arg_path, py_arg_result_name, py_arg_row):
+    # Run a Python script with the row, and each of its columns, defined as variables and return its result variable
+    py_var_globals = {"row": py_arg_row}
+    py_var_globals.update({str(py_var_key): py_var_value for py_var_key, py_var_value in py_arg_row.items() if str(py_var_key).isidentifier()})
+    return runpy.run_path(py_arg_path, init_globals=py_var_globals).get(py_arg_result_name)
+
+
+def py_fn_for_loop(py_arg_parameters, py_arg_iteration, py_arg_executor="thread", py_arg_max_workers=None, py_arg_on_error="fail", py_arg_add_parameters=False):
+    """
+    Call py_arg_iteration with each row of py_arg_parameters (as a dict), on a bounded thread or process pool,
+    and concatenate the DataFrames it returns in row order. A failed iteration either stops the loop
+    (py_arg_on_error="fail") or is reported and left out of the result (py_arg_on_error="skip").
+    """
+    py_var_rows = py_arg_parameters.to_dict("records")
+    py_var_max_workers = max(1, min(py_arg_max_workers or os.cpu_count() or 1, len(py_var_rows) or 1))
+
+    # Outcomes are (row index, result, error), yielded in row order
+    def py_fn_outcomes():
+        if py_arg_executor == "sequential":
+            for py_var_index, py_var_row in enumerate(py_var_rows):
+                try:
+                    yield py_var_index, py_arg_iteration(py_var_row), None
+                except Exception as e:
+                    yield py_var_index, None, e
+            return
+        py_var_pool_class = concurrent.futures.ProcessPoolExecutor if py_arg_executor == "process" else concurrent.futures.ThreadPoolExecutor
+        py_var_pool = py_var_pool_class(max_workers=py_var_max_workers)
+        try:
+            py_var_futures = [py_var_pool.submit(py_arg_iteration, py_var_row) for py_var_row in py_var_rows]
+            for py_var_index, py_var_future in enumerate(py_var_futures):
+                try:
+                    yield py_var_index, py_var_future.result(), None
+                except Exception as e:
+                    yield py_var_index, None, e
+        finally:
+            # Iterations not started yet are cancelled when the loop stops early
+            py_var_pool.shutdown(wait=True, cancel_futures=True)
+
+    py_var_results = []
+    py_var_failures = []
+    py_var_outcomes = py_fn_outcomes()
+    try:
+        for py_var_index, py_var_result, py_var_error in py_var_outcomes:
+            if py_var_error is not None:
+                if py_arg_on_error != "skip":
+                    raise RuntimeError(f"Iteration {py_var_index} failed for {py_var_rows[py_var_index]}") from py_var_error
+                py_var_failures.append(py_var_index)
+                print(f"Iteration {py_var_index} failed for {py_var_rows[py_var_index]}: {type(py_var_error).__name__}: {py_var_error}")
+                continue
+            if py_var_result is None:
+                continue
+            if not isinstance(py_var_result, pd.DataFrame):
+                py_var_result = pd.DataFrame([py_var_result] if isinstance(py_var_result, dict) else py_var_result)
+            if py_arg_add_parameters:
+                py_var_parameters = {py_var_key: py_var_value for py_var_key, py_var_value in py_var_rows[py_var_index].items() if py_var_key not in py_var_result.columns}
+                py_var_result = pd.concat(
+                    [pd.DataFrame(py_var_parameters, index=py_var_result.index, columns=list(py_var_parameters)), py_var_result],
+                    axis=1
+                )
+            py_var_results.append(py_var_result)
+    finally:
+        py_var_outcomes.close()
+
+    if py_var_failures:
+        print(f"{len(py_var_failures)} of {len(py_var_rows)} iterations failed and were skipped: {py_var_failures}")
+    if not py_var_results:
+        return pd.DataFrame()
+    return pd.concat(py_var_results, ignore_index=True)
+`;
+    return [tsForLoopFunctions];
+  }
+
+  public generateComponentCode({ config, inputName, outputName }): string {
+    const executor = config.tsCFselectForLoopExecutor || "thread";
+    const maxWorkers = config.tsCFinputNumberForLoopMaxWorkers ? String(config.tsCFinputNumberForLoopMaxWorkers) : "None";
+    const onError = config.tsCFselectForLoopOnError || "fail";
+    const addParameters = config.tsCFbooleanForLoopAddParameters ? "True" : "False";
+
+    let code = "";
+    let iteration = "";
+    if ((config.tsCFselectForLoopBody || "code") === "script") {
+      const scriptPath = (config.tsCFfileForLoopScript || "").trim();
+      const resultName = (config.tsCFinputForLoopResultName || "").trim() || "output";
+      iteration = `functools.partial(py_fn_for_loop_script, r"${scriptPath}", "${resultName}")`;
+    } else {
+      // The iteration code becomes a function of the row, returning 'output'
+      const body = this.getCodeLines(config).body.map(line => `    ${line}`).join('\n');
+      iteration = `${outputName}_iteration`;
+      code += `
+def ${iteration}(row):
+    output = None
+${body}
+    return output
+`;
+    }
+
+    code += `
+${outputName} = py_fn_for_loop(${inputName}, ${iteration}, py_arg_executor="${executor}", py_arg_max_workers=${maxWorkers}, py_arg_on_error="${onError}", py_arg_add_parameters=${addParameters})
+`;
     return code;
   }
-}
\ No newline at end of file
+}
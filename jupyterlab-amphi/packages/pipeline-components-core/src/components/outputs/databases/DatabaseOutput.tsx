@@ -92,6 +92,17 @@ export class DatabaseOutput extends BaseCoreComponent {
     return imports.filter(i => (seen.has(i) ? false : (seen.add(i), true)));
   }
 
+  public provideFunctions({ config }): string[] {
+    switch (config.tsCFselectProvider) {
+      case "mysql": return new MySQLOutput().provideFunctions({ config });
+      case "postgres": return new PostgresOutput().provideFunctions({ config });
+      case "sqlserver": return new SqlServerOutput().provideFunctions({ config });
+      case "snowflake": return new SnowflakeOutput().provideFunctions({ config });
+      case "oracle": return new OracleOutput().provideFunctions({ config });
+      default: return [];
+    }
+  }
+
   public generateComponentCode({ config, inputName }): string {
     switch (config.tsCFselectProvider) {
       case "mysql": return new MySQLOutput().generateComponentCode({ config, inputName });
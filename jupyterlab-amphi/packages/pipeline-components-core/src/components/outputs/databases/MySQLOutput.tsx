@@ -1,5 +1,6 @@
 import { mySQLIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
+import { DatabaseBulkLoadHandler } from '../../common/DatabaseBulkLoadHandler';
 
 export class MySQLOutput extends BaseCoreComponent {
   constructor() {
@@ -78,11 +79,10 @@ export class MySQLOutput extends BaseCoreComponent {
           type: "radio",
           label: "Mode",
           id: "tsCFradioMode",
-          options: [
-            { value: "insert", label: "INSERT" }
-          ],
+          options: DatabaseBulkLoadHandler.getModeOptions(),
           advanced: true
         },
+        ...DatabaseBulkLoadHandler.getBulkLoadFields(),
         {
           type: "dataMapping",
           imports: ["pymysql"],
@@ -137,6 +137,10 @@ export class MySQLOutput extends BaseCoreComponent {
 	"import pymysql"];
   }
 
+  public provideFunctions({ config }): string[] {
+    return DatabaseBulkLoadHandler.isBulkMode(config) ? DatabaseBulkLoadHandler.provideFunctions() : [];
+  }
+
   public generateDatabaseConnectionCode({ config, connectionName }): string {
     return `
 # Connect to the MySQL database
@@ -190,6 +194,23 @@ ${inputName} = ${inputName}[[${selectedColumns}]]
 
     const connectionCode = this.generateDatabaseConnectionCode({ config, connectionName: uniqueEngineName });
 
+    if (DatabaseBulkLoadHandler.isBulkMode(config)) {
+      // Multi-row INSERT ... VALUES statements, one per batch
+      const writeCode = DatabaseBulkLoadHandler.generateWriteCode({
+        config,
+        inputName,
+        engineName: uniqueEngineName,
+        tableName: config.tsCFtableTableName.value,
+        schema: "",
+        dialect: "mysql",
+        method: `"multi"`,
+        label: "MySQL"
+      });
+      return `
+${connectionCode}
+${mappingsCode}${columnsCode}${writeCode}`;
+    }
+
     return `
 ${connectionCode}
 ${mappingsCode}${columnsCode}
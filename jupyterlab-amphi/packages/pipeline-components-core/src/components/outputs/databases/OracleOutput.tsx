@@ -1,5 +1,6 @@
 import { oracleIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent'; // Adjust the import path
+import { DatabaseBulkLoadHandler } from '../../common/DatabaseBulkLoadHandler';
 
 export class OracleOutput extends BaseCoreComponent {
   constructor() {
@@ -90,11 +91,10 @@ export class OracleOutput extends BaseCoreComponent {
           type: "radio",
           label: "Mode",
           id: "tsCFradioMode",
-          options: [
-            { value: "insert", label: "INSERT" }
-          ],
+          options: DatabaseBulkLoadHandler.getModeOptions(),
           advanced: true
         },
+        ...DatabaseBulkLoadHandler.getBulkLoadFields(),
         {
           type: "dataMapping",
           label: "Mapping",
@@ -176,6 +176,13 @@ export class OracleOutput extends BaseCoreComponent {
     return imports;
   }
 
+  public provideFunctions({ config }): string[] {
+    if (!DatabaseBulkLoadHandler.isBulkMode(config)) {
+      return [];
+    }
+    return [...DatabaseBulkLoadHandler.provideFunctions(), DatabaseBulkLoadHandler.provideArrayInsertFunction()];
+  }
+
   public generateComponentCode({ config, inputName }): string {
     const dbapi = config.tsCFselectDbapi;
     const uniqueEngineName = `${inputName}_Engine`;
@@ -225,6 +232,24 @@ ${inputName} = ${inputName}[[${selectedColumns}]]
 
     const ifExistsAction = config.tsCFradioIfTableExists;
 
+    if (DatabaseBulkLoadHandler.isBulkMode(config)) {
+      // Array binding through executemany, one round-trip per batch
+      const writeCode = DatabaseBulkLoadHandler.generateWriteCode({
+        config,
+        inputName,
+        engineName: uniqueEngineName,
+        tableName: config.tsCFtableTableName,
+        schema: config.tsCFinputSchema && config.tsCFinputSchema.trim(),
+        dialect: "oracle",
+        method: "py_fn_array_insert_method",
+        label: "Oracle"
+      });
+      return `
+# Connect to the Oracle database
+${oracleClientInitialization}${uniqueEngineName} = sqlalchemy.create_engine("${connectionString}")
+${mappingsCode}${columnsCode}${writeCode}`;
+    }
+
     const schemaParam = config.tsCFinputSchema && config.tsCFinputSchema.trim()
       ? `,
         schema="${config.tsCFinputSchema}"`
@@ -1,5 +1,6 @@
 import { postgresIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
+import { DatabaseBulkLoadHandler } from '../../common/DatabaseBulkLoadHandler';
 
 export class PostgresOutput extends BaseCoreComponent {
   constructor() {
@@ -86,11 +87,10 @@ export class PostgresOutput extends BaseCoreComponent {
           type: "radio",
           label: "Mode",
           id: "tsCFradioMode",
-          options: [
-            { value: "insert", label: "INSERT" }
-          ],
+          options: DatabaseBulkLoadHandler.getModeOptions(),
           advanced: true
         },
+        ...DatabaseBulkLoadHandler.getBulkLoadFields(),
         {
           type: "dataMapping",
           label: "Mapping",
@@ -171,6 +171,13 @@ WHERE
 	];
   }
 
+  public provideFunctions({ config }): string[] {
+    if (!DatabaseBulkLoadHandler.isBulkMode(config)) {
+      return [];
+    }
+    return [...DatabaseBulkLoadHandler.provideFunctions(), DatabaseBulkLoadHandler.providePostgresCopyFunction()];
+  }
+
   public generateDatabaseConnectionCode({ config, connectionName }): string {
     return `
 # Connect to the Postgres database
@@ -229,6 +236,23 @@ ${inputName} = ${inputName}[[${selectedColumns}]]
 
     const connectionCode = this.generateDatabaseConnectionCode({ config, connectionName: uniqueEngineName });
 
+    if (DatabaseBulkLoadHandler.isBulkMode(config)) {
+      // COPY FROM STDIN instead of row-wise INSERTs
+      const writeCode = DatabaseBulkLoadHandler.generateWriteCode({
+        config,
+        inputName,
+        engineName: uniqueEngineName,
+        tableName: config.tsCFtableTableName.value,
+        schema: config.tsCFinputSchema,
+        dialect: "postgres",
+        method: "py_fn_postgres_copy_method",
+        label: "Postgres"
+      });
+      return `
+${connectionCode}
+${mappingsCode}${columnsCode}${writeCode}`;
+    }
+
     return `
 ${connectionCode}
 ${mappingsCode}${columnsCode}
@@ -1,5 +1,6 @@
 import { snowflakeIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent'; // Adjust the import path
+import { DatabaseBulkLoadHandler } from '../../common/DatabaseBulkLoadHandler';
 
 export class SnowflakeOutput extends BaseCoreComponent {
   constructor() {
@@ -94,11 +95,10 @@ export class SnowflakeOutput extends BaseCoreComponent {
           type: "radio",
           label: "Mode",
           id: "tsCFradioMode",
-          options: [
-            { value: "insert", label: "INSERT" }
-          ],
+          options: DatabaseBulkLoadHandler.getModeOptions(),
           advanced: true
         },
+        ...DatabaseBulkLoadHandler.getBulkLoadFields(),
         {
           type: "dataMapping",
           label: "Mapping",
@@ -131,16 +131,27 @@ export class SnowflakeOutput extends BaseCoreComponent {
   }
 
   public provideDependencies({ config }): string[] {
+    if (DatabaseBulkLoadHandler.isBulkMode(config)) {
+      return ['snowflake-sqlalchemy', 'snowflake-connector-python[pandas]'];
+    }
     return ['snowflake-sqlalchemy'];
   }
 
   public provideImports({ config }): string[] {
-    return [
+    const imports = [
       "import pandas as pd",
       "import sqlalchemy",
       "import urllib.parse",
       "from snowflake.sqlalchemy import URL"
     ];
+    if (DatabaseBulkLoadHandler.isBulkMode(config)) {
+      imports.push("from snowflake.connector.pandas_tools import pd_writer");
+    }
+    return imports;
+  }
+
+  public provideFunctions({ config }): string[] {
+    return DatabaseBulkLoadHandler.isBulkMode(config) ? DatabaseBulkLoadHandler.provideFunctions() : [];
   }
 
   public generateDatabaseConnectionCode({ config, connectionName }): string {
@@ -203,6 +214,23 @@ ${inputName} = ${inputName}[[${selectedColumns}]]
 
     const connectionCode = this.generateDatabaseConnectionCode({ config, connectionName: uniqueEngineName });
 
+    if (DatabaseBulkLoadHandler.isBulkMode(config)) {
+      // pd_writer stages the batch as Parquet and loads it with COPY INTO
+      const writeCode = DatabaseBulkLoadHandler.generateWriteCode({
+        config,
+        inputName,
+        engineName: uniqueEngineName,
+        tableName: config.tsCFtableTableName.value,
+        schema: config.tsCFinputSchema,
+        dialect: "snowflake",
+        method: "pd_writer",
+        label: "Snowflake"
+      });
+      return `
+${connectionCode}
+${mappingsCode}${columnsCode}${writeCode}`;
+    }
+
     return `
 ${connectionCode}
 ${mappingsCode}${columnsCode}
@@ -1,5 +1,6 @@
 import { sqlServerIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent'; // Adjust the import path
+import { DatabaseBulkLoadHandler } from '../../common/DatabaseBulkLoadHandler';
 
 export class SqlServerOutput extends BaseCoreComponent {
     constructor() {
@@ -79,11 +80,10 @@ export class SqlServerOutput extends BaseCoreComponent {
                     type: "radio",
                     label: "Mode",
                     id: "tsCFradioMode",
-                    options: [
-                        { value: "insert", label: "INSERT" }
-                    ],
+                    options: DatabaseBulkLoadHandler.getModeOptions(),
                     advanced: true
                 },
+                ...DatabaseBulkLoadHandler.getBulkLoadFields(),
                 {
                     type: "dataMapping",
                     label: "Mapping",
@@ -158,11 +158,18 @@ WHERE TABLE_NAME = '{{tsCFtableTableName.value}}' AND TABLE_SCHEMA = 'dbo';
 		"import pyodbc"];
     }
 
+    public provideFunctions({ config }): string[] {
+        return DatabaseBulkLoadHandler.isBulkMode(config) ? DatabaseBulkLoadHandler.provideFunctions() : [];
+    }
+
     public generateDatabaseConnectionCode({ config, connectionName }): string {
+        // fast_executemany sends each batch as parameter arrays instead of one round-trip per row
+        const fastExecutemany = DatabaseBulkLoadHandler.isBulkMode(config) ? `,
+  fast_executemany=True` : '';
         return `
 # Connect to the SQL Server database
 ${connectionName} = sqlalchemy.create_engine(
-  "mssql+pyodbc://${config.tsCFinputUserName}:${config.tsCFinputPassword}@${config.tsCFinputHost}:${config.tsCFinputPort}/${config.tsCFinputDatabaseName}?driver=ODBC+Driver+17+for+SQL+Server"
+  "mssql+pyodbc://${config.tsCFinputUserName}:${config.tsCFinputPassword}@${config.tsCFinputHost}:${config.tsCFinputPort}/${config.tsCFinputDatabaseName}?driver=ODBC+Driver+17+for+SQL+Server"${fastExecutemany}
 )
 `;
     }
@@ -208,6 +215,22 @@ ${connectionName} = sqlalchemy.create_engine(
 
         const connectionCode = this.generateDatabaseConnectionCode({ config, connectionName: uniqueEngineName });
 
+        if (DatabaseBulkLoadHandler.isBulkMode(config)) {
+            const writeCode = DatabaseBulkLoadHandler.generateWriteCode({
+                config,
+                inputName,
+                engineName: uniqueEngineName,
+                tableName: config.tsCFtableTableName,
+                schema: "dbo",
+                dialect: "sqlserver",
+                method: "None",
+                label: "SQL Server"
+            });
+            return `
+${connectionCode}
+${mappingsCode}${columnsCode}${writeCode}`;
+        }
+
         return `
 ${connectionCode}
 ${mappingsCode}${columnsCode}
@@ -115,12 +115,33 @@ export class CsvFileOutput extends BaseCoreComponent {
     return imports;
   }
 
-  public generateComponentCode({ config, inputName }): string {
+  public consumesChunks({ config }): boolean {
+    return true;
+  }
+
+  public generateComponentCode({ config, inputName, chunked = false }): string {
     const optionsString = this.generateOptionsCode(config);
     const createFoldersCode = config.createFoldersIfNotExist 
       ? `os.makedirs(os.path.dirname("${config.filePath}"), exist_ok=True)\n`
       : '';
 
+    if (chunked) {
+      // First chunk honours the configured mode and header, following chunks are appended
+      const appendOptionsString = this.generateOptionsCode({
+        ...config,
+        csvOptions: { ...config.csvOptions, mode: 'a', header: false }
+      });
+      const code = `
+# Export to CSV file, one chunk at a time
+${createFoldersCode}for py_var_chunk_index, py_var_chunk in enumerate(py_fn_iter_chunks(${inputName})):
+    if py_var_chunk_index == 0:
+        py_var_chunk.to_csv("${config.filePath}"${optionsString})
+    else:
+        py_var_chunk.to_csv("${config.filePath}"${appendOptionsString})
+`;
+      return code.trim();
+    }
+
     const code = `
 # Export to CSV file
 ${createFoldersCode}${inputName}.to_csv("${config.filePath}"${optionsString})
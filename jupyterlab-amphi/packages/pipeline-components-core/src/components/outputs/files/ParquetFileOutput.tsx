@@ -30,8 +30,34 @@ export class ParquetFileOutput extends BaseCoreComponent {
           label: "File path",
           id: "filePath",
           placeholder: "Type file name",
-          validation: "\\.(parquet)$",
-          validationMessage: "This field expects a file with a .parquet extension such as output.parquet."
+          validation: "\\.(parquet)$|^[^.]*$",
+          validationMessage: "This field expects a file with a .parquet extension such as output.parquet, or a folder when partitioning."
+        },
+        {
+          type: "columns",
+          label: "Partition columns",
+          id: "tsCFcolumnsPartitionCols",
+          tooltip: "Write a hive-partitioned folder (e.g. year=2023/) instead of a single file. Partitions present in the data are replaced, the others are kept.",
+          placeholder: "Select columns",
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Row group size (rows)",
+          id: "tsCFinputNumberRowGroupSize",
+          tooltip: "Maximum number of rows per row group. Smaller row groups let readers skip more data with filters, larger ones compress better.",
+          placeholder: "Default: engine default",
+          min: 1,
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Max rows per file",
+          id: "tsCFinputNumberMaxRowsPerFile",
+          tooltip: "Split the output in several files of at most this many rows, written by several threads. The file path is then used as a folder.",
+          placeholder: "Default: no limit",
+          min: 1,
+          advanced: true
         },
         {
           type: "radio",
@@ -80,12 +106,102 @@ export class ParquetFileOutput extends BaseCoreComponent {
     return imports;
   }
 
-  public generateComponentCode({ config, inputName }): string {
+  public provideFunctions({ config }): string[] {
+    if (!this.isDatasetOutput(config)) {
+      return [];
+    }
+    const tsWriteParquetDatasetFunction = `
+def py_fn_write_parquet_dataset(py_arg_data, py_arg_path, py_arg_partition_cols=None, py_arg_compression="snappy", py_arg_row_group_size=None, py_arg_max_rows_per_file=None, py_arg_storage_options=None):
+    """
+    Write a DataFrame, or a chunked stream of DataFrames, as a Parquet dataset folder
+    hive-partitioned on py_arg_partition_cols. Files are written by several threads.
+    """
+    import itertools
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    py_var_chunks = iter([py_arg_data]) if isinstance(py_arg_data, pd.DataFrame) else iter(py_arg_data)
+    py_var_first = next(py_var_chunks, None)
+    if py_var_first is None:
+        return
+    # Without the pandas metadata, partition keys are read back with their partition type
+    py_var_schema = pa.Schema.from_pandas(py_var_first, preserve_index=False).remove_metadata()
+
+    def py_fn_batches():
+        for py_var_chunk in itertools.chain([py_var_first], py_var_chunks):
+            yield from pa.Table.from_pandas(py_var_chunk, schema=py_var_schema, preserve_index=False).to_batches()
+
+    py_var_filesystem, py_var_target = None, py_arg_path
+    if "://" in py_arg_path:
+        import fsspec
+        py_var_filesystem, py_var_target = fsspec.core.url_to_fs(py_arg_path, **(py_arg_storage_options or {}))
+
+    py_var_max_rows_per_file = int(py_arg_max_rows_per_file) if py_arg_max_rows_per_file else 0
+    py_var_row_group_size = int(py_arg_row_group_size) if py_arg_row_group_size else 1024 * 1024
+    if py_var_max_rows_per_file:
+        py_var_row_group_size = min(py_var_row_group_size, py_var_max_rows_per_file)
+
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(py_var_schema, py_fn_batches()),
+        py_var_target,
+        format="parquet",
+        partitioning=py_arg_partition_cols or None,
+        partitioning_flavor="hive" if py_arg_partition_cols else None,
+        file_options=ds.ParquetFileFormat().make_write_options(compression=py_arg_compression),
+        max_rows_per_file=py_var_max_rows_per_file,
+        max_rows_per_group=py_var_row_group_size,
+        min_rows_per_group=py_var_row_group_size if py_arg_row_group_size else 0,
+        existing_data_behavior="delete_matching",
+        use_threads=True,
+        filesystem=py_var_filesystem
+    )
+`;
+    return [tsWriteParquetDatasetFunction];
+  }
+
+  public consumesChunks({ config }): boolean {
+    return true;
+  }
+
+  // Partitioned or size-bounded outputs are written as a dataset folder
+  public isDatasetOutput(config): boolean {
+    return (Array.isArray(config.tsCFcolumnsPartitionCols) && config.tsCFcolumnsPartitionCols.length > 0)
+      || !!config.tsCFinputNumberMaxRowsPerFile;
+  }
+
+  public generateComponentCode({ config, inputName, chunked = false }): string {
     const optionsString = this.generateOptionsCode(config);
     const createFoldersCode = config.createFoldersIfNotExist 
       ? `os.makedirs(os.path.dirname("${config.filePath}"), exist_ok=True)\n`
       : '';
 
+    if (this.isDatasetOutput(config)) {
+      const compression = config.parquetOptions?.compression;
+      const compressionString = !compression || compression === "None" ? "None" : `"${compression}"`;
+      const storageOptions = S3OptionsHandler.handleS3SpecificOptions(config, config.parquetOptions?.storage_options || {});
+      const storageOptionsString = Object.keys(storageOptions).length > 0 ? JSON.stringify(storageOptions) : 'None';
+      const partitionCols = (config.tsCFcolumnsPartitionCols || [])
+        .map(column => `"${String(column.value).trim()}"`)
+        .join(', ');
+      const code = `
+# Export to a Parquet dataset folder
+py_fn_write_parquet_dataset(${inputName}, "${config.filePath}", [${partitionCols}], ${compressionString}, ${config.tsCFinputNumberRowGroupSize || 'None'}, ${config.tsCFinputNumberMaxRowsPerFile || 'None'}, ${storageOptionsString})
+`;
+      return code.trim();
+    }
+
+    if (chunked) {
+      const compression = config.parquetOptions?.compression;
+      const compressionString = !compression || compression === "None" ? "None" : `"${compression}"`;
+      const storageOptions = S3OptionsHandler.handleS3SpecificOptions(config, config.parquetOptions?.storage_options || {});
+      const storageOptionsString = Object.keys(storageOptions).length > 0 ? JSON.stringify(storageOptions) : 'None';
+      const code = `
+# Export to Parquet file, one chunk at a time
+${createFoldersCode}py_fn_write_parquet_chunks(${inputName}, "${config.filePath}", ${compressionString}, ${storageOptionsString})
+`;
+      return code.trim();
+    }
+
     const code = `
 # Export to Parquet file
 ${createFoldersCode}${inputName}.to_parquet("${config.filePath}"${optionsString})
@@ -116,6 +232,10 @@ ${createFoldersCode}${inputName}.to_parquet("${config.filePath}"${optionsString}
         return `${key}="${value}"`;
       });
 
+    if (config.tsCFinputNumberRowGroupSize) {
+      optionsEntries.push(`row_group_size=${config.tsCFinputNumberRowGroupSize}`);
+    }
+
     const optionsString = optionsEntries.join(', ');
     return optionsString ? `, ${optionsString}` : '';
   }
@@ -1,6 +1,7 @@
 import { bucketIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
 import { S3OptionsHandler } from '../../common/S3OptionsHandler';
+import { S3TransferHandler } from '../../common/S3TransferHandler';
 import { CsvFileOutput } from './CsvFileOutput';
 import { JsonFileOutput } from './JsonFileOutput';
 import { ExcelFileOutput } from './ExcelFileOutput';
@@ -63,7 +64,8 @@ export class S3FileOutput extends BaseCoreComponent {
         ...filteredXmlFields.map(field => ({
           ...field,
           condition: { tsCFradioFileType: ["xml"], ...(field.condition || {}) }
-        }))
+        })),
+        ...S3TransferHandler.getWriteFields(["csv", "json", "excel", "xml"])
       ]
     };
 
@@ -72,31 +74,102 @@ export class S3FileOutput extends BaseCoreComponent {
     super("S3 File Output", "fileOutput", description, "pandas_df_output", [], "outputs", bucketIcon, defaultConfig, form);
   }
 
+  // Component writing the selected file type
+  public getFileComponent(config): any {
+    if (config.tsCFradioFileType === "csv") {
+      return new CsvFileOutput();
+    } else if (config.tsCFradioFileType === "json") {
+      return new JsonFileOutput();
+    } else if (config.tsCFradioFileType === "excel") {
+      return new ExcelFileOutput();
+    } else if (config.tsCFradioFileType === "parquet") {
+      return new ParquetFileOutput();
+    } else if (config.tsCFradioFileType === "xml") {
+      return new XmlFileOutput();
+    }
+    return null;
+  }
+
+  // Parquet datasets and Excel appends keep the writers of their file type, other files are uploaded in parts
+  public uploadsInParts(config): boolean {
+    if (config.tsCFradioFileType === "parquet") {
+      return !new ParquetFileOutput().isDatasetOutput(config);
+    } else if (config.tsCFradioFileType === "excel") {
+      return config.excelOptions?.mode !== 'append';
+    }
+    return ["csv", "json", "xml"].includes(config.tsCFradioFileType);
+  }
+
+  public provideDependencies({ config }): string[] {
+    let deps: string[] = ['s3fs'];
+    const component = this.getFileComponent(config);
+    if (component && typeof component.provideDependencies === 'function') {
+      component.provideDependencies({ config }).forEach(dep => dep && !deps.includes(dep) && deps.push(dep));
+    }
+    return deps;
+  }
+
   public provideImports({ config }): string[] {
     let imports = ["import pandas as pd"];
     if (config.createFoldersIfNotExist) {
       imports.push("import os");
     }
+    if (this.uploadsInParts(config)) {
+      S3TransferHandler.provideImports().forEach(imp => !imports.includes(imp) && imports.push(imp));
+    }
     return imports;
   }
 
+  public provideFunctions({ config }): string[] {
+    if (this.uploadsInParts(config)) {
+      return S3TransferHandler.provideFunctions();
+    }
+    const component = this.getFileComponent(config);
+    return component && typeof component.provideFunctions === 'function' ? component.provideFunctions({ config }) : [];
+  }
+
   public generateComponentCode({ config, inputName }): string {
+    const component = this.getFileComponent(config);
+    if (!component) {
+      return '';
+    }
+    if (!this.uploadsInParts(config)) {
+      return component.generateComponentCode({ config, inputName });
+    }
+
+    // The object is serialized in memory with the options of its file type, the upload opens the file system
+    const optionsKey = { csv: "csvOptions", json: "jsonOptions", excel: "excelOptions", parquet: "parquetOptions" }[config.tsCFradioFileType];
+    const writeConfig: any = optionsKey ? S3TransferHandler.withoutStorageOptions(config, optionsKey) : config;
+    if (writeConfig.csvOptions) {
+      // Objects cannot be appended to, they are always written whole
+      writeConfig.csvOptions = { ...writeConfig.csvOptions, storage_options: null, mode: null };
+    }
+
+    let writer = '';
     if (config.tsCFradioFileType === "csv") {
-      const csvComponent = new CsvFileOutput();
-      return csvComponent.generateComponentCode({ config, inputName });
+      writer = `frame.to_csv(buffer${component.generateOptionsCode(writeConfig)})`;
     } else if (config.tsCFradioFileType === "json") {
-      const jsonComponent = new JsonFileOutput();
-      return jsonComponent.generateComponentCode({ config, inputName });
+      writer = `frame.to_json(buffer${component.generateOptionsCode(writeConfig)})`;
     } else if (config.tsCFradioFileType === "excel") {
-      const excelComponent = new ExcelFileOutput();
-      return excelComponent.generateComponentCode({ config, inputName });
+      const engine = config.engine && config.engine !== 'None' ? `'${config.engine}'` : 'None';
+      writer = `frame.to_excel(buffer, engine=${engine}${component.generateOptionsCode(writeConfig)})`;
     } else if (config.tsCFradioFileType === "parquet") {
-      const parquetComponent = new ParquetFileOutput();
-      return parquetComponent.generateComponentCode({ config, inputName });
-    } else if (config.tsCFradioFileType === "xml") {
-      const xmlComponent = new XmlFileOutput();
-      return xmlComponent.generateComponentCode({ config, inputName });
+      writer = `frame.to_parquet(buffer${component.generateOptionsCode(writeConfig)})`;
+    } else {
+      writer = `frame.to_xml(buffer)`;
     }
-    return '';
+
+    const storageOptions = S3TransferHandler.getStorageOptions(config, config.csvOptions?.storage_options);
+    const storageOptionsString = Object.keys(storageOptions).length > 0 ? JSON.stringify(storageOptions) : 'None';
+    const partitionCols = config.tsCFradioFileType !== "parquet" && Array.isArray(config.tsCFcolumnsS3PartitionCols)
+      ? config.tsCFcolumnsS3PartitionCols.map(column => `"${String(column.value).trim()}"`)
+      : [];
+    const partitionColsString = partitionCols.length > 0 ? `[${partitionCols.join(', ')}]` : 'None';
+
+    const code = `
+# Export to S3, uploaded in concurrent parts
+py_fn_s3_write_frame(${inputName}, "${config.filePath}", lambda frame, buffer: ${writer}, ${storageOptionsString}, ${config.tsCFinputNumberS3PartSize || 50}, ${config.tsCFinputNumberS3MaxWorkers || 8}, ${partitionColsString})
+`;
+    return code.trim();
   }
 }
@@ -1,5 +1,6 @@
 import { aggregateIcon } from '../../icons';
 import { BaseCoreComponent } from '../BaseCoreComponent';
+import { SpillHandler } from '../common/SpillHandler';
 
 export class Aggregate extends BaseCoreComponent {
   constructor() {
@@ -32,7 +33,8 @@ export class Aggregate extends BaseCoreComponent {
             { value: "var", label: "Variance", tooltip: "Returns the variance of the group." },
             { value: "prod", label: "Product", tooltip: "Returns the product of all values in the group." }
           ],
-        }
+        },
+        ...SpillHandler.getSpillFields("For data larger than memory: partition the rows on disk by hash of the group by columns and aggregate one partition at a time. Needs group by columns. Groups come out by partition rather than sorted.")
       ],
     };
     const description = "Use Aggregate to perform various summary calculations such as sum, count, min/max, average, mean/median, count and more.";
@@ -40,8 +42,21 @@ export class Aggregate extends BaseCoreComponent {
     super("Aggregate Rows", "aggregate", description, "pandas_df_processor", [], "transforms", aggregateIcon, defaultConfig, form);
   }
 
+  // Without group by columns the aggregation has a single group and cannot be partitioned
+  private isSpilled(config): boolean {
+    return SpillHandler.isSpilled(config) && config.tsCFcolumnsGroupByColumns?.length > 0;
+  }
+
   public provideImports({ config }): string[] {
-    return [];
+    return this.isSpilled(config) ? SpillHandler.provideImports() : [];
+  }
+
+  public provideFunctions({ config }): string[] {
+    return this.isSpilled(config) ? SpillHandler.provideFunctions() : [];
+  }
+
+  public producesChunks({ config }): boolean {
+    return this.isSpilled(config);
   }
 
   public generateComponentCode({ config, inputName, outputName }) {
@@ -73,7 +88,13 @@ export class Aggregate extends BaseCoreComponent {
     // Generate groupby code
     let code = "";
 
-    if (groupColumns.length > 0) {
+    if (this.isSpilled(config)) {
+      // Groups share their partition, each partition is aggregated on its own
+      const keys = `[${groupColumns.map(col => `"${col}"`).join(",")}]`;
+      code += `
+${outputName} = py_fn_spill_apply(${inputName}, ${keys}, lambda py_arg_frame: py_arg_frame.groupby(${keys}).agg(${aggArgs}).reset_index()${SpillHandler.generateOptionsCode(config)})
+`;
+    } else if (groupColumns.length > 0) {
       code += `
 ${outputName} = ${inputName}.groupby([`;
 
@@ -25,7 +25,8 @@ export class CompareDataframes extends BaseCoreComponent {
           options: [
             { value: "pandas", label: "Pandas", tooltip: "Mature, easy-to-use, great for small-to-medium datasets." },
             { value: "polars", label: "Polars", tooltip: "Fast, memory-efficient, great for large-scale in-memory analytics." },
-            { value: "duckdb", label: "DuckDB", tooltip: "SQL-based, excellent for large datasets" }
+            { value: "duckdb", label: "DuckDB", tooltip: "SQL-based, excellent for large datasets" },
+            { value: "pandas_hash", label: "Pandas (hash-based)", tooltip: "Rows are compared through 64-bit hashes of their key and value columns, then column by column only where hashes differ. Lowest memory, best for reconciling large extracts." }
           ],
           advanced: true
         }
@@ -68,6 +69,18 @@ export class CompareDataframes extends BaseCoreComponent {
 		  advanced: true
         }
 		,
+        {
+          type: "inputNumber",
+          label: "Key hash chunks",
+          id: "tsCFinputNumberHashChunks",
+          tooltip: "Hash-based engine with key fields only: split the comparison in this many buckets of key hashes, joined one after the other to limit peak memory.",
+          placeholder: "Default: 1 (no chunking)",
+          min: 1,
+          max: 1024,
+		  condition: { tsCFselectExecutionEngine: ["pandas_hash"], tsCFselectComparisonMode: ["field_data","differing_fields"]},
+          advanced: true
+        }
+		,
         {
           type: "columns",
           label: "Fields to be ignored",
@@ -144,6 +157,7 @@ export class CompareDataframes extends BaseCoreComponent {
   public provideImports({ config }): string[] {
     return [
 	"import pandas as pd",
+	"import numpy as np",
 	"import polars as pl",
 	"import pyarrow",
 	"import duckdb",
@@ -566,6 +580,305 @@ def compare_pandas(
     else:
         raise ValueError(f"Unsupported comparison mode: {mode}")
 
+####pandas hash-based#########
+def pandas_hash_rows(df: pd.DataFrame, cols: list) -> pd.Series:
+    # One 64-bit hash per row over cols; -0.0 is normalized so that it hashes like 0.0
+    if not cols:
+        return pd.Series(0, index=df.index, dtype="uint64")
+    frame = df[cols]
+    float_cols = [col for col in cols if pd.api.types.is_float_dtype(frame[col])]
+    if float_cols:
+        frame = frame.copy(deep=False)
+        frame[float_cols] = frame[float_cols] + 0.0
+    return pd.util.hash_pandas_object(frame, index=False)
+
+def pandas_hash_common_columns(df1: pd.DataFrame, df2: pd.DataFrame, column_mismatch: str = "intersect") -> list:
+    if column_mismatch == "strict":
+        if set(df1.columns) != set(df2.columns):
+            missing_1 = set(df2.columns) - set(df1.columns)
+            missing_2 = set(df1.columns) - set(df2.columns)
+            raise ValueError(
+                f"Column mismatch: extra in df2={missing_1}, extra in df1={missing_2}"
+            )
+        return list(df1.columns)
+    elif column_mismatch == "intersect":
+        return [col for col in df1.columns if col in df2.columns]
+    else:
+        raise ValueError(f"Invalid column_mismatch value: {column_mismatch}")
+
+def pandas_hash_prepare(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    common_cols: list,
+    rounding: Optional[Dict[str, Union[int, str]]] = None
+):
+    # Restrict to common columns, round, and cast df2 to df1 dtypes so that equal values hash equally
+    df1 = pandas_apply_rounding_by_type(df1[common_cols], rounding)
+    df2 = pandas_apply_rounding_by_type(df2[common_cols], rounding)
+    mismatched = [col for col in common_cols if df1[col].dtype != df2[col].dtype]
+    if mismatched:
+        df2 = df2.copy(deep=False)
+        df2[mismatched] = pandas_align_dtypes(df1[mismatched], df2[mismatched])
+    return df1, df2
+
+def compare_pandas_hash_data(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    column_mismatch: str = "intersect",
+    rounding: Optional[Dict[str, Union[int, str]]] = None,
+    index_data_for_compare: bool = False,
+    check_forcount: bool = True,
+) -> pd.DataFrame:
+    # Same output as compare_pandas_data, but rows are reduced to one hash each and only
+    # the hash counts of both sides are joined, instead of grouping the union of both inputs.
+    if index_data_for_compare:
+        df1 = df1.reset_index(drop=True)
+        df2 = df2.reset_index(drop=True)
+        df1["_row_index_for_compare"] = df1.index
+        df2["_row_index_for_compare"] = df2.index
+
+    common_cols = pandas_hash_common_columns(df1, df2, column_mismatch)
+    df1, df2 = pandas_hash_prepare(df1, df2, common_cols, rounding)
+
+    all_cols = set(common_cols)
+    origin_col = get_safe_origin_column_name(all_cols, base_name="origin_data")
+    row_count_col = get_safe_origin_column_name(all_cols | {origin_col}, base_name="row_count")
+    diff_type_col = get_safe_origin_column_name(all_cols | {origin_col, row_count_col}, base_name="difference_type")
+    total_diff_col = get_safe_origin_column_name(all_cols | {origin_col, row_count_col, diff_type_col}, base_name="total_count_diff")
+
+    hash1 = pandas_hash_rows(df1, common_cols)
+    hash2 = pandas_hash_rows(df2, common_cols)
+    counts = pd.concat(
+        [hash1.value_counts().rename("left"), hash2.value_counts().rename("right")],
+        axis=1
+    ).fillna(0).astype("int64")
+
+    def side_rows(df, row_hashes, side, hashes, diff_type, total):
+        selected = row_hashes.isin(hashes).to_numpy()
+        first = ~row_hashes[selected].duplicated().to_numpy()
+        part = df[selected][first].reset_index(drop=True)
+        part_hashes = row_hashes[selected][first].to_numpy()
+        part[origin_col] = side
+        part[row_count_col] = counts[side].loc[part_hashes].to_numpy()
+        part[diff_type_col] = diff_type
+        part[total_diff_col] = total.loc[part_hashes].to_numpy()
+        return part
+
+    results = []
+
+    # (a) rows only in one side
+    only_left = counts.index[counts["right"] == 0]
+    only_right = counts.index[counts["left"] == 0]
+    if len(only_left):
+        results.append(side_rows(df1, hash1, "left", only_left, "row_differs", counts["left"]))
+    if len(only_right):
+        results.append(side_rows(df2, hash2, "right", only_right, "row_differs", counts["right"]))
+
+    # (b) rows present in both but with different counts
+    if check_forcount:
+        count_diff = counts[(counts["left"] > 0) & (counts["right"] > 0) & (counts["left"] != counts["right"])]
+        if not count_diff.empty:
+            diff_val = (count_diff["left"] - count_diff["right"]).abs()
+            results.append(side_rows(df1, hash1, "left", count_diff.index, "count_differs", diff_val))
+            results.append(side_rows(df2, hash2, "right", count_diff.index, "count_differs", diff_val))
+
+    if results:
+        diff_rows = pd.concat(results, ignore_index=True)
+    else:
+        # ensure correct dtypes when empty
+        empty_dict = {col: pd.Series(dtype=df1[col].dtype) for col in common_cols}
+        empty_dict.update({
+        origin_col: pd.Series(dtype="object"),
+        row_count_col: pd.Series(dtype="int64"),
+        diff_type_col: pd.Series(dtype="object"),
+        total_diff_col: pd.Series(dtype="int64"),
+        })
+        diff_rows = pd.DataFrame(empty_dict)
+
+    return pandas_align_dtypes(df1, diff_rows, null_representation="pd.NA")
+
+def compare_pandas_hash_count_data(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    column_mismatch: str = "intersect",
+    rounding: Optional[Dict[str, Union[int, str]]] = None,
+    index_data_for_compare: bool = False,
+    check_forcount: bool = True
+) -> pd.DataFrame:
+    diff_rows = compare_pandas_hash_data(
+        df1=df1,
+        df2=df2,
+        column_mismatch=column_mismatch,
+        rounding=rounding,
+        index_data_for_compare=index_data_for_compare,
+        check_forcount=check_forcount
+    )
+    row_count_col = get_safe_origin_column_name(set(diff_rows.columns), base_name="row_count")
+    return pd.DataFrame({row_count_col: [len(diff_rows)]})
+
+def compare_pandas_hash_data_field(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    key_fields: list[str],
+    column_mismatch: str = "intersect",
+    rounding: Optional[Dict[str, Union[int, str]]] = None,
+    index_data_for_compare: bool = False,
+    hash_chunks: Optional[int] = None,
+) -> pd.DataFrame:
+    # Same output as compare_pandas_data_field. Only key hashes and row positions are joined;
+    # rows whose value hashes match on both sides are dropped before any column is compared,
+    # and the remaining rows are compared with one vectorized mask per column.
+    # With hash_chunks > 1 the join runs separately on each bucket of key hashes.
+    if not key_fields:
+        raise ValueError("key_fields must be provided")
+
+    if index_data_for_compare:
+        df1 = df1.reset_index(drop=True)
+        df2 = df2.reset_index(drop=True)
+        df1["_row_index_for_compare"] = df1.index
+        df2["_row_index_for_compare"] = df2.index
+
+    common_cols = pandas_hash_common_columns(df1, df2, column_mismatch)
+    for k in key_fields:
+        if k not in common_cols:
+            raise ValueError(f"Key field {k} not in both datasets")
+    value_fields = [col for col in common_cols if col not in key_fields]
+
+    df1, df2 = pandas_hash_prepare(df1, df2, common_cols, rounding)
+
+    key_hash1 = pandas_hash_rows(df1, key_fields).to_numpy()
+    key_hash2 = pandas_hash_rows(df2, key_fields).to_numpy()
+    value_hash1 = pandas_hash_rows(df1, value_fields).to_numpy()
+    value_hash2 = pandas_hash_rows(df2, value_fields).to_numpy()
+
+    def emit(df, positions, field, origin, row_ids):
+        part = df[key_fields].iloc[positions].reset_index(drop=True)
+        part["Field"] = field
+        part["Value"] = df[field].iloc[positions].astype(str).to_numpy()
+        part["Origin"] = origin
+        part["_row"] = row_ids
+        return part
+
+    def compare_chunk(positions1, positions2):
+        pairs = pd.DataFrame({"h": key_hash1[positions1], "l": positions1}).merge(
+            pd.DataFrame({"h": key_hash2[positions2], "r": positions2}),
+            on="h", how="outer", sort=False
+        )
+        has_left = pairs["l"].notna().to_numpy()
+        has_right = pairs["r"].notna().to_numpy()
+        left_pos = pairs["l"].fillna(0).to_numpy(dtype="int64")
+        right_pos = pairs["r"].fillna(0).to_numpy(dtype="int64")
+
+        both = has_left & has_right
+        both[both] = value_hash1[left_pos[both]] != value_hash2[right_pos[both]]
+        both_left, both_right = left_pos[both], right_pos[both]
+        only_left = left_pos[has_left & ~has_right]
+        only_right = right_pos[has_right & ~has_left]
+
+        # Row ids keep the left and right values of the same key next to each other
+        both_ids = np.arange(len(both_left))
+        left_ids = np.arange(len(only_left)) + len(both_left)
+        right_ids = np.arange(len(only_right)) + len(both_left) + len(only_left)
+
+        parts = []
+        for field in value_fields:
+            left_values = df1[field].iloc[both_left].reset_index(drop=True)
+            right_values = df2[field].iloc[both_right].reset_index(drop=True)
+            left_null = left_values.isna().to_numpy()
+            right_null = right_values.isna().to_numpy()
+            diff_mask = left_values.ne(right_values).fillna(True).to_numpy(dtype=bool) & ~(left_null & right_null)
+
+            left_mask = diff_mask & ~left_null
+            right_mask = diff_mask & ~right_null
+            only_left_mask = df1[field].iloc[only_left].notna().to_numpy()
+            only_right_mask = df2[field].iloc[only_right].notna().to_numpy()
+
+            field_parts = [
+                emit(df1, both_left[left_mask], field, "left", both_ids[left_mask]),
+                emit(df2, both_right[right_mask], field, "right", both_ids[right_mask]),
+                emit(df1, only_left[only_left_mask], field, "left", left_ids[only_left_mask]),
+                emit(df2, only_right[only_right_mask], field, "right", right_ids[only_right_mask]),
+            ]
+            parts.append(pd.concat(field_parts, ignore_index=True).sort_values("_row", kind="stable"))
+        return parts
+
+    chunk_count = int(hash_chunks) if hash_chunks and int(hash_chunks) > 1 else 1
+    if chunk_count == 1:
+        parts = compare_chunk(np.arange(len(df1)), np.arange(len(df2)))
+    else:
+        bucket1 = key_hash1 % np.uint64(chunk_count)
+        bucket2 = key_hash2 % np.uint64(chunk_count)
+        parts = []
+        for bucket in range(chunk_count):
+            parts.extend(compare_chunk(np.flatnonzero(bucket1 == bucket), np.flatnonzero(bucket2 == bucket)))
+
+    parts = [part for part in parts if not part.empty]
+    if not parts:
+        empty_dict = {col: pd.Series(dtype=df1[col].dtype) for col in key_fields}
+        empty_dict.update({"Field": pd.Series(dtype="object"), "Value": pd.Series(dtype="object"), "Origin": pd.Series(dtype="object")})
+        return pd.DataFrame(empty_dict)
+    return pd.concat(parts, ignore_index=True).drop(columns="_row")
+
+def compare_pandas_hash_differing_fields(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    key_fields: list[str],
+    column_mismatch: str = "intersect",
+    rounding: Optional[Dict[str, Union[int, str]]] = None,
+    index_data_for_compare: bool = False,
+    hash_chunks: Optional[int] = None,
+) -> pd.DataFrame:
+    diffs = compare_pandas_hash_data_field(
+        df1, df2, key_fields=key_fields,
+        column_mismatch=column_mismatch,
+        rounding=rounding,
+        index_data_for_compare=index_data_for_compare,
+        hash_chunks=hash_chunks
+    )
+
+    return (
+        diffs.drop_duplicates(subset=["Field"] + key_fields)
+        .groupby("Field")
+        .size()
+        .reset_index(name="CountDistinctKeys")
+        .sort_values("Field")
+        .reset_index(drop=True)
+    )
+
+def compare_pandas_hash(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    mode: str = "data",
+    column_mismatch: str = "intersect",
+    rounding: Optional[Dict[str, Union[int, str]]] = None,
+    key_fields: Optional[list[str]] = None,
+    index_data_for_compare: bool = False,
+    index_metadata_for_compare: bool = True,
+    ignore_fields: Optional[list[str]] = None,
+    check_forcount: bool = True,
+    hash_chunks: Optional[int] = None
+) -> pd.DataFrame:
+
+    if ignore_fields:
+        df1 = df1.drop(columns=[f for f in ignore_fields if f in df1.columns])
+        df2 = df2.drop(columns=[f for f in ignore_fields if f in df2.columns])
+
+    if mode == "data":
+        return compare_pandas_hash_data(df1, df2, column_mismatch, rounding, index_data_for_compare, check_forcount)
+    elif mode == "count_data":
+        return compare_pandas_hash_count_data(df1, df2, column_mismatch, rounding, index_data_for_compare, check_forcount)
+    elif mode == "field_data":
+        return compare_pandas_hash_data_field(df1, df2, key_fields=key_fields, column_mismatch=column_mismatch, rounding=rounding, index_data_for_compare=index_data_for_compare, hash_chunks=hash_chunks)
+    elif mode == "differing_fields":
+        return compare_pandas_hash_differing_fields(df1, df2, key_fields=key_fields, column_mismatch=column_mismatch, rounding=rounding, index_data_for_compare=index_data_for_compare, hash_chunks=hash_chunks)
+    elif mode == "metadata":
+        # Metadata frames have one row per column, hashing brings nothing there
+        return compare_pandas_metadata(df1, df2, index_metadata_for_compare)
+    elif mode == "metadata+metrics":
+        return compare_pandas_metadata_and_metrics(df1, df2, index_metadata_for_compare)
+    else:
+        raise ValueError(f"Unsupported comparison mode: {mode}")
+
 ####polars#########
 def polars_apply_rounding_by_type(
     df: pl.DataFrame,
@@ -1310,6 +1623,7 @@ def py_fn_compare_datasets(
     index_metadata_for_compare: bool = True,
 	check_forcount: bool = True,
     ignore_fields: Optional[list[str]] = None,
+    hash_chunks: Optional[int] = None,
 ):
     #Parameters:
 		#execution_engine : execution engine (pandas, polars, duckdb...)
@@ -1322,6 +1636,7 @@ def py_fn_compare_datasets(
         #index_metadata_for_compare : true if the order of columns is relevant
         #ignore fields : fields that won't be in comparison
         #check_forcount : add a check on count for duplicate rows
+        #hash_chunks : pandas_hash engine only, number of key hash buckets compared one after the other
 
     #Returns:
         #pd.DataFrame: result of comparison result
@@ -1343,6 +1658,18 @@ def py_fn_compare_datasets(
             ignore_fields= ignore_fields,
             check_forcount=check_forcount
         )
+    elif execution_engine == "pandas_hash":
+        return compare_pandas_hash(
+            df1, df2, mode=mode,
+            column_mismatch=column_mismatch,
+            rounding=rounding,
+            key_fields=key_fields,
+            index_data_for_compare=index_data_for_compare,
+            index_metadata_for_compare=index_metadata_for_compare,
+            ignore_fields= ignore_fields,
+            check_forcount=check_forcount,
+            hash_chunks=hash_chunks
+        )
     elif execution_engine == "polars":
 		#Convert to polars dataframe both pandas dataframe
         df1_pl = pl.from_pandas(df1)
@@ -1378,7 +1705,7 @@ def py_fn_compare_datasets(
         else :
             return diff_rows
     else:
-        raise ValueError(f"Unsupported engine: {engine}")
+        raise ValueError(f"Unsupported engine: {execution_engine}")
     `;
     return [tsCompareFunction];
   }
@@ -1426,6 +1753,7 @@ def py_fn_compare_datasets(
 	const tsConstIndexDataForCompare = config.tsCFbooleanIndexDataForCompare ? "True" : "False";
 	const tsConstIndexMetadataForCompare = config.tsCFbooleanIndexMetadataForCompare ? "True" : "False";
 	const tsConstCheckForCount = config.tsCFbooleanCheckForCount ? "True" : "False";
+	const tsConstHashChunks = config.tsCFinputNumberHashChunks ? String(config.tsCFinputNumberHashChunks) : "None";
 	
     // Join the keys into a string for the Python code
     const tsConstKeyFieldsStr = `[${tsConstKeyFields.join(', ')}]`;
@@ -1446,7 +1774,8 @@ def py_fn_compare_datasets(
   ignore_fields=${tsConstFieldsToIgnoreStr},
   index_data_for_compare=${tsConstIndexDataForCompare},
   index_metadata_for_compare=${tsConstIndexMetadataForCompare},
-  check_forcount=${tsConstCheckForCount}
+  check_forcount=${tsConstCheckForCount},
+  hash_chunks=${tsConstHashChunks}
   )`
   
 
@@ -1,5 +1,6 @@
 import { dedupIcon } from '../../icons';
 import { BaseCoreComponent } from '../BaseCoreComponent';
+import { SpillHandler } from '../common/SpillHandler';
 
 
 
@@ -27,7 +28,8 @@ export class Deduplicate extends BaseCoreComponent {
           id: "tsCFcolumnsSubset",
           placeholder: "All columns",
           tooltip: "Columns considered for identifying duplicates. Leave empty to consider all columns."
-        }
+        },
+        ...SpillHandler.getSpillFields("For data larger than memory: partition the rows on disk by hash of the columns and deduplicate one partition at a time. Rows come out grouped by partition rather than in input order.")
       ],
     };
     const description = "Use Deduplicate to remove duplicate rows based on values on one or more columns.";
@@ -36,7 +38,15 @@ export class Deduplicate extends BaseCoreComponent {
   }
 
   public provideImports({ config }): string[] {
-    return [];
+    return SpillHandler.isSpilled(config) ? SpillHandler.provideImports() : [];
+  }
+
+  public provideFunctions({ config }): string[] {
+    return SpillHandler.isSpilled(config) ? SpillHandler.provideFunctions() : [];
+  }
+
+  public producesChunks({ config }): boolean {
+    return SpillHandler.isSpilled(config);
   }
 
   public generateComponentCode({ config, inputName, outputName }): string {
@@ -57,6 +67,13 @@ export class Deduplicate extends BaseCoreComponent {
       keep = config.tsCFselectKeep === "False" ? "False" : `"${config.tsCFselectKeep}"`;
     }
   
+    if (SpillHandler.isSpilled(config)) {
+      // Duplicates share their partition, each partition is deduplicated on its own
+      const keys = subset.length > 0 ? `[${subset.map(column => column.named ? `"${column.value.trim()}"` : column.value).join(', ')}]` : 'None';
+      code += `${outputName} = py_fn_spill_apply(${inputName}, ${keys}, lambda py_arg_frame: py_arg_frame.drop_duplicates(${columns}${columns ? ', ' : ''}keep=${keep})${SpillHandler.generateOptionsCode(config)})\n`;
+      return code;
+    }
+
     // Generating the code for deduplication
     code += `${outputName} = ${inputName}.drop_duplicates(${columns}${columns && keep ? `, keep=${keep}` : !columns && keep ? `keep=${keep}` : ''})\n`;
   
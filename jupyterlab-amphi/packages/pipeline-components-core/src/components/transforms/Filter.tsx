@@ -94,6 +94,11 @@ export class Filter extends BaseCoreComponent {
     return [];
   }
 
+  // Row-wise operation, can run on each chunk of a streamed input
+  public consumesChunks({ config }): boolean {
+    return true;
+  }
+
   public generateComponentCode({
     config,
     inputName,
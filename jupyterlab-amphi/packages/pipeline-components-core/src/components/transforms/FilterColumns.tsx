@@ -34,6 +34,11 @@ export class FilterColumns extends BaseCoreComponent {
     return [];
   }
 
+  // Row-wise operation, can run on each chunk of a streamed input
+  public consumesChunks({ config }): boolean {
+    return true;
+  }
+
   public generateComponentCode({ config, inputName, outputName }): string {
     const allColumns = config.tsCFtransferDataColumns.sourceData;
     const targetKeys = config.tsCFtransferDataColumns.targetKeys;
@@ -1,10 +1,13 @@
 import { activityIcon } from '../../icons';
 import { BaseCoreComponent } from '../BaseCoreComponent';
+import { SketchHandler } from '../common/SketchHandler';
 
 export class FrequencyAnalysis extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
-      tsCFcolumnsColumnsToAnalyze: []	  
+      tsCFcolumnsColumnsToAnalyze: [],
+      tsCFselectProfilingMode: "exact",
+      tsCFinputNumberTopValues: 100
     };
 
     const form = {
@@ -15,6 +18,25 @@ export class FrequencyAnalysis extends BaseCoreComponent {
           label: "Columns to analyze",
           id: "tsCFcolumnsColumnsToAnalyze",
           placeholder: "Leave blank to analyze all columns",
+        },
+        {
+          type: "select",
+          label: "Mode",
+          id: "tsCFselectProfilingMode",
+          options: [
+            { value: "exact", label: "Exact", tooltip: "Count every value exactly." },
+            { value: "approximate", label: "Approximate", tooltip: "For large datasets: keep only the most frequent values of each column, counted in one pass, with a column bounding their error." }
+          ],
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Top values",
+          id: "tsCFinputNumberTopValues",
+          tooltip: "Number of most frequent values kept per column, null values are always counted.",
+          min: 1,
+          condition: { tsCFselectProfilingMode: ["approximate"] },
+          advanced: true
         }
       ],
     };
@@ -25,11 +47,14 @@ export class FrequencyAnalysis extends BaseCoreComponent {
   }
 
   public provideImports({ config }): string[] {
-    return [
+    const imports = [
 	"import pandas as pd",
 	"from typing import List, Optional"
-	]
-;
+	];
+    if (config.tsCFselectProfilingMode === "approximate") {
+      imports.push(...SketchHandler.provideImports());
+    }
+    return imports;
   }
 
   public provideFunctions({ config }): string[] {
@@ -121,6 +146,65 @@ def py_fn_value_frequency(
 
     return py_freq
     `;
+    if (config.tsCFselectProfilingMode === "approximate") {
+      // Top values of each column, counted with a frequent items sketch
+      const tsFrequencyAnalysisApproximateFunction = `
+def py_fn_value_frequency_approximate(
+    py_arg_dataframe: pd.DataFrame,
+    py_arg_columns: Optional[List[str]] = None,
+    py_arg_top_values: int = 100,
+    py_arg_chunk_rows: int = 1_000_000
+) -> pd.DataFrame:
+    """
+    Approximate version of py_fn_value_frequency for large DataFrames, computed in one pass over row chunks.
+
+    Only the py_arg_top_values most frequent values of each column are returned, found with a
+    Misra-Gries summary. The returned frequencies are at most 'frequency_error' below the true
+    frequencies (0 when exact). Null values are counted exactly and percents are relative to the
+    number of rows, as in py_fn_value_frequency.
+    """
+    if py_arg_columns is None:
+        py_arg_columns = list(py_arg_dataframe.columns)
+
+    py_sketches = [py_fn_mg_new(max(10 * py_arg_top_values, 1000)) for _ in py_arg_columns]
+    py_nulls = [0] * len(py_arg_columns)
+    py_rows = 0
+    for py_chunk in py_fn_sketch_chunks(py_arg_dataframe[py_arg_columns], py_arg_chunk_rows):
+        py_rows += len(py_chunk)
+        for py_position, py_sketch in enumerate(py_sketches):
+            py_values = py_chunk.iloc[:, py_position]
+            py_nulls[py_position] += int(py_values.isna().sum())
+            py_fn_mg_update(py_sketch, py_values.dropna())
+
+    py_frames = []
+    for py_name, py_sketch, py_null_count in sorted(zip(py_arg_columns, py_sketches, py_nulls), key=lambda py_item: str(py_item[0])):
+        # A value kept by the sketch was seen at least once, even when its counter is down to 0
+        py_counts = py_sketch["counts"].clip(lower=1)
+        if py_null_count:
+            # Object index, so that the null row does not turn integer values into floats (and merge large ones)
+            py_counts = pd.Series(
+                np.append(py_counts.to_numpy(dtype="int64"), py_null_count),
+                index=pd.Index([*py_counts.index, np.nan], dtype=object)
+            )
+        py_top = py_counts.sort_values(ascending=False, kind="mergesort").head(py_arg_top_values)
+        py_frames.append(pd.DataFrame({
+            "field_name": py_name,
+            "field_value": py_top.index.to_numpy(dtype=object),
+            "frequency": py_top.to_numpy(dtype="int64"),
+            "frequency_error": np.where(py_top.index.isna(), 0, py_sketch["error"]).astype("int64")
+        }))
+
+    py_freq = pd.concat(py_frames, ignore_index=True) if py_frames else pd.DataFrame(columns=["field_name", "field_value", "frequency", "frequency_error"])
+    py_freq["field_name"] = py_freq["field_name"].astype("string")
+    py_freq["frequency"] = py_freq["frequency"].astype("int64")
+    py_freq["frequency_error"] = py_freq["frequency_error"].astype("int64")
+    py_freq["percent"] = (py_freq["frequency"] / max(py_rows, 1) * 100.0).astype("float64")
+    py_freq["cumulative_frequency"] = py_freq.groupby("field_name")["frequency"].cumsum().astype("int64")
+    py_freq["cumulative_percent"] = py_freq.groupby("field_name")["percent"].cumsum().astype("float64")
+    return py_freq[["field_name", "field_value", "frequency", "percent", "cumulative_frequency", "cumulative_percent", "frequency_error"]]
+`;
+      return [...SketchHandler.provideFunctions(), tsFrequencyAnalysisApproximateFunction];
+    }
     return [tsFrequencyAnalysisFunction];
   }
 
@@ -133,6 +217,17 @@ def py_fn_value_frequency(
         .join(", ")}]`;
     }
 
+    if (config.tsCFselectProfilingMode === "approximate") {
+      const tsConstTopValues = config.tsCFinputNumberTopValues || 100;
+      return `
+${outputName}=py_fn_value_frequency_approximate(
+    py_arg_dataframe=${inputName},
+    py_arg_columns=${tsConstColumnsToAnalyze},
+    py_arg_top_values=${tsConstTopValues}
+    )
+`;
+    }
+
     return `
 ${outputName}=py_fn_value_frequency(	
     py_arg_dataframe=${inputName},
@@ -74,8 +74,7 @@ export class HierarchyPath extends BaseCoreComponent {
   public provideImports({ config }): string[] {
     return [
       "import pandas as pd",
-      "import numpy as np",
-      "from collections import defaultdict"];
+      "import numpy as np"];
   }
 
   public provideFunctions({ config }): string[] {
@@ -83,91 +82,191 @@ export class HierarchyPath extends BaseCoreComponent {
     // Functions to find the path of each node of hierarchy
     const tsHierarchyPathFunction = `
 def py_fn_build_all_hierarchy_paths(df, parent_col, child_col, separator=" > ", aggregations=None):
-    child_to_parents = defaultdict(set)
-    for _, row in df.iterrows():
-        child_to_parents[row[child_col]].add(row[parent_col])
-
-    def get_paths(node, visited=None):
-        if visited is None:
-            visited = set()
-        if node in visited:
-            return [[f"{node}{separator}[CYCLE DETECTED]"]]
-        visited.add(node)
-        parents = child_to_parents.get(node)
-        if not parents or all(pd.isna(p) for p in parents):
-            return [[node]]
-        all_paths = []
-        for parent in parents:
-            if pd.isna(parent):
-                all_paths.append([node])
-            else:
-                for path in get_paths(parent, visited.copy()):
-                    all_paths.append(path + [node])
-        return all_paths
-
-    rows = []
-    for child in df[child_col].unique():
-        paths = get_paths(child)
-        for path in paths:
-            flat_path = separator.join(str(p) for p in path)
-            head = path[0] if path else None
-            length = len(path)
-            rows.append((child, path, flat_path, head, length))
-
-    result_df = pd.DataFrame(rows, columns=[child_col, "_path_nodes", "hierarchy_path", "head_node", "path_length"])
-    result_df["hierarchy_path"] = result_df["hierarchy_path"].astype("string")
-    
-    # Identify root nodes (parents that never appear as children)
-    all_children = set(df[child_col].dropna().unique())
-    all_parents = set(df[parent_col].dropna().unique())
-    root_only_nodes = all_parents - all_children
-
-    # Add a row for each root node
-    for root in root_only_nodes:
-      result_df.loc[len(result_df)] = {
-        child_col: root,
-        "_path_nodes": [root],
-        "hierarchy_path": str(root),
-        "head_node": root,
-        "path_length": 1
-      }
-    
-    if aggregations:
-        for agg_label, field, func in aggregations:
-            values = []
-            expected_dtype = df[field].dtype if field in df.columns else None
-
-            for path_nodes in result_df["_path_nodes"]:
-                # Build edge set from consecutive nodes in the path
-                edges = set(zip(path_nodes[:-1], path_nodes[1:]))
-                # Filter rows in df that match those edges
-                mask = df.apply(lambda row: (row[parent_col], row[child_col]) in edges, axis=1)
-                path_df = df[mask]
-                series = path_df[field]
-
-                if func == "sum":
-                    agg_value = series.sum(skipna=True)
-                elif func == "max":
-                    agg_value = series.max(skipna=True)
-                elif func == "min":
-                    agg_value = series.min(skipna=True)
-                elif func == "mean":
-                    agg_value = series.mean(skipna=True)
-                elif func == "count":
-                    agg_value = series.count()
+    """
+    Build the root-to-node paths of every node of a parent/child hierarchy.
+    Nodes are integer coded once and paths are expanded level by level from the roots
+    over CSR adjacency arrays. Only nodes with a cycle among their ancestors are walked
+    depth-first, reusing the paths already built for their acyclic ancestors.
+    """
+    aggregations = aggregations or []
+
+    # Integer-code the nodes, child values first so that they label the nodes
+    values = pd.concat([df[child_col].astype(object), df[parent_col].astype(object)], ignore_index=True)
+    codes, uniques = pd.factorize(values)
+    uniques = np.asarray(uniques, dtype=object)
+    n_rows, n_nodes = len(df), len(uniques)
+    child_codes, parent_codes = codes[:n_rows], codes[n_rows:]
+    labels = np.array([str(node) for node in uniques], dtype=object)
+
+    # Unique edges, sorted by parent: CSR adjacency from parents to children
+    valid = (child_codes >= 0) & (parent_codes >= 0)
+    edge_keys, edge_of_row = np.unique(parent_codes[valid].astype(np.int64) * max(n_nodes, 1) + child_codes[valid], return_inverse=True)
+    edge_parents, edge_children = edge_keys // max(n_nodes, 1), edge_keys % max(n_nodes, 1)
+    n_edges = len(edge_keys)
+    child_offsets = np.concatenate([[0], np.cumsum(np.bincount(edge_parents, minlength=n_nodes))])
+
+    def expand(nodes):
+        # (index in nodes, edge) pairs for every child edge of the given nodes
+        counts = child_offsets[nodes + 1] - child_offsets[nodes]
+        owners = np.repeat(np.arange(len(nodes)), counts)
+        positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(child_offsets[nodes], counts)
+        return owners, positions
+
+    # A path starts on nodes without parent or with a null parent
+    has_null_parent = np.zeros(n_nodes, dtype=bool)
+    has_null_parent[child_codes[(child_codes >= 0) & (parent_codes < 0)]] = True
+    is_child = np.zeros(n_nodes, dtype=bool)
+    is_child[child_codes[child_codes >= 0]] = True
+    is_start = has_null_parent | ~is_child
+
+    # Peel the hierarchy from the roots: nodes never settled have a cycle among their ancestors
+    remaining = np.bincount(edge_children, minlength=n_nodes)
+    settled = np.zeros(n_nodes, dtype=bool)
+    frontier = np.flatnonzero(remaining == 0)
+    while len(frontier):
+        settled[frontier] = True
+        targets = edge_children[expand(frontier)[1]]
+        remaining -= np.bincount(targets, minlength=n_nodes)
+        frontier = np.unique(targets[remaining[targets] == 0])
+
+    # Aggregations accumulate per-edge statistics of the input rows along each path
+    def pick(current, candidate, take_min):
+        current = current.copy()
+        current_missing, candidate_missing = pd.isna(current), pd.isna(candidate)
+        replace = current_missing & ~candidate_missing
+        both = ~current_missing & ~candidate_missing
+        replace[both] = (candidate[both] < current[both]) if take_min else (candidate[both] > current[both])
+        current[replace] = candidate[replace]
+        return current
+
+    accumulators = {}
+    for _, field, func in aggregations:
+        for kind in {"mean": ["sum", "count"]}.get(func, [func]):
+            if kind in ("sum", "count", "min", "max") and (kind, field) not in accumulators:
+                grouped = pd.Series(df[field].to_numpy()[valid]).groupby(edge_of_row)
+                if kind in ("sum", "count"):
+                    accumulators[(kind, field)] = (getattr(grouped, kind)().reindex(range(n_edges), fill_value=0).to_numpy(), 0)
+                else:
+                    edge_stats = getattr(grouped, kind)().reindex(range(n_edges)).to_numpy()
+                    edge_stats = edge_stats.astype("float64") if edge_stats.dtype.kind in "iub" else edge_stats
+                    accumulators[(kind, field)] = (edge_stats if edge_stats.dtype.kind == "f" else edge_stats.astype(object), np.nan)
+    accumulator_keys = list(accumulators)
+
+    def accumulate(key, states, edges):
+        if key[0] in ("sum", "count"):
+            return states + accumulators[key][0][edges]
+        return pick(states, accumulators[key][0][edges], key[0] == "min")
+
+    # Expand all paths of settled nodes, level by level, from the start nodes
+    nodes = np.flatnonzero(is_start & settled)
+    level = {
+        "node": nodes,
+        "path": labels[nodes],
+        "head": uniques[nodes],
+        "length": np.ones(len(nodes), dtype=np.int64),
+        "states": [np.full(len(nodes), accumulators[key][1], dtype=accumulators[key][0].dtype) for key in accumulator_keys]
+    }
+    levels = []
+    settled_edge = settled[edge_children]
+    while len(level["node"]):
+        levels.append(level)
+        owners, positions = expand(level["node"])
+        keep = settled_edge[positions]
+        owners, positions = owners[keep], positions[keep]
+        children = edge_children[positions]
+        level = {
+            "node": children,
+            "path": level["path"][owners] + separator + labels[children],
+            "head": level["head"][owners],
+            "length": level["length"][owners] + 1,
+            "states": [accumulate(key, state[owners], positions) for key, state in zip(accumulator_keys, level["states"])]
+        }
+
+    path_nodes = np.concatenate([level["node"] for level in levels]) if levels else np.array([], dtype=np.int64)
+    path_strings = np.concatenate([level["path"] for level in levels]) if levels else np.array([], dtype=object)
+    path_heads = np.concatenate([level["head"] for level in levels]) if levels else np.array([], dtype=object)
+    path_lengths = np.concatenate([level["length"] for level in levels]) if levels else np.array([], dtype=np.int64)
+    path_states = [np.concatenate([level["states"][index] for level in levels]) if levels else np.array([]) for index in range(len(accumulator_keys))]
+
+    # Nodes below a cycle: depth-first walk up their parents, as a chain of records
+    unsettled = np.flatnonzero(~settled)
+    if len(unsettled):
+        paths_of = pd.Series(np.arange(len(path_nodes))).groupby(path_nodes).apply(list).to_dict()
+        parent_order = np.argsort(edge_children, kind="stable")
+        parent_offsets = np.concatenate([[0], np.cumsum(np.bincount(edge_children, minlength=n_nodes))])
+
+        def combine_scalar(key, current, edge):
+            value = accumulators[key][0][edge]
+            if key[0] in ("sum", "count"):
+                return current + value
+            if pd.isna(value):
+                return current
+            if pd.isna(current):
+                return value
+            return min(current, value) if key[0] == "min" else max(current, value)
+
+        def start_record(node):
+            return (labels[node], uniques[node], 1, [accumulators[key][1] for key in accumulator_keys], True)
+
+        def walk(node, visited):
+            # Records are (path, head, length, states, ends on a node)
+            if node in visited:
+                marker = f"{labels[node]}{separator}[CYCLE DETECTED]"
+                return [(marker, marker, 1, [accumulators[key][1] for key in accumulator_keys], False)]
+            visited = visited | {node}
+            records = [start_record(node)] if has_null_parent[node] else []
+            for edge in parent_order[parent_offsets[node]:parent_offsets[node + 1]]:
+                parent = edge_parents[edge]
+                if settled[parent]:
+                    parent_records = [
+                        (path_strings[index], path_heads[index], path_lengths[index], [state[index] for state in path_states], True)
+                        for index in paths_of.get(parent, [])
+                    ]
                 else:
-                    agg_value = np.nan
+                    parent_records = walk(parent, visited)
+                for path, head, length, states, on_node in parent_records:
+                    if on_node:
+                        states = [combine_scalar(key, state, edge) for key, state in zip(accumulator_keys, states)]
+                    records.append((f"{path}{separator}{labels[node]}", head, length + 1, states, True))
+            return records
+
+        extra = [(node, record) for node in unsettled for record in walk(node, frozenset())]
+        if extra:
+            path_nodes = np.concatenate([path_nodes, np.array([node for node, _ in extra], dtype=np.int64)])
+            path_strings = np.concatenate([path_strings, np.array([record[0] for _, record in extra], dtype=object)])
+            path_heads = np.concatenate([path_heads, np.array([record[1] for _, record in extra], dtype=object)])
+            path_lengths = np.concatenate([path_lengths, np.array([record[2] for _, record in extra], dtype=np.int64)])
+            path_states = [
+                np.concatenate([state, np.array([record[3][index] for _, record in extra], dtype=object)])
+                for index, state in enumerate(path_states)
+            ]
 
-                values.append(agg_value)
+    # Children in order of appearance, then the root-only nodes
+    order = np.argsort(path_nodes, kind="stable")
+    result_df = pd.DataFrame({
+        child_col: uniques[path_nodes[order]],
+        "hierarchy_path": pd.array(path_strings[order], dtype="string"),
+        "head_node": path_heads[order],
+        "path_length": path_lengths[order]
+    })
+    states = {key: pd.Series(state[order]) for key, state in zip(accumulator_keys, path_states)}
 
-            result_df[agg_label] = pd.Series(values)
-            if expected_dtype is not None:
-                try:
-                    result_df[agg_label] = result_df[agg_label].astype(expected_dtype)
-                except Exception:
-                    pass
+    for agg_label, field, func in aggregations:
+        expected_dtype = df[field].dtype if field in df.columns else None
+        if func in ("sum", "count", "min", "max"):
+            result_df[agg_label] = states[(func, field)].infer_objects()
+        elif func == "mean":
+            counts = states[("count", field)].astype("float64")
+            result_df[agg_label] = (states[("sum", field)].astype("float64") / counts).where(counts > 0)
+        else:
+            result_df[agg_label] = np.nan
+        if expected_dtype is not None:
+            try:
+                result_df[agg_label] = result_df[agg_label].astype(expected_dtype)
+            except Exception:
+                pass
 
-    return result_df.drop(columns="_path_nodes")
+    return result_df
     `;
     return [tsHierarchyPathFunction];
   }
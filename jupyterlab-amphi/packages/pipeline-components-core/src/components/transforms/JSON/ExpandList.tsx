@@ -1,5 +1,6 @@
 import { expandJsonIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
+import { JSONColumnHandler } from '../../common/JSONColumnHandler';
 
 export class ExpandList extends BaseCoreComponent {
   constructor() {
@@ -21,7 +22,30 @@ export class ExpandList extends BaseCoreComponent {
   }
 
   public provideImports({ config }): string[] {
-    return ["import pandas as pd"];
+    return JSONColumnHandler.provideImports();
+  }
+
+  public provideFunctions({ config }): string[] {
+    const tsExpandListFunction = `
+def py_fn_expand_json_list(py_arg_series):
+    """
+    Expand a column of lists (or JSON list text) into one column per list position,
+    and a column of objects into one column per key. Values are split on the Arrow list
+    offsets; columns mixing several value types fall back to Series.apply(pd.Series).
+    Only text holding a JSON array or object is parsed, other text is kept as it is.
+    """
+    py_var_values, _, py_var_invalid = py_fn_json_parse_column(py_arg_series, py_arg_containers_only=True)
+    # Text that is not JSON stays a plain value
+    py_var_values[py_var_invalid] = py_arg_series.to_numpy(dtype=object)[py_var_invalid]
+
+    py_var_array = py_fn_json_to_arrow(py_var_values)
+    if py_var_array is not None and pa.types.is_list(py_var_array.type):
+        return py_fn_json_columns_to_frame(py_fn_json_list_columns(py_var_array), py_arg_series.index)
+    if py_var_array is not None and pa.types.is_struct(py_var_array.type):
+        return py_fn_json_columns_to_frame(py_fn_json_flatten_arrow(py_var_array, py_arg_max_level=0), py_arg_series.index)
+    return pd.Series(py_var_values, index=py_arg_series.index, dtype=object).apply(pd.Series)
+`;
+    return [...JSONColumnHandler.provideFunctions(), tsExpandListFunction];
   }
 
   public generateComponentCode({ config, inputName, outputName }): string {
@@ -35,7 +59,7 @@ export class ExpandList extends BaseCoreComponent {
     columnReference = columnIsNamed ? `'${columnName}'` : columnName;
 
     let code = `# Expand the list in the specified column\n`;
-    code += `${outputName} = ${inputName}[${columnReference}].apply(pd.Series)\n`;
+    code += `${outputName} = py_fn_expand_json_list(${inputName}[${columnReference}])\n`;
 
     return code;
   }
@@ -1,5 +1,6 @@
 import { expandIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
+import { JSONColumnHandler } from '../../common/JSONColumnHandler';
 
 //test : some tests can be played with both json files in test-assets. Use it as a whole and then play with different arrays and objects levels.
 
@@ -105,8 +106,7 @@ export class ExplodeJSON extends BaseCoreComponent {
 
   public provideImports({ config }): string[] {
     return [
-	   "import json",
-       "import pandas as pd",
+       ...JSONColumnHandler.provideImports(),
        "import polars as pl",
        "import duckdb"
     ];
@@ -219,18 +219,15 @@ def py_fn_explode_json_column(
 
         return expanded
 
-    all_rows = []
+    # Parse the whole column at once, rows with invalid JSON text are dropped
+    parsed_values, _, invalid_values = py_fn_json_parse_column(df[py_arg_json_col])
 
-    for _, row in df.iterrows():
-        raw_value = row[py_arg_json_col]
+    all_rows = []
+    parent_positions = []
 
-        if isinstance(raw_value, str):
-            try:
-                parsed_json = json.loads(raw_value)
-            except json.JSONDecodeError:
-                continue
-        else:
-            parsed_json = raw_value
+    for position, parsed_json in enumerate(parsed_values):
+        if invalid_values[position]:
+            continue
 
         # ---- ROOT NORMALIZATION ----
         if isinstance(parsed_json, list):
@@ -255,26 +252,43 @@ def py_fn_explode_json_column(
             if py_arg_flatten_arrays_as_rows:
                 rows = _py_fin_expand_all_arrays(rows)
 
-            for r in rows:
-                output_row = row.drop(labels=[py_arg_json_col]).to_dict()
-
-                if py_arg_keep_raw_json:
-                    output_row[py_arg_json_col] = raw_value
-
-                output_row.update(r)
-                all_rows.append(output_row)
+            all_rows.extend(rows)
+            parent_positions.extend([position] * len(rows))
+
+    # The other columns are taken once per output row from the parent row positions
+    base_columns = [col for col in df.columns if col != py_arg_json_col]
+    if py_arg_keep_raw_json:
+        base_columns.append(py_arg_json_col)
+    result = df[base_columns].iloc[parent_positions].reset_index(drop=True)
+    exploded = pd.DataFrame(all_rows, index=result.index)
+
+    # Exploded keys named like an input column replace its values on the rows holding the key,
+    # mixed columns are rebuilt from the values so that their type is inferred as a whole
+    overlapping = [col for col in exploded.columns if col in result.columns]
+    for col in overlapping:
+        has_key = np.fromiter((col in row for row in all_rows), dtype=bool, count=len(all_rows))
+        if has_key.all():
+            result[col] = exploded[col]
+        elif has_key.any():
+            base_values = result[col].to_numpy(dtype=object)
+            result[col] = pd.Series(
+                [row[col] if has_key[i] else base_values[i] for i, row in enumerate(all_rows)],
+                index=result.index,
+                dtype=object
+            ).infer_objects()
+    result = pd.concat([result, exploded.drop(columns=overlapping)], axis=1)
 
     if py_arg_output_engine == "pandas":
-        return pd.DataFrame(all_rows)
+        return result
     elif py_arg_output_engine == "polars":
-        return pl.DataFrame(all_rows)
+        return pl.from_pandas(result)
     elif py_arg_output_engine == "duckdb":
-        return duckdb.from_df(pd.DataFrame(all_rows))
+        return duckdb.from_df(result)
     else:
         raise ValueError("Invalid output engine. Choose 'pandas', 'polars', or 'duckdb'.")
 
 	    `;
-    return [tsExplodeJSONFunction];
+    return [...JSONColumnHandler.provideFunctions(), tsExplodeJSONFunction];
   }
   
   public generateComponentCode({ config, inputName, outputName }): string {
@@ -1,5 +1,6 @@
 import { expandIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
+import { JSONColumnHandler } from '../../common/JSONColumnHandler';
 
 
 export class FlattenJSON extends BaseCoreComponent {
@@ -62,10 +63,33 @@ export class FlattenJSON extends BaseCoreComponent {
   }
 
   public provideImports({ config }): string[] {
-    return [
-      "import pandas as pd",
-      "from pandas import json_normalize"
-    ];
+    return JSONColumnHandler.provideImports();
+  }
+
+  public provideFunctions({ config }): string[] {
+    const tsFlattenJSONFunction = `
+def py_fn_flatten_json_column(py_arg_series, py_arg_sep=".", py_arg_max_level=None):
+    """
+    Flatten a column of objects (or JSON object text) into one column per nested key.
+    Objects are normalized to an Arrow struct array whose fields are flattened without
+    building a row per object; columns whose keys change type across rows fall back to
+    pandas.json_normalize.
+    """
+    py_var_values, _, py_var_invalid = py_fn_json_parse_column(py_arg_series)
+    py_var_values[py_var_invalid] = None
+
+    py_var_array = py_fn_json_to_arrow(py_var_values)
+    if py_var_array is not None and pa.types.is_struct(py_var_array.type):
+        return py_fn_json_columns_to_frame(py_fn_json_flatten_arrow(py_var_array, py_arg_sep, py_arg_max_level), py_arg_series.index)
+    py_var_flat = pd.json_normalize(
+        [py_var_value if isinstance(py_var_value, dict) else {} for py_var_value in py_var_values],
+        sep=py_arg_sep,
+        max_level=py_arg_max_level
+    )
+    py_var_flat.index = py_arg_series.index
+    return py_var_flat
+`;
+    return [...JSONColumnHandler.provideFunctions(), tsFlattenJSONFunction];
   }
 
   public generateComponentCode({ config, inputName, outputName }): string {
@@ -79,9 +103,9 @@ export class FlattenJSON extends BaseCoreComponent {
 
     let code = `# Flatten JSON in the specified column\n`;
     if (const_ts_boolean_keepAll) {
-	code += `${outputName} = ${inputName}.join(pd.json_normalize(${inputName}[${columnReference}],sep='${const_ts_levelseparator}',max_level=${const_ts_inputnumber_maxlevel}))\n`;
+	code += `${outputName} = ${inputName}.join(py_fn_flatten_json_column(${inputName}[${columnReference}],py_arg_sep='${const_ts_levelseparator}',py_arg_max_level=${const_ts_inputnumber_maxlevel}))\n`;
     } else {
-      code += `${outputName} = pd.json_normalize(${inputName}[${columnReference}],sep='${const_ts_levelseparator}',max_level=${const_ts_inputnumber_maxlevel})\n`;
+      code += `${outputName} = py_fn_flatten_json_column(${inputName}[${columnReference}],py_arg_sep='${const_ts_levelseparator}',py_arg_max_level=${const_ts_inputnumber_maxlevel}).reset_index(drop=True)\n`;
     }
     return code;
   }
@@ -93,6 +93,10 @@ export class JSONTools extends BaseCoreComponent {
   public provideFunctions({ config }): string[] {
     if (config.tsCFradioToolType === 'explodeJSON' && typeof (ExplodeJSON as any).prototype.provideFunctions === 'function') {
       return new ExplodeJSON().provideFunctions({ config });
+    } else if (config.tsCFradioToolType === 'expandList') {
+      return new ExpandList().provideFunctions({ config });
+    } else if (config.tsCFradioToolType === 'flattenJSON') {
+      return new FlattenJSON().provideFunctions({ config });
     } else if (config.tsCFradioToolType === 'validateJSON' && typeof (ValidateJSON as any).prototype.provideFunctions === 'function') {
       return new ValidateJSON().provideFunctions({ config });
     } else if (config.tsCFradioToolType === 'createJSONfromTable' && typeof (CreateJSONfromTable as any).prototype.provideFunctions === 'function') {
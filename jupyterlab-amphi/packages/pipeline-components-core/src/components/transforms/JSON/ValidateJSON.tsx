@@ -1,5 +1,6 @@
 import { expandIcon } from '../../../icons';
 import { BaseCoreComponent } from '../../BaseCoreComponent';
+import { JSONColumnHandler } from '../../common/JSONColumnHandler';
 
 export class ValidateJSON extends BaseCoreComponent {
   constructor() {
@@ -44,9 +45,8 @@ export class ValidateJSON extends BaseCoreComponent {
 
   public provideImports({ config }): string[] {
     return [
-	   "import json",
-	   "from typing import List",
-       "import pandas as pd"//,
+	   ...JSONColumnHandler.provideImports(),
+	   "from typing import List"//,
        //"import polars as pl",
        //"import duckdb"
     ];
@@ -68,7 +68,9 @@ def py_fn_validate_json_columns(
 
     A value is considered valid JSON if:
     - It is a valid JSON string
-    - It can be successfully parsed using json.loads
+    - It can be successfully parsed (orjson when installed, json.loads otherwise)
+
+    Each distinct string is parsed once.
 
     Parameters
     ----------
@@ -84,47 +86,19 @@ def py_fn_validate_json_columns(
         DataFrame with additional boolean validation columns.
     """
 
-    def _py_fn_is_valid_json(py_arg_value: object) -> bool:
-        """
-        Check whether a value is valid JSON.
-
-        Parameters
-        ----------
-        py_arg_value : object
-            Value to validate.
-
-        Returns
-        -------
-        bool
-            True if the value is valid JSON, otherwise False.
-        """
-
-        if pd.isna(py_arg_value):
-            return False
-
-        if not isinstance(py_arg_value, str):
-            return False
-
-        try:
-            json.loads(py_arg_value)
-            return True
-        except (TypeError, ValueError, json.JSONDecodeError):
-            return False
-
     py_output_dataframe = py_arg_dataframe.copy()
 
     for py_col in py_arg_columns_to_validate:
         py_validation_column = f"is_{py_col}_valid_json"
 
-        py_output_dataframe[py_validation_column] = (
+        py_output_dataframe[py_validation_column] = py_fn_json_validate_column(
             py_output_dataframe[py_col]
-            .apply(_py_fn_is_valid_json)
         )
 
     return py_output_dataframe
 
 	    `;
-    return [tsValidateJSONFunction];
+    return [...JSONColumnHandler.provideFunctions(), tsValidateJSONFunction];
   }
   
   public generateComponentCode({ config, inputName, outputName }): string {
@@ -0,0 +1,79 @@
+import { MemoryUtils } from '@amphi/pipeline-components-manager';
+import { engineIcon } from '../../icons';
+import { BaseCoreComponent } from '../BaseCoreComponent';
+
+export class OptimizeMemory extends BaseCoreComponent {
+  constructor() {
+    const defaultConfig = {
+      tsCFselectStringEncoding: "category",
+      tsCFinputNumberMaxUniqueRatio: 50,
+      tsCFbooleanDowncastFloats: true
+    };
+    const form = {
+      idPrefix: "component__form",
+      fields: [
+        {
+          type: "columns",
+          label: "Columns",
+          id: "tsCFcolumnsOptimizedColumns",
+          placeholder: "All columns",
+          tooltip: "Columns to optimize. Leave empty to optimize all columns."
+        },
+        {
+          type: "select",
+          label: "Repetitive strings",
+          id: "tsCFselectStringEncoding",
+          options: [
+            { value: "category", label: "Categorical", tooltip: "Store each distinct string once, as a pandas categorical column." },
+            { value: "dictionary", label: "Arrow dictionary", tooltip: "Store each distinct string once, as a pyarrow dictionary column." },
+            { value: "none", label: "Keep as strings", tooltip: "Only convert strings to pyarrow strings." }
+          ],
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Max distinct values (%)",
+          id: "tsCFinputNumberMaxUniqueRatio",
+          tooltip: "String columns are encoded when their number of distinct values is at most this percentage of the rows.",
+          min: 1,
+          max: 100,
+          condition: { tsCFselectStringEncoding: ["category", "dictionary"] },
+          advanced: true
+        },
+        {
+          type: "boolean",
+          label: "Downcast floats",
+          id: "tsCFbooleanDowncastFloats",
+          tooltip: "Store float columns as float32 when every value is exactly representable.",
+          advanced: true
+        }
+      ],
+    };
+    const description = "Use Optimize Memory to store the data with the lightest lossless types: smallest integer types, float32 when exact, categorical and pyarrow strings. The memory saved is printed.";
+
+    super("Optimize Memory", "optimizeMemory", description, "pandas_df_processor", [], "transforms", engineIcon, defaultConfig, form);
+  }
+
+  public provideImports({ config }): string[] {
+    return ["import numpy as np", "import pandas as pd"];
+  }
+
+  public provideFunctions({ config }): string[] {
+    return MemoryUtils.provideFunctions();
+  }
+
+  public generateComponentCode({ config, inputName, outputName }): string {
+    const selected = Array.isArray(config.tsCFcolumnsOptimizedColumns) ? config.tsCFcolumnsOptimizedColumns : [];
+    const columns = selected.length > 0
+      ? `[${selected.map(column => column.named ? `"${column.value.trim()}"` : column.value).join(', ')}]`
+      : "None";
+    const strings = config.tsCFselectStringEncoding || "category";
+    const maxUniqueRatio = (config.tsCFinputNumberMaxUniqueRatio ?? 50) / 100;
+    const downcastFloats = config.tsCFbooleanDowncastFloats === false ? "False" : "True";
+
+    return `
+# Convert to the lightest lossless types
+${outputName} = py_fn_optimize_memory(${inputName}, py_arg_columns=${columns}, py_arg_strings="${strings}", py_arg_max_unique_ratio=${maxUniqueRatio}, py_arg_downcast_floats=${downcastFloats})
+`;
+  }
+}
@@ -1,5 +1,6 @@
 import { sortIcon } from '../../icons';
 import { BaseCoreComponent } from '../BaseCoreComponent';
+import { SpillHandler } from '../common/SpillHandler';
 
 
 
@@ -26,7 +27,8 @@ export class Sort extends BaseCoreComponent {
           label: "Ignore Index",
           id: "tsCFbooleanIgnoreIndex",
           advanced: true
-        }
+        },
+        ...SpillHandler.getSpillFields("For data larger than memory: sort runs that fit the memory budget, spill them to disk and merge them (external merge sort). The result gets a new index.")
       ],
     };
     const description = "Use Sort Rows to sort based on the values in columns. Values will be sorted by lexicographical order.";
@@ -35,16 +37,33 @@ export class Sort extends BaseCoreComponent {
   }
 
   public provideImports({config}): string[] {
-    return [];
+    return SpillHandler.isSpilled(config) ? SpillHandler.provideImports() : [];
+  }
+
+  public provideFunctions({ config }): string[] {
+    return SpillHandler.isSpilled(config) ? SpillHandler.provideFunctions() : [];
+  }
+
+  public producesChunks({ config }): boolean {
+    return SpillHandler.isSpilled(config);
   }
 
   public generateComponentCode({ config, inputName, outputName }): string {
 
-    const tsConstByColumns = `by=[${config.tsCFkeyvalueColumnsRadioColumnAndOrder.map(item => item.key.named ? `"${item.key.value}"` : item.key.value).join(", ")}]`;
-    const tsConstAscending = `ascending=[${config.tsCFkeyvalueColumnsRadioColumnAndOrder.map(item => item.value === "True" ? "True" : "False").join(", ")}]`;
+    const tsConstByList = `[${config.tsCFkeyvalueColumnsRadioColumnAndOrder.map(item => item.key.named ? `"${item.key.value}"` : item.key.value).join(", ")}]`;
+    const tsConstAscendingList = `[${config.tsCFkeyvalueColumnsRadioColumnAndOrder.map(item => item.value === "True" ? "True" : "False").join(", ")}]`;
+    const tsConstByColumns = `by=${tsConstByList}`;
+    const tsConstAscending = `ascending=${tsConstAscendingList}`;
 		//for boolean
 	let tsConstIgnoreIndexStep1 = config.tsCFbooleanIgnoreIndex ? 'True' : 'False';
     const tsConstIgnoreIndex = config.tsCFbooleanIgnoreIndex ? `, ignore_index=${tsConstIgnoreIndexStep1}` : "";
+
+    if (SpillHandler.isSpilled(config)) {
+      return `
+# Sort rows out of core
+${outputName} = py_fn_spill_sort(${inputName}, ${tsConstByList}, ${tsConstAscendingList}${SpillHandler.generateOptionsCode(config)})
+`;
+    }
     
     const code = `
 # Sort rows 
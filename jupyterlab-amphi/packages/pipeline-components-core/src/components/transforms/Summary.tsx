@@ -1,11 +1,13 @@
 import { eyeGlassesIcon } from '../../icons';
 import { BaseCoreComponent } from '../BaseCoreComponent';
+import { SketchHandler } from '../common/SketchHandler';
 
 export class Summary extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
       tsCFselectStatisticsType: "all",
       tsCFradioPivot: "rows",
+      tsCFselectProfilingMode: "exact"
     };
     const form = {
       idPrefix: "component__form",
@@ -40,6 +42,16 @@ export class Summary extends BaseCoreComponent {
             { value: "rows", label: "As rows" },
             { value: "columns", label: "As columns" }
           ],
+        },
+        {
+          type: "select",
+          label: "Mode",
+          id: "tsCFselectProfilingMode",
+          options: [
+            { value: "exact", label: "Exact", tooltip: "Compute every statistic exactly." },
+            { value: "approximate", label: "Approximate", tooltip: "For large datasets: compute unique counts, most frequent values and percentiles with sketches in one pass, and add columns bounding their error." }
+          ],
+          advanced: true
         }
       ],
     };
@@ -50,9 +62,13 @@ export class Summary extends BaseCoreComponent {
   }
 
   public provideImports({ config }): string[] {
-    return [
+    const imports = [
       "import pandas as pd",
       "import numpy as np"];
+    if (config.tsCFselectProfilingMode === "approximate") {
+      imports.push(...SketchHandler.provideImports());
+    }
+    return imports;
   }
 
   public provideFunctions({ config }): string[] {
@@ -163,6 +179,130 @@ def py_fn_describe_dataset(df, column_type='all', orientation='columns_as_row',
         result_df = result_df.set_index("field_name").transpose().reset_index().rename(columns={'index': 'stat'})
     return result_df
     `;
+    if (config.tsCFselectProfilingMode === "approximate") {
+      // Sketch-based summary for datasets too large to profile exactly
+      const tsSummaryApproximateFunction = `
+def py_fn_describe_dataset_approximate(df, orientation='columns_as_row', py_arg_top_capacity=1000, py_arg_chunk_rows=1_000_000):
+    """
+    Approximate version of py_fn_describe_dataset, computed in one pass over row chunks with sketches:
+    HyperLogLog distinct counts, Misra-Gries most frequent values and compactor quantiles.
+    Counts, min, max, mean, std and string lengths stay exact. The error columns bound the approximations:
+    'unique_error' is the relative standard error of 'unique', 'freq_error' the most 'max freq' can be below
+    the true frequency and 'quantile_error' the rank error of the quartiles, as a fraction of the count.
+    """
+    py_var_states = []
+    for py_var_chunk in py_fn_sketch_chunks(df, py_arg_chunk_rows):
+        if not py_var_states:
+            py_var_states = [{
+                'field_name': py_var_name,
+                'dtype': py_var_chunk.dtypes.iloc[py_var_position],
+                'count': 0, 'mins': [], 'maxs': [],
+                'hll': py_fn_hll_new(), 'mg': py_fn_mg_new(py_arg_top_capacity), 'kll': py_fn_kll_new(),
+                'n': 0, 'mean': 0.0, 'm2': 0.0,
+                'length_sum': 0, 'shortest': None, 'longest': None
+            } for py_var_position, py_var_name in enumerate(py_var_chunk.columns)]
+        for py_var_position, py_var_state in enumerate(py_var_states):
+            py_var_dtype = py_var_state['dtype']
+            col_data = py_var_chunk.iloc[:, py_var_position].dropna()
+            if col_data.empty:
+                continue
+            py_var_state['count'] += len(col_data)
+            py_fn_hll_update(py_var_state['hll'], py_fn_sketch_hash(col_data))
+            py_fn_mg_update(py_var_state['mg'], col_data)
+            try:
+                py_var_state['mins'].append(col_data.min())
+                py_var_state['maxs'].append(col_data.max())
+            except TypeError:
+                pass
+
+            if pd.api.types.is_numeric_dtype(py_var_dtype) or pd.api.types.is_datetime64_any_dtype(py_var_dtype):
+                py_var_values, _ = py_fn_sketch_numbers(col_data)
+                # Chan et al. update of the count, mean and sum of squared deviations
+                py_var_chunk_mean = py_var_values.mean()
+                py_var_chunk_m2 = ((py_var_values - py_var_chunk_mean) ** 2).sum()
+                py_var_total = py_var_state['n'] + len(py_var_values)
+                py_var_delta = py_var_chunk_mean - py_var_state['mean']
+                py_var_state['m2'] += py_var_chunk_m2 + py_var_delta ** 2 * py_var_state['n'] * len(py_var_values) / py_var_total
+                py_var_state['mean'] += py_var_delta * len(py_var_values) / py_var_total
+                py_var_state['n'] = py_var_total
+                if not pd.api.types.is_bool_dtype(py_var_dtype):
+                    py_fn_kll_update(py_var_state['kll'], py_var_values)
+            elif pd.api.types.is_string_dtype(py_var_dtype) or isinstance(py_var_dtype, pd.CategoricalDtype):
+                str_data = col_data.astype(str)
+                lengths = str_data.str.len().to_numpy()
+                py_var_state['length_sum'] += int(lengths.sum())
+                py_var_shortest, py_var_longest = str_data.iloc[int(lengths.argmin())], str_data.iloc[int(lengths.argmax())]
+                if py_var_state['shortest'] is None or len(py_var_shortest) < len(py_var_state['shortest']):
+                    py_var_state['shortest'] = py_var_shortest
+                if py_var_state['longest'] is None or len(py_var_longest) > len(py_var_state['longest']):
+                    py_var_state['longest'] = py_var_longest
+
+    summary = []
+    for py_var_state in py_var_states:
+        py_var_dtype = py_var_state['dtype']
+        py_var_mg = py_var_state['mg']
+        py_var_counts = py_var_mg['counts']
+        data = {
+            'field_name': py_var_state['field_name'],
+            'type': str(py_var_dtype),
+            'count': py_var_state['count'],
+            'most freq value': py_var_counts.idxmax() if not py_var_counts.empty else "",
+            # The top counter may be down to 0 on high-cardinality columns, its value was still seen once
+            'max freq': max(int(py_var_counts.max()), 1) if not py_var_counts.empty else 0,
+            'freq_error': py_var_mg['error']
+        }
+        if py_fn_mg_exact(py_var_mg):
+            # Every value was counted: distinct count and least frequent value are exact
+            data.update({
+                'unique': len(py_var_counts),
+                'unique_error': 0.0,
+                'least freq value': py_var_counts.idxmin() if not py_var_counts.empty else ""
+            })
+        else:
+            py_var_unique, py_var_unique_error = py_fn_hll_count(py_var_state['hll'])
+            data.update({'unique': int(round(py_var_unique)), 'unique_error': py_var_unique_error})
+        try:
+            data.update({'min': min(py_var_state['mins']), 'max': max(py_var_state['maxs'])})
+        except (TypeError, ValueError):
+            pass
+
+        if pd.api.types.is_numeric_dtype(py_var_dtype) or pd.api.types.is_datetime64_any_dtype(py_var_dtype):
+            if py_var_state['n']:
+                _, py_fn_back = py_fn_sketch_numbers(pd.Series([], dtype=py_var_dtype))
+                data.update({
+                    'mean': py_fn_back(py_var_state['mean']),
+                    'std': py_fn_back(np.sqrt(py_var_state['m2'] / (py_var_state['n'] - 1)), True) if py_var_state['n'] > 1 else np.nan
+                })
+                if not pd.api.types.is_bool_dtype(py_var_dtype):
+                    py_var_quartiles, py_var_quantile_error = py_fn_kll_quantiles(py_var_state['kll'], [0.25, 0.5, 0.75])
+                    data.update({py_var_label: py_fn_back(py_var_value) for py_var_label, py_var_value in zip(['25%', '50%', '75%'], py_var_quartiles)})
+                    data['quantile_error'] = py_var_quantile_error
+        elif (pd.api.types.is_string_dtype(py_var_dtype) or isinstance(py_var_dtype, pd.CategoricalDtype)) and py_var_state['count']:
+            data.update({
+                'avg_length': py_var_state['length_sum'] / py_var_state['count'],
+                'min_length': len(py_var_state['shortest']),
+                'max_length': len(py_var_state['longest']),
+                'shortest': py_var_state['shortest'],
+                'longest': py_var_state['longest']
+            })
+        summary.append(data)
+
+    expected_columns = ['field_name', 'type', 'count', 'unique', 'most freq value', 'max freq', 'least freq value', 'min', 'max', 'mean', 'std', 'avg_length', 'min_length', 'max_length', 'shortest', 'longest', '25%', '50%', '75%', 'unique_error', 'freq_error', 'quantile_error']
+    result_df = pd.DataFrame(summary, columns=expected_columns)
+    for col in ['avg_length', 'unique_error', 'quantile_error']:
+        result_df[col] = pd.to_numeric(result_df[col], errors='coerce').astype('float64')
+    for col in ['count', 'unique', 'max freq', 'min_length', 'max_length', 'freq_error']:
+        result_df[col] = pd.to_numeric(result_df[col], errors='coerce').astype('Int64')
+    result_df['field_name'] = result_df['field_name'].astype('string')
+    result_df['type'] = result_df['type'].astype('string')
+    for col in ['most freq value', 'least freq value', 'shortest', 'longest', 'min', 'max', 'mean', 'std', '25%', '50%', '75%']:
+        result_df[col] = result_df[col].astype('object')
+    if orientation == 'columns_as_column':
+        result_df = result_df.set_index("field_name").transpose().reset_index().rename(columns={'index': 'stat'})
+    return result_df
+`;
+      return [...SketchHandler.provideFunctions(), tsSummaryApproximateFunction];
+    }
     return [tsSummaryFunction];
   }
   public generateComponentCode({ config, inputName, outputName }: { config: any; inputName: string; outputName: string }): string {
@@ -190,11 +330,14 @@ def py_fn_describe_dataset(df, column_type='all', orientation='columns_as_row',
     } else {
       orientation="columns_as_column"
     }
+    const summaryCall = config.tsCFselectProfilingMode === "approximate"
+      ? `py_fn_describe_dataset_approximate(df_subset, '${orientation}')`
+      : `py_fn_describe_dataset(df_subset, 'all', '${orientation}')`;
     //execute the function
     code += `
 # Execute the detect unique key function
 ${outputName} = []
-${outputName} = py_fn_describe_dataset(df_subset, 'all', '${orientation}')
+${outputName} = ${summaryCall}
 del df_subset
     `;
     return code + '\n';
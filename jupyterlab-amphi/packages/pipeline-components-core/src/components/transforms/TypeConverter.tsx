@@ -367,6 +367,11 @@ def py_fn_convert_columns_type(
     return [tsTypeConverterFunction];
   }
   
+  // Row-wise operation, can run on each chunk of a streamed input
+  public consumesChunks({ config }): boolean {
+    return true;
+  }
+
   public generateComponentCode({ config, inputName, outputName }): string {
    const tsConstDataTypePandasStep1 = config.tsCFcascaderDataTypePandas[config.tsCFcascaderDataTypePandas.length - 1];
    let tsConstDataTypePandas = 'None';
@@ -1,11 +1,13 @@
 import { UniqueKeyIcon } from '../../icons';
 import { BaseCoreComponent } from '../BaseCoreComponent';
+import { SketchHandler } from '../common/SketchHandler';
 
 export class UniqueKeyDetector extends BaseCoreComponent {
   constructor() {
     const defaultConfig = {
       tsCFcolumnsCombinationColumns: [],
-      tsCFinputNumberCombinationNField : 1
+      tsCFinputNumberCombinationNField : 1,
+      tsCFselectProfilingMode: "exact"
     };
 
     const form = {
@@ -25,6 +27,16 @@ export class UniqueKeyDetector extends BaseCoreComponent {
           placeholder: "Default: 1",
           min: 1,
           advanced: false
+        },
+        {
+          type: "select",
+          label: "Mode",
+          id: "tsCFselectProfilingMode",
+          options: [
+            { value: "exact", label: "Exact", tooltip: "Compare the values of each combination." },
+            { value: "approximate", label: "Approximate", tooltip: "For large datasets: compare 64-bit hashes of each combination, rejecting most combinations on the first rows. Combinations reported are always unique. The error_bound column gives the probability that a hash collision made a true key look duplicated, leaving it out of the result." }
+          ],
+          advanced: true
         }
       ],
     };
@@ -35,10 +47,14 @@ export class UniqueKeyDetector extends BaseCoreComponent {
   }
 
   public provideImports({ config }): string[] {
-    return [
+    const imports = [
       "import pandas as pd",
       "from itertools import combinations"
       ];
+    if (config.tsCFselectProfilingMode === "approximate") {
+      imports.push(...SketchHandler.provideImports());
+    }
+    return imports;
   }
 
   public provideFunctions({ config }): string[] {
@@ -86,6 +102,54 @@ def py_fn_detect_unique_key(df, fields=None, max_combination=0):
     return result
 
     `;
+    if (config.tsCFselectProfilingMode === "approximate") {
+      // Unique key detection on hashed rows
+      const tsUniqueKeyDetectorApproximateFunction = `
+def py_fn_detect_unique_key_approximate(df, fields=None, max_combination=0, py_arg_sample_rows=1_000_000):
+    #Hash-based version of py_fn_detect_unique_key for large DataFrames.
+    #Each field is hashed once to 64 bits and a combination is unique when its combined hashes are.
+    #Duplicates are first looked for in the leading rows, which rejects most combinations without a full pass.
+    #Equal values always hash equally, so every combination reported is unique. A hash collision can only make
+    #a true key look duplicated and leave it out of the result.
+    #Returns:
+    #result: A DataFrame with columns ['number_of_fields', 'field_combination', 'error_bound'],
+    #error_bound being the probability that a hash collision left a true key out of the result.
+    if fields is None or len(fields) == 0:
+        fields = list(df.columns)
+
+    total_rows = len(df)
+    max_combination = max_combination if max_combination > 0 else len(fields)
+    py_var_hashes = {field: py_fn_sketch_hash(df[field]) for field in fields}
+    py_var_error_bound = min(total_rows * (total_rows - 1) / 2 / 2.0 ** 64, 1.0)
+
+    def py_fn_unique(py_arg_hashes):
+        return len(pd.unique(py_arg_hashes)) == len(py_arg_hashes)
+
+    result = []
+    for r in range(1, max_combination + 1):
+        for combo in combinations(fields, r):
+            combo = list(combo)
+            py_var_combined = py_var_hashes[combo[0]]
+            for field in combo[1:]:
+                py_var_combined = (py_var_combined * np.uint64(0x9E3779B97F4A7C15)) ^ py_var_hashes[field]
+            if py_fn_unique(py_var_combined[:py_arg_sample_rows]) and (total_rows <= py_arg_sample_rows or py_fn_unique(py_var_combined)):
+                result.append({
+                    "number_of_fields": r,
+                    "field_combination": combo,
+                    "error_bound": py_var_error_bound
+                })
+    #dataframe (no list) even if empty, and well typed
+    result = pd.DataFrame(result, columns=["number_of_fields", "field_combination", "error_bound"])
+    result = result.astype({
+        "number_of_fields": "int",
+        "field_combination": "object",
+        "error_bound": "float64"
+    })
+
+    return result
+`;
+      return [...SketchHandler.provideFunctions(), tsUniqueKeyDetectorApproximateFunction];
+    }
     return [tsUniqueKeyDetectorFunction];
   }
 
@@ -99,10 +163,11 @@ public generateComponentCode({ config, inputName, outputName }: { config: any; i
         .map((item: any) => (item.named ? `"${item.value}"` : item.value))
         .join(", ")}]`;
     }
+    const tsConstDetectFunction = config.tsCFselectProfilingMode === "approximate" ? "py_fn_detect_unique_key_approximate" : "py_fn_detect_unique_key";
     return `
 # Execute the detect unique key function
 ${outputName} = []
-${outputName} = py_fn_detect_unique_key(${inputName},${tsConstCombinationColumns},${tsConstCombinationNField})
+${outputName} = ${tsConstDetectFunction}(${inputName},${tsConstCombinationColumns},${tsConstCombinationNField})
     `;
   }
 }
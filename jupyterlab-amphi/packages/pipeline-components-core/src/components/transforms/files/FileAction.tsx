@@ -11,7 +11,8 @@ export class FileAction extends BaseCoreComponent {
       tsCFcolumnFileNewName : "",
       tsCFcolumnOverwriteFileIfExists : "",
       tsCFcolumnRetryCount : 0,
-      tsCFbooleanRaiseError : true
+      tsCFbooleanRaiseError : true,
+      tsCFselectFileActionExecutor : "sequential"
     };
 
     const form = {
@@ -93,7 +94,28 @@ export class FileAction extends BaseCoreComponent {
           tooltip: "Raise an error and stop execution",
           id: "tsCFbooleanRaiseError",
           advanced: true
-         }
+         },
+        {
+          type: "select",
+          label: "Execution",
+          id: "tsCFselectFileActionExecutor",
+          options: [
+            { value: "sequential", label: "Sequential", tooltip: "Run the actions one row after the other." },
+            { value: "concurrent", label: "Concurrent", tooltip: "Plan all the actions first, create each destination directory once, then run them on a thread pool. Rows touching the same file still run in row order, so statuses are the same as in sequential mode. Best for many files or network drives." }
+          ],
+          advanced: true
+        },
+        {
+          type: "inputNumber",
+          label: "Max workers",
+          id: "tsCFinputNumberFileActionMaxWorkers",
+          tooltip: "Maximum number of file actions running at the same time.",
+          placeholder: "Default: number of CPUs + 4, at most 32",
+          min: 1,
+          max: 256,
+          condition: { tsCFselectFileActionExecutor: ["concurrent"] },
+          advanced: true
+        }
       ],
     };
 
@@ -259,6 +281,104 @@ def handle_file_safe(file_path, action, destination=None, new_name=None, overwri
                 if raise_on_error:
                     raise
                 return 'failure', f"Exception after {attempt+1} attempt(s): {last_error_msg}"
+#################################################################
+def file_action_target(file_path, action, destination=None, new_name=None):
+    #Path written by an action, None when the action writes nothing or its arguments are missing
+    if action in ['move', 'copy']:
+        return None if pd.isna(destination) else destination
+    if action == 'rename':
+        return None if (pd.isna(new_name) or pd.isna(file_path)) else os.path.join(os.path.dirname(file_path), new_name)
+    if action == 'zip':
+        if pd.isna(file_path):
+            return None
+        return destination if not (pd.isna(destination) or destination == '') else f"{file_path}.zip"
+    if action == 'create as empty':
+        return None if pd.isna(file_path) else file_path
+    return None
+
+def plan_file_actions(normalized_df, new_name_col='', overwrite_col='', retry_count_col=''):
+    #Plan the actions of a normalized dataframe before running them:
+    #- the handle_file_safe arguments of each row
+    #- the destination directories, each created once
+    #- chains of rows sharing a source or target path, run in row order so that they behave as sequentially.
+    #  Rows of different chains touch different files and can run concurrently.
+    records = normalized_df.to_dict('records')
+    arguments = []
+    directories = set()
+    parents = {}
+
+    def find(key):
+        # Union-find root of a path, with path halving
+        parents.setdefault(key, key)
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+        return key
+
+    row_keys = []
+    for record in records:
+        file_path = record['normalized_file_path']
+        action = record['normalized_action']
+        destination = record.get('normalized_destination')
+        new_name = record.get(new_name_col, '')
+        arguments.append({
+            'file_path': file_path,
+            'action': action,
+            'destination': destination,
+            'new_name': new_name,
+            'overwrite': '' if overwrite_col == '' else record.get(overwrite_col),
+            'retry_count': 0 if retry_count_col == '' else record.get(retry_count_col)
+        })
+
+        target = file_action_target(file_path, action, destination, new_name)
+        # Only the directories of actions that will get to write are created ahead
+        if target is not None and action != 'rename' and (action == 'create as empty' or (not pd.isna(file_path) and os.path.exists(file_path))):
+            if not (action == 'zip' and (pd.isna(destination) or destination == '')):
+                directory = os.path.dirname(target)
+                if directory:
+                    directories.add(directory)
+
+        keys = [os.path.normcase(os.path.abspath(path)) for path in (file_path, target) if not pd.isna(path) and path != '']
+        for key in keys[1:]:
+            parents[find(key)] = find(keys[0])
+        row_keys.append(keys[0] if keys else None)
+
+    chains = {}
+    for position, key in enumerate(row_keys):
+        chains.setdefault(find(key) if key is not None else ('row', position), []).append(position)
+    return arguments, sorted(directories), list(chains.values())
+
+def handle_files_concurrently(normalized_df, new_name_col='', overwrite_col='', retry_count_col='', raise_on_error=False, max_workers=None):
+    #Run the file actions of a normalized dataframe on a bounded thread pool, after planning them.
+    #Returns the (status, reason) of each row, as the row-by-row handle_file_safe calls would.
+    import concurrent.futures
+
+    arguments, directories, chains = plan_file_actions(normalized_df, new_name_col, overwrite_col, retry_count_col)
+    for directory in directories:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            # Reported by the actions writing there
+            pass
+
+    results = [None] * len(arguments)
+
+    def run_chain(positions):
+        for position in positions:
+            results[position] = handle_file_safe(**arguments[position], raise_on_error=raise_on_error)
+
+    # Long chains first, so that they do not end up alone at the end of the run
+    chains.sort(key=len, reverse=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(run_chain, chain) for chain in chains]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            for pending in futures:
+                pending.cancel()
+            raise
+    return pd.Series(results, index=normalized_df.index, dtype='object')
     `;
     return [FileActionFunction];
   }
@@ -280,21 +400,17 @@ const retry_count_value = config.tsCFcolumnRetryCount?.value ?? "";
 const action_on_file_all_value = config.tsCFradioActionOnFileAll ?? "";
 //console.log(action_on_file_all_value);
 const raise_on_error=config.tsCFbooleanRaiseError ? "True" : "False";
-    return `
-# Execute the file action function
-${outputName} = []
-
-normalized_input_dataframe=normalize_input_dataframe(
-    input_df=${inputName},
-    file_path_col='${source_file_path_value}',
-    destination_col='${destination_path_value}',
-    action_col='${action_on_file_value}',
+const max_workers = config.tsCFinputNumberFileActionMaxWorkers ? String(config.tsCFinputNumberFileActionMaxWorkers) : "None";
+const run_actions = config.tsCFselectFileActionExecutor === "concurrent"
+  ? `results = handle_files_concurrently(
+    normalized_input_dataframe,
     new_name_col='${file_new_name_value}',
     overwrite_col='${overwrite_file_if_exists_value}',
     retry_count_col='${retry_count_value}',
-    action_from_form='${action_on_file_all_value}'
-)
-results = normalized_input_dataframe.apply(
+    raise_on_error=${raise_on_error},
+    max_workers=${max_workers}
+)`
+  : `results = normalized_input_dataframe.apply(
     lambda row: handle_file_safe(
         file_path=row['normalized_file_path'],
         action=row['normalized_action'],
@@ -305,7 +421,22 @@ results = normalized_input_dataframe.apply(
         raise_on_error=${raise_on_error}
     ),
     axis=1
+)`;
+    return `
+# Execute the file action function
+${outputName} = []
+
+normalized_input_dataframe=normalize_input_dataframe(
+    input_df=${inputName},
+    file_path_col='${source_file_path_value}',
+    destination_col='${destination_path_value}',
+    action_col='${action_on_file_value}',
+    new_name_col='${file_new_name_value}',
+    overwrite_col='${overwrite_file_if_exists_value}',
+    retry_count_col='${retry_count_value}',
+    action_from_form='${action_on_file_all_value}'
 )
+${run_actions}
 
 # Unpack results into 'status' and 'reason' columns as strings
 normalized_input_dataframe['status'] = results.apply(lambda x: str(x[0]))  # Ensure status is a string
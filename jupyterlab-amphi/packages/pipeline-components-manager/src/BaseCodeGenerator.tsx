@@ -6,6 +6,9 @@ import {
   PipelineService, Node, Flow
 } from './PipelineService';
 import { RequestService } from './RequestService';
+import { ChunkUtils } from './chunkUtils';
+import { MemoryUtils } from './memoryUtils';
+import { ProfilingUtils } from './profilingUtils';
 import { KernelMessage } from '@jupyterlab/services';
 
 export interface NodeObject {
@@ -20,11 +23,45 @@ export interface NodeObject {
   lastUpdated: number;
   lastExecuted: number;
   runtime: string;
+  chunked?: boolean;
 }
 
 export abstract class BaseCodeGenerator {
   // Common or shared methods go here
 
+  // Outputs of the component code providers, per component and arguments: on previews only the
+  // nodes whose configuration or inputs changed generate their code again
+  private static providerCache = new WeakMap<any, Map<string, any>>();
+  private static formattedCache = new Map<string, string>();
+  static cacheLimit = 5000;
+
+  static callProvider(component: any, method: string, args: any): any {
+    let cache = BaseCodeGenerator.providerCache.get(component);
+    if (!cache) {
+      cache = new Map<string, any>();
+      BaseCodeGenerator.providerCache.set(component, cache);
+    }
+    // Execution timestamps change on every run but not the generated code
+    const key = `${method}:${JSON.stringify(args, (name, value) =>
+      name === 'lastUpdated' || name === 'lastExecuted' ? undefined : value
+    )}`;
+    let result = cache.get(key);
+    if (result === undefined) {
+      result = component[method](args);
+      BaseCodeGenerator.remember(cache, key, result);
+    }
+    // Callers extend the returned lists
+    return Array.isArray(result) ? [...result] : result;
+  }
+
+  // Bounded insertion, the oldest entry is dropped first
+  private static remember(cache: Map<string, any>, key: string, value: any): void {
+    if (cache.size >= BaseCodeGenerator.cacheLimit) {
+      cache.delete(cache.keys().next().value);
+    }
+    cache.set(key, value);
+  }
+
   static computeNodesToTraverse(
     flow: Flow,
     targetNodeId: string,
@@ -111,11 +148,14 @@ export abstract class BaseCodeGenerator {
     componentService: any,
     nodesToTraverse: string[],
     nodesMap: Map<string, Node>,
-    variablesAutoNaming: boolean
+    variablesAutoNaming: boolean,
+    profiling: boolean = false
   ): NodeObject[] {
     const nodeObjects: NodeObject[] = [];
     const counters = new Map<string, number>();
     const nodeOutputs = new Map<string, string>();
+    // Nodes whose output is a stream of DataFrame chunks rather than a single DataFrame
+    const chunkedOutputs = new Set<string>();
 
     function incrementCounter(key: string) {
       const count = counters.get(key) || 0;
@@ -150,26 +190,42 @@ export abstract class BaseCodeGenerator {
       const componentType = component._type;
       const componentId = component._id;
 
-      const imports = component.provideImports({ config });
-      const dependencies = typeof component.provideDependencies === 'function'
-        ? component.provideDependencies({ config })
+      const imports: string[] = this.callProvider(component, 'provideImports', { config });
+      const dependencies: string[] = typeof component.provideDependencies === 'function'
+        ? this.callProvider(component, 'provideDependencies', { config })
         : [];
-      const functions = typeof component.provideFunctions === 'function'
-        ? component.provideFunctions({ config })
+      const functions: string[] = typeof component.provideFunctions === 'function'
+        ? this.callProvider(component, 'provideFunctions', { config })
         : [];
+      const producesChunks = typeof component.producesChunks === 'function' && component.producesChunks({ config });
+      const consumesChunks = typeof component.consumesChunks === 'function' && component.consumesChunks({ config });
 
       let code = '';
       let inputName = '';
       let outputName = '';
-	  //Generate a comment with origin node infos : type,nameId,customTitle
-	  const generatedCode = component.generateComponentCode({ config });
-      const needsNewLine = !generatedCode.startsWith('\n');
-      if (config.customTitle) {
-
-        code += `\n# id : ${node.id} | Type : ${node.type} | Name Id : ${config.nameId} | Custom Title : ${config.customTitle}${needsNewLine ? '\n' : ''}`;
-		} else {
-		code += `\n# id : ${node.id} | Type : ${node.type} | Name Id : ${config.nameId}${needsNewLine ? '\n' : ''}`;	
-      }
+      // DataFrames measured before and after the node when profiling
+      let profileInputs: string[] = [];
+      let profileOutput = '';
+      // Code of the component, the first one generated decides the line break after the header comment
+      let generatedCode: string | undefined;
+      const generate = (args: any): string => {
+        const componentCode = this.callProvider(component, 'generateComponentCode', { config, ...args });
+        generatedCode = generatedCode ?? componentCode;
+        return componentCode;
+      };
+
+      // Chunked inputs are streamed through chunk-aware components and collected for the others
+      const resolveChunkedInput = (previousNodeId: string, name: string, streamed: boolean): string => {
+        if (!chunkedOutputs.has(previousNodeId)) {
+          return name;
+        }
+        ChunkUtils.provideFunctions().forEach(f => functions.includes(f) || functions.push(f));
+        if (streamed) {
+          return name;
+        }
+        code += ChunkUtils.generateCollectCode(name);
+        return `${name}_collected`;
+      };
 
       try {
         switch (componentType) {
@@ -194,35 +250,68 @@ export abstract class BaseCodeGenerator {
               }
             } 
 
+            // Processors producing chunks (out-of-core operations) take the whole input stream
+            const chunked = chunkedOutputs.has(previousNodeId) && consumesChunks && !producesChunks;
+            inputName = resolveChunkedInput(previousNodeId, inputName, chunked || producesChunks);
+
             outputName = getOutputName(node, componentId, variablesAutoNaming)
             nodeOutputs.set(nodeId, outputName);
-            code += component.generateComponentCode({ config, inputName, outputName });
+            profileInputs = [inputName];
+            profileOutput = outputName;
+            if (producesChunks) {
+              chunkedOutputs.add(nodeId);
+              ChunkUtils.provideFunctions().forEach(f => functions.includes(f) || functions.push(f));
+              code += generate({ inputName, outputName });
+            } else if (chunked) {
+              chunkedOutputs.add(nodeId);
+              code += ChunkUtils.wrapChunkedProcessorCode(
+                generate({ inputName, outputName }),
+                inputName,
+                outputName
+              );
+            } else {
+              code += generate({ inputName, outputName });
+            }
             break;
           }
           case 'ibis_df_double_processor':
           case 'pandas_df_double_processor': {
             const [input1Id, input2Id] = PipelineService.findMultiplePreviousNodeIds(flow, nodeId);
-            const inputName1 = getInputName(input1Id, componentType);
-            const inputName2 = getInputName(input2Id, componentType);
+            const inputName1 = resolveChunkedInput(input1Id, getInputName(input1Id, componentType), false);
+            const inputName2 = resolveChunkedInput(input2Id, getInputName(input2Id, componentType), false);
             outputName = getOutputName(node, componentId, variablesAutoNaming)
             nodeOutputs.set(nodeId, outputName);
-            code += component.generateComponentCode({ config, inputName1, inputName2, outputName });
+            profileInputs = [inputName1, inputName2];
+            profileOutput = outputName;
+            code += generate({ inputName1, inputName2, outputName });
             break;
           }
           case 'ibis_df_multi_processor':
           case 'pandas_df_multi_processor': {
             const inputIds = PipelineService.findMultiplePreviousNodeIds(flow, nodeId);
-            const inputNames = inputIds.map(id => getInputName(id, componentType));
+            const inputNames = inputIds.map(id => resolveChunkedInput(id, getInputName(id, componentType), false));
             outputName = getOutputName(node, componentId, variablesAutoNaming)
             nodeOutputs.set(nodeId, outputName);
-            code += component.generateComponentCode({ config, inputNames, outputName });
+            profileInputs = inputNames;
+            profileOutput = outputName;
+            code += generate({ inputNames, outputName });
             break;
           }
           case 'pandas_df_input':
           case 'documents_input': {
             outputName = getOutputName(node, componentId, variablesAutoNaming)
             nodeOutputs.set(nodeId, outputName);
-            code += component.generateComponentCode({ config, outputName });
+            if (producesChunks) {
+              chunkedOutputs.add(nodeId);
+              ChunkUtils.provideFunctions().forEach(f => functions.includes(f) || functions.push(f));
+            }
+            profileOutput = outputName;
+            code += generate({ outputName });
+            if (MemoryUtils.optimizeInputs && componentType === 'pandas_df_input') {
+              ['import numpy as np', 'import pandas as pd'].forEach(i => imports.includes(i) || imports.push(i));
+              MemoryUtils.provideFunctions().forEach(f => functions.includes(f) || functions.push(f));
+              code += MemoryUtils.generatePostInputCode(outputName, producesChunks);
+            }
             break;
           }
           case 'ibis_df_input': {
@@ -256,9 +345,9 @@ export abstract class BaseCodeGenerator {
 
             // Generate code with or without uniqueEngineName
             if (uniqueEngineName) {
-              code += component.generateComponentCode({ config, outputName, uniqueEngineName });
+              code += generate({ outputName, uniqueEngineName });
             } else {
-              code += component.generateComponentCode({ config, outputName });
+              code += generate({ outputName });
             }
             break;
           }
@@ -282,22 +371,42 @@ export abstract class BaseCodeGenerator {
               }
             }
 
-            code += component.generateComponentCode({ config, inputName });
+            const chunked = chunkedOutputs.has(previousNodeId) && consumesChunks;
+            inputName = resolveChunkedInput(previousNodeId, inputName, chunked);
+            profileInputs = [inputName];
+
+            code += chunked
+              ? generate({ inputName, chunked })
+              : generate({ inputName });
             break;
           }
           case 'pandas_df_switch': {
             const previousNodeId = PipelineService.findPreviousNodeId(flow, nodeId);
-            inputName = getInputName(previousNodeId, componentType);
+            inputName = resolveChunkedInput(previousNodeId, getInputName(previousNodeId, componentType), false);
             outputName = getOutputName(node, componentId, variablesAutoNaming);
             nodeOutputs.set(nodeId, outputName);
+            profileInputs = [inputName];
 
-            code += component.generateComponentCode({ config, inputName, outputName }); 
+            code += generate({ inputName, outputName }); 
             break;
           }
           default:
             throw new Error(`Pipeline Configuration Error: ${componentType} for node ${nodeId}`);
         }
 
+        //Generate a comment with origin node infos : type,nameId,customTitle
+        const needsNewLine = !(generatedCode ?? '').startsWith('\n');
+        if (config.customTitle) {
+          code = `\n# id : ${node.id} | Type : ${node.type} | Name Id : ${config.nameId} | Custom Title : ${config.customTitle}${needsNewLine ? '\n' : ''}` + code;
+        } else {
+          code = `\n# id : ${node.id} | Type : ${node.type} | Name Id : ${config.nameId}${needsNewLine ? '\n' : ''}` + code;
+        }
+
+        if (profiling) {
+          ProfilingUtils.provideFunctions().forEach(f => functions.includes(f) || functions.push(f));
+          code = ProfilingUtils.wrapNodeCode(code, nodeId, config.customTitle || node.type, profileInputs, profileOutput);
+        }
+
         nodeObjects.push({
           id: nodeId,
           title: config.customTitle || node.type,
@@ -309,7 +418,8 @@ export abstract class BaseCodeGenerator {
           functions,
           lastUpdated: config.lastUpdated || 0,
           lastExecuted: config.lastExecuted || 0,
-          runtime: config.backend?.engine || 'local'
+          runtime: config.backend?.engine || 'local',
+          chunked: chunkedOutputs.has(nodeId)
         });
 
       } catch (error) {
@@ -322,6 +432,17 @@ export abstract class BaseCodeGenerator {
   }
 
   static formatVariables(code: string): string {
+    // Helpers are formatted once, not on every preview
+    const cached = BaseCodeGenerator.formattedCache.get(code);
+    if (cached !== undefined) {
+      return cached;
+    }
+    const formatted = BaseCodeGenerator.formatCode(code);
+    BaseCodeGenerator.remember(BaseCodeGenerator.formattedCache, code, formatted);
+    return formatted;
+  }
+
+  private static formatCode(code: string): string {
     const lines = code.split('\n');
 
     const transformed = lines.map(line => {
@@ -6,6 +6,8 @@ import {
   PipelineService, Node, Flow
 } from './PipelineService';
 import { BaseCodeGenerator, NodeObject } from './BaseCodeGenerator';
+import { ProfilingUtils } from './profilingUtils';
+import { DefinitionUtils } from './definitionUtils';
 
 export class CodeGenerator extends BaseCodeGenerator {
 
@@ -14,7 +16,9 @@ export class CodeGenerator extends BaseCodeGenerator {
     componentService: any,
     targetNodeId: string,
     fromStart: boolean,
-    variablesAutoNaming: boolean
+    variablesAutoNaming: boolean,
+    profiling: boolean = false,
+    deduplicate: boolean = false
   ): {
     codeList: string[];
     incrementalCodeList: { code: string; nodeId: string }[];
@@ -52,7 +56,8 @@ export class CodeGenerator extends BaseCodeGenerator {
       componentService,
       nodesToTraverse,
       nodesMap,
-      variablesAutoNaming
+      variablesAutoNaming,
+      profiling
     );
 
     // Process
@@ -61,11 +66,19 @@ export class CodeGenerator extends BaseCodeGenerator {
       nodeObj.dependencies.forEach(d => uniqueDependencies.add(d));
       nodeObj.functions.forEach(f => functions.add(f));
 
-      const nodeCode = [
-        ...nodeObj.imports,
-        ...nodeObj.functions,
-        nodeObj.code
-      ].join('\n');
+      // Deduplicated imports and helpers only run when the kernel does not have them yet
+      const nodeCode = (deduplicate
+        ? [
+          ...DefinitionUtils.provideFunctions(),
+          DefinitionUtils.wrapDefinitionCode(nodeObj.imports.join('\n')),
+          ...nodeObj.functions.map(f => DefinitionUtils.wrapDefinitionCode(f)),
+          nodeObj.code
+        ]
+        : [
+          ...nodeObj.imports,
+          ...nodeObj.functions,
+          nodeObj.code
+        ]).join('\n');
 
       incrementalCodeList.push({ code: nodeCode, nodeId: nodeObj.id });
       codeList.push(nodeObj.code);
@@ -115,21 +128,28 @@ export class CodeGenerator extends BaseCodeGenerator {
       }
     }
 
+    // Per-node timings collected by the instrumented code, reported even when a node raises
+    if (profiling) {
+      const combined = codeList.join('\n');
+      codeList.length = 0;
+      codeList.push(ProfilingUtils.wrapReportCode(combined));
+    }
+
     // Handle env/connection code
     let envVariablesCode = '';
     envMap.forEach(node => {
       const comp = componentService.getComponent(node.type);
       const config: any = node.data;
-      envVariablesCode += comp.generateComponentCode({ config });
-      comp.provideImports({ config }).forEach(i => uniqueImports.add(i));
+      envVariablesCode += this.callProvider(comp, 'generateComponentCode', { config });
+      this.callProvider(comp, 'provideImports', { config }).forEach(i => uniqueImports.add(i));
     });
 
     let connectionsCode = '';
     connMap.forEach(node => {
       const comp = componentService.getComponent(node.type);
       const config: any = node.data;
-      connectionsCode += comp.generateComponentCode({ config });
-      comp.provideImports({ config }).forEach(i => uniqueImports.add(i));
+      connectionsCode += this.callProvider(comp, 'generateComponentCode', { config });
+      this.callProvider(comp, 'provideImports', { config }).forEach(i => uniqueImports.add(i));
     });
 
     // Final build
@@ -138,17 +158,30 @@ export class CodeGenerator extends BaseCodeGenerator {
     const dateComment = `# Source code generated by Amphi\n# Date: ${dateString}`;
     const additionalImports = `# Additional dependencies: ${Array.from(uniqueDependencies).join(', ')}`;
 
-    const finalList = [
+    const format = (code: string) => this.formatVariables(code);
+    // Deduplicated blocks are formatted before being wrapped, their source is a string literal
+    const definitions = deduplicate
+      ? [
+        ...DefinitionUtils.provideFunctions(),
+        DefinitionUtils.wrapDefinitionCode(format(Array.from(uniqueImports).join('\n'))),
+        envVariablesCode && format(envVariablesCode),
+        connectionsCode && format(connectionsCode),
+        ...Array.from(functions).map(f => DefinitionUtils.wrapDefinitionCode(format(f)))
+      ]
+      : [
+        ...Array.from(uniqueImports),
+        envVariablesCode,
+        connectionsCode,
+        ...Array.from(functions)
+      ].filter(Boolean).map(format);
+
+    const formatted = [
       dateComment,
       additionalImports,
-      ...Array.from(uniqueImports),
-      envVariablesCode,
-      connectionsCode,
-      ...Array.from(functions),
-      ...codeList
+      ...definitions,
+      profiling ? ProfilingUtils.generateResetCode() : '',
+      ...codeList.filter(Boolean).map(format)
     ].filter(Boolean);
-
-    const formatted = finalList.map(code => this.formatVariables(code));
     return {
       codeList: formatted,
       incrementalCodeList,
@@ -160,14 +193,16 @@ export class CodeGenerator extends BaseCodeGenerator {
     pipelineJson: string,
     commands: any,
     componentService: any,
-    variablesAutoNaming: boolean
+    variablesAutoNaming: boolean,
+    profiling: boolean = false
   ): string {
     const { codeList } = this.generateCodeForNodes(
       PipelineService.filterPipeline(pipelineJson),
       componentService,
       'none',
       true,
-      variablesAutoNaming
+      variablesAutoNaming,
+      profiling
     );
     return codeList.join('\n');
   }
@@ -215,8 +250,9 @@ export class CodeGenerator extends BaseCodeGenerator {
       fromStart = true;
     }
 
+    // Previews run on a live kernel: imports and helpers already defined there are not run again
     const { codeList, incrementalCodeList, executedNodes } = this
-      .generateCodeForNodes(flow, componentService, targetNode, fromStart, variablesAutoNaming);
+      .generateCodeForNodes(flow, componentService, targetNode, fromStart, variablesAutoNaming, false, true);
 
     if (fromStart) {
       console.log("Generating code from start (fromStart: true).");
@@ -1,6 +1,8 @@
 // ExecutionTypes.ts
 // Types for component execution metadata and status
 
+import { NodeProfile } from './profilingUtils';
+
 export interface ExecutionMetadata {
   status: 'idle' | 'running' | 'success' | 'failed';
   timestamp?: number;
@@ -10,6 +12,7 @@ export interface ExecutionMetadata {
   memorySize?: string;     // e.g., "1.2 MB"
   errorMessage?: string;
   errorType?: string;
+  profile?: NodeProfile;   // set by profiled runs
 }
 
 export interface ExecutionResult {
@@ -22,5 +25,6 @@ export interface ExecutionResult {
     executionTime?: number;
     errorMessage?: string;
     errorType?: string;
+    profile?: NodeProfile;
   };
 }
@@ -0,0 +1,404 @@
+// ================================================
+// benchmarkUtils.ts
+// ================================================
+// Component benchmarks: the code of representative component configurations is
+// generated with the registered components and timed on synthetic datasets scaled
+// from the test assets. Results are saved as JSON to be compared across releases.
+
+export interface BenchmarkCase {
+  name: string;                 // unique name of the case in the results
+  componentId: string;
+  inputs: string[];             // benchmark datasets given to the component, in input order
+  config: Record<string, any>;  // merged over the default configuration of the component
+}
+
+export interface BenchmarkOptions {
+  assetsDir: string;            // folder of the test assets the datasets are derived from
+  dataDir: string;              // folder where the scaled input files are written
+  resultsPath: string;          // JSON results file
+  baselinePath?: string;        // JSON results of a previous release to compare with
+  scales: number[];             // dataset sizes, as multiples of the base sizes
+  repeat: number;               // timed runs of each case, the median is reported
+  tolerance: number;            // relative slowdown or memory growth reported as a regression
+  version: string;
+  cases?: BenchmarkCase[];
+}
+
+export class BenchmarkUtils {
+
+  // Representative configurations of the benchmarked components, reading the files of dataDir
+  static defaultCases(dataDir: string): BenchmarkCase[] {
+    const column = (value: string) => ({ value, named: true });
+    return [
+      {
+        name: "CSV input",
+        componentId: "csvFileInput",
+        inputs: [],
+        config: { filePath: `${dataDir}/orders.csv`, csvOptions: { sep: "," } }
+      },
+      {
+        name: "Parquet input",
+        componentId: "parquetFileInput",
+        inputs: [],
+        config: { filePath: `${dataDir}/orders.parquet` }
+      },
+      {
+        name: "Excel input",
+        componentId: "excelfileInput",
+        inputs: [],
+        config: { filePath: `${dataDir}/orders.xlsx` }
+      },
+      {
+        name: "XML input",
+        componentId: "xmlFileInput",
+        inputs: [],
+        config: { filePath: `${dataDir}/suppliers.xml` }
+      },
+      {
+        name: "JSON input",
+        componentId: "jsonFileInput",
+        inputs: [],
+        config: { filePath: `${dataDir}/customers.json` }
+      },
+      {
+        name: "Join orders with order totals",
+        componentId: "join",
+        inputs: ["orders", "order_totals"],
+        config: {
+          tsCFselectJoinType: "left",
+          tsCFcolumnOperationColumnJoinConditions: [
+            { leftColumn: column("SalesOrderID"), operation: "=", rightColumn: column("SalesOrderID") }
+          ]
+        }
+      },
+      {
+        name: "Aggregate orders by product",
+        componentId: "aggregate",
+        inputs: ["orders"],
+        config: {
+          tsCFcolumnsGroupByColumns: [column("ProductName"), column("Color")],
+          tsCFkeyvalueColumnsSelectOperations: [
+            { key: column("LineTotal"), value: { value: "sum" } },
+            { key: column("OrderQty"), value: { value: "mean" } },
+            { key: column("SalesOrderDetailID"), value: { value: "count" } }
+          ]
+        }
+      },
+      {
+        name: "Compare orders with a modified copy",
+        componentId: "CompareDataframes",
+        inputs: ["orders", "orders_modified"],
+        config: { tsCFcolumnsKeyFields: [column("SalesOrderDetailID")] }
+      },
+      {
+        name: "Hierarchy paths",
+        componentId: "hierarchy_path",
+        inputs: ["hierarchy"],
+        config: {
+          tsCFcolumnHierarchyParentColumn: column("parent"),
+          tsCFcolumnHierarchyChildColumn: column("child"),
+          tsCFkeyvalueColumnsSelectHierarchyPathColumnOperations: [
+            { key: column("amount"), value: { value: "sum" } }
+          ]
+        }
+      },
+      {
+        name: "Flatten JSON customers",
+        componentId: "flattenJSON",
+        inputs: ["customers"],
+        config: { tsCFcolumnColumnToFlatten: column("customer") }
+      }
+    ];
+  }
+
+  // Python helpers building the datasets, timing the cases and writing the results
+  static provideFunctions(): string[] {
+    const tsBenchmarkFunctions = `
+def py_fn_benchmark_tile(py_arg_frame, py_arg_rows):
+    # py_arg_rows rows repeating py_arg_frame, and the copy number of each row
+    py_var_positions = np.arange(py_arg_rows)
+    py_var_tiled = py_arg_frame.iloc[py_var_positions % len(py_arg_frame)].reset_index(drop=True)
+    return py_var_tiled, py_var_positions // len(py_arg_frame)
+
+
+def py_fn_benchmark_datasets(py_arg_assets_dir, py_arg_data_dir, py_arg_scale):
+    """
+    Synthetic datasets derived from the test assets, py_arg_scale times their base size.
+    Returns the in-memory frames given to the transforms and writes the files read by
+    the inputs in py_arg_data_dir. Keys stay unique across the copies of the fixtures.
+    """
+    import json
+    import os
+    os.makedirs(py_arg_data_dir, exist_ok=True)
+    py_var_scaled = lambda py_arg_base: max(int(round(py_arg_base * py_arg_scale)), 1)
+
+    py_var_fixture = pd.read_parquet(os.path.join(py_arg_assets_dir, "Orders.parquet"))
+    py_var_orders, py_var_copy = py_fn_benchmark_tile(py_var_fixture, py_var_scaled(len(py_var_fixture)))
+    for py_var_key in ["SalesOrderDetailID", "SalesOrderID"]:
+        py_var_orders[py_var_key] = py_var_orders[py_var_key] + py_var_copy * (int(py_var_fixture[py_var_key].max()) + 1)
+
+    # Order totals, one row per order, and a copy of the orders with 1% of the rows dropped and 1% changed
+    py_var_totals = py_var_orders.groupby("SalesOrderID", as_index=False).agg(
+        OrderTotal=("LineTotal", "sum"), OrderLines=("SalesOrderDetailID", "count")
+    )
+    py_var_modified = py_var_orders[np.arange(len(py_var_orders)) % 100 != 0].copy()
+    py_var_modified.loc[py_var_modified.index % 100 == 50, "LineTotal"] += 1
+
+    # Hierarchy of 8 children per node with an amount per edge
+    py_var_nodes = py_var_scaled(100_000)
+    py_var_children = np.arange(1, py_var_nodes)
+    py_var_hierarchy = pd.DataFrame({
+        "parent": pd.Series((py_var_children - 1) // 8).map("N{}".format),
+        "child": pd.Series(py_var_children).map("N{}".format),
+        "amount": py_var_orders["LineTotal"].to_numpy()[py_var_children % len(py_var_orders)]
+    })
+
+    # Customers with nested objects and arrays
+    with open(os.path.join(py_arg_assets_dir, "test_json_arrays_object_2customers.json"), encoding="utf-8") as py_var_file:
+        py_var_customer_fixture = json.load(py_var_file)["customer"]
+    py_var_customers = []
+    for py_var_position in range(py_var_scaled(10_000)):
+        py_var_customer = dict(py_var_customer_fixture[py_var_position % len(py_var_customer_fixture)])
+        py_var_customer["first_name"] = f"{py_var_customer['first_name']} {py_var_position}"
+        py_var_customer["age"] = (py_var_customer.get("age") or 0) + py_var_position % 50
+        py_var_customers.append(py_var_customer)
+
+    py_var_suppliers, py_var_copy = py_fn_benchmark_tile(
+        pd.read_xml(os.path.join(py_arg_assets_dir, "Suppliers.xml"), parser="etree"), py_var_scaled(10_000)
+    )
+    py_var_suppliers["SupplierID"] = py_var_suppliers["SupplierID"] + py_var_copy * (int(py_var_suppliers["SupplierID"].max()) + 1)
+
+    def py_fn_write_customers(py_arg_path):
+        with open(py_arg_path, "w", encoding="utf-8") as py_var_output:
+            json.dump({"customer": py_var_customers}, py_var_output)
+
+    # A missing writer (openpyxl, ...) only fails the cases reading its file
+    py_var_writers = {
+        "orders.csv": lambda py_arg_path: py_var_orders.to_csv(py_arg_path, index=False),
+        "orders.parquet": lambda py_arg_path: py_var_orders.to_parquet(py_arg_path, index=False),
+        "orders.xlsx": lambda py_arg_path: py_var_orders.head(py_var_scaled(10_000)).to_excel(py_arg_path, index=False),
+        "suppliers.xml": lambda py_arg_path: py_var_suppliers.to_xml(py_arg_path, index=False, root_name="Suppliers", row_name="Supplier", parser="etree"),
+        "customers.json": py_fn_write_customers
+    }
+    for py_var_name, py_var_writer in py_var_writers.items():
+        try:
+            py_var_writer(os.path.join(py_arg_data_dir, py_var_name))
+        except Exception as py_var_error:
+            print(f"Benchmark file {py_var_name} could not be written: {py_var_error}")
+
+    return {
+        "orders": py_var_orders,
+        "order_totals": py_var_totals,
+        "orders_modified": py_var_modified,
+        "hierarchy": py_var_hierarchy,
+        "customers": pd.DataFrame({"customer": py_var_customers})
+    }
+
+
+def py_fn_benchmark_rows(py_arg_value):
+    # Row count of a DataFrame, None for anything else
+    return len(py_arg_value) if isinstance(py_arg_value, pd.DataFrame) else None
+
+
+def py_fn_benchmark_case(py_arg_case, py_arg_datasets, py_arg_repeat=3):
+    """
+    Run the code of a case py_arg_repeat times and return its median wall time and throughput.
+    The peak memory allocated during one more run is measured with tracemalloc, which slows
+    the code down and is therefore kept out of the timed runs. It covers Python and numpy
+    allocations, not Arrow buffers: those are reported as arrowMemory, the Arrow memory the run
+    still holds at its end, or its peak when the run raises the high-water mark of the Arrow
+    memory pool. Inputs are copied before each run.
+    """
+    import statistics
+    import time
+    import tracemalloc
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    py_var_result = {"case": py_arg_case["name"], "component": py_arg_case["componentId"]}
+    try:
+        py_var_inputs = [py_arg_datasets[py_var_name] for py_var_name in py_arg_case["inputs"]]
+        py_var_namespace = {"__name__": "__amphi_benchmark__"}
+        exec(py_arg_case["setup"], py_var_namespace)
+        py_var_code = compile(py_arg_case["code"], py_arg_case["name"], "exec")
+
+        def py_fn_run(py_arg_traced):
+            # Wall time, and with py_arg_traced the tracemalloc peak and the Arrow memory of the run
+            for py_var_input_name, py_var_input in zip(py_arg_case["inputNames"], py_var_inputs):
+                py_var_namespace[py_var_input_name] = py_var_input.copy()
+            py_var_namespace.pop("output", None)
+            if py_arg_traced:
+                if pa is not None:
+                    py_var_pool = pa.default_memory_pool()
+                    py_var_arrow_before, py_var_arrow_max = py_var_pool.bytes_allocated(), py_var_pool.max_memory()
+                tracemalloc.start()
+            py_var_start = time.perf_counter()
+            try:
+                exec(py_var_code, py_var_namespace)
+                py_var_time = time.perf_counter() - py_var_start
+                if not py_arg_traced:
+                    return py_var_time, None, None
+                py_var_arrow = None
+                if pa is not None:
+                    py_var_arrow = max(py_var_pool.bytes_allocated() - py_var_arrow_before, 0)
+                    if py_var_pool.max_memory() > py_var_arrow_max:
+                        py_var_arrow = max(py_var_arrow, py_var_pool.max_memory() - py_var_arrow_before)
+                return py_var_time, tracemalloc.get_traced_memory()[1], py_var_arrow
+            finally:
+                if py_arg_traced:
+                    tracemalloc.stop()
+
+        py_var_times = [py_fn_run(False)[0] for _ in range(max(py_arg_repeat, 1))]
+        _, py_var_peak, py_var_arrow = py_fn_run(True)
+        py_var_rows_in = sum(len(py_var_input) for py_var_input in py_var_inputs) if py_var_inputs else None
+        py_var_rows_out = py_fn_benchmark_rows(py_var_namespace.get("output"))
+        py_var_time = statistics.median(py_var_times)
+        py_var_rows = py_var_rows_in if py_var_rows_in is not None else py_var_rows_out
+        py_var_result.update(
+            rowsIn=py_var_rows_in,
+            rowsOut=py_var_rows_out,
+            time=round(py_var_time, 6),
+            times=[round(py_var_run_time, 6) for py_var_run_time in py_var_times],
+            rowsPerSecond=round(py_var_rows / py_var_time, 1) if py_var_rows is not None and py_var_time > 0 else None,
+            peakMemory=py_var_peak,
+            arrowMemory=py_var_arrow
+        )
+    except Exception as py_var_error:
+        py_var_result["error"] = f"{type(py_var_error).__name__}: {py_var_error}"
+    return py_var_result
+
+
+def py_fn_benchmark_compare(py_arg_results, py_arg_baseline_path, py_arg_tolerance=0.2):
+    # Ratios to the results of the same case and scale in a previous results file
+    import json
+    with open(py_arg_baseline_path, encoding="utf-8") as py_var_file:
+        py_var_baseline = json.load(py_var_file)
+    py_var_previous = {(py_var_item["case"], py_var_item["scale"]): py_var_item for py_var_item in py_var_baseline.get("results", [])}
+    py_var_comparison = []
+    for py_var_item in py_arg_results:
+        py_var_before = py_var_previous.get((py_var_item["case"], py_var_item["scale"]))
+        if py_var_before is None or "error" in py_var_before or "error" in py_var_item:
+            continue
+        py_var_ratios = {
+            py_var_measure: py_var_item[py_var_measure] / py_var_before[py_var_measure]
+            for py_var_measure in ["time", "peakMemory"]
+            if py_var_item.get(py_var_measure) is not None and py_var_before.get(py_var_measure)
+        }
+        py_var_comparison.append({
+            "case": py_var_item["case"],
+            "scale": py_var_item["scale"],
+            "timeRatio": round(py_var_ratios["time"], 3) if "time" in py_var_ratios else None,
+            "peakMemoryRatio": round(py_var_ratios["peakMemory"], 3) if "peakMemory" in py_var_ratios else None,
+            "regression": any(py_var_ratio > 1 + py_arg_tolerance for py_var_ratio in py_var_ratios.values())
+        })
+    return {"baseline": py_arg_baseline_path, "baselineVersion": py_var_baseline.get("version"), "cases": py_var_comparison}
+
+
+def py_fn_benchmark_run(py_arg_cases, py_arg_options):
+    """
+    Run every case at every scale, write the JSON results to py_arg_options["resultsPath"]
+    and print them, with the ratios to the baseline results when one is given.
+    """
+    import datetime
+    import json
+    import os
+    import platform
+
+    py_var_results = []
+    for py_var_scale in py_arg_options["scales"]:
+        py_var_datasets = py_fn_benchmark_datasets(py_arg_options["assetsDir"], py_arg_options["dataDir"], py_var_scale)
+        for py_var_case in py_arg_cases:
+            py_var_result = py_fn_benchmark_case(py_var_case, py_var_datasets, py_arg_options["repeat"])
+            py_var_result["scale"] = py_var_scale
+            py_var_results.append(py_var_result)
+            if "error" in py_var_result:
+                print(f"  x{py_var_scale:<6} {py_var_result['case']:<40} failed: {py_var_result['error']}")
+            else:
+                py_var_rate = "" if py_var_result["rowsPerSecond"] is None else f"{py_var_result['rowsPerSecond']:>14,.0f} rows/s"
+                py_var_arrow = "" if py_var_result["arrowMemory"] is None else f", Arrow {py_var_result['arrowMemory'] / 2**20:,.1f} MiB"
+                print(f"  x{py_var_scale:<6} {py_var_result['case']:<40} {py_var_result['time']:10.3f}s {py_var_rate}  peak {py_var_result['peakMemory'] / 2**20:,.1f} MiB{py_var_arrow}")
+        del py_var_datasets
+
+    py_var_report = {
+        "version": py_arg_options["version"],
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__
+        },
+        "scales": py_arg_options["scales"],
+        "repeat": py_arg_options["repeat"],
+        "results": py_var_results
+    }
+    if py_arg_options.get("baselinePath"):
+        py_var_report["comparison"] = py_fn_benchmark_compare(py_var_results, py_arg_options["baselinePath"], py_arg_options["tolerance"])
+        for py_var_item in py_var_report["comparison"]["cases"]:
+            if py_var_item["regression"]:
+                print(f"Regression: {py_var_item['case']} (x{py_var_item['scale']}) time x{py_var_item['timeRatio']}, peak memory x{py_var_item['peakMemoryRatio']}")
+
+    py_var_directory = os.path.dirname(py_arg_options["resultsPath"])
+    if py_var_directory:
+        os.makedirs(py_var_directory, exist_ok=True)
+    with open(py_arg_options["resultsPath"], "w", encoding="utf-8") as py_var_file:
+        json.dump(py_var_report, py_var_file, indent=2, default=str)
+    print(f"Benchmark results written to {py_arg_options['resultsPath']}")
+    return py_var_report
+`;
+    return [tsBenchmarkFunctions];
+  }
+
+  // Code of one case: the imports and functions of the component, and the code producing "output"
+  static generateCaseCode(componentService: any, benchmarkCase: BenchmarkCase): Record<string, any> {
+    const component = componentService.getComponent(benchmarkCase.componentId);
+    if (!component) {
+      throw new Error(`Component "${benchmarkCase.componentId}" is not registered.`);
+    }
+    const config = { ...component._default, ...benchmarkCase.config };
+    const inputNames = benchmarkCase.inputs.length > 1
+      ? benchmarkCase.inputs.map((_, index) => `input${index + 1}`)
+      : benchmarkCase.inputs.map(() => 'input');
+    const context: any = { config, outputName: 'output' };
+    inputNames.forEach((inputName, index) => {
+      context[inputNames.length > 1 ? `inputName${index + 1}` : 'inputName'] = inputName;
+    });
+
+    const functions = typeof component.provideFunctions === 'function' ? component.provideFunctions({ config }) : [];
+    return {
+      name: benchmarkCase.name,
+      componentId: benchmarkCase.componentId,
+      inputs: benchmarkCase.inputs,
+      inputNames,
+      setup: [...component.provideImports({ config }), ...functions].join('\n'),
+      code: component.generateComponentCode(context)
+    };
+  }
+
+  // Complete benchmark script, run on the kernel of a pipeline
+  static generateBenchmarkCode(componentService: any, options: BenchmarkOptions): string {
+    const cases = (options.cases ?? BenchmarkUtils.defaultCases(options.dataDir)).map(benchmarkCase => {
+      try {
+        return BenchmarkUtils.generateCaseCode(componentService, benchmarkCase);
+      } catch (error) {
+        // Reported as a failed case, the other cases still run
+        const message = JSON.stringify(`Code generation failed: ${(error as Error).message}`);
+        return { ...benchmarkCase, inputNames: [], setup: '', code: `raise RuntimeError(${message})` };
+      }
+    });
+    const { cases: _, ...runOptions } = options;
+
+    // Double JSON encoding: the inner JSON is a valid Python string literal
+    return `
+import json
+import numpy as np
+import pandas as pd
+${BenchmarkUtils.provideFunctions().join('\n')}
+
+py_fn_benchmark_run(json.loads(${JSON.stringify(JSON.stringify(cases))}), json.loads(${JSON.stringify(JSON.stringify(runOptions))}))
+`;
+  }
+}
@@ -0,0 +1,174 @@
+// ================================================
+// chunkUtils.ts
+// ================================================
+// Helpers for streaming (chunked) DataFrames between components.
+// A chunked node output is a re-iterable object yielding pandas DataFrames,
+// so a file larger than memory can flow from an input to an output in one pass.
+
+export class ChunkUtils {
+
+  // Python helpers shared by every chunk producer and consumer.
+  static provideFunctions(): string[] {
+    const tsChunkFunctions = `
+class py_cls_chunked_frame:
+    """
+    Re-iterable stream of pandas DataFrame chunks.
+    Every iteration calls the factory again, so the stream can be consumed by several nodes
+    (each one re-reading the source) without holding the whole dataset in memory.
+    """
+    _amphi_chunked = True
+
+    def __init__(self, py_arg_factory):
+        self._factory = py_arg_factory
+
+    def __iter__(self):
+        return iter(self._factory())
+
+
+def py_fn_iter_chunks(py_arg_data):
+    # Iterate over a chunked stream, or over a plain DataFrame as a single chunk
+    if isinstance(py_arg_data, pd.DataFrame):
+        return iter([py_arg_data])
+    return iter(py_arg_data)
+
+
+def py_fn_map_chunks(py_arg_data, py_arg_fn):
+    # Apply a DataFrame -> DataFrame function lazily on every chunk
+    if isinstance(py_arg_data, pd.DataFrame):
+        return py_arg_fn(py_arg_data)
+    return py_cls_chunked_frame(lambda: (py_arg_fn(py_var_chunk) for py_var_chunk in py_arg_data))
+
+
+def py_fn_chunk_dtypes(py_arg_chunk):
+    """
+    Nullable dtypes of a chunk, as convert_dtypes() infers them, keyed by column.
+    Float columns stay floats even when the chunk only holds whole numbers, since a later chunk may not.
+    """
+    py_var_converted = py_arg_chunk.convert_dtypes()
+    py_var_dtypes = {}
+    for py_var_column in py_var_converted.columns:
+        py_var_dtype = py_var_converted[py_var_column].dtype
+        if pd.api.types.is_float_dtype(py_arg_chunk[py_var_column].dtype) and pd.api.types.is_integer_dtype(py_var_dtype):
+            py_var_dtype = pd.Float64Dtype()
+        py_var_dtypes[py_var_column] = py_var_dtype
+    return py_var_dtypes
+
+
+def py_fn_common_dtype(py_arg_dtype, py_arg_other):
+    # Narrowest nullable dtype holding the values of both dtypes: integers and floats widen to Float64, anything else to strings
+    if py_arg_dtype == py_arg_other:
+        return py_arg_dtype
+    if pd.api.types.is_numeric_dtype(py_arg_dtype) and pd.api.types.is_numeric_dtype(py_arg_other) \\
+            and not pd.api.types.is_bool_dtype(py_arg_dtype) and not pd.api.types.is_bool_dtype(py_arg_other):
+        return pd.Float64Dtype()
+    if isinstance(py_arg_dtype, pd.StringDtype) or isinstance(py_arg_other, pd.StringDtype):
+        return pd.StringDtype()
+    return object
+
+
+def py_fn_cast_chunk(py_arg_chunk, py_arg_dtypes):
+    # Convert a chunk to the dtypes of the stream, whatever its own values would infer
+    py_var_chunk = py_arg_chunk.convert_dtypes()
+    py_var_casts = {
+        py_var_column: py_var_dtype for py_var_column, py_var_dtype in py_arg_dtypes.items()
+        if py_var_column in py_var_chunk.columns and py_var_chunk[py_var_column].dtype != py_var_dtype
+    }
+    return py_var_chunk.astype(py_var_casts) if py_var_casts else py_var_chunk
+
+
+def py_fn_stable_chunks(py_arg_factory):
+    """
+    Chunked stream converted to nullable dtypes that are the same in every chunk, so that consumers such as the
+    Parquet writer see a single schema. The dtypes are found by a first pass over the source that only keeps the
+    dtypes of each chunk: a value widening a column in a later chunk (2.5 after integers) widens it in every chunk,
+    and columns null in a chunk take the dtype of the chunks holding values.
+    """
+    py_var_state = {}
+
+    def py_fn_scan():
+        py_var_dtypes = {}
+        for py_var_chunk in py_arg_factory():
+            for py_var_column, py_var_dtype in py_fn_chunk_dtypes(py_var_chunk).items():
+                py_var_known = py_var_dtypes.get(py_var_column)
+                if py_var_known is None:
+                    py_var_dtypes[py_var_column] = (py_var_dtype, py_var_chunk[py_var_column].notna().any())
+                elif py_var_chunk[py_var_column].notna().any():
+                    py_var_dtypes[py_var_column] = (py_var_dtype if not py_var_known[1] else py_fn_common_dtype(py_var_known[0], py_var_dtype), True)
+        return {py_var_column: py_var_dtype for py_var_column, (py_var_dtype, _) in py_var_dtypes.items()}
+
+    def py_fn_chunks():
+        if "dtypes" not in py_var_state:
+            py_var_state["dtypes"] = py_fn_scan()
+        return (py_fn_cast_chunk(py_var_chunk, py_var_state["dtypes"]) for py_var_chunk in py_arg_factory())
+
+    return py_cls_chunked_frame(py_fn_chunks)
+
+
+def py_fn_collect_chunks(py_arg_data, py_arg_max_rows=None):
+    # Materialize a chunked stream into a single DataFrame (optionally only the leading rows)
+    py_var_chunks = []
+    py_var_rows = 0
+    for py_var_chunk in py_fn_iter_chunks(py_arg_data):
+        py_var_chunks.append(py_var_chunk)
+        py_var_rows += len(py_var_chunk)
+        if py_arg_max_rows is not None and py_var_rows >= py_arg_max_rows:
+            break
+    if not py_var_chunks:
+        return pd.DataFrame()
+    py_var_df = py_var_chunks[0] if len(py_var_chunks) == 1 else pd.concat(py_var_chunks, ignore_index=True)
+    return py_var_df if py_arg_max_rows is None else py_var_df.head(py_arg_max_rows)
+
+
+def py_fn_write_parquet_chunks(py_arg_data, py_arg_path, py_arg_compression="snappy", py_arg_storage_options=None):
+    # Stream chunks into a single Parquet file, one row group per chunk
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    py_var_file = None
+    if "://" in py_arg_path:
+        # Remote targets (S3, ...) go through fsspec like pandas does
+        import fsspec
+        py_var_file = fsspec.open(py_arg_path, "wb", **(py_arg_storage_options or {})).open()
+    py_var_writer = None
+    try:
+        for py_var_chunk in py_fn_iter_chunks(py_arg_data):
+            py_var_table = pa.Table.from_pandas(py_var_chunk, preserve_index=False)
+            if py_var_writer is None:
+                py_var_writer = pq.ParquetWriter(py_var_file or py_arg_path, py_var_table.schema, compression=py_arg_compression)
+            else:
+                # Later chunks may infer slightly different types, align them on the first one
+                py_var_table = py_var_table.cast(py_var_writer.schema)
+            py_var_writer.write_table(py_var_table)
+    finally:
+        if py_var_writer is not None:
+            py_var_writer.close()
+        if py_var_file is not None:
+            py_var_file.close()
+`;
+    return [tsChunkFunctions];
+  }
+
+  // Run the code of a DataFrame -> DataFrame component on every chunk of its input
+  static wrapChunkedProcessorCode(code: string, inputName: string, outputName: string): string {
+    const body = code
+      .split('\n')
+      .map(line => (line.trim() === '' ? '' : `    ${line}`))
+      .join('\n');
+
+    return `
+def py_fn_${outputName}_chunk(${inputName}):
+${body}
+    return ${outputName}
+
+${outputName} = py_fn_map_chunks(${inputName}, py_fn_${outputName}_chunk)
+`;
+  }
+
+  // Materialize a chunked input for a component that only works on a full DataFrame
+  static generateCollectCode(inputName: string): string {
+    return `
+# Collect streamed chunks into a single DataFrame
+${inputName}_collected = py_fn_collect_chunks(${inputName})
+`;
+  }
+}
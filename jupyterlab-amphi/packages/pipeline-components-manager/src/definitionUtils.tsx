@@ -0,0 +1,60 @@
+// ================================================
+// definitionUtils.ts
+// ================================================
+// Kernel-side deduplication of imports and helper functions: every block of
+// definitions is sent with the hash of its source and only runs when the kernel
+// session has not already run it, so previews do not redefine large helpers.
+
+export class DefinitionUtils {
+
+  // Python helper running a block of definitions once per kernel session.
+  static provideFunctions(): string[] {
+    const tsDefinitionFunctions = `
+def py_fn_define_once(py_arg_key, py_arg_source):
+    """
+    Run a block of imports or helper definitions unless this kernel session already ran it
+    and the names it bound still hold what it defined. Blocks are keyed by the hash of their
+    source: a changed helper runs again, and a helper redefined by another block is restored.
+    """
+    import linecache
+    py_var_globals = globals()
+    py_var_missing = object()
+    py_var_registry = py_var_globals.setdefault("_amphi_definitions", {})
+    py_var_bound = py_var_registry.get(py_arg_key)
+    if py_var_bound is not None and all(py_var_globals.get(py_var_name, py_var_missing) is py_var_value for py_var_name, py_var_value in py_var_bound.items()):
+        return
+    py_var_before = dict(py_var_globals)
+    py_var_filename = f"<amphi-definitions-{py_arg_key}>"
+    # Source lines of the block for the tracebacks raised by the helpers
+    linecache.cache[py_var_filename] = (len(py_arg_source), None, py_arg_source.splitlines(True), py_var_filename)
+    exec(compile(py_arg_source, py_var_filename, "exec"), py_var_globals)
+    py_var_registry[py_arg_key] = {
+        py_var_name: py_var_value for py_var_name, py_var_value in py_var_globals.items()
+        if py_var_name != "_amphi_definitions" and py_var_before.get(py_var_name, py_var_missing) is not py_var_value
+    }
+`;
+    return [tsDefinitionFunctions];
+  }
+
+  // 53-bit hash of a block source (cyrb53), as hexadecimal
+  static hash(source: string): string {
+    let h1 = 0xdeadbeef;
+    let h2 = 0x41c6ce57;
+    for (let i = 0; i < source.length; i++) {
+      const ch = source.charCodeAt(i);
+      h1 = Math.imul(h1 ^ ch, 2654435761);
+      h2 = Math.imul(h2 ^ ch, 1597334677);
+    }
+    h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+    h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+    return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16);
+  }
+
+  // Block of definitions run through py_fn_define_once, the JSON string is a valid Python literal
+  static wrapDefinitionCode(source: string): string {
+    if (!source.trim()) {
+      return '';
+    }
+    return `py_fn_define_once("${DefinitionUtils.hash(source)}", ${JSON.stringify(source)})`;
+  }
+}
@@ -11,6 +11,11 @@ export { renderComponentUI, renderHandle, createZoomSelector } from './rendererU
 export { PipelineComponent } from './PipelineComponent';
 export { CodeGenerator } from './CodeGenerator';
 export { CodeGeneratorDagster } from './CodeGeneratorDagster';
+export { ChunkUtils } from './chunkUtils';
+export { MemoryUtils } from './memoryUtils';
+export { DefinitionUtils } from './definitionUtils';
+export { BenchmarkUtils, BenchmarkCase, BenchmarkOptions } from './benchmarkUtils';
+export { ProfilingUtils, NodeProfile } from './profilingUtils';
 export { PipelineService } from './PipelineService';
 export { RequestService } from './RequestService';
 export { InputFile, InputRegular, SelectRegular, SelectColumns, CodeTextarea, CodeTextareaMirror } from './forms';
@@ -29,6 +34,8 @@ interface ComponentItem {
   _form?: Record<string, any>;
   _description?: string;
   provideImports?: (ctx: any) => string[];
+  producesChunks?: (ctx: { config: any }) => boolean;   // output is a stream of DataFrame chunks
+  consumesChunks?: (ctx: { config: any }) => boolean;   // can process chunks one at a time
   generateComponentCode?: (ctx: { config: any; outputName: string }) => string;
   getInstance?: () => ComponentItem;
 }
@@ -0,0 +1,106 @@
+// ================================================
+// memoryUtils.ts
+// ================================================
+// Memory optimization of DataFrames: narrowest lossless numeric dtypes,
+// dictionary-encoded repetitive strings and pyarrow-backed strings.
+// Used by the Optimize Memory component and, when enabled in the settings,
+// automatically after every input.
+
+export class MemoryUtils {
+
+  // Pipeline-wide option, set from the editor settings: optimize the output of every input node
+  static optimizeInputs = false;
+
+  // Python helpers converting a DataFrame to lighter dtypes and reporting the memory saved.
+  static provideFunctions(): string[] {
+    const tsMemoryFunctions = `
+def py_fn_optimize_memory_dtype(py_arg_dtype, py_arg_numpy_name):
+    # Narrower dtype of the same family: numpy, pandas nullable or pyarrow-backed
+    if isinstance(py_arg_dtype, pd.ArrowDtype):
+        import pyarrow as pa
+        return pd.ArrowDtype(pa.from_numpy_dtype(np.dtype(py_arg_numpy_name)))
+    if isinstance(py_arg_dtype, pd.api.extensions.ExtensionDtype):
+        return pd.api.types.pandas_dtype(py_arg_numpy_name.capitalize().replace("Uint", "UInt"))
+    return np.dtype(py_arg_numpy_name)
+
+
+def py_fn_optimize_memory(py_arg_df, py_arg_columns=None, py_arg_strings="category", py_arg_max_unique_ratio=0.5, py_arg_downcast_floats=True, py_arg_report=True, py_arg_stable_dtypes=False):
+    """
+    Return the DataFrame with the narrowest lossless dtypes: integers downcast to the smallest type holding
+    their range, floats to float32 when every value round-trips, repetitive strings dictionary-encoded
+    (py_arg_strings="category" or "dictionary", at most py_arg_max_unique_ratio distinct values per row)
+    and the other strings stored as pyarrow strings. Nullable columns stay nullable.
+    With py_arg_stable_dtypes, only the conversions decided by the column dtype are made, not by its values,
+    so that every chunk of a stream gets the same dtypes: string columns are stored as pyarrow strings.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    py_var_before = py_arg_df.memory_usage(deep=True).sum() if py_arg_report else 0
+    py_var_result = py_arg_df.copy(deep=False)
+    for py_var_column in (py_arg_columns if py_arg_columns is not None else py_arg_df.columns):
+        py_var_series = py_arg_df[py_var_column]
+        py_var_dtype = py_var_series.dtype
+        if py_arg_stable_dtypes:
+            # Decided before looking at the values, so that chunks holding only nulls are converted too
+            if pa is not None and isinstance(py_var_dtype, pd.StringDtype) and py_var_dtype.storage != "pyarrow":
+                py_var_result[py_var_column] = py_var_series.astype(pd.StringDtype("pyarrow"))
+            continue
+        py_var_values = py_var_series.dropna()
+        if py_var_values.empty or isinstance(py_var_dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(py_var_dtype):
+            continue
+        try:
+            if pd.api.types.is_integer_dtype(py_var_dtype):
+                py_var_min, py_var_max = int(py_var_values.min()), int(py_var_values.max())
+                for py_var_candidate in ("uint8", "uint16", "uint32", "int8", "int16", "int32") if py_var_min >= 0 else ("int8", "int16", "int32"):
+                    py_var_info = np.iinfo(py_var_candidate)
+                    if py_var_info.min <= py_var_min and py_var_max <= py_var_info.max:
+                        if np.dtype(py_var_candidate).itemsize < py_var_dtype.itemsize:
+                            py_var_result[py_var_column] = py_var_series.astype(py_fn_optimize_memory_dtype(py_var_dtype, py_var_candidate))
+                        break
+            elif pd.api.types.is_float_dtype(py_var_dtype):
+                if not py_arg_downcast_floats or py_var_dtype.itemsize <= 4:
+                    continue
+                py_var_floats = py_var_values.to_numpy(dtype="float64")
+                py_var_narrow = py_var_floats.astype("float32")
+                if np.array_equal(py_var_narrow.astype("float64"), py_var_floats, equal_nan=True):
+                    py_var_result[py_var_column] = py_var_series.astype(py_fn_optimize_memory_dtype(py_var_dtype, "float32"))
+            elif pd.api.types.is_string_dtype(py_var_dtype) and not pd.api.types.is_datetime64_any_dtype(py_var_dtype):
+                # Object columns are only converted when they hold nothing but strings
+                if py_var_dtype == object and not py_var_values.map(type).eq(str).all():
+                    continue
+                py_var_unique = py_var_values.nunique()
+                if py_arg_strings != "none" and len(py_var_series) and py_var_unique <= py_arg_max_unique_ratio * len(py_var_series):
+                    if py_arg_strings == "dictionary" and pa is not None:
+                        py_var_result[py_var_column] = py_var_series.astype(pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string())))
+                    else:
+                        py_var_result[py_var_column] = py_var_series.astype("category")
+                elif pa is not None and getattr(py_var_dtype, "storage", None) != "pyarrow" and not isinstance(py_var_dtype, pd.ArrowDtype):
+                    py_var_result[py_var_column] = py_var_series.astype(pd.StringDtype("pyarrow"))
+        except (TypeError, ValueError, OverflowError) as e:
+            print(f"Column {py_var_column!r} kept as {py_var_dtype}: {e}")
+
+    if py_arg_report:
+        py_var_after = py_var_result.memory_usage(deep=True).sum()
+        print(f"Memory usage: {py_var_before / 1024 ** 2:,.1f} MB -> {py_var_after / 1024 ** 2:,.1f} MB ({py_var_before / max(py_var_after, 1):.1f}x smaller)")
+    return py_var_result
+`;
+    return [tsMemoryFunctions];
+  }
+
+  // Optimize the output of an input node. Chunks only get the conversions decided by the column dtypes:
+  // downcasts and dictionaries decided on each chunk values would give the chunks different dtypes,
+  // which chunked writers casting to the first chunk schema reject.
+  static generatePostInputCode(outputName: string, chunked: boolean): string {
+    if (chunked) {
+      return `
+${outputName} = py_fn_map_chunks(${outputName}, lambda py_arg_chunk: py_fn_optimize_memory(py_arg_chunk, py_arg_report=False, py_arg_stable_dtypes=True))
+`;
+    }
+    return `
+${outputName} = py_fn_optimize_memory(${outputName})
+`;
+  }
+}
@@ -0,0 +1,160 @@
+// ================================================
+// profilingUtils.ts
+// ================================================
+// Instrumentation of the generated code: every node is wrapped with timers and
+// memory sampling, and a JSON profile is emitted at the end of the run.
+
+export interface NodeProfile {
+  nodeId: string;
+  title: string;
+  status?: 'success';
+  wallTime: number;             // in seconds
+  rowsIn?: number | null;
+  rowsOut?: number | null;
+  memoryIn?: number | null;     // DataFrame memory_usage(deep=True), in bytes
+  memoryOut?: number | null;
+  memoryDelta?: number | null;
+  peakRss?: number | null;      // peak resident set size of the process, in bytes
+}
+
+export class ProfilingUtils {
+
+  // Python helpers recording one entry per node in the _amphi_profile global.
+  static provideFunctions(): string[] {
+    const tsProfilingFunctions = `
+def py_fn_profile_peak_rss():
+    # Peak resident set size of the process in bytes, None when it cannot be measured
+    try:
+        import resource
+        import sys
+        py_var_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return py_var_peak if sys.platform == "darwin" else py_var_peak * 1024
+    except ImportError:
+        try:
+            import psutil
+            py_var_info = psutil.Process().memory_info()
+            return getattr(py_var_info, "peak_wset", py_var_info.rss)
+        except ImportError:
+            return None
+
+
+def py_fn_profile_entries():
+    # Node measures of the current run, keyed by node id. Profiled scripts reset them first
+    if "_amphi_profile" not in globals():
+        globals()["_amphi_profile"] = dict()
+    return globals()["_amphi_profile"]
+
+
+def py_fn_profile_frame_stats(py_arg_frames):
+    # Total rows and deep memory of the DataFrames, None when none of them is a DataFrame
+    py_var_frames = [py_var_frame for py_var_frame in py_arg_frames if isinstance(py_var_frame, pd.DataFrame)]
+    if not py_var_frames:
+        return None, None
+    return (
+        sum(len(py_var_frame) for py_var_frame in py_var_frames),
+        int(sum(py_var_frame.memory_usage(deep=True).sum() for py_var_frame in py_var_frames))
+    )
+
+
+def py_fn_profile_start(py_arg_node_id, py_arg_title, py_arg_inputs=()):
+    import time
+    py_var_rows, py_var_memory = py_fn_profile_frame_stats(py_arg_inputs)
+    py_var_entry = {
+        "nodeId": py_arg_node_id,
+        "title": py_arg_title,
+        "status": "running",
+        "rowsIn": py_var_rows,
+        "memoryIn": py_var_memory,
+        "start": time.perf_counter()
+    }
+    # A node still running when the profile is read is the one that failed
+    py_fn_profile_entries()[py_arg_node_id] = py_var_entry
+    return py_var_entry
+
+
+def py_fn_profile_end(py_arg_entry, py_arg_output=None):
+    import time
+    py_var_wall_time = time.perf_counter() - py_arg_entry.pop("start")
+    py_var_rows, py_var_memory = py_fn_profile_frame_stats([py_arg_output])
+    py_arg_entry.update(
+        status="success",
+        wallTime=round(py_var_wall_time, 6),
+        rowsOut=py_var_rows,
+        memoryOut=py_var_memory,
+        memoryDelta=(py_var_memory - (py_arg_entry["memoryIn"] or 0)) if py_var_memory is not None else None,
+        peakRss=py_fn_profile_peak_rss()
+    )
+    # Keyed by node so that re-running a node replaces its previous measure
+    py_fn_profile_entries()[py_arg_entry["nodeId"]] = py_arg_entry
+
+
+def py_fn_profile_nodes():
+    # Measures of the nodes that completed in this run, and the ids of the nodes that started but did not complete
+    py_var_entries = list(py_fn_profile_entries().values())
+    return (
+        [py_var_entry for py_var_entry in py_var_entries if py_var_entry["status"] == "success"],
+        [py_var_entry["nodeId"] for py_var_entry in py_var_entries if py_var_entry["status"] != "success"]
+    )
+
+
+def py_fn_profile_json():
+    import json
+    py_var_nodes, py_var_failed = py_fn_profile_nodes()
+    return json.dumps({
+        "nodes": py_var_nodes,
+        "failedNodes": py_var_failed,
+        "totalWallTime": round(sum(py_var_node["wallTime"] for py_var_node in py_var_nodes), 6),
+        "peakRss": py_fn_profile_peak_rss()
+    }, default=str)
+
+
+def py_fn_profile_report(py_arg_path=None):
+    """
+    Write the JSON profile to py_arg_path (or the AMPHI_PROFILE_PATH environment variable)
+    and print the nodes sorted by wall time.
+    """
+    import os
+    py_var_path = py_arg_path or os.environ.get("AMPHI_PROFILE_PATH")
+    py_var_profile = py_fn_profile_json()
+    if py_var_path:
+        with open(py_var_path, "w", encoding="utf-8") as py_var_file:
+            py_var_file.write(py_var_profile)
+    py_var_nodes, py_var_failed = py_fn_profile_nodes()
+    print("Pipeline profile (slowest nodes first):")
+    for py_var_node in sorted(py_var_nodes, key=lambda py_var_node: -py_var_node["wallTime"]):
+        py_var_rows = "" if py_var_node["rowsOut"] is None else f", {py_var_node['rowsOut']} rows"
+        print(f"  {py_var_node['wallTime']:10.3f}s  {py_var_node['title']} ({py_var_node['nodeId']}){py_var_rows}")
+    for py_var_node_id in py_var_failed:
+        print(f"  {'failed':>11}  {py_fn_profile_entries()[py_var_node_id]['title']} ({py_var_node_id})")
+`;
+    return [tsProfilingFunctions];
+  }
+
+  // Wrap the code of a node between a start and an end measure
+  static wrapNodeCode(code: string, nodeId: string, title: string, inputNames: string[], outputName?: string): string {
+    return `
+_amphi_profile_entry = py_fn_profile_start("${nodeId}", ${JSON.stringify(title)}, [${inputNames.join(', ')}])${code}
+py_fn_profile_end(_amphi_profile_entry, ${outputName || 'None'})
+`;
+  }
+
+  // Emitted once at the start of a profiled script, measures of previous runs are not reported again
+  static generateResetCode(): string {
+    return `
+# Pipeline profile of this run
+globals()["_amphi_profile"] = {}
+`;
+  }
+
+  // Run the code of a profiled script in a try block whose finally writes the profile, so that failed runs are reported too
+  static wrapReportCode(code: string): string {
+    const body = code.trim() ? code.split('\n').map(line => `    ${line}`).join('\n') : '    pass';
+    return `
+try:
+${body}
+finally:
+    # Pipeline profile
+    py_fn_profile_report()
+`;
+  }
+}
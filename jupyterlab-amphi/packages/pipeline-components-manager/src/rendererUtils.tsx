@@ -182,6 +182,29 @@ const MemoizedComponentUI = React.memo(
       return '';
     }, [data.execution]);
 
+    // Summary of the last profiled run, e.g. "1.23 s · 5,291 rows · +1.2 MB"
+    const profileSummary = useMemo(() => {
+      const profile = data.execution?.profile;
+      if (!profile) {
+        return null;
+      }
+      const parts = [`${profile.wallTime.toFixed(2)} s`];
+      if (profile.rowsOut !== null && profile.rowsOut !== undefined) {
+        parts.push(`${profile.rowsOut.toLocaleString()} rows`);
+      }
+      if (profile.memoryDelta !== null && profile.memoryDelta !== undefined) {
+        const megabytes = profile.memoryDelta / (1024 * 1024);
+        parts.push(`${megabytes >= 0 ? '+' : ''}${megabytes.toFixed(1)} MB`);
+      }
+      return parts.join(' · ');
+    }, [data.execution]);
+
+    const profileOverlay = profileSummary && (
+      <div className="component__profile" title="Wall time, output rows and memory delta of the last profiled run">
+        {profileSummary}
+      </div>
+    );
+
     const modifier = '--default';
     const isIbis = false;
 
@@ -247,6 +270,7 @@ const MemoizedComponentUI = React.memo(
               <Icon.react height="36px" width="36px" color={colorPrimary} marginRight={8} />
               <Text>{titleName}</Text>
             </div>
+            {profileOverlay}
             {handle}
           </div>
         </ConfigProvider>
@@ -286,6 +310,7 @@ const MemoizedComponentUI = React.memo(
             <div style={{ display: 'none' }}>
               <ConfigForm {...enhancedConfigFormProps} />
             </div>
+            {profileOverlay}
             {handle}
           </div>
         </ConfigProvider>
@@ -332,6 +357,7 @@ const MemoizedComponentUI = React.memo(
               )}
             </form>
           </div>
+          {profileOverlay}
           {handle}
         </div>
       </ConfigProvider>
@@ -354,7 +354,8 @@ const PipelineWrapper: React.FC<IProps> = ({
                       rowCount: result.metadata.rowCount,
                       columnCount: result.metadata.columnCount,
                       errorMessage: result.metadata.errorMessage,
-                      errorType: result.metadata.errorType
+                      errorType: result.metadata.errorType,
+                      profile: result.metadata.profile
                     }
                   }
                 }
@@ -1097,6 +1098,9 @@ export class PipelineEditorFactory extends ABCWidgetFactory<DocumentWidget> {
                   `An error occurred during the execution of 'pipeline-editor:run-pipeline'.\n${reason}`
                 );
               });
+            } else if (executionMode === 'profiled') {
+              // Full pipeline execution, instrumented per node
+              await commands.execute('pipeline-editor:run-profiled-pipeline', { context });
             } else {
               // Incremental execution
               await commands.execute('pipeline-editor:run-incremental-pipeline', { context });
@@ -1117,6 +1121,11 @@ export class PipelineEditorFactory extends ABCWidgetFactory<DocumentWidget> {
             label: 'Run Step-by-Step',
             value: 'incremental',
             title: 'Execute each component one by one.'
+          },
+          {
+            label: 'Run with Profiling',
+            value: 'profiled',
+            title: 'Execute all components at once and measure each one.'
           }
         ];
 
@@ -1147,6 +1156,10 @@ export class PipelineEditorFactory extends ABCWidgetFactory<DocumentWidget> {
                   <div>
                     <strong>Full Pipeline:</strong> The entire pipeline executes at once.
                   </div>
+                ) : executionMode === 'profiled' ? (
+                  <div>
+                    <strong>Profiling:</strong> The entire pipeline executes at once while recording wall time, rows and memory of each component. Results are shown on the components and a JSON profile is printed in the console.
+                  </div>
                 ) : (
                   <div>
                     <strong>Step-by-Step:</strong> Each component executes one by one and shows results in the console. Easier to identify where errors occur.
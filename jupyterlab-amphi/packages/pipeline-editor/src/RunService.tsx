@@ -70,6 +70,20 @@ export class RunService {
       return future.done;
     }
   
+    // Run code on the kernel and resolve with everything it printed on stdout
+    static retrieveKernelOutput(session: any, code: string): Promise<string> {
+      return new Promise((resolve, reject) => {
+        let output = '';
+        const future = session.kernel.requestExecute({ code });
+        future.onIOPub = (msg: any) => {
+          if (msg.header.msg_type === 'stream' && msg.content.name === 'stdout') {
+            output += msg.content.text;
+          }
+        };
+        future.done.then(() => resolve(output)).catch(reject);
+      });
+    }
+
     static async executeKernelCodeWithNotifications(
         Notification: any,
         session: any,
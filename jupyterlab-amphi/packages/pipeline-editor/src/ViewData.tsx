@@ -1,12 +1,10 @@
 import { StackedPanel } from '@lumino/widgets';
-import { SessionContext } from '@jupyterlab/apputils';
 import { KernelMessage } from '@jupyterlab/services';
 import { PipelineService } from '@amphi/pipeline-components-manager';
 import React from 'react';
 import ReactDOM from 'react-dom';
 import { gridAltIcon } from './icons'; // Re-using your icon
-import { JSONModel } from '@lumino/datagrid'; // Just for type reference if needed
-import { GridMouseEventArgs } from "@glideapps/glide-data-grid";
+import { GridMouseEventArgs, Rectangle } from "@glideapps/glide-data-grid";
 import { useLayer } from "react-laag";
 
 // You can reuse the same "DataView" React component you already have,
@@ -23,11 +21,57 @@ import {
 } from "@glideapps/glide-data-grid";
 
 
-function DataView({ htmlData }: { htmlData: string }) {
+// Rows are fetched from the kernel in pages of this size, as the grid scrolls
+const PAGE_SIZE = 200;
+// Pages kept in memory, the farthest from the visible region are dropped first
+const MAX_CACHED_PAGES = 50;
+
+interface IPreviewSchema {
+    rows: number;
+    columns: Array<{ name: string; type: string }>;
+}
+
+interface IPreviewSort {
+    column: number;
+    ascending: boolean;
+}
+
+interface IPreviewWindow {
+    offset: number;
+    rows: number;
+    columns: Array<Array<string | null>>;
+}
+
+interface IPreviewSource {
+    schema: IPreviewSchema;
+    fetchWindow(offset: number, limit: number, sort: IPreviewSort | null, query: string): Promise<IPreviewWindow>;
+}
+
+// Map a column dtype to one of the header icons
+function columnIcon(colType: string): string {
+    const type = colType.toLowerCase();
+    if (type.includes("int")) return "number";
+    if (type.includes("float") || type.includes("decimal")) return "decimal";
+    if (type.includes("date") || type.includes("time")) return "datetime";
+    if (type.includes("bool")) return "boolean";
+    return "string";
+}
+
+function DataView({ source }: { source: IPreviewSource }) {
     const [pixelRatio, setPixelRatio] = React.useState(() => window.devicePixelRatio);
-    const [rowsData, setRowsData] = React.useState<any[]>([]);
-    const [gridColumns, setGridColumns] = React.useState<GridColumn[]>([]);
-    const [originalHeaders, setOriginalHeaders] = React.useState<string[]>([]);
+    const [rowCount, setRowCount] = React.useState<number>(source.schema.rows);
+    const [sort, setSort] = React.useState<IPreviewSort | null>(null);
+    const [query, setQuery] = React.useState<string>("");
+    const [queryInput, setQueryInput] = React.useState<string>("");
+    const [error, setError] = React.useState<string>("");
+    const [pagesVersion, setPagesVersion] = React.useState(0);
+    const [columnWidths, setColumnWidths] = React.useState<Record<number, number>>({});
+
+    // Loaded pages of the current view (sort + filter), as columns of display strings
+    const pagesRef = React.useRef(new Map<number, Array<Array<string | null>>>());
+    const pendingRef = React.useRef(new Set<number>());
+    const generationRef = React.useRef(0);
+    const visibleRef = React.useRef<Rectangle>({ x: 0, y: 0, width: 0, height: 0 });
 
     interface IBounds {
         left: number; top: number; width: number; height: number; right: number; bottom: number;
@@ -55,69 +99,92 @@ function DataView({ htmlData }: { htmlData: string }) {
         return Math.min(Math.max(title.length * 8 + 40, 80), 200);
     };
 
-    React.useEffect(() => {
-        const { data, headers } = htmlToJson(htmlData);
-        setOriginalHeaders(headers);
-
-        // Clean up "<NA>"
-        const cleanedData = data.map(row => {
-            const cleanRow = { ...row };
-            Object.keys(cleanRow).forEach(key => {
-                if (cleanRow[key] === "<NA>" || cleanRow[key] === "null") {
-                    cleanRow[key] = "";
+    const gridColumns = React.useMemo<GridColumn[]>(() => source.schema.columns.map((column, index) => {
+        const arrow = sort?.column === index ? (sort.ascending ? " ▲" : " ▼") : "";
+        return {
+            title: column.name + arrow,
+            id: `${column.name} (${column.type})`,
+            icon: columnIcon(column.type),
+            width: columnWidths[index] ?? getOptimalColumnWidth(column.name)
+        };
+    }), [source, sort, columnWidths]);
+
+    const loadPage = React.useCallback((page: number) => {
+        if (pagesRef.current.has(page) || pendingRef.current.has(page)) {
+            return;
+        }
+        const generation = generationRef.current;
+        pendingRef.current.add(page);
+        source.fetchWindow(page * PAGE_SIZE, PAGE_SIZE, sort, query)
+            .then(window => {
+                if (generation !== generationRef.current) {
+                    return;
+                }
+                pendingRef.current.delete(page);
+                pagesRef.current.set(page, window.columns);
+                if (pagesRef.current.size > MAX_CACHED_PAGES) {
+                    const visiblePage = Math.floor(visibleRef.current.y / PAGE_SIZE);
+                    const farthest = Array.from(pagesRef.current.keys())
+                        .sort((a, b) => Math.abs(b - visiblePage) - Math.abs(a - visiblePage))[0];
+                    pagesRef.current.delete(farthest);
+                }
+                setError("");
+                setRowCount(window.rows);
+                setPagesVersion(version => version + 1);
+            })
+            .catch(reason => {
+                if (generation === generationRef.current) {
+                    pendingRef.current.delete(page);
+                    setError(String(reason));
                 }
             });
-            return cleanRow;
-        });
+    }, [source, sort, query]);
 
-        const updatedColumns: GridColumn[] = headers.map((header) => {
-            if (!header.trim()) {
-                return { title: header, width: getOptimalColumnWidth(header) };
-            }
-            // Attempt to parse for "ColumnName (Type)"
-            const match = header.match(/^(.*?)\s*\((.*?)\)\s*$/);
-            let cleanColumnName = header;
-            let dataType = "string";
-
-            if (match) {
-                cleanColumnName = match[1].trim();
-                const colType = match[2].trim().toLowerCase();
-                if (colType.includes("int")) dataType = "number";
-                else if (colType.includes("float") || colType.includes("decimal")) dataType = "decimal";
-                else if (colType.includes("date") || colType.includes("time")) dataType = "datetime";
-                else if (colType.includes("bool")) dataType = "boolean";
-            }
+    const loadVisiblePages = React.useCallback((range: Rectangle) => {
+        const firstPage = Math.floor(range.y / PAGE_SIZE);
+        const lastPage = Math.floor((range.y + Math.max(range.height, 1) - 1) / PAGE_SIZE);
+        for (let page = firstPage; page <= lastPage; page++) {
+            loadPage(page);
+        }
+    }, [loadPage]);
 
-            return {
-                title: cleanColumnName,
-                id: header,
-                icon: dataType,
-                width: getOptimalColumnWidth(cleanColumnName)
-            };
+    // A new sort or filter is a new view: drop the loaded pages and fetch the visible ones again
+    React.useEffect(() => {
+        generationRef.current += 1;
+        pagesRef.current.clear();
+        pendingRef.current.clear();
+        setPagesVersion(version => version + 1);
+        loadVisiblePages(visibleRef.current);
+    }, [loadVisiblePages]);
+
+    const onVisibleRegionChanged = React.useCallback((range: Rectangle) => {
+        visibleRef.current = range;
+        loadVisiblePages(range);
+    }, [loadVisiblePages]);
+
+    const onHeaderClicked = React.useCallback((colIndex: number) => {
+        // Ascending, then descending, then back to the original order
+        setSort(previous => {
+            if (previous?.column !== colIndex) return { column: colIndex, ascending: true };
+            if (previous.ascending) return { column: colIndex, ascending: false };
+            return null;
         });
-
-        setGridColumns(updatedColumns);
-        setRowsData(cleanedData);
-    }, [htmlData]);
+    }, []);
 
     const onColumnResize = React.useCallback(
         (_column: GridColumn, newSize: number, colIndex: number) => {
-            setGridColumns((prev) => {
-                const updated = [...prev];
-                updated[colIndex] = { ...updated[colIndex], width: newSize };
-                return updated;
-            });
+            setColumnWidths(prev => ({ ...prev, [colIndex]: newSize }));
         },
         []
     );
 
     const getCellContent = React.useCallback(
         ([col, row]: Item): GridCell => {
-            if (row >= rowsData.length || col >= gridColumns.length) {
-                return { kind: GridCellKind.Text, data: "", displayData: "", allowOverlay: false };
+            const page = pagesRef.current.get(Math.floor(row / PAGE_SIZE));
+            if (!page) {
+                return { kind: GridCellKind.Loading, allowOverlay: false };
             }
-            const columnKey = originalHeaders[col];
-            const value = rowsData[row][columnKey] ?? "";
+            const value = page[col]?.[row % PAGE_SIZE] ?? "";
             return {
                 kind: GridCellKind.Text,
                 data: value,
@@ -125,7 +192,7 @@ function DataView({ htmlData }: { htmlData: string }) {
                 allowOverlay: false
             };
         },
-        [gridColumns, rowsData, originalHeaders]
+        [gridColumns, pagesVersion]
     );
 
     const onItemHovered = React.useCallback(
@@ -141,8 +208,7 @@ function DataView({ htmlData }: { htmlData: string }) {
             const col = args.location[0];
             timeoutRef.current = window.setTimeout(() => {
                 if (col >= gridColumns.length) return;
-                const raw = originalHeaders[col];
-                const type = raw.match(/\((.+?)\)/)?.[1] ?? "string";
+                const type = source.schema.columns[col].type;
                 const { x, y, width, height } = args.bounds;
                 setTooltip({
                     val: type,
@@ -150,7 +216,7 @@ function DataView({ htmlData }: { htmlData: string }) {
                 });
             }, 800);         // delay (ms)
         },
-        [gridColumns, originalHeaders]
+        [gridColumns, source]
     );
 
     // Create icons for header
@@ -218,15 +284,31 @@ function DataView({ htmlData }: { htmlData: string }) {
     });
 
     return (
-        <div style={{ position: "relative", width: "100%", height: "100%" }}>
-
+        <div style={{ position: "relative", width: "100%", height: "100%", display: "flex", flexDirection: "column" }}>
+            <div style={{ display: "flex", gap: 8, padding: "4px 8px", alignItems: "center", fontSize: "0.8125rem" }}>
+                <input
+                    type="text"
+                    value={queryInput}
+                    placeholder="Filter, e.g. Quantity > 10 and Region == 'Europe' (press Enter)"
+                    style={{ flex: 1 }}
+                    onChange={event => setQueryInput(event.target.value)}
+                    onKeyDown={event => {
+                        if (event.key === "Enter") setQuery(queryInput.trim());
+                    }}
+                />
+                <span>{rowCount.toLocaleString()} rows</span>
+                {error && <span style={{ color: "var(--jp-error-color1)" }}>{error}</span>}
+            </div>
+            <div style={{ position: "relative", flex: 1 }}>
             <DataEditor
                 key={pixelRatio}
                 columns={gridColumns}
                 minColumnWidth={100}
                 getCellContent={getCellContent}
                 onItemHovered={onItemHovered}
-                rows={rowsData.length}
+                onVisibleRegionChanged={onVisibleRegionChanged}
+                onHeaderClicked={onHeaderClicked}
+                rows={rowCount}
                 rowMarkers="both"
                 onColumnResize={onColumnResize}
                 smoothScrollX={false}
@@ -249,6 +331,7 @@ function DataView({ htmlData }: { htmlData: string }) {
                     []
                 )}
             />
+            </div>
             {tooltip &&
                 renderLayer(
                     <div
@@ -273,36 +356,41 @@ function DataView({ htmlData }: { htmlData: string }) {
     );
 }
 
-// Utility to parse HTML table into JSON rows & headers
-function htmlToJson(htmlString: string): {
-    data: Array<Record<string, string>>;
-    headers: string[];
-} {
-    const parser = new DOMParser();
-    const doc = parser.parseFromString(htmlString, "text/html");
-
-    // Get all header cells and remove the first (index) column
-    const allHeaderCells = Array.from(doc.querySelectorAll("table thead th"));
-    const headers = allHeaderCells.slice(1).map(th => th.textContent?.trim() ?? "");
-
-    // Process each row, skipping the first cell (index column)
-    const rows = doc.querySelectorAll("table tbody tr");
-    const data = Array.from(rows, (row) => {
-        const cells = row.querySelectorAll("th, td");
-        const rowObj: Record<string, string> = {};
-        headers.forEach((header, idx) => {
-            // Corresponding cell index is offset by 1 to skip the index column
-            rowObj[header] = cells[idx + 1]?.textContent?.trim() ?? "";
-        });
-        return rowObj;
-    });
+// Run code in the kernel and parse the JSON it prints on stdout
+function executeForJSON(kernel: any, code: string): Promise<any> {
+    return new Promise((resolve, reject) => {
+        const future = kernel.requestExecute({ code, stop_on_error: false, store_history: false });
+        let output = '';
+        let error = '';
+
+        future.onIOPub = (msg: KernelMessage.IIOPubMessage) => {
+            const msgType = msg.header.msg_type;
+            if (msgType === 'stream') {
+                const content = msg.content as KernelMessage.IStreamMsg['content'];
+                if (content.name === 'stdout') {
+                    output += content.text;
+                }
+            } else if (msgType === 'error') {
+                const content = msg.content as KernelMessage.IErrorMsg['content'];
+                error = `${content.ename}: ${content.evalue}`;
+            }
+        };
 
-    return { data, headers };
+        future.done
+            .then(() => {
+                if (error) {
+                    reject(error);
+                } else {
+                    resolve(JSON.parse(output));
+                }
+            })
+            .catch(reject);
+    });
 }
 
 // Build a small lumino panel that renders the React DataView component
 class DataViewPanel extends StackedPanel {
-    constructor(htmlData: string) {
+    constructor(source: IPreviewSource) {
         super();
         this.id = 'datagrid-viewer';
         this.title.label = 'Data Browser';
@@ -310,39 +398,10 @@ class DataViewPanel extends StackedPanel {
         this.title.icon = gridAltIcon;
 
         // Render the React component into this panel's DOM node
-        ReactDOM.render(<DataView htmlData={htmlData} />, this.node);
+        ReactDOM.render(<DataView source={source} />, this.node);
     }
 }
 
-// Convert the "table" oriented JSON to an HTML string so our existing DataView can parse it
-function modelToHTMLTable(jsonModel: any): string {
-    // The "table" orient JSON has a "schema" and "data" array
-    const fields = jsonModel.schema.fields; // typed column objects
-    const tableRows = jsonModel.data;       // array of row objects
-
-    // Construct <thead> with typed columns
-    let thead = '<thead><tr>';
-    for (const field of fields) {
-        const headerTitle = field.name || '';
-        thead += `<th>${headerTitle}</th>`;
-    }
-    thead += '</tr></thead>';
-
-    // Construct <tbody>
-    let tbody = '<tbody>';
-    for (const row of tableRows) {
-        tbody += '<tr>';
-        for (const field of fields) {
-            const colName = field.name;
-            tbody += `<td>${row[colName] !== undefined ? row[colName] : ''}</td>`;
-        }
-        tbody += '</tr>';
-    }
-    tbody += '</tbody>';
-
-    return `<table>${thead}${tbody}</table>`;
-}
-
 /**
  * Main entry point to view data with glide-data-grid
  */
@@ -373,57 +432,44 @@ export async function viewData(
             return;
         }
 
-        // Execute in kernel to get JSON "table" data
-        const code = `_amphi_metadatapanel_getmatrixcontent(${varName}, 10000)`;
-        const future = kernel.requestExecute({ code, stop_on_error: false, store_history: false });
+        // Only the schema is fetched up front, rows are fetched by window as the grid scrolls
+        const schema: IPreviewSchema = await executeForJSON(kernel, `_amphi_metadatapanel_getpreviewschema(${varName})`);
+        const source: IPreviewSource = {
+            schema,
+            fetchWindow: (offset, limit, sort, query) => executeForJSON(
+                kernel,
+                `_amphi_metadatapanel_getpreviewwindow(${varName}, ${offset}, ${limit}, ` +
+                `sort=${sort ? sort.column : 'None'}, ascending=${sort && !sort.ascending ? 'False' : 'True'}, ` +
+                `query=${query ? JSON.stringify(query) : 'None'})`
+            )
+        };
 
-        future.onIOPub = (msg: KernelMessage.IIOPubMessage) => {
-            const msgType = msg.header.msg_type;
-            if (msgType === 'execute_result') {
-                const payload = msg.content as any;
-                let content: string = payload.data['text/plain'] as string;
-                // Clean up the escaping
-                content = content.replace(/^'|'$/g, '');
-                content = content.replace(/\\"/g, '"');
-                // Parse as JSON
-                const modelOptions = JSON.parse(content);
-
-                // Convert that to an HTML table with typed columns
-                const htmlData = modelToHTMLTable(modelOptions);
-
-                // Build and attach a React-based panel
-                const panel = new DataViewPanel(htmlData);
-
-                const logConsoleId = 'amphi-logConsole';
-                let logConsolePanel = null;
-                for (const widget of app.shell.widgets('main')) {
-                    if (widget.id === logConsoleId) {
-                        logConsolePanel = widget;
-                        break;
-                    }
-                }
+        // Build and attach a React-based panel
+        const panel = new DataViewPanel(source);
 
-                // If console panel is open, show the panel as tab-after
-                if (logConsolePanel && logConsolePanel.isAttached) {
-                    if (!panel.isAttached) {
-                        app.shell.add(panel, 'main', { ref: logConsolePanel.id, mode: 'tab-after' });
-                    }
-                } else {
-                    // Otherwise, split-bottom
-                    if (!panel.isAttached) {
-                        app.shell.add(panel, 'main', { mode: 'split-bottom' });
-                    }
-                }
-                app.shell.activateById(panel.id);
-            } else if (msgType === 'error') {
-                console.error("Kernel error on 'matrixQuery' call!");
+        const logConsoleId = 'amphi-logConsole';
+        let logConsolePanel = null;
+        for (const widget of app.shell.widgets('main')) {
+            if (widget.id === logConsoleId) {
+                logConsolePanel = widget;
+                break;
             }
-        };
+        }
 
-        future.onReply = (_msg: KernelMessage.IExecuteReplyMsg) => { /* do nothing */ };
-        future.onDone = () => { /* do nothing */ };
+        // If console panel is open, show the panel as tab-after
+        if (logConsolePanel && logConsolePanel.isAttached) {
+            if (!panel.isAttached) {
+                app.shell.add(panel, 'main', { ref: logConsolePanel.id, mode: 'tab-after' });
+            }
+        } else {
+            // Otherwise, split-bottom
+            if (!panel.isAttached) {
+                app.shell.add(panel, 'main', { mode: 'split-bottom' });
+            }
+        }
+        app.shell.activateById(panel.id);
 
     } catch (error) {
         console.error('Error viewing data:', error);
     }
-}
\ No newline at end of file
+}
@@ -26,7 +26,7 @@ import { Dialog, showDialog } from '@jupyterlab/apputils';
 import { createAboutDialog } from './AboutDialog';
 import { RunService } from './RunService'
 import { viewData } from './ViewData'
-import { ComponentManager, CodeGenerator, CodeGeneratorDagster, PipelineService, IPipelineExecutionToken, IPipelineExecutionService } from '@amphi/pipeline-components-manager';
+import { BenchmarkUtils, ComponentManager, CodeGenerator, CodeGeneratorDagster, MemoryUtils, PipelineService, IPipelineExecutionToken, IPipelineExecutionService } from '@amphi/pipeline-components-manager';
 import { pipelineCategoryIcon, pipelineBrandIcon, componentIcon, gridAltIcon } from './icons';
 import { PipelineEditorFactory, commandIDs } from './PipelineEditorWidget';
 import { showErrorModal } from './ErrorModal';
@@ -46,6 +46,8 @@ namespace CommandIDs {
   export const runPipelineUntil = 'pipeline-editor:run-pipeline-until';
   export const runIncrementalPipeline = 'pipeline-editor:run-incremental-pipeline';
   export const runIncrementalPipelineUntil = 'pipeline-editor:run-incremental-pipeline-until';
+  export const runProfiledPipeline = 'pipeline-editor:run-profiled-pipeline';
+  export const runBenchmarks = 'pipeline-editor:run-benchmarks';
   export const generateCode = 'pipeline-editor:generate-code';
 
 }
@@ -136,6 +138,10 @@ const pipelineEditor: JupyterFrontEndPlugin<WidgetTracker<DocumentWidget>> = {
       console.log(
         `Settings extension: enableTelemetry is set to '${enableTelemetry}'`
       );
+      MemoryUtils.optimizeInputs = setting.get('optimizeInputMemory').composite as boolean;
+      console.log(
+        `Settings extension: optimizeInputMemory is set to '${MemoryUtils.optimizeInputs}'`
+      );
     }
 
     function maskedSensitiveParams(url) {
@@ -406,7 +412,8 @@ const pipelineEditor: JupyterFrontEndPlugin<WidgetTracker<DocumentWidget>> = {
                 json,
                 commands,
                 componentService,
-                false
+                false,
+                !!args.profiling
               );
               return code; // callers can handle the resulting code as needed
             } catch (err) {
@@ -765,6 +772,102 @@ ${code}
           isEnabled
         });
 
+        commands.addCommand(CommandIDs.runProfiledPipeline, {
+          label: 'Run Pipeline with Profiling',
+          execute: async args => {
+            const current = getCurrent(args);
+            if (!current) {
+              return;
+            }
+
+            executionService.clearAllExecutionData();
+
+            let code;
+            try {
+              code = CodeGenerator.generateCode(
+                current.context.model.toString(),
+                commands,
+                componentService,
+                true,
+                true
+              );
+            } catch (error) {
+              console.error('Code generation failed for profiled pipeline execution:', error);
+              showErrorModal(error as Error, 'Failed to generate code for profiled pipeline execution');
+              return;
+            }
+
+            // Nodes measured before a failure are still reported, the profile only holds this run
+            try {
+              await commands.execute('pipeline-editor:run-pipeline', { code });
+            } finally {
+              const output = await RunService.retrieveKernelOutput(
+                current.context.sessionContext.session,
+                `if "py_fn_profile_json" in globals():\n    print(py_fn_profile_json())`
+              );
+              if (output.trim()) {
+                const profile = JSON.parse(output);
+                profile.nodes.forEach(nodeProfile => {
+                  executionService.reportExecution({
+                    nodeId: nodeProfile.nodeId,
+                    status: 'success',
+                    timestamp: Date.now(),
+                    metadata: {
+                      executionTime: nodeProfile.wallTime,
+                      rowCount: nodeProfile.rowsOut ?? undefined,
+                      profile: nodeProfile
+                    }
+                  });
+                });
+                // Started without completing: the node where the run stopped, nodes after it are not reached
+                (profile.failedNodes || []).forEach(nodeId => {
+                  executionService.reportExecution({
+                    nodeId,
+                    status: 'failed',
+                    timestamp: Date.now(),
+                    metadata: {
+                      errorMessage: 'Execution failed in this component',
+                      errorType: 'ExecutionError'
+                    }
+                  });
+                });
+              }
+            }
+
+            if (enableTelemetry) {
+              posthog.capture('run_pipeline', {
+                pipeline_metadata: current.context.model.toString(),
+                run_type: "profiled_full"
+              });
+            }
+          },
+          isEnabled
+        });
+
+        /**
+         * Benchmark the components on the kernel of the current pipeline
+         * Args: { scales, repeat, assetsDir, dataDir, resultsPath, baselinePath, tolerance } – all optional.
+         */
+        commands.addCommand(CommandIDs.runBenchmarks, {
+          label: 'Run Component Benchmarks',
+          execute: async args => {
+            const dataDir = (args.dataDir as string) ?? 'amphi_benchmarks/data';
+            const code = BenchmarkUtils.generateBenchmarkCode(componentService, {
+              assetsDir: (args.assetsDir as string) ?? 'tests-assets',
+              dataDir,
+              resultsPath: (args.resultsPath as string) ?? `amphi_benchmarks/results-${LIB_VERSION}.json`,
+              baselinePath: args.baselinePath as string | undefined,
+              scales: (args.scales as number[]) ?? [0.1, 1, 10],
+              repeat: (args.repeat as number) ?? 3,
+              tolerance: (args.tolerance as number) ?? 0.2,
+              version: LIB_VERSION
+            });
+            // Results are printed in the Log Console and written to the results file
+            await commands.execute(CommandIDs.runPipeline, { code });
+          },
+          isEnabled
+        });
+
         commands.addCommand('pipeline-editor:version', {
           label: 'About Amphi',
           execute: () => {
@@ -809,6 +912,12 @@ ${code}
           args: { isPalette: true }
         });
 
+        palette.addItem({
+          command: CommandIDs.runBenchmarks,
+          category: 'Pipeline',
+          args: { isPalette: true }
+        });
+
         // Components //
         // ----
         // ----
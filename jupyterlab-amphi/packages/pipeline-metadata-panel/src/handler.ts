@@ -64,6 +64,10 @@ abstract class AbstractHandler implements IMetadataPanel.IInspectable {
     varName: string
    ): any;
 
+  performContentInspection(varName: string): Promise<string> {
+    return Promise.reject('Content inspection is not supported by this kernel');
+  }
+
   abstract performWidgetInspection(
     varName: string
   ): Kernel.IShellFuture<
@@ -97,6 +101,7 @@ export class VariableInspectionHandler extends AbstractHandler {
   private _queryCommand: string;
   private _matrixQueryCommand: string;
   private _widgetQueryCommand: string;
+  private _contentQueryCommand: string;
   private _deleteCommand: string;
   private _deleteAllCommand: string;
   private _ready: Promise<void>;
@@ -111,6 +116,7 @@ export class VariableInspectionHandler extends AbstractHandler {
     this._queryCommand = options.queryCommand;
     this._matrixQueryCommand = options.matrixQueryCommand;
     this._widgetQueryCommand = options.widgetQueryCommand;
+    this._contentQueryCommand = options.contentQueryCommand;
     this._deleteCommand = options.deleteCommand;
     this._deleteAllCommand = options.deleteAllCommand;
     this._initScript = options.initScript;
@@ -269,6 +275,40 @@ export class VariableInspectionHandler extends AbstractHandler {
     });
   }
 
+  /**
+   * Fetch the full content of a variable whose summary content was deferred.
+   */
+  performContentInspection(varName: string): Promise<string> {
+    const request: KernelMessage.IExecuteRequestMsg['content'] = {
+      code: this._contentQueryCommand + "('" + varName + "')",
+      stop_on_error: false,
+      store_history: false
+    };
+    const con = this._connector;
+    return new Promise((resolve, reject) => {
+      con.fetch(request, (response: KernelMessage.IIOPubMessage) => {
+        const msgType = response.header.msg_type;
+        switch (msgType) {
+          case 'execute_result': {
+            const payload = response.content as IExecuteResult;
+            let content: string = payload.data['text/plain'] as string;
+            if (content.slice(0, 1) === "'" || content.slice(0, 1) === '"') {
+              content = content.slice(1, -1);
+              content = content.replace(/\\"/g, '"').replace(/\\'/g, "'");
+            }
+            resolve(JSON.parse(content).varContent);
+            break;
+          }
+          case 'error':
+            reject("Kernel error on 'contentQuery' call!");
+            break;
+          default:
+            break;
+        }
+      });
+    });
+  }
+
   /**
    * Send a kernel request to delete a variable from the global environment
    */
@@ -385,7 +425,10 @@ export class VariableInspectionHandler extends AbstractHandler {
         if (
           !(code === this._queryCommand) &&
           !(code === this._matrixQueryCommand) &&
-          !code.startsWith(this._widgetQueryCommand)
+          !code.startsWith(this._widgetQueryCommand) &&
+          !code.startsWith(this._contentQueryCommand) &&
+          // Data browser windows are fetched while scrolling, they do not change the variables
+          !code.startsWith('_amphi_metadatapanel_getpreview')
         ) {
           this.performInspection();
         }
@@ -410,6 +453,7 @@ export namespace VariableInspectionHandler {
     queryCommand: string;
     matrixQueryCommand: string;
     widgetQueryCommand: string;
+    contentQueryCommand: string;
     deleteCommand: string;
     deleteAllCommand: string;
     initScript: string;
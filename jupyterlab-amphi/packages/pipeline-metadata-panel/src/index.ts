@@ -181,6 +181,7 @@ const consoles: JupyterFrontEndPlugin<void> = {
             const queryCommand = result.queryCommand;
             const matrixQueryCommand = result.matrixQueryCommand;
             const widgetQueryCommand = result.widgetQueryCommand;
+            const contentQueryCommand = result.contentQueryCommand;
             const deleteCommand = result.deleteCommand;
             const deleteAllCommand = result.deleteAllCommand;
 
@@ -189,6 +190,7 @@ const consoles: JupyterFrontEndPlugin<void> = {
               queryCommand: queryCommand,
               matrixQueryCommand: matrixQueryCommand,
               widgetQueryCommand,
+              contentQueryCommand,
               deleteCommand: deleteCommand,
               deleteAllCommand: deleteAllCommand,
               connector: connector,
@@ -271,9 +273,11 @@ const pipelines: JupyterFrontEndPlugin<void> = {
     } = {};
 
     let customCodeInitialization = "";
+    let deepMemoryUsage = false;
 
     function loadSetting(setting: ISettingRegistry.ISettings): void {
       customCodeInitialization = setting.get('customCodeInitialization').composite as string;
+      deepMemoryUsage = setting.get('deepMemoryUsage').composite as boolean;
       console.log(`Settings: Amphi Metadata extension: customCodeInitialization is set to '${customCodeInitialization}'`);
     }
 
@@ -308,10 +312,11 @@ const pipelines: JupyterFrontEndPlugin<void> = {
                 });
 
               scripts.then((result: Languages.LanguageModel) => {
-                const initScript = result.initScript + "\n" + customCodeInitialization;
+                const initScript = result.initScript + "\n" + (deepMemoryUsage ? "_amphi_metadatapanel_deep_memory = True\n" : "") + customCodeInitialization;
                 const queryCommand = result.queryCommand;
                 const matrixQueryCommand = result.matrixQueryCommand;
                 const widgetQueryCommand = result.widgetQueryCommand;
+                const contentQueryCommand = result.contentQueryCommand;
                 const deleteCommand = result.deleteCommand;
                 const deleteAllCommand = result.deleteAllCommand;
 
@@ -319,6 +324,7 @@ const pipelines: JupyterFrontEndPlugin<void> = {
                   queryCommand: queryCommand,
                   matrixQueryCommand: matrixQueryCommand,
                   widgetQueryCommand,
+                  contentQueryCommand,
                   deleteCommand: deleteCommand,
                   deleteAllCommand: deleteAllCommand,
                   connector: connector,
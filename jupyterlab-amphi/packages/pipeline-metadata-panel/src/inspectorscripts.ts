@@ -5,6 +5,7 @@ export namespace Languages {
       queryCommand: string;
       matrixQueryCommand: string;
       widgetQueryCommand: string;
+      contentQueryCommand: string;
       deleteCommand: string;
       deleteAllCommand: string;
     };
@@ -17,9 +18,11 @@ export namespace Languages {
   
     static py_script = `
 import json
+import reprlib
 import sys
 import types
 import re
+import weakref
 from warnings import filterwarnings
 import subprocess
 
@@ -62,6 +65,13 @@ __K = None
 __torch = None
 __ipywidgets = None
 __xr = None
+
+# Deep memory usage walks every object of string columns, it is off unless enabled in the settings
+_amphi_metadatapanel_deep_memory = False
+# Per-variable summaries: var_name -> (reference to the object, version stamp, summary)
+_amphi_metadatapanel_summaries = {}
+# Number of columns (or values) shown before the content is deferred to the expanded view
+_amphi_metadatapanel_preview_items = 20
   
 def _attempt_import(module):
     try:
@@ -93,7 +103,7 @@ def _amphi_metadatapanel_getsizeof(x):
     elif __torch and isinstance(x, __torch.Tensor):
         return x.element_size() * x.nelement()
     elif __pd and type(x).__name__ == 'DataFrame':
-        return x.memory_usage().sum()
+        return x.memory_usage(deep=_amphi_metadatapanel_deep_memory).sum()
     else:
         return sys.getsizeof(x)
 
@@ -159,6 +169,52 @@ def _amphi_metadatapanel_getcontentof(x):
     return content
 
 
+def _amphi_metadatapanel_previewof(x):
+    # Short content for the panel, and whether the full content is deferred until the row is expanded
+    n = _amphi_metadatapanel_preview_items
+    if __pd and isinstance(x, __pd.DataFrame):
+        if x.shape[1] <= n:
+            return _amphi_metadatapanel_getcontentof(x), False
+        return _amphi_metadatapanel_getcontentof(x.iloc[:0, :n]), True
+    if __pd and isinstance(x, __pd.Series):
+        return _amphi_metadatapanel_getcontentof(x.head(n)), len(x) > n
+    if isinstance(x, (list, tuple, set, frozenset, dict)) and len(x) > n:
+        return f"{type(x).__name__}, " + reprlib.repr(x), True
+    if isinstance(x, str) and len(x) > 200:
+        return f"{type(x).__name__}, " + x[:200] + "...", True
+    return _amphi_metadatapanel_getcontentof(x), False
+
+
+def _amphi_metadatapanel_execution_count():
+    # Count of the last stored execution: the panel queries are not stored, pipeline runs and cells are
+    return getattr(_amphi_metadatapanel_Jupyter, "execution_count", None)
+
+
+def _amphi_metadatapanel_refof(x):
+    # Weak reference to an object when it supports one, the object itself otherwise (immutable values)
+    try:
+        return weakref.ref(x)
+    except TypeError:
+        return lambda: x
+
+
+def _amphi_metadatapanel_stampof(x):
+    """
+    Cheap version stamp of an object, None when it cannot be told whether it changed.
+    Arrays and frames can be edited in place without changing shape or dtypes,
+    so their stamps also change with every new execution.
+    """
+    if __pd and isinstance(x, __pd.DataFrame):
+        return (_amphi_metadatapanel_execution_count(), x.shape, id(x.columns), tuple(x.dtypes))
+    if __pd and isinstance(x, __pd.Series):
+        return (_amphi_metadatapanel_execution_count(), x.shape, x.name, x.dtype)
+    if __np and isinstance(x, __np.ndarray):
+        return (_amphi_metadatapanel_execution_count(), x.shape, x.dtype)
+    if isinstance(x, (str, bytes, int, float, bool, tuple, frozenset)):
+        return ()
+    return None
+
+
 def _amphi_metadatapanel_is_matrix(x):
     # True if type(x).__name__ in ["DataFrame", "ndarray", "Series"] else False
     if __pd and isinstance(x, __pd.DataFrame):
@@ -195,12 +251,27 @@ def get_camel_case_variables():
             variable_names.append(key)
     return variable_names
 
+def _amphi_metadatapanel_summaryof(var_name, x):
+    shape = _amphi_metadatapanel_getshapeof(x)
+    content, deferred = _amphi_metadatapanel_previewof(x)
+    return {
+        'varName': var_name,
+        'varType': type(x).__name__,
+        'varSize': str(_amphi_metadatapanel_getsizeof(x)),
+        'varShape': str(shape) if shape else '',
+        'varContent': str(content),
+        'contentDeferred': deferred,
+        'isMatrix': _amphi_metadatapanel_is_matrix(x),
+        'isWidget': _amphi_metadatapanel_is_widget(type(x))
+    }
+
+
 def _amphi_metadatapanel_dict_list():
     _check_imported()
 
     def keep_cond(obj):
         try:
-            if isinstance(obj, str):
+            if isinstance(obj, (str, list, tuple, dict, set, int, float, bool)):
                 return True
             if __tf and isinstance(obj, __tf.Variable):
                 return True
@@ -216,20 +287,34 @@ def _amphi_metadatapanel_dict_list():
         except:
             return False
 
-    camel_case_vars = get_camel_case_variables()
-    vardic = [
-        {
-            'varName': var_name,
-            'varType': type(eval(var_name)).__name__, 
-            'varSize': str(_amphi_metadatapanel_getsizeof(eval(var_name))), 
-            'varShape': str(_amphi_metadatapanel_getshapeof(eval(var_name))) if _amphi_metadatapanel_getshapeof(eval(var_name)) else '', 
-            'varContent': str(_amphi_metadatapanel_getcontentof(eval(var_name))),
-            'isMatrix': _amphi_metadatapanel_is_matrix(eval(var_name)),
-            'isWidget': _amphi_metadatapanel_is_widget(type(eval(var_name)))
-        }
-        for var_name in camel_case_vars if keep_cond(eval(var_name))
-    ]
+    # Only the variables whose object or version stamp changed since the last call are summarized again
+    namespace = globals()
+    vardic = []
+    cache = {}
+    for var_name in get_camel_case_variables():
+        obj = namespace[var_name]
+        stamp = _amphi_metadatapanel_stampof(obj)
+        cached = _amphi_metadatapanel_summaries.get(var_name)
+        # The reference tells the cached object apart from a new one that reuses its id
+        if cached is not None and stamp is not None and cached[0]() is obj and cached[1] == stamp:
+            summary = cached[2]
+        elif keep_cond(obj):
+            summary = _amphi_metadatapanel_summaryof(var_name, obj)
+        else:
+            summary = None
+        cache[var_name] = (_amphi_metadatapanel_refof(obj), stamp, summary)
+        if summary is not None:
+            vardic.append(summary)
+    _amphi_metadatapanel_summaries.clear()
+    _amphi_metadatapanel_summaries.update(cache)
     return json.dumps(vardic, ensure_ascii=False)
+
+
+def _amphi_metadatapanel_getfullcontent(var_name):
+    # Full content of one variable, requested when its row is expanded in the panel
+    _check_imported()
+    content = _amphi_metadatapanel_getcontentof(globals()[var_name])
+    return json.dumps({'varName': var_name, 'varContent': str(content)}, ensure_ascii=False)
   
 # 1) Updated Python helper function to add column types in parentheses
 
@@ -273,6 +358,96 @@ def _amphi_metadatapanel_getmatrixcontent(x, max_rows=10000):
         s = __pd.Series(x)
         return _amphi_metadatapanel_getmatrixcontent(s)
 
+
+
+# Windowed preview: the schema is sent first, then row windows are fetched on demand.
+# Sorted or filtered views are kept as row positions, keyed by object, execution and view.
+_amphi_metadatapanel_preview_views = {}
+# Last materialized preview of a source that is not a pandas object (chunked stream, Spark, ...), and its execution
+_amphi_metadatapanel_preview_source = (None, None, None)
+
+
+def _amphi_metadatapanel_preview_frame(x):
+    global _amphi_metadatapanel_preview_source
+    if __pd and isinstance(x, __pd.DataFrame):
+        return x
+    if __pd and isinstance(x, __pd.Series):
+        return x.to_frame()
+    if _amphi_metadatapanel_preview_source[0] is x and _amphi_metadatapanel_preview_source[1] == _amphi_metadatapanel_execution_count():
+        return _amphi_metadatapanel_preview_source[2]
+    if getattr(x, "_amphi_chunked", False):
+        # Chunked (streamed) DataFrames: preview the leading chunks only
+        chunks, rows = [], 0
+        for chunk in x:
+            chunks.append(chunk)
+            rows += len(chunk)
+            if rows >= 10000:
+                break
+        df = __pd.concat(chunks, ignore_index=True).head(10000) if chunks else __pd.DataFrame()
+    elif __pyspark and isinstance(x, __pyspark.sql.DataFrame):
+        df = x.limit(10000).toPandas()
+    else:
+        df = __pd.DataFrame(x)
+    _amphi_metadatapanel_preview_source = (x, _amphi_metadatapanel_execution_count(), df)
+    return df
+
+
+def _amphi_metadatapanel_preview_positions(x, source, sort=None, ascending=True, query=None):
+    """
+    Row positions of the sorted/filtered view, None for the frame as is.
+    Views are computed again after a new execution, which may have edited the frame in place,
+    and when another object reuses the id of the source.
+    """
+    if sort is None and not query:
+        return None
+    key = (id(source), _amphi_metadatapanel_execution_count(), x.shape, sort, ascending, query)
+    cached = _amphi_metadatapanel_preview_views.get(key)
+    if cached is not None and cached[0]() is source:
+        return cached[1]
+    positions = None
+    if query:
+        positions = __np.flatnonzero(__np.asarray(x.eval(query), dtype=bool))
+    if sort is not None:
+        column = x[sort] if positions is None else x[sort].iloc[positions]
+        order = column.reset_index(drop=True).sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+        positions = order if positions is None else positions[order]
+    # Keep only the views of the last previews
+    if len(_amphi_metadatapanel_preview_views) >= 4:
+        _amphi_metadatapanel_preview_views.pop(next(iter(_amphi_metadatapanel_preview_views)))
+    _amphi_metadatapanel_preview_views[key] = (_amphi_metadatapanel_refof(source), positions)
+    return positions
+
+
+def _amphi_metadatapanel_getpreviewschema(x):
+    _check_imported()
+    df = _amphi_metadatapanel_preview_frame(x)
+    print(json.dumps({
+        "rows": len(df),
+        "columns": [{"name": str(col), "type": str(dtype)} for col, dtype in zip(df.columns, df.dtypes)]
+    }, ensure_ascii=False))
+
+
+def _amphi_metadatapanel_getpreviewwindow(x, offset=0, limit=200, sort=None, ascending=True, query=None):
+    """
+    Print one window of rows as compact columnar JSON: one list of display strings per column,
+    null for missing values. sort is a column position, query a DataFrame.eval filter expression.
+    """
+    _check_imported()
+    df = _amphi_metadatapanel_preview_frame(x)
+    if sort is not None:
+        sort = df.columns[sort]
+    positions = _amphi_metadatapanel_preview_positions(df, x, sort, ascending, query)
+    rows = len(df) if positions is None else len(positions)
+    if positions is None:
+        window = df.iloc[offset:offset + limit]
+    else:
+        window = df.iloc[positions[offset:offset + limit]]
+    columns = []
+    for position in range(window.shape[1]):
+        values = window.iloc[:, position]
+        missing = values.isna().to_numpy()
+        columns.append([None if m else v for v, m in zip(values.astype(str).tolist(), missing.tolist())])
+    print(json.dumps({"offset": offset, "rows": rows, "columns": columns}, ensure_ascii=False))
   
   
 def _amphi_metadatapanel_displaywidget(widget):
@@ -306,6 +481,19 @@ def __amphi_display(obj, dfName=None, nodeId=None, runtime=None):
 
     # Try pandas DataFrame (supports both __pd and pd globals)
     _pd = globals().get("__pd") or globals().get("pd")
+
+    # Chunked (streamed) DataFrames: preview the leading chunks only
+    if _pd is not None and getattr(obj, "_amphi_chunked", False):
+        preview_chunks = []
+        preview_rows = 0
+        for chunk in obj:
+            preview_chunks.append(chunk)
+            preview_rows += len(chunk)
+            if preview_rows >= 10000:
+                break
+        obj = _pd.concat(preview_chunks, ignore_index=True).head(10000) if preview_chunks else _pd.DataFrame()
+        metadata["runtime"] = metadata["runtime"] or "local (pandas, chunked)"
+
     if _pd is not None and isinstance(obj, _pd.DataFrame):
         metadata["runtime"] = metadata["runtime"] or "local (pandas)"
         result_df = obj.copy()
@@ -422,6 +610,7 @@ def _amphi_display_documents_as_html(documents):
         queryCommand: '_amphi_metadatapanel_dict_list()',
         matrixQueryCommand: '_amphi_metadatapanel_getmatrixcontent',
         widgetQueryCommand: '_amphi_metadatapanel_displaywidget',
+        contentQueryCommand: '_amphi_metadatapanel_getfullcontent',
         deleteCommand: '_amphi_metadatapanel_deletevariable',
         deleteAllCommand: '_amphi_metadatapanel_deleteallvariables'
       },
@@ -430,6 +619,7 @@ def _amphi_display_documents_as_html(documents):
         queryCommand: '_amphi_metadatapanel_dict_list()',
         matrixQueryCommand: '_amphi_metadatapanel_getmatrixcontent',
         widgetQueryCommand: '_amphi_metadatapanel_displaywidget',
+        contentQueryCommand: '_amphi_metadatapanel_getfullcontent',
         deleteCommand: '_amphi_metadatapanel_deletevariable',
         deleteAllCommand: '_amphi_metadatapanel_deleteallvariables'
       },
@@ -438,6 +628,7 @@ def _amphi_display_documents_as_html(documents):
         queryCommand: '_amphi_metadatapanel_dict_list()',
         matrixQueryCommand: '_amphi_metadatapanel_getmatrixcontent',
         widgetQueryCommand: '_amphi_metadatapanel_displaywidget',
+        contentQueryCommand: '_amphi_metadatapanel_getfullcontent',
         deleteCommand: '_amphi_metadatapanel_deletevariable',
         deleteAllCommand: '_amphi_metadatapanel_deleteallvariables'
       }
@@ -11,6 +11,7 @@ const TABLE_CLASS = 'amphi-MetadataPanel-table';
 const TABLE_BODY_CLASS = 'amphi-MetadataPanel-content';
 const TABLE_ROW_CLASS = 'amphi-MetadataPanel-table-row';
 const TABLE_NAME_CLASS = 'amphi-MetadataPanel-varName';
+const CONTENT_EXPAND_CLASS = 'amphi-MetadataPanel-expandContent';
 
 /**
  * A panel that renders the variables
@@ -130,6 +131,23 @@ export class MetadataPanelPanel
 
       let contentCell = row.insertCell(2);
       contentCell.innerHTML = item.varContent.split(',').join('<br>');
+      if (item.contentDeferred) {
+        // Only a summary was sent, the full content is fetched when the row is expanded
+        const expandLink = document.createElement('a');
+        expandLink.className = CONTENT_EXPAND_CLASS;
+        expandLink.title = 'Show all';
+        expandLink.innerHTML = '&hellip;';
+        expandLink.onclick = (ev: MouseEvent): any => {
+          this._source
+            ?.performContentInspection(name)
+            .then((content: string) => {
+              contentCell.innerHTML = content.split(',').join('<br>');
+            })
+            .catch(reason => console.error(reason));
+        };
+        contentCell.appendChild(document.createElement('br'));
+        contentCell.appendChild(expandLink);
+      }
 
       lastNameToPreview = name;
     }
@@ -46,6 +46,7 @@ export namespace IMetadataPanel {
       varName: string,
       maxRows?: number
     ): Promise<DataModel>;
+    performContentInspection(varName: string): Promise<string>;
     performWidgetInspection(
       varName: string
     ): Kernel.IShellFuture<
@@ -66,6 +67,7 @@ export namespace IMetadataPanel {
     varSize: string;
     varShape: string;
     varContent: string;
+    contentDeferred?: boolean;
     varType: string;
     isMatrix: boolean;
     isWidget: boolean;
@@ -0,0 +1,45 @@
+"""
+The Python helpers of the components are shipped as template literals in the TypeScript sources.
+load_helpers() executes the helper templates of the given source files in a fresh namespace, so
+that they can be tested as the plain functions they are in the generated pipelines.
+"""
+import pathlib
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PACKAGES = pathlib.Path(__file__).resolve().parents[1] / "packages"
+
+_TEMPLATE = re.compile(r"`((?:[^`\\]|\\.)*)`", re.S)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+
+def _unescape(py_arg_template):
+    # Template literal escapes: \\ is a backslash, \` a backtick, \n a newline
+    return re.sub(r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(1)), py_arg_template, flags=re.S)
+
+
+def load_helpers(*paths, **names):
+    """
+    Namespace holding the helpers (def py_fn_* / class py_cls_*) of the given sources, relative to packages/.
+    Templates interpolating ${...} are generated component code, not helpers, and are skipped.
+    """
+    namespace = {"pd": pd, "np": np, **names}
+    for path in paths:
+        source = (PACKAGES / path).read_text()
+        for match in _TEMPLATE.finditer(source):
+            body = _unescape(match.group(1))
+            if "${" in match.group(1) or not re.search(r"^(def py_fn_|class py_cls_)", body, re.M):
+                continue
+            exec(compile(body, str(path), "exec"), namespace)
+    return namespace
+
+
+CHUNK_UTILS = "pipeline-components-manager/src/chunkUtils.tsx"
+
+
+@pytest.fixture
+def chunk_helpers():
+    return load_helpers(CHUNK_UTILS)
@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+
+@pytest.fixture
+def benchmark_helpers():
+    return load_helpers("pipeline-components-manager/src/benchmarkUtils.tsx")
+
+
+def test_benchmark_case_reports_arrow_memory(benchmark_helpers):
+    case = {
+        "name": "to_arrow_strings",
+        "componentId": "typeConverter",
+        "inputs": ["strings"],
+        "inputNames": ["df"],
+        "setup": "import pandas as pd",
+        "code": "output = df.astype('string[pyarrow]')",
+    }
+    datasets = {"strings": pd.DataFrame({"s": pd.Series([f"value {index}" for index in range(200_000)], dtype=object)})}
+
+    result = benchmark_helpers["py_fn_benchmark_case"](case, datasets, 1)
+
+    assert "error" not in result
+    assert result["rowsOut"] == 200_000
+    # The Arrow string buffers of the output are not seen by tracemalloc
+    assert result["arrowMemory"] >= 200_000 * len("value 0")
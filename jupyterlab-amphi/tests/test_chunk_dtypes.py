@@ -0,0 +1,49 @@
+import pandas as pd
+import pyarrow.parquet as pq
+
+
+CSV = "id,v,note\n1,1,\n2,2,\n3,2.5,hello\n4,3,x\n"
+
+
+def test_stable_chunks_widen_every_chunk(tmp_path, chunk_helpers):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+
+    stream = chunk_helpers["py_fn_stable_chunks"](lambda: pd.read_csv(path, chunksize=2))
+    chunks = list(stream)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+    assert chunks[0].dtypes.to_dict() == chunks[1].dtypes.to_dict()
+    assert chunks[0]["id"].dtype == "Int64"
+    assert chunks[0]["v"].dtype == "Float64"
+    assert isinstance(chunks[0]["note"].dtype, pd.StringDtype)
+
+
+def test_stable_chunks_write_parquet(tmp_path, chunk_helpers):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    target = tmp_path / "data.parquet"
+
+    stream = chunk_helpers["py_fn_stable_chunks"](lambda: pd.read_csv(path, chunksize=2))
+    chunk_helpers["py_fn_write_parquet_chunks"](stream, str(target))
+
+    table = pq.read_table(target).to_pandas()
+    assert table["v"].tolist() == [1.0, 2.0, 2.5, 3.0]
+    assert table["note"].tolist()[2:] == ["hello", "x"]
+    assert table["note"].isna().tolist()[:2] == [True, True]
+
+
+def test_stable_chunks_scan_once(tmp_path, chunk_helpers):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    reads = []
+
+    def factory():
+        reads.append(1)
+        return pd.read_csv(path, chunksize=2)
+
+    stream = chunk_helpers["py_fn_stable_chunks"](factory)
+    list(stream)
+    list(stream)
+    # One dtype scan, then one read per iteration
+    assert len(reads) == 3
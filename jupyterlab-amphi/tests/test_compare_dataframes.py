@@ -0,0 +1,51 @@
+import typing
+
+import duckdb
+import pandas as pd
+import polars as pl
+import pyarrow
+import pytest
+
+from conftest import load_helpers
+
+
+@pytest.fixture
+def compare():
+    namespace = load_helpers(
+        "pipeline-components-core/src/components/transforms/CompareDataframes.tsx",
+        pl=pl, duckdb=duckdb, pyarrow=pyarrow, typing=typing, **{name: getattr(typing, name) for name in typing.__all__}
+    )
+    return namespace["py_fn_compare_datasets"]
+
+
+LEFT = pd.DataFrame({"id": [1, 2, 3, 4, 6], "name": ["a", "b", "c", "d", "f"], "v": [1.0, 2.0, 3.0, 4.0, None]})
+RIGHT = pd.DataFrame({"id": [1, 2, 3, 5, 6], "name": ["a", "B", "c", "e", "f"], "v": [1.0, 2.0, 3.5, 5.0, None]})
+
+
+def rows(frame):
+    frame = frame.copy()
+    frame.columns.name = None
+    return frame.astype(str).sort_values(list(frame.columns)).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("mode", ["data", "count_data", "field_data", "differing_fields"])
+def test_hash_engine_matches_pandas_engine(compare, mode):
+    expected = compare(LEFT, RIGHT, execution_engine="pandas", mode=mode, key_fields=["id"])
+
+    result = compare(LEFT, RIGHT, execution_engine="pandas_hash", mode=mode, key_fields=["id"])
+
+    pd.testing.assert_frame_equal(rows(result), rows(expected))
+
+
+def test_hash_buckets_do_not_change_field_differences(compare):
+    expected = compare(LEFT, RIGHT, execution_engine="pandas_hash", mode="field_data", key_fields=["id"])
+
+    result = compare(LEFT, RIGHT, execution_engine="pandas_hash", mode="field_data", key_fields=["id"], hash_chunks=3)
+
+    pd.testing.assert_frame_equal(rows(result), rows(expected))
+
+
+def test_hash_engine_of_equal_frames(compare):
+    result = compare(LEFT, LEFT.copy(), execution_engine="pandas_hash", mode="data")
+
+    assert result.empty
@@ -0,0 +1,71 @@
+import csv
+import io
+import re
+import types
+
+import pandas as pd
+import pytest
+import sqlalchemy
+
+from conftest import load_helpers
+
+BULK_LOAD = "pipeline-components-core/src/components/common/DatabaseBulkLoadHandler.ts"
+
+
+@pytest.fixture
+def bulk_helpers():
+    return load_helpers(BULK_LOAD, sqlalchemy=sqlalchemy)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(sqlalchemy.text("INSERT INTO items VALUES (1, 'a'), (2, 'b')"))
+    yield engine
+    engine.dispose()
+
+
+def test_merge_upserts_and_drops_staging(engine, bulk_helpers):
+    frame = pd.DataFrame({"id": [2, 3], "name": ["B", "c"]})
+
+    bulk_helpers["py_fn_merge_to_sql"](frame, "items", engine, ["id"], "sqlite")
+
+    result = pd.read_sql("SELECT * FROM items ORDER BY id", engine)
+    assert result.values.tolist() == [[1, "a"], [2, "B"], [3, "c"]]
+    assert sqlalchemy.inspect(engine).get_table_names() == ["items"]
+
+
+def test_failed_merge_drops_staging(engine, bulk_helpers):
+    frame = pd.DataFrame({"id": [2], "name": ["B"]})
+
+    # No unique constraint on name: ON CONFLICT (name) is rejected
+    with pytest.raises(sqlalchemy.exc.OperationalError):
+        bulk_helpers["py_fn_merge_to_sql"](frame, "items", engine, ["name"], "sqlite")
+
+    assert sqlalchemy.inspect(engine).get_table_names() == ["items"]
+
+
+def test_postgres_copy_keeps_empty_strings(bulk_helpers):
+    copied = {}
+
+    class Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def copy_expert(self, sql, buffer):
+            copied["sql"], copied["data"] = sql, buffer.read()
+
+    dialect = sqlalchemy.create_engine("sqlite://").dialect
+    conn = types.SimpleNamespace(dialect=dialect, connection=types.SimpleNamespace(cursor=Cursor))
+    table = types.SimpleNamespace(table=sqlalchemy.Table("items", sqlalchemy.MetaData()))
+
+    bulk_helpers["py_fn_postgres_copy_method"](table, conn, ["id", "note"], iter([(1, ""), (2, None)]))
+
+    null = re.search(r"NULL '([^']+)'", copied["sql"]).group(1)
+    rows = list(csv.reader(io.StringIO(copied["data"])))
+    assert rows == [["1", ""], ["2", null]]
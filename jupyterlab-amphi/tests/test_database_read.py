@@ -0,0 +1,55 @@
+import contextlib
+import decimal
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from conftest import CHUNK_UTILS, load_helpers
+
+
+@pytest.fixture
+def read_helpers():
+    return load_helpers(CHUNK_UTILS, "pipeline-components-core/src/components/common/DatabaseReadHandler.ts")
+
+
+def database(path, rows, decimals=False):
+    with contextlib.closing(sqlite3.connect(path)) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER, v REAL, note TEXT)")
+        conn.executemany("INSERT INTO items VALUES (?, ?, ?)", rows)
+        conn.commit()
+
+    def connect():
+        conn = sqlite3.connect(path)
+        if decimals:
+            # Like NUMERIC columns on most drivers, numbers come back as Decimal
+            conn.row_factory = lambda cursor, row: tuple(decimal.Decimal(str(value)) if isinstance(value, float) else value for value in row)
+        return contextlib.closing(conn)
+
+    return connect
+
+
+def test_sql_chunks_keep_first_chunk_dtypes(tmp_path, read_helpers):
+    connect = database(tmp_path / "db.sqlite", [(1, 1.0, None), (2, 2.0, None), (3, 2.5, "hello"), (4, None, "x")])
+
+    chunks = list(read_helpers["py_fn_read_sql_chunks"](connect, "SELECT * FROM items ORDER BY id", 2))
+
+    assert chunks[0].dtypes.to_dict() == chunks[1].dtypes.to_dict()
+    assert chunks[0]["v"].dtype == "Float64"
+    assert pd.concat(chunks)["v"].tolist()[:3] == [1.0, 2.0, 2.5]
+
+
+def test_sql_partitioned_on_decimal_bounds(tmp_path, read_helpers):
+    rows = [(index, index / 4, None) for index in range(1, 41)]
+    connect = database(tmp_path / "db.sqlite", rows, decimals=True)
+
+    result = read_helpers["py_fn_read_sql_partitioned"](connect, "SELECT * FROM items", "v", 4, "qmark")
+
+    assert sorted(result["id"].tolist()) == list(range(1, 41))
+
+
+def test_sql_partitioned_rejects_text_columns(tmp_path, read_helpers):
+    connect = database(tmp_path / "db.sqlite", [(1, 1.0, "a"), (2, 2.0, "b")])
+
+    with pytest.raises(ValueError, match="must be numeric or date"):
+        read_helpers["py_fn_read_sql_partitioned"](connect, "SELECT * FROM items", "note", 2, "qmark")
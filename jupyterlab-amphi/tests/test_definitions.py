@@ -0,0 +1,54 @@
+import traceback
+
+import pytest
+
+from conftest import load_helpers
+
+
+@pytest.fixture
+def kernel():
+    # The helper runs the blocks in the globals it is defined in, the kernel namespace of a pipeline
+    return load_helpers("pipeline-components-manager/src/definitionUtils.tsx")
+
+
+HELPER = "runs.append(1)\ndef py_fn_helper():\n    return 'first'\n"
+
+
+def test_block_runs_once(kernel):
+    kernel["runs"] = []
+
+    kernel["py_fn_define_once"]("a1", HELPER)
+    kernel["py_fn_define_once"]("a1", HELPER)
+
+    assert kernel["runs"] == [1]
+    assert kernel["py_fn_helper"]() == "first"
+
+
+def test_changed_block_runs_again(kernel):
+    kernel["runs"] = []
+    kernel["py_fn_define_once"]("a1", HELPER)
+
+    kernel["py_fn_define_once"]("b2", HELPER.replace("first", "second"))
+
+    assert kernel["runs"] == [1, 1]
+    assert kernel["py_fn_helper"]() == "second"
+
+
+def test_redefined_helper_is_restored(kernel):
+    kernel["runs"] = []
+    kernel["py_fn_define_once"]("a1", HELPER)
+    kernel["py_fn_define_once"]("b2", HELPER.replace("first", "second"))
+
+    kernel["py_fn_define_once"]("a1", HELPER)
+
+    assert kernel["runs"] == [1, 1, 1]
+    assert kernel["py_fn_helper"]() == "first"
+
+
+def test_tracebacks_show_the_block_source(kernel):
+    kernel["py_fn_define_once"]("c3", "def py_fn_fail():\n    raise ValueError('boom')\n")
+
+    with pytest.raises(ValueError) as error:
+        kernel["py_fn_fail"]()
+
+    assert "raise ValueError('boom')" in "".join(traceback.format_tb(error.tb))
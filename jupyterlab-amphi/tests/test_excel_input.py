@@ -0,0 +1,73 @@
+import concurrent.futures
+import importlib.util
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def excel_helpers():
+    return load_helpers(
+        "pipeline-components-core/src/components/inputs/files/ExcelFileInput.tsx",
+        os=os, importlib=importlib, concurrent=concurrent
+    )
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "sales.xlsx"
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame({"id": [1, 2], "amount": [10.5, 20.0]}).to_excel(writer, sheet_name="2023", index=False)
+        pd.DataFrame({"id": [3], "amount": [7.25]}).to_excel(writer, sheet_name="2024", index=False)
+        pd.DataFrame({"id": [4, 5, 6], "amount": [1.0, 2.0, 3.0]}).to_excel(writer, sheet_name="2025", index=False)
+    return str(path)
+
+
+def test_engine_choice(excel_helpers, monkeypatch):
+    assert excel_helpers["py_fn_excel_engine"]("openpyxl") == "openpyxl"
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object() if name == "python_calamine" else None)
+    assert excel_helpers["py_fn_excel_engine"]() == "calamine"
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert excel_helpers["py_fn_excel_engine"]() is None
+
+
+def test_sheets_are_concatenated_in_order(excel_helpers, workbook):
+    result = excel_helpers["py_fn_read_excel_sheets"](workbook, ["2025", "2023", "2025"], engine="openpyxl")
+
+    assert result["id"].tolist() == [4, 5, 6, 1, 2]
+    assert result.index.tolist() == list(range(5))
+
+
+def test_sheet_column(excel_helpers, workbook):
+    result = excel_helpers["py_fn_read_excel_sheets"](workbook, ["2023", "2024", "2025"], py_arg_sheet_column="sheet", usecols=["amount"])
+
+    assert list(result.columns) == ["amount", "sheet"]
+    assert isinstance(result["sheet"].dtype, pd.CategoricalDtype)
+    assert result["sheet"].tolist() == ["2023", "2023", "2024", "2025", "2025", "2025"]
+    assert list(result["sheet"].cat.categories) == ["2023", "2024", "2025"]
+
+
+def test_large_workbook_sheets_are_read_in_parallel(excel_helpers, workbook, monkeypatch):
+    submitted = []
+
+    class Executor(concurrent.futures.ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(kwargs["sheet_name"])
+            return super().submit(fn, *args, **kwargs)
+
+    # Threads instead of processes, the read functions are the same
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", Executor)
+    monkeypatch.setattr(os.path, "getsize", lambda path: 1 << 20)
+
+    result = excel_helpers["py_fn_read_excel_sheets"](workbook, ["2024", "2023"], py_arg_sheet_column="sheet", engine="openpyxl")
+
+    assert submitted == ["2024", "2023"]
+    assert result["id"].tolist() == [3, 1, 2]
+    assert result["sheet"].tolist() == ["2024", "2023", "2023"]
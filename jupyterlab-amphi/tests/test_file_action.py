@@ -0,0 +1,83 @@
+import os
+import shutil
+import zipfile
+
+import pandas as pd
+import pytest
+
+from conftest import PACKAGES, _TEMPLATE, _unescape
+
+FILE_ACTION = PACKAGES / "pipeline-components-core/src/components/transforms/files/FileAction.tsx"
+
+
+@pytest.fixture
+def file_helpers():
+    # The File Action helpers predate the py_fn_ naming, their template is found by its content
+    body = next(_unescape(match.group(1)) for match in _TEMPLATE.finditer(FILE_ACTION.read_text()) if "def handle_files_concurrently" in match.group(1))
+    namespace = {"pd": pd, "os": os, "shutil": shutil, "zipfile": zipfile}
+    exec(compile(body, str(FILE_ACTION), "exec"), namespace)
+    return namespace
+
+
+def actions(root):
+    # Rows touching the same files must behave as if run one after the other
+    return pd.DataFrame({
+        "file_path": [f"{root}/a.txt", f"{root}/out/b.txt", f"{root}/a.txt", f"{root}/c.txt", f"{root}/new/empty.txt", f"{root}/missing.txt", f"{root}/d.txt"],
+        "destination": [f"{root}/out/b.txt", None, None, f"{root}/zips/c.zip", None, f"{root}/out/missing.txt", f"{root}/out2/d.txt"],
+        "action": ["copy", "rename", "delete", "zip", "create as empty", "move", "move"],
+        "new_name": [None, "renamed.txt", None, None, None, None, None],
+    })
+
+
+def prepare(root):
+    for name in ("a.txt", "c.txt", "d.txt"):
+        (root / name).write_text(name)
+
+
+def run(file_helpers, root, concurrent):
+    normalized = file_helpers["normalize_input_dataframe"](actions(root))
+    if concurrent:
+        return file_helpers["handle_files_concurrently"](normalized, new_name_col="new_name", max_workers=4)
+    return normalized.apply(
+        lambda row: file_helpers["handle_file_safe"](row["normalized_file_path"], row["normalized_action"], row.get("normalized_destination"), row.get("new_name", "")),
+        axis=1
+    )
+
+
+def tree(root):
+    return sorted(str(path.relative_to(root)) for path in root.rglob("*"))
+
+
+def test_concurrent_actions_match_sequential_actions(file_helpers, tmp_path):
+    sequential_root, concurrent_root = tmp_path / "sequential", tmp_path / "concurrent"
+    for root in (sequential_root, concurrent_root):
+        root.mkdir()
+        prepare(root)
+
+    sequential = run(file_helpers, sequential_root, concurrent=False)
+    concurrent = run(file_helpers, concurrent_root, concurrent=True)
+
+    assert [status for status, _ in concurrent] == [status for status, _ in sequential]
+    assert [status for status, _ in concurrent] == ["success"] * 5 + ["failure", "success"]
+    assert tree(concurrent_root) == tree(sequential_root)
+    assert (concurrent_root / "out/renamed.txt").read_text() == "a.txt"
+    assert not (concurrent_root / "a.txt").exists()
+    assert zipfile.ZipFile(concurrent_root / "zips/c.zip").namelist() == ["c.txt"]
+
+
+def test_rows_sharing_a_path_form_one_chain(file_helpers, tmp_path):
+    prepare(tmp_path)
+    normalized = file_helpers["normalize_input_dataframe"](actions(tmp_path))
+
+    _, directories, chains = file_helpers["plan_file_actions"](normalized, new_name_col="new_name")
+
+    assert sorted(chains) == [[0, 1, 2], [3], [4], [5], [6]]
+    # No directory is created for the move of a missing file
+    assert [os.path.basename(directory) for directory in directories] == ["new", "out", "out2", "zips"]
+
+
+def test_failures_raise_when_asked(file_helpers, tmp_path):
+    normalized = file_helpers["normalize_input_dataframe"](pd.DataFrame({"file_path": [f"{tmp_path}/missing.txt"], "action": ["delete"]}))
+
+    with pytest.raises(FileNotFoundError):
+        file_helpers["handle_files_concurrently"](normalized, raise_on_error=True)
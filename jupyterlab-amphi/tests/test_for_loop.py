@@ -0,0 +1,81 @@
+import concurrent.futures
+import functools
+import os
+import runpy
+import time
+
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+
+@pytest.fixture
+def loop_helpers():
+    return load_helpers(
+        "pipeline-components-core/src/components/orchestration/ForLoop.tsx",
+        os=os, runpy=runpy, functools=functools, concurrent=concurrent
+    )
+
+
+PARAMETERS = pd.DataFrame({"n": [3, 1, 2], "label": ["c", "a", "b"]})
+
+
+@pytest.mark.parametrize("executor", ["thread", "sequential"])
+def test_results_are_concatenated_in_row_order(loop_helpers, executor):
+    def iteration(row):
+        # Later rows finish first on the pool
+        time.sleep(row["n"] / 100)
+        return pd.DataFrame({"value": [row["label"]] * row["n"]})
+
+    result = loop_helpers["py_fn_for_loop"](PARAMETERS, iteration, py_arg_executor=executor, py_arg_max_workers=3)
+
+    assert result["value"].tolist() == ["c", "c", "c", "a", "b", "b"]
+    assert result.index.tolist() == list(range(6))
+
+
+def test_dict_results_and_parameters(loop_helpers):
+    result = loop_helpers["py_fn_for_loop"](
+        PARAMETERS, lambda row: None if row["n"] == 1 else {"square": row["n"] ** 2, "label": row["label"].upper()},
+        py_arg_add_parameters=True
+    )
+
+    expected = pd.DataFrame({"n": [3, 2], "square": [9, 4], "label": ["C", "B"]})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def fail_on_one(row):
+    if row["n"] == 1:
+        raise ValueError("no")
+    return {"n": row["n"]}
+
+
+def test_failed_iteration_stops_the_loop(loop_helpers):
+    with pytest.raises(RuntimeError, match="Iteration 1 failed") as error:
+        loop_helpers["py_fn_for_loop"](PARAMETERS, fail_on_one)
+
+    assert isinstance(error.value.__cause__, ValueError)
+
+
+def test_failed_iteration_is_skipped(loop_helpers, capsys):
+    result = loop_helpers["py_fn_for_loop"](PARAMETERS, fail_on_one, py_arg_on_error="skip")
+
+    assert result["n"].tolist() == [3, 2]
+    assert "1 of 3 iterations failed and were skipped: [1]" in capsys.readouterr().out
+
+
+def test_empty_parameters(loop_helpers):
+    result = loop_helpers["py_fn_for_loop"](PARAMETERS.iloc[:0], fail_on_one)
+
+    assert result.empty
+
+
+def test_script_iteration(loop_helpers, tmp_path):
+    script = tmp_path / "iteration.py"
+    script.write_text("import pandas as pd\noutput = pd.DataFrame({'label': [label * n], 'keys': [len(row)]})\n")
+    iteration = functools.partial(loop_helpers["py_fn_for_loop_script"], str(script), "output")
+
+    result = loop_helpers["py_fn_for_loop"](PARAMETERS, iteration)
+
+    assert result["label"].tolist() == ["ccc", "a", "bb"]
+    assert result["keys"].tolist() == [2, 2, 2]
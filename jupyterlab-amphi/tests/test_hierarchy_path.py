@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+
+@pytest.fixture
+def build_paths():
+    return load_helpers("pipeline-components-core/src/components/transforms/HierarchyPath.tsx")["py_fn_build_all_hierarchy_paths"]
+
+
+def paths(frame):
+    return frame.sort_values(["hierarchy_path"]).reset_index(drop=True)
+
+
+def test_paths_and_aggregations_of_a_tree(build_paths):
+    df = pd.DataFrame({"p": [None, "a", "a", "b"], "c": ["a", "b", "c", "d"], "w": [1, 2, 3, 4]})
+
+    result = build_paths(df, "p", "c", aggregations=[("sum_w", "w", "sum"), ("mean_w", "w", "mean"), ("max_w", "w", "max")])
+
+    expected = pd.DataFrame({
+        "c": ["a", "b", "d", "c"],
+        "hierarchy_path": ["a", "a > b", "a > b > d", "a > c"],
+        "head_node": ["a", "a", "a", "a"],
+        "path_length": [1, 2, 3, 2],
+        "sum_w": [0, 2, 6, 3],
+        "mean_w": [np.nan, 2.0, 3.0, 3.0],
+        "max_w": [np.nan, 2.0, 4.0, 3.0],
+    })
+    pd.testing.assert_frame_equal(paths(result), expected, check_dtype=False)
+
+
+def test_node_with_several_parents_gets_a_path_per_parent(build_paths):
+    df = pd.DataFrame({"p": ["r", "r", "a", "b", None], "c": ["a", "b", "m", "m", "z"], "w": [1, 2, 3, 4, 5]})
+
+    result = build_paths(df, "p", "c", separator="/", aggregations=[("n", "w", "count"), ("lo", "w", "min")])
+
+    expected = pd.DataFrame({
+        "c": ["r", "a", "m", "b", "m", "z"],
+        "hierarchy_path": ["r", "r/a", "r/a/m", "r/b", "r/b/m", "z"],
+        "head_node": ["r", "r", "r", "r", "r", "z"],
+        "path_length": [1, 2, 3, 2, 3, 1],
+        "n": [0, 1, 2, 1, 2, 0],
+        "lo": [np.nan, 1.0, 1.0, 2.0, 2.0, np.nan],
+    })
+    pd.testing.assert_frame_equal(paths(result), expected, check_dtype=False)
+
+
+def test_cycles_are_reported_in_the_path(build_paths):
+    df = pd.DataFrame({"p": [None, "a", "x", "y"], "c": ["a", "b", "y", "x"], "w": [1, 2, 5, 6]})
+
+    result = paths(build_paths(df, "p", "c", aggregations=[("sum_w", "w", "sum")]))
+
+    cycles = result[result["c"].isin(["x", "y"])]
+    assert cycles["hierarchy_path"].tolist() == ["x > [CYCLE DETECTED] > y > x", "y > [CYCLE DETECTED] > x > y"]
+    assert cycles["head_node"].tolist() == ["x > [CYCLE DETECTED]", "y > [CYCLE DETECTED]"]
+    assert cycles["sum_w"].tolist() == [6, 5]
+    assert result.loc[result["c"] == "b", "hierarchy_path"].item() == "a > b"
+
+
+def test_long_chain(build_paths):
+    depth = 2000
+    df = pd.DataFrame({"p": [None, *range(depth - 1)], "c": list(range(depth))})
+
+    result = build_paths(df, "p", "c")
+
+    assert len(result) == depth
+    assert result["path_length"].max() == depth
+    assert result.loc[result["path_length"].idxmax(), "hierarchy_path"] == " > ".join(str(node) for node in range(depth))
@@ -0,0 +1,91 @@
+import json
+import sys
+import types
+from typing import List
+
+import duckdb
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from conftest import load_helpers
+
+JSON = "pipeline-components-core/src/components/"
+BIG = 2 ** 70
+
+
+@pytest.fixture
+def strict_orjson(monkeypatch):
+    # orjson rejects integers wider than 64 bits, as recent releases do
+    def loads(text):
+        value = json.loads(text)
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, int) and not -2 ** 63 <= item < 2 ** 64:
+                raise module.JSONDecodeError("Integer exceeds 64-bit range", text, 0)
+        return value
+
+    module = types.ModuleType("orjson")
+    module.JSONDecodeError = type("JSONDecodeError", (json.JSONDecodeError,), {})
+    module.loads = loads
+    monkeypatch.setitem(sys.modules, "orjson", module)
+
+
+def json_helpers(*components):
+    return load_helpers(
+        JSON + "common/JSONColumnHandler.ts", *(JSON + "transforms/JSON/" + component for component in components),
+        json=json, pa=pa, pc=pc, pl=pl, duckdb=duckdb, List=List
+    )
+
+
+def test_validate_accepts_big_integers(strict_orjson):
+    helpers = json_helpers("ValidateJSON.tsx")
+    frame = pd.DataFrame({"payload": [f'{{"id": {BIG}}}', '{"id": 1}', "{not json"]})
+
+    result = helpers["py_fn_validate_json_columns"](frame, ["payload"])
+
+    assert result["is_payload_valid_json"].tolist() == [True, True, False]
+
+
+def test_explode_keeps_big_integer_rows(strict_orjson):
+    helpers = json_helpers("ExplodeJSON.tsx")
+    frame = pd.DataFrame({"key": [1, 2], "payload": [f'{{"id": {BIG}}}', '{"id": 1}']})
+
+    result = helpers["py_fn_explode_json_column"](frame, "payload")
+
+    assert result["key"].tolist() == [1, 2]
+    assert result["id"].tolist() == [BIG, 1]
+
+
+def test_flatten_keeps_big_integers(strict_orjson):
+    helpers = json_helpers("FlattenJSON.tsx")
+
+    result = helpers["py_fn_flatten_json_column"](pd.Series([f'{{"id": {BIG}}}', '{"id": 1}']))
+
+    assert result["id"].tolist() == [BIG, 1]
+
+
+def test_flatten_empty_objects_add_no_column():
+    helpers = json_helpers("FlattenJSON.tsx")
+
+    result = helpers["py_fn_flatten_json_column"](pd.Series(["{}", "{}"]))
+
+    assert list(result.columns) == []
+    assert len(result) == 2
+
+
+def test_flatten_keeps_keys_null_in_every_row():
+    helpers = json_helpers("FlattenJSON.tsx")
+
+    result = helpers["py_fn_flatten_json_column"](pd.Series(['{"a": 1, "b": null, "c": {"d": null}}', '{"a": 2, "b": null, "c": {"d": null}}']))
+
+    assert list(result.columns) == ["a", "b", "c.d"]
+    assert result["b"].isna().all()
+    assert result["c.d"].isna().all()
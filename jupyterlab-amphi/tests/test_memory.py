@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+
+@pytest.fixture
+def memory_helpers():
+    return load_helpers("pipeline-components-manager/src/memoryUtils.tsx")
+
+
+def test_stable_dtypes_convert_all_null_chunks(memory_helpers):
+    optimize = memory_helpers["py_fn_optimize_memory"]
+    chunks = [
+        pd.DataFrame({"id": [1, 2], "note": pd.array(["a", "b"], dtype=pd.StringDtype("python"))}),
+        pd.DataFrame({"id": [3, 4], "note": pd.array([None, None], dtype=pd.StringDtype("python"))}),
+    ]
+
+    optimized = [optimize(chunk, py_arg_report=False, py_arg_stable_dtypes=True) for chunk in chunks]
+
+    assert optimized[0].dtypes.to_dict() == optimized[1].dtypes.to_dict()
+    assert optimized[1]["note"].dtype == pd.StringDtype("pyarrow")
+
+
+def test_optimize_downcasts_integers(memory_helpers):
+    frame = pd.DataFrame({"id": [1, 2, 300]})
+
+    result = memory_helpers["py_fn_optimize_memory"](frame, py_arg_report=False)
+
+    assert result["id"].dtype == "uint16"
@@ -0,0 +1,81 @@
+import json
+import re
+import types
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import PACKAGES, _unescape
+
+SCRIPT = PACKAGES / "pipeline-metadata-panel/src/inspectorscripts.ts"
+
+
+def panel_functions(*names):
+    """
+    Namespace with the given functions of the kernel script. The whole script installs packages
+    and needs an IPython kernel, only the functions under test are executed.
+    """
+    source = _unescape(SCRIPT.read_text())
+    shell = types.SimpleNamespace(execution_count=1)
+    namespace = {
+        "__pd": pd, "__np": np, "__pyspark": None, "json": json, "weakref": weakref,
+        "_check_imported": lambda: None, "_amphi_metadatapanel_Jupyter": shell,
+        "_amphi_metadatapanel_preview_views": {}, "_amphi_metadatapanel_preview_source": (None, None, None),
+    }
+    for name in names:
+        match = re.search(rf"^def {name}\(.*?(?=^\S)", source, re.M | re.S)
+        exec(match.group(0), namespace)
+    return namespace, shell
+
+
+@pytest.fixture
+def preview():
+    return panel_functions(
+        "_amphi_metadatapanel_execution_count", "_amphi_metadatapanel_refof", "_amphi_metadatapanel_stampof",
+        "_amphi_metadatapanel_preview_frame", "_amphi_metadatapanel_preview_positions", "_amphi_metadatapanel_getpreviewwindow"
+    )
+
+
+def window(namespace, capsys, frame, **kwargs):
+    namespace["_amphi_metadatapanel_getpreviewwindow"](frame, **kwargs)
+    return capsys.readouterr().out
+
+
+def test_sorted_view_follows_in_place_edits(preview, capsys):
+    namespace, shell = preview
+    frame = pd.DataFrame({"v": [3, 1, 2]})
+    assert '["1", "2", "3"]' in window(namespace, capsys, frame, sort=0)
+
+    # Same object, shape and dtypes, edited by a new execution
+    frame.loc[0, "v"] = 0
+    shell.execution_count += 1
+
+    assert '["0", "1", "2"]' in window(namespace, capsys, frame, sort=0)
+
+
+def test_sorted_view_of_object_reusing_an_id(preview, capsys):
+    namespace, _ = preview
+    frame = pd.DataFrame({"v": [3, 1, 2]})
+    window(namespace, capsys, frame, sort=0)
+    positions = namespace["_amphi_metadatapanel_preview_views"]
+    key = next(iter(positions))
+    del frame
+
+    other = pd.DataFrame({"v": [5, 6, 4]})
+    # Pretend the new frame got the id of the freed one
+    positions[(id(other),) + key[1:]] = positions.pop(key)
+
+    assert '["4", "5", "6"]' in window(namespace, capsys, other, sort=0)
+
+
+def test_frame_stamp_changes_with_execution(preview):
+    namespace, shell = preview
+    frame = pd.DataFrame({"v": [1]})
+    stamp = namespace["_amphi_metadatapanel_stampof"](frame)
+
+    shell.execution_count += 1
+
+    assert namespace["_amphi_metadatapanel_stampof"](frame) != stamp
+    assert namespace["_amphi_metadatapanel_stampof"]("text") == ()
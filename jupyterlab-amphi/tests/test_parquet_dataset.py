@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from conftest import CHUNK_UTILS, load_helpers
+
+
+@pytest.fixture
+def parquet_helpers():
+    return load_helpers(CHUNK_UTILS, "pipeline-components-core/src/components/outputs/files/ParquetFileOutput.tsx")
+
+
+def test_partitioned_dataset_round_trip(tmp_path, parquet_helpers):
+    frame = pd.DataFrame({"year": [2023, 2023, 2024], "id": [1, 2, 3], "v": [0.5, 1.5, 2.5]})
+    target = tmp_path / "dataset"
+
+    parquet_helpers["py_fn_write_parquet_dataset"](frame, str(target), ["year"])
+
+    assert sorted(path.name for path in target.iterdir()) == ["year=2023", "year=2024"]
+    result = pd.read_parquet(target, columns=["id", "year"], filters=[("year", "=", 2024)])
+    assert result["id"].tolist() == [3]
+    assert result["year"].astype(int).tolist() == [2024]
+
+
+def test_chunked_stream_rows_per_file(tmp_path, parquet_helpers):
+    source = tmp_path / "data.csv"
+    source.write_text("id,v\n" + "".join(f"{index},{index / 2}\n" for index in range(10)))
+    stream = parquet_helpers["py_fn_stable_chunks"](lambda: pd.read_csv(source, chunksize=3))
+    target = tmp_path / "dataset"
+
+    parquet_helpers["py_fn_write_parquet_dataset"](stream, str(target), py_arg_max_rows_per_file=4)
+
+    assert len(list(target.glob("*.parquet"))) == 3
+    result = pd.read_parquet(target).sort_values("id")
+    assert result["id"].tolist() == list(range(10))
+    assert result["v"].tolist() == [index / 2 for index in range(10)]
+
+
+def test_empty_stream_writes_nothing(tmp_path, parquet_helpers):
+    target = tmp_path / "dataset"
+
+    parquet_helpers["py_fn_write_parquet_dataset"](parquet_helpers["py_cls_chunked_frame"](lambda: iter([])), str(target))
+
+    assert not target.exists()
@@ -0,0 +1,32 @@
+import json
+
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+
+@pytest.fixture
+def profiling_helpers():
+    return load_helpers("pipeline-components-manager/src/profilingUtils.tsx")
+
+
+def test_failed_run_still_writes_profile(tmp_path, profiling_helpers):
+    path = tmp_path / "profile.json"
+    start, end, report = (profiling_helpers[name] for name in ("py_fn_profile_start", "py_fn_profile_end", "py_fn_profile_report"))
+
+    # The shape of a profiled script: node code in a try block, the report in its finally block
+    with pytest.raises(ZeroDivisionError):
+        try:
+            entry = start("input", "CSV File Input", [])
+            frame = pd.DataFrame({"id": [1, 2]})
+            end(entry, frame)
+            entry = start("filter", "Filter", [frame])
+            1 / 0
+        finally:
+            report(str(path))
+
+    profile = json.loads(path.read_text())
+    assert [node["nodeId"] for node in profile["nodes"]] == ["input"]
+    assert profile["nodes"][0]["rowsOut"] == 2
+    assert profile["failedNodes"] == ["filter"]
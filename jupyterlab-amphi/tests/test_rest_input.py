@@ -0,0 +1,176 @@
+import collections
+import email.utils
+import http.server
+import json
+import threading
+import time
+import typing
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+requests = pytest.importorskip("requests")
+from requests.adapters import HTTPAdapter  # noqa: E402
+
+
+@pytest.fixture
+def rest_helpers():
+    return load_helpers(
+        "pipeline-components-core/src/components/inputs/cloud/RestInput.tsx",
+        requests=requests, time=time, threading=threading, email=email, HTTPAdapter=HTTPAdapter,
+        ThreadPoolExecutor=ThreadPoolExecutor, **{name: getattr(typing, name) for name in typing.__all__}
+    )
+
+
+RECORDS = [{"id": index, "name": f"item {index}"} for index in range(25)]
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    requests_seen = collections.Counter()
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, body, status=200, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        query = {key: values[0] for key, values in urllib.parse.parse_qs(url.query).items()}
+        Handler.requests_seen[url.path] += 1
+        if url.path == "/offset":
+            start, limit = int(query["offset"]), int(query["limit"])
+            self.reply(RECORDS[start:start + limit])
+        elif url.path == "/page":
+            start = (int(query["page"]) - 1) * 10
+            self.reply({"results": RECORDS[start:start + 10]})
+        elif url.path == "/cursor":
+            start = int(query.get("cursor", 0))
+            next_cursor = start + 10 if start + 10 < len(RECORDS) else None
+            self.reply({"data": {"items": RECORDS[start:start + 10]}, "meta": {"next": next_cursor}})
+        elif url.path == "/link":
+            start = int(query.get("start", 0))
+            headers = {"Link": f'<http://{self.headers["Host"]}/link?start={start + 10}>; rel="next"'} if start + 10 < len(RECORDS) else {}
+            self.reply(RECORDS[start:start + 10], headers=headers)
+        elif url.path == "/flaky":
+            if Handler.requests_seen[url.path] < 3:
+                self.reply({"error": "busy"}, status=503, headers={"Retry-After": "0"})
+            else:
+                self.reply([{"ok": True}])
+        else:
+            self.reply({"error": "not found"}, status=404)
+
+
+@pytest.fixture(scope="module")
+def endpoint():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def server(endpoint):
+    Handler.requests_seen.clear()
+    return endpoint
+
+
+def test_value_paths(rest_helpers):
+    value = rest_helpers["py_fn_rest_api_value"]
+    body = {"data": {"items": [{"id": 1}, {"id": 2}]}}
+
+    assert value(body, "$") is body
+    assert value(body, "data.items.-1.id") == 2
+    assert value(body, "data.items.5") is None
+    assert value(body, "data.missing.id") is None
+
+
+def test_retry_after(rest_helpers):
+    retry_after = rest_helpers["py_fn_rest_api_retry_after"]
+
+    assert retry_after("2") == 2.0
+    assert retry_after(None) is None
+    assert retry_after("soon") is None
+    assert 50 < retry_after(email.utils.formatdate(time.time() + 60, usegmt=True)) <= 60
+
+
+def test_throttle_spaces_requests(rest_helpers):
+    wait = rest_helpers["py_fn_rest_api_throttle"](50)
+
+    start = time.monotonic()
+    for _ in range(6):
+        wait()
+
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_offset_pagination(rest_helpers, server, concurrency):
+    result = rest_helpers["py_fn_rest_api_call"](
+        f"{server}/offset", py_arg_body_mime_type="None", py_arg_pagination="offset", py_arg_page_size=10,
+        py_arg_limit_param="limit", py_arg_records_path="$", py_arg_concurrency=concurrency
+    )
+
+    assert result["id"].tolist() == list(range(25))
+
+
+def test_page_pagination_with_records_path(rest_helpers, server):
+    result = rest_helpers["py_fn_rest_api_call"](
+        f"{server}/page", py_arg_body_mime_type="None", py_arg_pagination="page", py_arg_page_size=10,
+        py_arg_records_path="results", py_arg_concurrency=2
+    )
+
+    assert result["id"].tolist() == list(range(25))
+
+
+def test_cursor_pagination(rest_helpers, server):
+    result = rest_helpers["py_fn_rest_api_call"](
+        f"{server}/cursor", py_arg_body_mime_type="None", py_arg_pagination="cursor",
+        py_arg_cursor_path="meta.next", py_arg_records_path="data.items"
+    )
+
+    assert result["name"].tolist() == [record["name"] for record in RECORDS]
+
+
+def test_link_pagination_with_max_pages(rest_helpers, server):
+    result = rest_helpers["py_fn_rest_api_call"](
+        f"{server}/link", py_arg_body_mime_type="None", py_arg_pagination="link", py_arg_max_pages=2
+    )
+
+    assert len(result) == 2
+    assert [len(body) for body in result["response_body"]] == [10, 10]
+    assert Handler.requests_seen["/link"] == 2
+
+
+def test_unavailable_responses_are_retried(rest_helpers, server):
+    result = rest_helpers["py_fn_rest_api_call"](f"{server}/flaky", py_arg_body_mime_type="None", py_arg_max_retries=3)
+
+    assert result["response_status_code"].tolist() == ["200"]
+    assert Handler.requests_seen["/flaky"] == 3
+
+
+def test_retries_are_bounded(rest_helpers, server):
+    with pytest.raises(requests.exceptions.HTTPError):
+        rest_helpers["py_fn_rest_api_call"](f"{server}/flaky", py_arg_body_mime_type="None", py_arg_max_retries=1)
+
+    assert Handler.requests_seen["/flaky"] == 2
+
+
+def test_offset_pagination_requires_records(rest_helpers, server):
+    with pytest.raises(ValueError, match="Records path"):
+        rest_helpers["py_fn_rest_api_call"](
+            f"{server}/cursor", py_arg_body_mime_type="None", py_arg_pagination="offset", py_arg_page_size=10, py_arg_limit_param="limit"
+        )
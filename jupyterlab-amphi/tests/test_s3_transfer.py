@@ -0,0 +1,114 @@
+import concurrent.futures
+import io
+import posixpath
+
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+s3fs = pytest.importorskip("s3fs")
+moto_server = pytest.importorskip("moto.server")
+
+BUCKET = "amphi-test"
+
+
+@pytest.fixture(scope="module")
+def endpoint():
+    # s3fs talks to S3 with aiobotocore, which the in-process mocks do not patch: the mock runs as a local server
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    yield f"http://127.0.0.1:{server.get_host_and_port()[1]}"
+    server.stop()
+
+
+@pytest.fixture
+def storage_options(endpoint, monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    options = {"client_kwargs": {"endpoint_url": endpoint}, "skip_instance_cache": True}
+    fs = s3fs.S3FileSystem(**options)
+    if fs.exists(BUCKET):
+        fs.rm(BUCKET, recursive=True)
+    fs.mkdir(BUCKET)
+    return options
+
+
+@pytest.fixture
+def fs(storage_options):
+    return s3fs.S3FileSystem(**storage_options)
+
+
+@pytest.fixture
+def s3_helpers():
+    return load_helpers(
+        "pipeline-components-core/src/components/common/S3TransferHandler.ts",
+        io=io, posixpath=posixpath, concurrent=concurrent, s3fs=s3fs
+    )
+
+
+def test_objects_are_listed_and_read_in_order(s3_helpers, fs):
+    for name, ids in [("b.csv", [3, 4]), ("a.csv", [1, 2]), ("nested/c.csv", [5])]:
+        fs.pipe(f"{BUCKET}/data/{name}", pd.DataFrame({"id": ids}).to_csv(index=False).encode())
+    fs.pipe(f"{BUCKET}/data/notes.txt", b"not a csv")
+
+    objects = s3_helpers["py_fn_s3_list_objects"](fs, f"{BUCKET}/data/*.csv")
+    assert list(objects) == [f"{BUCKET}/data/a.csv", f"{BUCKET}/data/b.csv"]
+
+    prefixed = s3_helpers["py_fn_s3_list_objects"](fs, f"{BUCKET}/data/")
+    assert len(prefixed) == 4
+
+    # The small object is fetched at once, the others streamed
+    result = s3_helpers["py_fn_s3_read_objects"](fs, {**objects, f"{BUCKET}/data/nested/c.csv": 1 << 30}, pd.read_csv, 2)
+    assert result["id"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_listing_without_objects(s3_helpers, fs):
+    with pytest.raises(FileNotFoundError):
+        s3_helpers["py_fn_s3_list_objects"](fs, f"{BUCKET}/missing/*.csv")
+
+
+def test_small_upload(s3_helpers, fs):
+    s3_helpers["py_fn_s3_upload"](fs, f"{BUCKET}/small.bin", b"payload")
+
+    assert fs.cat_file(f"{BUCKET}/small.bin") == b"payload"
+
+
+def test_multipart_upload(s3_helpers, fs):
+    # Parts of the minimum 5 MiB, the last one shorter
+    data = bytes(range(256)) * (11 * 2 ** 20 // 256 + 3)
+
+    s3_helpers["py_fn_s3_upload"](fs, f"{BUCKET}/large.bin", data, py_arg_part_size_mb=5, py_arg_max_workers=3)
+
+    assert fs.cat_file(f"{BUCKET}/large.bin") == data
+    assert fs.call_s3("list_multipart_uploads", Bucket=BUCKET).get("Uploads", []) == []
+
+
+def test_failed_multipart_upload_is_aborted(s3_helpers, fs, monkeypatch):
+    call_s3 = fs.call_s3
+
+    def failing_call_s3(method, *args, **kwargs):
+        if method == "upload_part" and kwargs["PartNumber"] == 2:
+            raise OSError("connection reset")
+        return call_s3(method, *args, **kwargs)
+
+    monkeypatch.setattr(fs, "call_s3", failing_call_s3)
+    with pytest.raises(OSError, match="connection reset"):
+        s3_helpers["py_fn_s3_upload"](fs, f"{BUCKET}/broken.bin", b"x" * (11 * 2 ** 20), py_arg_part_size_mb=5)
+
+    assert call_s3("list_multipart_uploads", Bucket=BUCKET).get("Uploads", []) == []
+    assert not fs.exists(f"{BUCKET}/broken.bin")
+
+
+def test_partitioned_frame_write(s3_helpers, fs, storage_options):
+    frame = pd.DataFrame({"year": [2024, 2025, 2024, None], "id": [1, 2, 3, 4]})
+
+    s3_helpers["py_fn_s3_write_frame"](
+        frame, f"s3://{BUCKET}/out/data.csv", lambda data, buffer: data.to_csv(buffer, index=False),
+        storage_options, py_arg_partition_cols=["year"]
+    )
+
+    written = sorted(fs.find(f"{BUCKET}/out/"))
+    assert written == [f"{BUCKET}/out/year=2024.0/data.csv", f"{BUCKET}/out/year=2025.0/data.csv", f"{BUCKET}/out/year=__HIVE_DEFAULT_PARTITION__/data.csv"]
+    assert pd.read_csv(io.BytesIO(fs.cat_file(written[0])))["id"].tolist() == [1, 3]
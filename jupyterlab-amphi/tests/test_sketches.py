@@ -0,0 +1,50 @@
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import load_helpers
+
+SKETCHES = "pipeline-components-core/src/components/common/SketchHandler.ts"
+
+
+@pytest.fixture
+def frequency_helpers():
+    return load_helpers(SKETCHES, "pipeline-components-core/src/components/transforms/FrequencyAnalysis.tsx", Optional=Optional, List=List)
+
+
+@pytest.fixture
+def summary_helpers():
+    return load_helpers(SKETCHES, "pipeline-components-core/src/components/transforms/Summary.tsx")
+
+
+def test_approximate_frequency_keeps_large_integer_keys(frequency_helpers):
+    frame = pd.DataFrame({"id": pd.array([2 ** 60 + 1, 2 ** 60 + 3, 2 ** 60 + 3, None], dtype="Int64")})
+
+    result = frequency_helpers["py_fn_value_frequency_approximate"](frame, py_arg_top_values=10)
+
+    keys = [None if pd.isna(value) else int(value) for value in result["field_value"]]
+    values = dict(zip(keys, result["frequency"]))
+    assert values == {2 ** 60 + 3: 2, 2 ** 60 + 1: 1, None: 1}
+
+
+def test_approximate_frequency_of_distinct_values(frequency_helpers):
+    frame = pd.DataFrame({"key": np.arange(5000)})
+
+    result = frequency_helpers["py_fn_value_frequency_approximate"](frame, py_arg_top_values=10, py_arg_chunk_rows=1000)
+
+    assert len(result) == 10
+    assert (result["frequency"] >= 1).all()
+    assert (result["frequency"] + result["frequency_error"] >= 1).all()
+
+
+def test_approximate_summary_of_distinct_values(summary_helpers):
+    frame = pd.DataFrame({"key": np.arange(5000), "label": [f"v{i % 7}" for i in range(5000)]})
+
+    result = summary_helpers["py_fn_describe_dataset_approximate"](frame, py_arg_top_capacity=100, py_arg_chunk_rows=1000).set_index("field_name")
+
+    assert result.loc["key", "max freq"] == 1
+    assert result.loc["key", "most freq value"] != ""
+    assert result.loc["label", "max freq"] == 5000 // 7 + 1
+    assert result.loc["label", "most freq value"] == "v0"
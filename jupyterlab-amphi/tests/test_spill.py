@@ -0,0 +1,123 @@
+import gc
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import CHUNK_UTILS, load_helpers
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def spill_helpers():
+    return load_helpers(
+        CHUNK_UTILS, "pipeline-components-core/src/components/common/SpillHandler.ts",
+        os=os, shutil=shutil, tempfile=tempfile, weakref=weakref, pa=pa, pq=pq
+    )
+
+
+def frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "key": rng.integers(0, 50, rows),
+        "label": rng.choice(["a", "b", "c", None], rows),
+        "value": rng.random(rows),
+    })
+
+
+def chunks(df, size):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def collect(spill_helpers, stream):
+    return spill_helpers["py_fn_collect_chunks"](stream)
+
+
+# About 3 KB of memory budget: chunks of a few rows and hundreds of runs
+TINY_MB = 0.003
+
+
+@pytest.mark.parametrize("fan_in", [2, 32])
+def test_external_sort_matches_in_memory_sort(spill_helpers, tmp_path, fan_in):
+    df = frame(3000)
+
+    stream = spill_helpers["py_fn_spill_sort"](chunks(df, 700), ["key", "value"], [True, False], py_arg_memory_mb=TINY_MB, py_arg_temp_dir=str(tmp_path), py_arg_fan_in=fan_in)
+
+    expected = df.sort_values(["key", "value"], ascending=[True, False], ignore_index=True)
+    pd.testing.assert_frame_equal(collect(spill_helpers, stream), expected)
+
+
+def test_external_sort_is_stable(spill_helpers, tmp_path):
+    df = pd.DataFrame({"key": [2, 1, 2, 1, 2, 1] * 200, "order": range(1200)})
+
+    stream = spill_helpers["py_fn_spill_sort"](df, ["key"], [True], py_arg_memory_mb=TINY_MB, py_arg_temp_dir=str(tmp_path), py_arg_fan_in=4)
+
+    result = collect(spill_helpers, stream)
+    assert result["key"].is_monotonic_increasing
+    assert result.groupby("key")["order"].apply(lambda orders: orders.is_monotonic_increasing).all()
+
+
+def test_external_sort_of_empty_stream(spill_helpers, tmp_path):
+    df = frame(0)
+
+    result = collect(spill_helpers, spill_helpers["py_fn_spill_sort"]([df], ["key"], [True], py_arg_temp_dir=str(tmp_path)))
+
+    assert result.empty
+    assert list(result.columns) == ["key", "label", "value"]
+
+
+def test_spilled_group_operation_matches_in_memory_groupby(spill_helpers, tmp_path):
+    df = frame(4000, seed=1)
+
+    # Partitions of about 1,000 rows are over the budget and split once more
+    stream = spill_helpers["py_fn_spill_apply"](
+        chunks(df, 900), ["key", "label"], lambda part: part.groupby(["key", "label"], dropna=False).agg(total=("value", "sum")).reset_index(),
+        py_arg_memory_mb=0.05, py_arg_temp_dir=str(tmp_path), py_arg_fanout=4
+    )
+
+    result = collect(spill_helpers, stream).sort_values(["key", "label"], ignore_index=True)
+    expected = df.groupby(["key", "label"], dropna=False).agg(total=("value", "sum")).reset_index().sort_values(["key", "label"], ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False)
+
+
+def test_keys_of_different_chunk_dtypes_share_partitions(spill_helpers, tmp_path):
+    # The same keys as Int64 in one chunk and Float64 with nulls in another
+    first = pd.DataFrame({"key": pd.array([1, 2, 3], dtype="Int64"), "value": [1, 1, 1]})
+    second = pd.DataFrame({"key": pd.array([1.0, 2.0, None], dtype="Float64"), "value": [1, 1, 1]})
+    third = pd.DataFrame({"key": pd.array([None], dtype="Int64"), "value": [1]})
+
+    stream = spill_helpers["py_fn_spill_apply"](
+        [first, second, third], ["key"], lambda part: part.drop_duplicates(["key"]),
+        py_arg_temp_dir=str(tmp_path), py_arg_fanout=8
+    )
+
+    result = collect(spill_helpers, stream)
+    assert sorted(result["key"].astype("Float64").fillna(-1).tolist()) == [-1.0, 1.0, 2.0, 3.0]
+
+
+def test_spill_directory_is_removed_with_the_stream(spill_helpers, tmp_path):
+    stream = spill_helpers["py_fn_spill_sort"](frame(100), ["key"], [True], py_arg_temp_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    del stream
+    gc.collect()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spill_directory_is_removed_when_the_operation_fails(spill_helpers, tmp_path):
+    def reduce(part):
+        if len(part):
+            raise ValueError("reduce failed")
+        return part
+
+    with pytest.raises(ValueError, match="reduce failed"):
+        spill_helpers["py_fn_spill_apply"](frame(100), ["key"], reduce, py_arg_temp_dir=str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []